@@ -490,6 +490,11 @@ class SkillAdaptor(ABC):
         base_meta.update(extra)
         return base_meta
 
+    @property
+    def chunk_workers(self) -> int:
+        """Worker processes for RAG chunking (``chunk_workers`` config, default 1)."""
+        return max(1, int(self.config.get("chunk_workers") or 1))
+
     def _maybe_chunk_content(
         self,
         content: str,
@@ -516,25 +521,62 @@ class SkillAdaptor(ABC):
             If chunking disabled or doc small: [(content, metadata)]
             If chunking enabled: [(chunk1, meta1), (chunk2, meta2), ...]
         """
-        # Skip chunking if disabled or document is small
-        if not enable_chunking:
-            return [(content, metadata)]
+        return self._chunk_documents(
+            [(content, metadata, source_file)],
+            enable_chunking=enable_chunking,
+            chunk_max_tokens=chunk_max_tokens,
+            preserve_code_blocks=preserve_code_blocks,
+            chunk_overlap_tokens=chunk_overlap_tokens,
+        )[0]
 
-        # Estimate tokens (~4 chars per token)
-        estimated_tokens = len(content) // 4
+    def _chunk_documents(
+        self,
+        documents: list[tuple[str, dict, str | None]],
+        enable_chunking: bool = False,
+        chunk_max_tokens: int = DEFAULT_CHUNK_TOKENS,
+        preserve_code_blocks: bool = True,
+        chunk_overlap_tokens: int = DEFAULT_CHUNK_OVERLAP_TOKENS,
+    ) -> list[list[tuple[str, dict]]]:
+        """
+        Optionally chunk several documents for RAG platforms.
 
-        # Add some buffer for safety (20%)
-        if estimated_tokens < (chunk_max_tokens * 0.8):
-            # Document fits in single chunk (with buffer)
-            return [(content, metadata)]
+        Same rules as ``_maybe_chunk_content`` for each document, but one
+        chunker is shared by all of them and large documents are chunked in
+        ``chunk_workers`` processes. Output order and chunk ids do not depend
+        on the worker count.
+
+        Args:
+            documents: (content, metadata, source_file) tuples
+            enable_chunking: Whether to enable chunking
+            chunk_max_tokens: Maximum tokens per chunk
+            preserve_code_blocks: Preserve code blocks during chunking
+            chunk_overlap_tokens: Overlap between chunks in tokens
+
+        Returns:
+            One list of (chunk_text, chunk_metadata) tuples per document
+        """
+        results = [[(content, metadata)] for content, metadata, _ in documents]
+
+        # Skip chunking if disabled
+        if not enable_chunking:
+            return results
+
+        # Skip small documents: estimate tokens (~4 chars per token) and add
+        # some buffer for safety (20%)
+        pending = [
+            i
+            for i, (content, _, _) in enumerate(documents)
+            if len(content) // 4 >= chunk_max_tokens * 0.8
+        ]
+        if not pending:
+            return results
 
-        # Initialize chunker with current settings (don't reuse to allow different settings per call)
         try:
             from skill_seekers.cli.rag_chunker import RAGChunker
         except ImportError:
             # RAGChunker not available - fall back to no chunking
             print("⚠️  Warning: RAGChunker not available, chunking disabled")
-            return [(content, metadata)]
+            return results
 
         # RAGChunker uses TOKENS (it converts to chars internally)
         # If overlap is at the default value but chunk size was customized,
@@ -554,26 +596,32 @@ class SkillAdaptor(ABC):
             min_chunk_size=100,  # 100 tokens minimum
         )
 
-        # Chunk the document
-        chunks = chunker.chunk_document(
-            text=content,
-            metadata=metadata,
-            source_file=source_file or metadata.get("file", "unknown"),
+        # Chunk the documents
+        chunked = chunker.chunk_documents(
+            [
+                (content, metadata, source_file or metadata.get("file", "unknown"))
+                for content, metadata, source_file in (documents[i] for i in pending)
+            ],
+            workers=self.chunk_workers,
         )
 
         # Convert RAGChunker output format to (text, metadata) tuples
-        result = []
-        for chunk_dict in chunks:
-            chunk_text = chunk_dict["page_content"]
-            chunk_meta = {
-                **metadata,  # Base metadata
-                **chunk_dict["metadata"],  # RAGChunker metadata (chunk_index, etc.)
-                "is_chunked": True,
-                "chunk_id": chunk_dict["chunk_id"],
-            }
-            result.append((chunk_text, chunk_meta))
-
-        return result
+        for i, chunks in zip(pending, chunked, strict=True):
+            metadata = documents[i][1]
+            results[i] = [
+                (
+                    chunk_dict["page_content"],
+                    {
+                        **metadata,  # Base metadata
+                        **chunk_dict["metadata"],  # RAGChunker metadata (chunk_index, etc.)
+                        "is_chunked": True,
+                        "chunk_id": chunk_dict["chunk_id"],
+                    },
+                )
+                for chunk_dict in chunks
+            ]
+
+        return results
 
     def _format_output_path(self, skill_dir: Path, output_path: Path, suffix: str) -> Path:
         """
@@ -681,22 +729,20 @@ class SkillAdaptor(ABC):
         if not api_key:
             raise ValueError("OPENAI_API_KEY not set. Set via env var or --openai-api-key")
 
+        from skill_seekers.cli.embedding_executor import EmbeddingExecutor, openai_embed_fn
+
         client = OpenAI(api_key=api_key)
-        embeddings: list[list[float]] = []
-        batch_size = 100
+        executor = EmbeddingExecutor(
+            openai_embed_fn(client, "text-embedding-3-small"),
+            on_batch=lambda done, total: print(f"  ✓ Embedded {done}/{total}"),
+        )
 
         print(f"  Generating OpenAI embeddings for {len(documents)} documents...")
 
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            try:
-                response = client.embeddings.create(input=batch, model="text-embedding-3-small")
-                embeddings.extend([item.embedding for item in response.data])
-                print(f"  ✓ Embedded {min(i + batch_size, len(documents))}/{len(documents)}")
-            except Exception as e:
-                raise Exception(f"OpenAI embedding generation failed: {e}") from e
-
-        return embeddings
+        try:
+            return executor.embed(documents)
+        except Exception as e:
+            raise Exception(f"OpenAI embedding generation failed: {e}") from e
 
     def _generate_st_embeddings(self, documents: list[str]) -> list[list[float]]:
         """Generate embeddings using sentence-transformers (all-MiniLM-L6-v2).
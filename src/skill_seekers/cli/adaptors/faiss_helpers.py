@@ -68,9 +68,7 @@ class FAISSHelpers(StreamingAdaptorMixin, SkillAdaptor):
         Returns:
             JSON string containing FAISS-compatible data
         """
-        documents = []
-        metadatas = []
-        ids = []
+        sources = []
 
         # Convert SKILL.md (main documentation)
         skill_md_path = skill_dir / "SKILL.md"
@@ -86,24 +84,7 @@ class FAISSHelpers(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    content,
-                    doc_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file="SKILL.md",
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
-
-                # Add all chunks to parallel arrays
-                for chunk_text, chunk_meta in chunks:
-                    documents.append(chunk_text)
-                    metadatas.append(chunk_meta)
-                    ids.append(self._generate_id(chunk_text, chunk_meta))
+                sources.append((content, doc_metadata, "SKILL.md"))
 
         # Convert all reference files using base helper method
         for ref_file, ref_content in self._iterate_references(skill_dir):
@@ -119,24 +100,26 @@ class FAISSHelpers(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    ref_content,
-                    doc_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file=ref_file.name,
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
-
-                # Add all chunks to parallel arrays
-                for chunk_text, chunk_meta in chunks:
-                    documents.append(chunk_text)
-                    metadatas.append(chunk_meta)
-                    ids.append(self._generate_id(chunk_text, chunk_meta))
+                sources.append((ref_content, doc_metadata, ref_file.name))
+
+        # Chunk if enabled
+        chunked = self._chunk_documents(
+            sources,
+            enable_chunking=enable_chunking,
+            chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
+            preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
+            chunk_overlap_tokens=kwargs.get("chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS),
+        )
+
+        # Add all chunks to parallel arrays
+        documents = []
+        metadatas = []
+        ids = []
+        for chunks in chunked:
+            for chunk_text, chunk_meta in chunks:
+                documents.append(chunk_text)
+                metadatas.append(chunk_meta)
+                ids.append(self._generate_id(chunk_text, chunk_meta))
 
         # FAISS configuration hints
         config = {
@@ -51,7 +51,7 @@ class HaystackAdaptor(StreamingAdaptorMixin, SkillAdaptor):
         Returns:
             JSON string containing array of Haystack Documents
         """
-        documents = []
+        sources = []
 
         # Convert SKILL.md (main documentation)
         skill_md_path = skill_dir / "SKILL.md"
@@ -67,27 +67,7 @@ class HaystackAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    content,
-                    doc_meta,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file="SKILL.md",
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
-
-                # Add all chunks as documents
-                for chunk_text, chunk_meta in chunks:
-                    documents.append(
-                        {
-                            "content": chunk_text,
-                            "meta": chunk_meta,
-                        }
-                    )
+                sources.append((content, doc_meta, "SKILL.md"))
 
         # Convert all reference files using base helper method
         for ref_file, ref_content in self._iterate_references(skill_dir):
@@ -104,27 +84,27 @@ class HaystackAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    ref_content,
-                    doc_meta,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file=ref_file.name,
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
+                sources.append((ref_content, doc_meta, ref_file.name))
 
-                # Add all chunks as documents
-                for chunk_text, chunk_meta in chunks:
-                    documents.append(
-                        {
-                            "content": chunk_text,
-                            "meta": chunk_meta,
-                        }
-                    )
+        # Chunk if enabled
+        chunked = self._chunk_documents(
+            sources,
+            enable_chunking=enable_chunking,
+            chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
+            preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
+            chunk_overlap_tokens=kwargs.get("chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS),
+        )
+
+        # Add all chunks as documents
+        documents = []
+        for chunks in chunked:
+            for chunk_text, chunk_meta in chunks:
+                documents.append(
+                    {
+                        "content": chunk_text,
+                        "meta": chunk_meta,
+                    }
+                )
 
         # Return as formatted JSON
         return json.dumps(documents, indent=2, ensure_ascii=False)
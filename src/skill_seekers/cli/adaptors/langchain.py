@@ -51,7 +51,7 @@ class LangChainAdaptor(StreamingAdaptorMixin, SkillAdaptor):
         Returns:
             JSON string containing array of LangChain Documents
         """
-        documents = []
+        sources = []
 
         # Convert SKILL.md (main documentation)
         skill_md_path = skill_dir / "SKILL.md"
@@ -66,23 +66,7 @@ class LangChainAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "version": metadata.version,
                     "doc_version": metadata.doc_version,
                 }
-
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    content,
-                    doc_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file="SKILL.md",
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
-
-                # Add all chunks to documents
-                for chunk_text, chunk_meta in chunks:
-                    documents.append({"page_content": chunk_text, "metadata": chunk_meta})
+                sources.append((content, doc_metadata, "SKILL.md"))
 
         # Convert all reference files using base helper method
         for ref_file, ref_content in self._iterate_references(skill_dir):
@@ -98,23 +82,22 @@ class LangChainAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "version": metadata.version,
                     "doc_version": metadata.doc_version,
                 }
+                sources.append((ref_content, doc_metadata, ref_file.name))
+
+        # Chunk if enabled
+        chunked = self._chunk_documents(
+            sources,
+            enable_chunking=enable_chunking,
+            chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
+            preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
+            chunk_overlap_tokens=kwargs.get("chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS),
+        )
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    ref_content,
-                    doc_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file=ref_file.name,
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
-
-                # Add all chunks to documents
-                for chunk_text, chunk_meta in chunks:
-                    documents.append({"page_content": chunk_text, "metadata": chunk_meta})
+        # Add all chunks to documents
+        documents = []
+        for chunks in chunked:
+            for chunk_text, chunk_meta in chunks:
+                documents.append({"page_content": chunk_text, "metadata": chunk_meta})
 
         # Return as formatted JSON
         return json.dumps(documents, indent=2, ensure_ascii=False)
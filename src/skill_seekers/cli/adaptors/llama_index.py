@@ -66,7 +66,7 @@ class LlamaIndexAdaptor(StreamingAdaptorMixin, SkillAdaptor):
         Returns:
             JSON string containing array of LlamaIndex Nodes
         """
-        nodes = []
+        sources = []
 
         # Convert SKILL.md (main documentation)
         skill_md_path = skill_dir / "SKILL.md"
@@ -82,29 +82,7 @@ class LlamaIndexAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    content,
-                    node_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file="SKILL.md",
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
-
-                # Add all chunks as nodes
-                for chunk_text, chunk_meta in chunks:
-                    nodes.append(
-                        {
-                            "text": chunk_text,
-                            "metadata": chunk_meta,
-                            "id_": self._generate_node_id(chunk_text, chunk_meta),
-                            "embedding": None,
-                        }
-                    )
+                sources.append((content, node_metadata, "SKILL.md"))
 
         # Convert all reference files using base helper method
         for ref_file, ref_content in self._iterate_references(skill_dir):
@@ -121,29 +99,29 @@ class LlamaIndexAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    ref_content,
-                    node_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file=ref_file.name,
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
+                sources.append((ref_content, node_metadata, ref_file.name))
 
-                # Add all chunks as nodes
-                for chunk_text, chunk_meta in chunks:
-                    nodes.append(
-                        {
-                            "text": chunk_text,
-                            "metadata": chunk_meta,
-                            "id_": self._generate_node_id(chunk_text, chunk_meta),
-                            "embedding": None,
-                        }
-                    )
+        # Chunk if enabled
+        chunked = self._chunk_documents(
+            sources,
+            enable_chunking=enable_chunking,
+            chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
+            preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
+            chunk_overlap_tokens=kwargs.get("chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS),
+        )
+
+        # Add all chunks as nodes
+        nodes = []
+        for chunks in chunked:
+            for chunk_text, chunk_meta in chunks:
+                nodes.append(
+                    {
+                        "text": chunk_text,
+                        "metadata": chunk_meta,
+                        "id_": self._generate_node_id(chunk_text, chunk_meta),
+                        "embedding": None,
+                    }
+                )
 
         # Return as formatted JSON
         return json.dumps(nodes, indent=2, ensure_ascii=False)
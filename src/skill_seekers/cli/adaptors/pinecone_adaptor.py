@@ -128,7 +128,7 @@ class PineconeAdaptor(StreamingAdaptorMixin, SkillAdaptor):
         Returns:
             JSON string containing Pinecone-compatible data
         """
-        vectors: list[dict[str, Any]] = []
+        sources = []
 
         # Convert SKILL.md (main documentation)
         skill_md_path = skill_dir / "SKILL.md"
@@ -144,28 +144,7 @@ class PineconeAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                chunks = self._maybe_chunk_content(
-                    content,
-                    doc_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file="SKILL.md",
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
-
-                for chunk_text, chunk_meta in chunks:
-                    vectors.append(
-                        {
-                            "id": self._generate_id(chunk_text, chunk_meta),
-                            "metadata": {
-                                **chunk_meta,
-                                "text": self._truncate_text_for_metadata(chunk_text),
-                            },
-                        }
-                    )
+                sources.append((content, doc_metadata, "SKILL.md"))
 
         # Convert all reference files
         for ref_file, ref_content in self._iterate_references(skill_dir):
@@ -201,28 +180,29 @@ class PineconeAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                             doc_metadata[key] = frontmatter_fields[key]
                     ref_content = stripped_content
 
-                chunks = self._maybe_chunk_content(
-                    ref_content,
-                    doc_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file=ref_file.name,
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
+                sources.append((ref_content, doc_metadata, ref_file.name))
 
-                for chunk_text, chunk_meta in chunks:
-                    vectors.append(
-                        {
-                            "id": self._generate_id(chunk_text, chunk_meta),
-                            "metadata": {
-                                **chunk_meta,
-                                "text": self._truncate_text_for_metadata(chunk_text),
-                            },
-                        }
-                    )
+        # Chunk if enabled
+        chunked = self._chunk_documents(
+            sources,
+            enable_chunking=enable_chunking,
+            chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
+            preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
+            chunk_overlap_tokens=kwargs.get("chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS),
+        )
+
+        vectors: list[dict[str, Any]] = []
+        for chunks in chunked:
+            for chunk_text, chunk_meta in chunks:
+                vectors.append(
+                    {
+                        "id": self._generate_id(chunk_text, chunk_meta),
+                        "metadata": {
+                            **chunk_meta,
+                            "text": self._truncate_text_for_metadata(chunk_text),
+                        },
+                    }
+                )
 
         index_name = metadata.name.replace("_", "-").lower()
 
@@ -65,7 +65,7 @@ class QdrantAdaptor(StreamingAdaptorMixin, SkillAdaptor):
         Returns:
             JSON string containing Qdrant-compatible data
         """
-        points = []
+        sources = []
 
         # Convert SKILL.md (main documentation)
         skill_md_path = skill_dir / "SKILL.md"
@@ -81,44 +81,7 @@ class QdrantAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    content,
-                    payload_meta,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file="SKILL.md",
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
-
-                # Add all chunks as points
-                for chunk_text, chunk_meta in chunks:
-                    point_id = self._generate_point_id(
-                        chunk_text,
-                        {
-                            "source": chunk_meta.get("source", metadata.name),
-                            "file": chunk_meta.get("file", "SKILL.md"),
-                        },
-                    )
-
-                    points.append(
-                        {
-                            "id": point_id,
-                            "vector": None,  # User will generate embeddings
-                            "payload": {
-                                "content": chunk_text,
-                                "source": chunk_meta.get("source", metadata.name),
-                                "category": chunk_meta.get("category", "overview"),
-                                "file": chunk_meta.get("file", "SKILL.md"),
-                                "type": chunk_meta.get("type", "documentation"),
-                                "version": chunk_meta.get("version", metadata.version),
-                                "doc_version": chunk_meta.get("doc_version", ""),
-                            },
-                        }
-                    )
+                sources.append((content, payload_meta, "SKILL.md"))
 
         # Convert all reference files using base helper method
         for ref_file, ref_content in self._iterate_references(skill_dir):
@@ -134,44 +97,44 @@ class QdrantAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    ref_content,
-                    payload_meta,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file=ref_file.name,
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
+                sources.append((ref_content, payload_meta, ref_file.name))
+
+        # Chunk if enabled
+        chunked = self._chunk_documents(
+            sources,
+            enable_chunking=enable_chunking,
+            chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
+            preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
+            chunk_overlap_tokens=kwargs.get("chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS),
+        )
+
+        # Add all chunks as points
+        points = []
+        for (_, payload_meta, _), chunks in zip(sources, chunked, strict=True):
+            for chunk_text, chunk_meta in chunks:
+                point_id = self._generate_point_id(
+                    chunk_text,
+                    {
+                        "source": chunk_meta.get("source", metadata.name),
+                        "file": chunk_meta.get("file", payload_meta["file"]),
+                    },
                 )
 
-                # Add all chunks as points
-                for chunk_text, chunk_meta in chunks:
-                    point_id = self._generate_point_id(
-                        chunk_text,
-                        {
+                points.append(
+                    {
+                        "id": point_id,
+                        "vector": None,  # User will generate embeddings
+                        "payload": {
+                            "content": chunk_text,
                             "source": chunk_meta.get("source", metadata.name),
-                            "file": chunk_meta.get("file", ref_file.name),
+                            "category": chunk_meta.get("category", payload_meta["category"]),
+                            "file": chunk_meta.get("file", payload_meta["file"]),
+                            "type": chunk_meta.get("type", payload_meta["type"]),
+                            "version": chunk_meta.get("version", metadata.version),
+                            "doc_version": chunk_meta.get("doc_version", ""),
                         },
-                    )
-
-                    points.append(
-                        {
-                            "id": point_id,
-                            "vector": None,  # User will generate embeddings
-                            "payload": {
-                                "content": chunk_text,
-                                "source": chunk_meta.get("source", metadata.name),
-                                "category": chunk_meta.get("category", category),
-                                "file": chunk_meta.get("file", ref_file.name),
-                                "type": chunk_meta.get("type", "reference"),
-                                "version": chunk_meta.get("version", metadata.version),
-                                "doc_version": chunk_meta.get("doc_version", ""),
-                            },
-                        }
-                    )
+                    }
+                )
 
         # Qdrant configuration
         config = {
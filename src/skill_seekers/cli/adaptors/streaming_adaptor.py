@@ -7,6 +7,8 @@ Enables memory-efficient processing of large documentation sets.
 """
 
 import json
+import os
+import shutil
 from pathlib import Path
 from collections.abc import Callable
 from typing import Any
@@ -14,6 +16,146 @@ from typing import Any
 from skill_seekers.cli.streaming_ingest import StreamingIngester, IngestionProgress
 
 
+#: Suffix of the per-array spool files written next to a streaming package.
+SPOOL_SUFFIX = ".part"
+
+
+class StreamingPackageWriter:
+    """
+    Incremental writer for a streaming package's JSON document.
+
+    A platform package is a JSON object whose list-valued keys grow by one
+    element per chunk (e.g. Chroma's parallel ``documents``/``metadatas``/
+    ``ids``). Each element is serialized as soon as its chunk arrives and
+    appended to a spool file per array, so memory use does not grow with the
+    corpus. ``finish`` stitches the envelope and the spools into the final
+    file; the result is byte-identical to
+    ``json.dumps(package, indent=2, ensure_ascii=False)``.
+
+    Spool sizes are exposed through ``state()`` so a checkpoint can resume an
+    interrupted write with ``resume(state)``.
+    """
+
+    def __init__(self, output_path: Path, array_keys: list[str]):
+        """
+        Prepare the writer; spool files are created on the first write.
+
+        Args:
+            output_path: Final package path
+            array_keys: Top-level keys whose values are per-chunk arrays
+        """
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.array_keys = list(array_keys)
+        self.count = 0
+        self._spools: dict[str, Any] = {}
+
+    def _spool_path(self, key: str) -> Path:
+        return self.output_path.with_name(f"{self.output_path.name}.{key}{SPOOL_SUFFIX}")
+
+    def _open_spools(self) -> None:
+        """Create (truncating) one spool file per array key."""
+        if not self._spools:
+            self._spools = {
+                key: open(self._spool_path(key), "w+b")  # noqa: SIM115 - closed in finish/close
+                for key in self.array_keys
+            }
+
+    def write(self, entries: dict[str, Any]) -> None:
+        """Append one chunk's element to every array."""
+        self._open_spools()
+        separator = b",\n" if self.count else b""
+        for key in self.array_keys:
+            element = json.dumps(entries[key], indent=2, ensure_ascii=False)
+            self._spools[key].write(separator + b"    " + _indent(element, "    ").encode("utf-8"))
+        self.count += 1
+
+    def state(self) -> dict[str, Any]:
+        """Flush spools and return what ``resume`` needs to continue the write."""
+        self._open_spools()
+        for spool in self._spools.values():
+            spool.flush()
+        return {
+            "output": str(self.output_path),
+            "chunks_written": self.count,
+            "spool_bytes": {key: spool.tell() for key, spool in self._spools.items()},
+        }
+
+    def resume(self, state: dict[str, Any]) -> bool:
+        """
+        Continue after a previous run's checkpoint ``state``.
+
+        Returns:
+            True if the spools were restored (callers skip ``count`` chunks);
+            False if they are missing or shorter than recorded (start over)
+        """
+        spool_bytes = state.get("spool_bytes", {})
+        if state.get("output") != str(self.output_path) or set(spool_bytes) != set(self.array_keys):
+            return False
+        self.close()
+        spools = {}
+        for key in self.array_keys:
+            path = self._spool_path(key)
+            if not path.exists() or path.stat().st_size < spool_bytes[key]:
+                for spool in spools.values():
+                    spool.close()
+                return False
+            spools[key] = open(path, "r+b")  # noqa: SIM115 - closed in finish/close
+            spools[key].truncate(spool_bytes[key])
+            spools[key].seek(spool_bytes[key])
+        self._spools = spools
+        self.count = state["chunks_written"]
+        return True
+
+    def finish(self, envelope: dict[str, Any]) -> Path:
+        """
+        Write the final package and remove the spools.
+
+        Args:
+            envelope: Top-level package dict in key order; values for the
+                array keys are ignored (the spooled elements are used)
+
+        Returns:
+            Path to the written package
+        """
+        self._open_spools()
+        tmp_path = self.output_path.with_name(self.output_path.name + ".tmp")
+        with open(tmp_path, "wb") as out:
+            out.write(b"{\n")
+            for i, (key, value) in enumerate(envelope.items()):
+                out.write(f"  {json.dumps(key, ensure_ascii=False)}: ".encode())
+                spool = self._spools.get(key)
+                if spool is None:
+                    text = json.dumps(value, indent=2, ensure_ascii=False)
+                    out.write(_indent(text, "  ").encode("utf-8"))
+                elif self.count == 0:
+                    out.write(b"[]")
+                else:
+                    out.write(b"[\n")
+                    spool.flush()
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, out)
+                    out.write(b"\n  ]")
+                out.write(b",\n" if i < len(envelope) - 1 else b"\n")
+            out.write(b"}")
+        os.replace(tmp_path, self.output_path)
+        self.close(remove=True)
+        return self.output_path
+
+    def close(self, remove: bool = False) -> None:
+        """Close the spools, deleting them if ``remove``."""
+        for key, spool in self._spools.items():
+            spool.close()
+            if remove:
+                self._spool_path(key).unlink(missing_ok=True)
+        self._spools = {}
+
+
+def _indent(text: str, prefix: str) -> str:
+    """Indent every line of a json.dumps() result after the first."""
+    return text.replace("\n", "\n" + prefix)
+
+
 class StreamingAdaptorMixin:
     """
     Mixin class to add streaming capabilities to platform adaptors.
@@ -34,20 +176,25 @@ class StreamingAdaptorMixin:
         chunk_overlap: int = 200,
         batch_size: int = 100,
         progress_callback: Callable | None = None,
+        checkpoint_path: Path | None = None,
     ) -> Path:
         """
         Package skill using streaming ingestion.
 
         Memory-efficient alternative to standard package() method.
         Suitable for large documentation sets (>100 documents or >10MB).
+        Chunks are written to the package as they are produced, so memory
+        use stays constant regardless of corpus size.
 
         Args:
             skill_dir: Path to skill directory
             output_path: Output path/filename
             chunk_size: Maximum characters per chunk
             chunk_overlap: Overlap between chunks (for context)
-            batch_size: Number of chunks per batch
+            batch_size: Number of chunks per batch (checkpoint interval)
             progress_callback: Optional callback(progress: IngestionProgress)
+            checkpoint_path: Optional checkpoint file; an interrupted run with
+                the same settings resumes from its last batch
 
         Returns:
             Path to created package file
@@ -82,20 +229,6 @@ class StreamingAdaptorMixin:
             if progress_callback:
                 progress_callback(progress)
 
-        # Stream and collect chunks
-        chunks = ingester.stream_skill_directory(skill_dir, callback=on_progress)
-        all_chunks = list(chunks)
-
-        print(f"\n✅ Streaming ingestion complete!")
-        print(f"   Total chunks: {len(all_chunks)}")
-        print(f"   Total bytes: {ingester.progress.bytes_processed:,}")
-        print(f"   Time: {ingester.progress.elapsed_time:.1f}s")
-        print(f"   Rate: {ingester.progress.chunks_per_second:.1f} chunks/sec")
-
-        # Convert chunks to platform format
-        print(f"\n📦 Converting to {self.PLATFORM_NAME} format...")
-        package_data = self._convert_chunks_to_platform_format(all_chunks, skill_dir.name)
-
         # Determine output filename
         if output_path.is_dir() or str(output_path).endswith("/"):
             output_path = output_path / f"{skill_dir.name}-{self.PLATFORM}-streaming.json"
@@ -105,17 +238,84 @@ class StreamingAdaptorMixin:
                 output_str = output_str.replace(".json", f"-{self.PLATFORM}.json")
             output_path = Path(output_str)
 
-        # Write output
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(
-            json.dumps(package_data, indent=2, ensure_ascii=False), encoding="utf-8"
+        # The empty package gives the key order; its list values are the
+        # arrays each chunk appends to
+        envelope = self._convert_chunks_to_platform_format([], skill_dir.name)
+        writer = StreamingPackageWriter(
+            output_path, [key for key, value in envelope.items() if isinstance(value, list)]
         )
+        checkpoint_settings = {
+            "skill_dir": str(skill_dir.resolve()),
+            "platform": self.PLATFORM,
+            "chunk_size": chunk_size,
+            "chunk_overlap": chunk_overlap,
+        }
+
+        skip = 0
+        if checkpoint_path:
+            state = ingester.load_checkpoint(checkpoint_path)
+            if (
+                state
+                and state.get("settings") == checkpoint_settings
+                and writer.resume(state.get("writer", {}))
+            ):
+                skip = writer.count
+                print(f"   ⏩ Resuming after {skip} chunks from checkpoint")
+
+        # Stream chunks straight into the package
+        print(f"\n📦 Writing {self.PLATFORM_NAME} package...")
+        chunks = ingester.stream_skill_directory(skill_dir, callback=on_progress)
+        try:
+            for index, (chunk_text, chunk_meta) in enumerate(chunks):
+                if index < skip:
+                    continue
+                writer.write(self._streaming_entries(chunk_text, chunk_meta, skill_dir.name))
+                if checkpoint_path and writer.count % batch_size == 0:
+                    ingester.save_checkpoint(
+                        checkpoint_path,
+                        {"settings": checkpoint_settings, "writer": writer.state()},
+                    )
+        except BaseException:
+            # Keep the spools for resume when checkpointing; otherwise clean up
+            writer.close(remove=not checkpoint_path)
+            raise
+
+        total = writer.count
+        if "total_chunks" in envelope:
+            envelope["total_chunks"] = total
+        output_path = writer.finish(envelope)
+        if checkpoint_path:
+            Path(checkpoint_path).unlink(missing_ok=True)
+
+        print(f"\n✅ Streaming ingestion complete!")
+        print(f"   Total chunks: {total}")
+        print(f"   Total bytes: {ingester.progress.bytes_processed:,}")
+        print(f"   Time: {ingester.progress.elapsed_time:.1f}s")
+        print(f"   Rate: {ingester.progress.chunks_per_second:.1f} chunks/sec")
 
         print(f"✅ Package created: {output_path}")
         print(f"   Size: {output_path.stat().st_size:,} bytes")
 
         return output_path
 
+    def _streaming_entries(self, chunk_text: str, chunk_meta: dict, skill_name: str) -> dict:
+        """
+        Array elements one chunk contributes to the streaming package.
+
+        Derived from ``_convert_chunks_to_platform_format`` on a one-chunk
+        list, so adaptors only define their format once.
+
+        Args:
+            chunk_text: Chunk content
+            chunk_meta: Chunk metadata from StreamingIngester
+            skill_name: Name of the skill
+
+        Returns:
+            Top-level array key -> element for this chunk
+        """
+        single = self._convert_chunks_to_platform_format([(chunk_text, chunk_meta)], skill_name)
+        return {key: value[0] for key, value in single.items() if isinstance(value, list)}
+
     def _convert_chunks_to_platform_format(
         self, chunks: list[tuple[str, dict]], skill_name: str
     ) -> dict:
@@ -133,7 +133,7 @@ class WeaviateAdaptor(StreamingAdaptorMixin, SkillAdaptor):
         Returns:
             JSON string containing Weaviate objects and schema
         """
-        objects = []
+        sources = []
 
         # Convert SKILL.md (main documentation)
         skill_md_path = skill_dir / "SKILL.md"
@@ -149,35 +149,7 @@ class WeaviateAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    content,
-                    obj_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file="SKILL.md",
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
-
-                # Add all chunks as objects
-                for chunk_text, chunk_meta in chunks:
-                    objects.append(
-                        {
-                            "id": self._generate_uuid(chunk_text, chunk_meta),
-                            "properties": {
-                                "content": chunk_text,
-                                "source": chunk_meta.get("source", metadata.name),
-                                "category": chunk_meta.get("category", "overview"),
-                                "file": chunk_meta.get("file", "SKILL.md"),
-                                "type": chunk_meta.get("type", "documentation"),
-                                "version": chunk_meta.get("version", metadata.version),
-                                "doc_version": chunk_meta.get("doc_version", ""),
-                            },
-                        }
-                    )
+                sources.append((content, obj_metadata, "SKILL.md"))
 
         # Convert all reference files using base helper method
         for ref_file, ref_content in self._iterate_references(skill_dir):
@@ -194,35 +166,35 @@ class WeaviateAdaptor(StreamingAdaptorMixin, SkillAdaptor):
                     "doc_version": metadata.doc_version,
                 }
 
-                # Chunk if enabled
-                chunks = self._maybe_chunk_content(
-                    ref_content,
-                    obj_metadata,
-                    enable_chunking=enable_chunking,
-                    chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
-                    preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
-                    source_file=ref_file.name,
-                    chunk_overlap_tokens=kwargs.get(
-                        "chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS
-                    ),
-                )
+                sources.append((ref_content, obj_metadata, ref_file.name))
 
-                # Add all chunks as objects
-                for chunk_text, chunk_meta in chunks:
-                    objects.append(
-                        {
-                            "id": self._generate_uuid(chunk_text, chunk_meta),
-                            "properties": {
-                                "content": chunk_text,
-                                "source": chunk_meta.get("source", metadata.name),
-                                "category": chunk_meta.get("category", category),
-                                "file": chunk_meta.get("file", ref_file.name),
-                                "type": chunk_meta.get("type", "reference"),
-                                "version": chunk_meta.get("version", metadata.version),
-                                "doc_version": chunk_meta.get("doc_version", ""),
-                            },
-                        }
-                    )
+        # Chunk if enabled
+        chunked = self._chunk_documents(
+            sources,
+            enable_chunking=enable_chunking,
+            chunk_max_tokens=kwargs.get("chunk_max_tokens", DEFAULT_CHUNK_TOKENS),
+            preserve_code_blocks=kwargs.get("preserve_code_blocks", True),
+            chunk_overlap_tokens=kwargs.get("chunk_overlap_tokens", DEFAULT_CHUNK_OVERLAP_TOKENS),
+        )
+
+        # Add all chunks as objects
+        objects = []
+        for (_, obj_metadata, _), chunks in zip(sources, chunked, strict=True):
+            for chunk_text, chunk_meta in chunks:
+                objects.append(
+                    {
+                        "id": self._generate_uuid(chunk_text, chunk_meta),
+                        "properties": {
+                            "content": chunk_text,
+                            "source": chunk_meta.get("source", metadata.name),
+                            "category": chunk_meta.get("category", obj_metadata["category"]),
+                            "file": chunk_meta.get("file", obj_metadata["file"]),
+                            "type": chunk_meta.get("type", obj_metadata["type"]),
+                            "version": chunk_meta.get("version", metadata.version),
+                            "doc_version": chunk_meta.get("doc_version", ""),
+                        },
+                    }
+                )
 
         # Generate schema
         class_name = "".join(word.capitalize() for word in metadata.name.split("_"))
@@ -0,0 +1,276 @@
+"""
+Persistent per-file cache for codebase analysis results.
+
+analyze_files() stores each file's stage results (signatures, dependencies,
+design patterns, test examples) under a key built from the file's content
+hash, its path within the repository, its language and a fingerprint of the
+analyzer version and stage settings. On the next run only files whose key
+is not cached are analyzed again; the aggregate outputs are rebuilt from the
+cached and fresh per-file results alike.
+
+For git work trees the cache also keeps a snapshot per analyzed directory:
+the commit analyzed last and the keys of the files that were clean at that
+commit. The next run asks git which files changed since then and reuses the
+recorded keys for the rest without reading or hashing them.
+
+Usage:
+    from skill_seekers.cli.analysis_cache import AnalysisCache
+
+    with AnalysisCache("~/.skill-seekers/cache/analysis.db") as cache:
+        results = analyze_files(sources, root, stages, cache=cache)
+        print(cache.stats())  # hits, misses, hit_rate, entries
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+#: Stay below SQLite's default host-parameter limit (999 before 3.32).
+_SQL_BATCH = 500
+
+
+def default_cache_path() -> Path:
+    """``analysis.db`` under $SKILL_SEEKERS_CACHE_DIR (default ~/.skill-seekers/cache)."""
+    env_cache = os.environ.get("SKILL_SEEKERS_CACHE_DIR")
+    base = Path(env_cache).expanduser() if env_cache else Path.home() / ".skill-seekers" / "cache"
+    return base / "analysis.db"
+
+
+def open_analysis_cache(db_path: str | Path | None) -> "AnalysisCache | None":
+    """
+    Open the cache at ``db_path`` for an analysis run.
+
+    A cache that cannot be opened must not fail the analysis, so errors are
+    logged and None (analyze every file) is returned.
+
+    Args:
+        db_path: Database path, or None to disable caching
+
+    Returns:
+        The open cache, or None
+    """
+    if db_path is None:
+        return None
+    try:
+        return AnalysisCache(db_path)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"⚠️  Analysis cache {db_path} unavailable ({e}), not caching")
+        return None
+
+
+def cache_key(relative: str, content: bytes, language: str, fingerprint: str) -> str:
+    """
+    Key for one file's analysis results.
+
+    Args:
+        relative: '/'-separated path within the analyzed directory
+        content: Raw file bytes
+        language: Language from ``detect_language``
+        fingerprint: Analyzer version and stage settings
+
+    Returns:
+        Hex SHA256 key
+    """
+    content_hash = hashlib.sha256(content).hexdigest()
+    return hashlib.sha256(
+        "\0".join((relative, content_hash, language, fingerprint)).encode()
+    ).hexdigest()
+
+
+class AnalysisCache:
+    """
+    SQLite-backed cache of per-file analysis results.
+
+    Values are stored as JSON in a WAL-mode database, so a cache can be
+    shared by successive runs (e.g. CI jobs restoring the cache directory).
+    Reading a cache never executes code from it, but its contents are
+    trusted: whoever can write the database decides the analysis results
+    that are reused.
+    Entries not used for ``ttl_days`` are pruned when the cache is opened.
+    Unreadable entries (e.g. written by an incompatible version) count as
+    misses.
+
+    Examples:
+        cache = AnalysisCache("/path/to/analysis.db")
+        cache.set_many([(key, result)])
+        found = cache.get_many([key, other_key])  # {key: result}
+        cache.stats()  # {"hits": 1, "misses": 1, "hit_rate": 0.5, ...}
+    """
+
+    def __init__(self, db_path: str | Path = ":memory:", ttl_days: int = 30):
+        """
+        Open (or create) an analysis cache.
+
+        Args:
+            db_path: Path to SQLite database (":memory:" for in-memory)
+            ttl_days: Days an unused entry is kept
+        """
+        self.db_path = str(db_path)
+        self.ttl_days = ttl_days
+        self.hits = 0
+        self.misses = 0
+
+        if self.db_path != ":memory:":
+            self.db_path = str(Path(self.db_path).expanduser())
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        if self.db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_results (
+                    key TEXT PRIMARY KEY,
+                    result BLOB NOT NULL,
+                    accessed_at TEXT NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    root TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    git_commit TEXT NOT NULL,
+                    keys TEXT NOT NULL,
+                    accessed_at TEXT NOT NULL,
+                    PRIMARY KEY (root, fingerprint)
+                )
+            """)
+            cutoff = (datetime.utcnow() - timedelta(days=ttl_days)).isoformat()
+            self.conn.execute("DELETE FROM file_results WHERE accessed_at < ?", (cutoff,))
+            self.conn.execute("DELETE FROM snapshots WHERE accessed_at < ?", (cutoff,))
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Look up results, one query per 500 keys.
+
+        Hits and misses are added to :meth:`stats`, and the access time of
+        every hit is refreshed.
+
+        Args:
+            keys: Cache keys from :func:`cache_key`
+
+        Returns:
+            Mapping of key -> cached result for the keys that were found
+        """
+        found: dict[str, Any] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), _SQL_BATCH):
+            batch = unique_keys[start : start + _SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT key, result FROM file_results WHERE key IN ({placeholders})",
+                batch,
+            ).fetchall()
+            for key, blob in rows:
+                try:
+                    found[key] = json.loads(blob)
+                except ValueError:
+                    continue
+
+        if found:
+            now = datetime.utcnow().isoformat()
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE file_results SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+
+        self.hits += len(found)
+        self.misses += len(unique_keys) - len(found)
+        return found
+
+    def set_many(self, items: list[tuple[str, Any]]) -> None:
+        """
+        Store results in a single transaction.
+
+        Args:
+            items: List of (key, result) pairs; results must be JSON-serializable
+        """
+        now = datetime.utcnow().isoformat()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO file_results (key, result, accessed_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(result, separators=(",", ":")), now) for key, result in items],
+            )
+
+    def get_snapshot(self, root: str, fingerprint: str) -> tuple[str, dict[str, str]] | None:
+        """
+        Last recorded snapshot of a directory.
+
+        Args:
+            root: Absolute path of the analyzed directory
+            fingerprint: Analyzer version and stage settings
+
+        Returns:
+            (commit, {relative path: cache key}) or None if never recorded
+        """
+        row = self.conn.execute(
+            "SELECT git_commit, keys FROM snapshots WHERE root = ? AND fingerprint = ?",
+            (root, fingerprint),
+        ).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def set_snapshot(self, root: str, fingerprint: str, commit: str, keys: dict[str, str]) -> None:
+        """
+        Record the commit a directory was analyzed at.
+
+        Args:
+            root: Absolute path of the analyzed directory
+            fingerprint: Analyzer version and stage settings
+            commit: HEAD commit SHA
+            keys: Cache keys of files whose content matches ``commit``
+        """
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO snapshots (root, fingerprint, git_commit, keys, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (root, fingerprint, commit, json.dumps(keys), datetime.utcnow().isoformat()),
+            )
+
+    def clear(self) -> int:
+        """
+        Delete every entry and snapshot.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM snapshots")
+            return self.conn.execute("DELETE FROM file_results").rowcount
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Lookup statistics for this session.
+
+        Returns:
+            hits, misses, hit_rate (0-1, None before any lookup) and the
+            number of stored entries
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "entries": self.conn.execute("SELECT COUNT(*) FROM file_results").fetchone()[0],
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "AnalysisCache":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
@@ -90,6 +90,30 @@ ANALYZE_ARGUMENTS: dict[str, dict[str, Any]] = {
             "metavar": "PATTERNS",
         },
     },
+    "jobs": {
+        "flags": ("--jobs",),
+        "kwargs": {
+            "type": int,
+            "metavar": "N",
+            "help": "Worker processes for per-file code analysis (default: 1, 0 = one per CPU)",
+        },
+    },
+    "analysis_cache": {
+        "flags": ("--analysis-cache",),
+        "kwargs": {
+            "type": str,
+            "metavar": "PATH",
+            "help": "Per-file analysis cache; unchanged files are reused across runs "
+            "(default: ~/.skill-seekers/cache/analysis.db)",
+        },
+    },
+    "no_analysis_cache": {
+        "flags": ("--no-analysis-cache",),
+        "kwargs": {
+            "action": "store_true",
+            "help": "Analyze every file without reading or updating the analysis cache",
+        },
+    },
     # Feature skip options
     "skip_api_reference": {
         "flags": ("--skip-api-reference",),
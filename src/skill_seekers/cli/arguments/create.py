@@ -470,6 +470,31 @@ LOCAL_ARGUMENTS: dict[str, dict[str, Any]] = {
             "metavar": "LEVEL",
         },
     },
+    "jobs": {
+        "flags": ("--jobs",),
+        "kwargs": {
+            "type": int,
+            "metavar": "N",
+            "help": "Worker processes for per-file code analysis and chat export parsing "
+            "(default: 1, 0 = one per CPU)",
+        },
+    },
+    "analysis_cache": {
+        "flags": ("--analysis-cache",),
+        "kwargs": {
+            "type": str,
+            "metavar": "PATH",
+            "help": "Per-file analysis cache; unchanged files are reused across runs "
+            "(default: ~/.skill-seekers/cache/analysis.db)",
+        },
+    },
+    "no_analysis_cache": {
+        "flags": ("--no-analysis-cache",),
+        "kwargs": {
+            "action": "store_true",
+            "help": "Analyze every file without reading or updating the analysis cache",
+        },
+    },
 }
 
 # PDF specific (from pdf.py)
@@ -134,6 +134,15 @@ PACKAGE_ARGUMENTS: dict[str, dict[str, Any]] = {
             "metavar": "N",
         },
     },
+    "chunk_workers": {
+        "flags": ("--chunk-workers",),
+        "kwargs": {
+            "type": int,
+            "default": 1,
+            "help": "Worker processes for RAG chunking of reference files (default: 1)",
+            "metavar": "N",
+        },
+    },
     "no_preserve_code_blocks": {
         "flags": ("--no-preserve-code-blocks",),
         "kwargs": {
@@ -59,6 +59,16 @@ RSS_ARGUMENTS: dict[str, dict[str, Any]] = {
             "metavar": "N",
         },
     },
+    "article_workers": {
+        "flags": ("--article-workers",),
+        "kwargs": {
+            "type": int,
+            "default": 8,
+            "help": "Concurrent article fetches when following links, "
+            "at most one request per second per host (default: 8)",
+            "metavar": "N",
+        },
+    },
     "from_json": {
         "flags": ("--from-json",),
         "kwargs": {
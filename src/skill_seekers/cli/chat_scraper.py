@@ -17,6 +17,14 @@ Extracted content includes messages, threads, reactions, code snippets,
 shared links, attachments, and user references. Messages are categorized
 by channel, date, and detected topic for structured skill output.
 
+Exports are read in place (ZIP members are never extracted to disk) and
+parsed in ``jobs`` worker processes. Each Slack task covers a run of one
+channel's day files up to PARSE_BATCH_BYTES of JSON, and only a few tasks
+per worker are in flight at once, so a huge channel arrives as a stream of
+bounded batches. Past SPOOL_MESSAGES messages the batches go straight into
+a temporary SQLite MessageStore, so multi-year workspace exports do not
+have to fit in memory as message dicts.
+
 Usage:
     # Slack workspace export (directory or ZIP)
     skill-seekers chat --export-path ./slack-export/ --platform slack --name myteam
@@ -34,13 +42,23 @@ Usage:
     skill-seekers chat --from-json myteam_extracted.json --name myteam
 """
 
+import itertools
 import json
 import logging
+import multiprocessing
 import os
+import pickle
 import re
-from collections import defaultdict
+import sqlite3
+import tempfile
+import zipfile
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from skill_seekers.cli.document_skill_builder import DocumentSkillBuilder
 from skill_seekers.cli.scraper_utils import score_code_quality as _score_code_quality
@@ -71,6 +89,15 @@ logger = logging.getLogger(__name__)
 # Maximum messages to fetch per channel when using API mode
 DEFAULT_MAX_MESSAGES = 5000
 
+# Parsed export messages kept in memory before spilling to a MessageStore
+SPOOL_MESSAGES = 200_000
+
+# Uncompressed Slack day-file JSON parsed per worker task (bounds each result)
+PARSE_BATCH_BYTES = 4 * 1024 * 1024
+
+# Parse tasks submitted per worker process ahead of the consumer
+TASKS_IN_FLIGHT_PER_WORKER = 2
+
 # Topic keywords for automatic content categorization
 _TOPIC_KEYWORDS: dict[str, list[str]] = {
     "troubleshooting": [
@@ -199,6 +226,291 @@ def _check_discord_deps() -> None:
         )
 
 
+# ---------------------------------------------------------------------------
+# Export reading and message spooling
+# ---------------------------------------------------------------------------
+
+
+def _section_date(msg: dict) -> str:
+    """Date part (YYYY-MM-DD) of a message's timestamp, for section grouping."""
+    ts = msg.get("timestamp", "")
+    try:
+        return ts[:10] if ts else "unknown"
+    except (TypeError, IndexError):
+        return "unknown"
+
+
+class _SlackExport:
+    """A Slack workspace export, read in place from a directory or a ZIP.
+
+    Channels are the top-level directories and day files the ``*.json``
+    files directly inside them, for both layouts.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._zip = zipfile.ZipFile(path) if path.is_file() else None
+
+    def channels(self) -> dict[str, list[str]]:
+        """Channel name -> sorted day file names."""
+        channels: dict[str, list[str]] = {}
+        if self._zip is None:
+            for channel_dir in self.path.iterdir():
+                if channel_dir.is_dir() and not channel_dir.name.startswith("."):
+                    channels[channel_dir.name] = sorted(f.name for f in channel_dir.glob("*.json"))
+        else:
+            for member in self._zip.namelist():
+                parts = member.split("/")
+                if len(parts) < 2 or parts[0].startswith("."):
+                    continue
+                day_files = channels.setdefault(parts[0], [])
+                if len(parts) == 2 and parts[1].endswith(".json"):
+                    day_files.append(parts[1])
+            for day_files in channels.values():
+                day_files.sort()
+        return dict(sorted(channels.items()))
+
+    def file_size(self, name: str) -> int:
+        """Uncompressed size of one export file, in bytes (0 if missing)."""
+        try:
+            if self._zip is None:
+                return (self.path / name).stat().st_size
+            return self._zip.getinfo(name).file_size
+        except (KeyError, OSError):
+            return 0
+
+    def day_file_batches(
+        self, channel: str, day_files: list[str], max_bytes: int
+    ) -> list[list[str]]:
+        """Split a channel's day files into consecutive runs of at most
+        ``max_bytes`` (a larger single file gets a run of its own).
+
+        A channel without day files still gets one (empty) run.
+        """
+        batches: list[list[str]] = [[]]
+        size = 0
+        for day_file in day_files:
+            file_size = self.file_size(f"{channel}/{day_file}")
+            if batches[-1] and size + file_size > max_bytes:
+                batches.append([])
+                size = 0
+            batches[-1].append(day_file)
+            size += file_size
+        return batches
+
+    def read_json(self, name: str) -> Any:
+        """Parse one export file ('/'-separated path within the export).
+
+        Raises:
+            OSError: If the file is missing or unreadable.
+            ValueError: If it is not valid UTF-8 JSON.
+        """
+        if self._zip is None:
+            with open(self.path / name, encoding="utf-8") as f:
+                return json.load(f)
+        try:
+            data = self._zip.read(name)
+        except KeyError as e:
+            raise FileNotFoundError(f"{name} not in {self.path}") from e
+        return json.loads(data.decode("utf-8"))
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+
+    def __enter__(self) -> "_SlackExport":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+def _parse_slack_channel(
+    converter: "ChatToSkillConverter",
+    export_path: str,
+    channel: str,
+    day_files: list[str],
+    users_map: dict[str, str],
+) -> tuple[str, int, list[dict]]:
+    """Parse a run of one Slack channel's day files (runs in a worker process)."""
+    messages: list[dict] = []
+    with _SlackExport(Path(export_path)) as export:
+        for day_file in day_files:
+            try:
+                day_messages = export.read_json(f"{channel}/{day_file}")
+            except (ValueError, OSError) as e:
+                logger.warning("Failed to parse %s/%s/%s: %s", export_path, channel, day_file, e)
+                continue
+
+            if not isinstance(day_messages, list):
+                continue
+
+            for raw_msg in day_messages:
+                parsed = converter._parse_slack_message(raw_msg, channel, users_map)
+                if parsed:
+                    messages.append(parsed)
+    return channel, len(day_files), messages
+
+
+def _parse_discord_file(
+    converter: "ChatToSkillConverter", json_file: Path
+) -> tuple[str, int, list[dict]] | None:
+    """Parse one DiscordChatExporter channel file (runs in a worker process)."""
+    try:
+        with open(json_file, encoding="utf-8") as f:
+            export_data = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Failed to parse %s: %s", json_file, e)
+        return None
+
+    # DiscordChatExporter format: top-level object with "messages" key
+    if isinstance(export_data, dict):
+        channel_info = export_data.get("channel", {})
+        channel_name = (
+            channel_info.get("name", json_file.stem)
+            if isinstance(channel_info, dict)
+            else json_file.stem
+        )
+        raw_messages = export_data.get("messages", [])
+    elif isinstance(export_data, list):
+        # Some exporters produce a bare list of messages
+        channel_name = json_file.stem
+        raw_messages = export_data
+    else:
+        logger.warning("Unexpected JSON structure in %s", json_file)
+        return None
+
+    messages = []
+    for raw_msg in raw_messages:
+        parsed = converter._parse_discord_message(raw_msg, channel_name)
+        if parsed:
+            messages.append(parsed)
+    return channel_name, len(raw_messages), messages
+
+
+class MessageStore:
+    """Normalized chat messages spooled to a temporary SQLite file.
+
+    Iterates in insertion order, like the list it stands in for. The
+    enrichment steps query it instead of scanning every message: (channel,
+    date) groups one at a time, thread members, messages containing a
+    marker, and per-message summary columns. The database file is deleted
+    on :meth:`close`.
+
+    Examples:
+        with MessageStore() as store:
+            store.add_many(messages)
+            for msg in store.containing("```"): ...
+            for (channel, date), group in store.groups(): ...
+    """
+
+    def __init__(self) -> None:
+        fd, self.db_path = tempfile.mkstemp(prefix="skill-seekers-chat-", suffix=".db")
+        os.close(fd)
+        self._count = 0
+        self.conn = sqlite3.connect(self.db_path)
+        # Scratch data: no journal, no fsync
+        self.conn.execute("PRAGMA journal_mode=OFF")
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute("""
+            CREATE TABLE messages (
+                id INTEGER PRIMARY KEY,
+                channel TEXT NOT NULL,
+                date TEXT NOT NULL,
+                user TEXT,
+                timestamp TEXT,
+                ts TEXT,
+                thread_ts TEXT,
+                has_code INTEGER NOT NULL,
+                data BLOB NOT NULL
+            )
+        """)
+
+    def add_many(self, messages: Iterable[dict]) -> None:
+        """Append messages in a single transaction."""
+        with self.conn:
+            cursor = self.conn.executemany(
+                """
+                INSERT INTO messages
+                (channel, date, user, timestamp, ts, thread_ts, has_code, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    (
+                        msg.get("channel", "general"),
+                        _section_date(msg),
+                        msg.get("user", "unknown"),
+                        msg.get("timestamp", ""),
+                        msg.get("ts", ""),
+                        msg.get("thread_ts") or None,
+                        "```" in msg.get("text", ""),
+                        pickle.dumps(msg, protocol=pickle.HIGHEST_PROTOCOL),
+                    )
+                    for msg in messages
+                ),
+            )
+            self._count += cursor.rowcount
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[dict]:
+        return self._messages("")
+
+    def _messages(self, where: str, params: tuple = ()) -> Iterator[dict]:
+        for (data,) in self.conn.execute(f"SELECT data FROM messages {where} ORDER BY id", params):
+            yield pickle.loads(data)
+
+    def containing(self, marker: str) -> Iterator[dict]:
+        """Messages whose pickled form contains ``marker`` (a superset of
+        those whose text does), in insertion order."""
+        return self._messages("WHERE instr(data, ?) > 0", (marker,))
+
+    def threaded(self) -> Iterator[dict]:
+        """Messages with a ``thread_ts``, in insertion order."""
+        return self._messages("WHERE thread_ts IS NOT NULL")
+
+    def with_ts(self, values: Iterable[str]) -> Iterator[dict]:
+        """Messages whose ``ts`` is one of ``values``, in insertion order."""
+        with self.conn:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted_ts (ts TEXT PRIMARY KEY)")
+            self.conn.execute("DELETE FROM wanted_ts")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO wanted_ts (ts) VALUES (?)", ((v,) for v in values)
+            )
+        return self._messages("WHERE ts IN (SELECT ts FROM wanted_ts)")
+
+    def summary_rows(self) -> Iterator[tuple[str, str, str, bool]]:
+        """(channel, user, timestamp, has_code) per message, in insertion order."""
+        for channel, user, timestamp, has_code in self.conn.execute(
+            "SELECT channel, user, timestamp, has_code FROM messages ORDER BY id"
+        ):
+            yield channel, user, timestamp, bool(has_code)
+
+    def unique_users(self) -> int:
+        """Number of distinct message authors."""
+        return self.conn.execute("SELECT COUNT(DISTINCT user) FROM messages").fetchone()[0]
+
+    def groups(self) -> Iterator[tuple[tuple[str, str], list[dict]]]:
+        """((channel, date), messages) in key order, one group in memory at a time."""
+        rows = self.conn.execute(
+            "SELECT channel, date, data FROM messages ORDER BY channel, date, id"
+        )
+        for key, group in itertools.groupby(rows, key=lambda row: (row[0], row[1])):
+            yield key, [pickle.loads(row[2]) for row in group]
+
+    def close(self) -> None:
+        """Close and delete the database."""
+        self.conn.close()
+        Path(self.db_path).unlink(missing_ok=True)
+
+    def __enter__(self) -> "MessageStore":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
 # ---------------------------------------------------------------------------
 # Helper: code quality scoring (consistent with other scrapers)
 # ---------------------------------------------------------------------------
@@ -245,6 +557,8 @@ class ChatToSkillConverter(DocumentSkillBuilder):
                 - channel (str): Channel ID to fetch (optional, API mode).
                 - max_messages (int): Max messages to fetch per channel
                   (default 5000).
+                - jobs (int): Worker processes parsing export channels
+                  (default 1, 0 = one per CPU).
                 - description (str): Skill description (optional, inferred
                   if absent).
         """
@@ -256,6 +570,7 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         self.token: str = config.get("token", "")
         self.channel: str = config.get("channel", "")
         self.max_messages: int = config.get("max_messages", DEFAULT_MAX_MESSAGES)
+        self.jobs: int = config.get("jobs", 1)
         self.description: str = (
             config.get("description") or f"Use when referencing {self.name} chat knowledge base"
         )
@@ -315,6 +630,14 @@ class ChatToSkillConverter(DocumentSkillBuilder):
                 "or --token (API mode) for chat extraction."
             )
 
+        try:
+            return self._process_messages(messages)
+        finally:
+            if isinstance(messages, MessageStore):
+                messages.close()
+
+    def _process_messages(self, messages: "list[dict] | MessageStore") -> bool:
+        """Enrich, group and save extracted messages (second half of extract_chat)."""
         if not messages:
             logger.warning("No messages extracted from %s source", self.platform)
             print("   ⚠️  No messages were extracted.")
@@ -333,7 +656,10 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         total_threads = len(threads)
         total_code_snippets = len(code_snippets)
         total_links = len(links)
-        unique_users = len({m.get("user", "unknown") for m in messages})
+        if isinstance(messages, MessageStore):
+            unique_users = messages.unique_users()
+        else:
+            unique_users = len({m.get("user", "unknown") for m in messages})
         channels_found = list(channel_summaries.keys())
 
         result_data = {
@@ -457,15 +783,16 @@ class ChatToSkillConverter(DocumentSkillBuilder):
     # Slack export extraction
     # ------------------------------------------------------------------
 
-    def _extract_slack_export(self) -> list[dict]:
-        """Parse a Slack workspace export directory.
+    def _extract_slack_export(self) -> "list[dict] | MessageStore":
+        """Parse a Slack workspace export directory or ZIP.
 
         Slack exports contain one directory per channel, each with JSON
         files named by date (e.g., ``2024-01-15.json``). Each JSON file
-        is a list of message objects.
+        is a list of message objects. ZIP exports are read in place.
 
         Returns:
-            List of normalized message dicts.
+            Normalized messages in channel then day order (a MessageStore
+            for large exports).
 
         Raises:
             FileNotFoundError: If export_path does not exist.
@@ -475,73 +802,43 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         if not export_path.exists():
             raise FileNotFoundError(f"Slack export path not found: {self.export_path}")
 
-        # Handle ZIP archives
-        if export_path.is_file() and export_path.suffix == ".zip":
-            export_path = self._unzip_export(export_path)
-
-        if not export_path.is_dir():
+        is_zip = export_path.is_file() and export_path.suffix == ".zip"
+        if not is_zip and not export_path.is_dir():
             raise ValueError(
                 f"Expected a directory for Slack export, got: {self.export_path}\n"
                 "Slack workspace exports are directories containing channel "
                 "subdirectories with daily JSON files."
             )
 
-        messages: list[dict] = []
-        channel_dirs = sorted(
-            d for d in export_path.iterdir() if d.is_dir() and not d.name.startswith(".")
-        )
-
-        if not channel_dirs:
-            raise ValueError(
-                f"No channel directories found in Slack export: {self.export_path}\n"
-                "Expected subdirectories named after channels (e.g., general/, random/)."
-            )
-
-        # Load users.json if available (for display name resolution)
-        users_map = self._load_slack_users(export_path)
-
-        for channel_dir in channel_dirs:
-            channel_name = channel_dir.name
-            json_files = sorted(channel_dir.glob("*.json"))
-
-            for json_file in json_files:
-                try:
-                    with open(json_file, encoding="utf-8") as f:
-                        day_messages = json.load(f)
-                except (json.JSONDecodeError, OSError) as e:
-                    logger.warning("Failed to parse %s: %s", json_file, e)
-                    continue
-
-                if not isinstance(day_messages, list):
-                    continue
-
-                for raw_msg in day_messages:
-                    parsed = self._parse_slack_message(raw_msg, channel_name, users_map)
-                    if parsed:
-                        messages.append(parsed)
-
-            print(f"   📁 #{channel_name}: {len(json_files)} day file(s)")
+        with _SlackExport(export_path) as export:
+            channels = export.channels()
+            if not channels:
+                raise ValueError(
+                    f"No channel directories found in Slack export: {self.export_path}\n"
+                    "Expected subdirectories named after channels (e.g., general/, random/)."
+                )
+            # Load users.json if available (for display name resolution)
+            users_map = self._load_slack_users(export)
 
-        print(f"   Total messages parsed: {len(messages)}")
-        return messages
+            tasks = [
+                (self, str(export_path), channel, batch, users_map)
+                for channel, day_files in channels.items()
+                for batch in export.day_file_batches(channel, day_files, PARSE_BATCH_BYTES)
+            ]
+        return self._collect_parsed(_parse_slack_channel, tasks, "day file(s)")
 
-    def _load_slack_users(self, export_dir: Path) -> dict[str, str]:
+    def _load_slack_users(self, export: _SlackExport) -> dict[str, str]:
         """Load user ID -> display name mapping from users.json.
 
         Args:
-            export_dir: Root directory of the Slack export.
+            export: The Slack export being read.
 
         Returns:
             Dict mapping user IDs to display names.
         """
-        users_file = export_dir / "users.json"
-        if not users_file.exists():
-            return {}
-
         try:
-            with open(users_file, encoding="utf-8") as f:
-                users_list = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            users_list = export.read_json("users.json")
+        except (ValueError, OSError):
             return {}
 
         users_map: dict[str, str] = {}
@@ -559,27 +856,99 @@ class ChatToSkillConverter(DocumentSkillBuilder):
 
         return users_map
 
-    def _unzip_export(self, zip_path: Path) -> Path:
-        """Extract a ZIP export to a temporary directory.
+    def _collect_parsed(
+        self, func: Callable, tasks: list[tuple], unit: str
+    ) -> "list[dict] | MessageStore":
+        """Gather parse results batch by batch, spilling to disk when large.
+
+        Consecutive batches of the same channel are reported as one
+        progress line. Once spilled, each batch is inserted into the
+        MessageStore as it arrives, so only the batches in flight are held
+        in memory.
 
         Args:
-            zip_path: Path to the ZIP archive.
+            func: Parser returning (channel, count, messages) or None.
+            tasks: Argument tuples for ``func``, in output order.
+            unit: What the per-channel count counts, for the progress line.
 
         Returns:
-            Path to the extracted directory.
+            The messages in task order: a list, or a MessageStore once there
+            are more than SPOOL_MESSAGES of them.
         """
-        import zipfile
+        messages: list[dict] | MessageStore = []
+        current: tuple[str, int] | None = None
+        try:
+            for result in self._map_tasks(func, tasks):
+                if result is None:
+                    continue
+                channel_name, count, parsed = result
+                if isinstance(messages, list) and len(messages) + len(parsed) > SPOOL_MESSAGES:
+                    store = MessageStore()
+                    store.add_many(messages)
+                    messages = store
+                    print(f"   Spilling messages to {store.db_path}")
+                if isinstance(messages, MessageStore):
+                    messages.add_many(parsed)
+                else:
+                    messages.extend(parsed)
+                del parsed
+                if current is not None and current[0] == channel_name:
+                    count += current[1]
+                elif current is not None:
+                    print(f"   📁 #{current[0]}: {current[1]} {unit}")
+                current = (channel_name, count)
+            if current is not None:
+                print(f"   📁 #{current[0]}: {current[1]} {unit}")
+        except BaseException:
+            if isinstance(messages, MessageStore):
+                messages.close()
+            raise
 
-        extract_dir = zip_path.parent / zip_path.stem
-        if extract_dir.exists():
-            print(f"   Using existing extracted directory: {extract_dir}")
-            return extract_dir
+        print(f"   Total messages parsed: {len(messages)}")
+        return messages
 
-        print(f"   Extracting ZIP: {zip_path} -> {extract_dir}")
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_dir)
+    def _map_tasks(self, func: Callable, tasks: list[tuple]) -> Iterator:
+        """Run ``func(*task)`` for every task, in ``jobs`` worker processes.
 
-        return extract_dir
+        Results are yielded in task order. At most TASKS_IN_FLIGHT_PER_WORKER
+        tasks per worker are submitted ahead of the consumer, so finished
+        results never pile up in this process while it is busy storing an
+        earlier one.
+        """
+        workers = min(self.jobs or os.cpu_count() or 1, len(tasks))
+        if workers <= 1:
+            for task in tasks:
+                yield func(*task)
+            return
+
+        print(f"   Parsing {len(tasks)} batch(es) with {workers} worker processes")
+        done = 0
+        # spawn, not fork: callers may hold threads or open pools
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                remaining = iter(tasks)
+                pending = deque(
+                    pool.submit(func, *task)
+                    for task in itertools.islice(remaining, workers * TASKS_IN_FLIGHT_PER_WORKER)
+                )
+                while pending:
+                    result = pending.popleft().result()
+                    done += 1
+                    task = next(remaining, None)
+                    if task is not None:
+                        pending.append(pool.submit(func, *task))
+                    yield result
+                    del result
+        except BrokenProcessPool as e:
+            logger.warning(
+                "⚠️  Parsing pool failed (%s); parsing the remaining %d batch(es) in-process",
+                e,
+                len(tasks) - done,
+            )
+            for task in tasks[done:]:
+                yield func(*task)
 
     # ------------------------------------------------------------------
     # Slack API extraction
@@ -722,7 +1091,7 @@ class ChatToSkillConverter(DocumentSkillBuilder):
     # Discord export extraction
     # ------------------------------------------------------------------
 
-    def _extract_discord_export(self) -> list[dict]:
+    def _extract_discord_export(self) -> "list[dict] | MessageStore":
         """Parse a Discord chat export in DiscordChatExporter JSON format.
 
         DiscordChatExporter produces a single JSON file per channel with
@@ -730,7 +1099,8 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         ``author``, ``timestamp``, ``attachments``, ``reactions``, etc.
 
         Returns:
-            List of normalized message dicts.
+            Normalized messages in file order (a MessageStore for large
+            exports).
 
         Raises:
             FileNotFoundError: If export_path does not exist.
@@ -752,42 +1122,8 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         if not json_files:
             raise ValueError(f"No JSON files found in Discord export: {self.export_path}")
 
-        messages: list[dict] = []
-
-        for json_file in json_files:
-            try:
-                with open(json_file, encoding="utf-8") as f:
-                    export_data = json.load(f)
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning("Failed to parse %s: %s", json_file, e)
-                continue
-
-            # DiscordChatExporter format: top-level object with "messages" key
-            if isinstance(export_data, dict):
-                channel_info = export_data.get("channel", {})
-                channel_name = (
-                    channel_info.get("name", json_file.stem)
-                    if isinstance(channel_info, dict)
-                    else json_file.stem
-                )
-                raw_messages = export_data.get("messages", [])
-            elif isinstance(export_data, list):
-                # Some exporters produce a bare list of messages
-                channel_name = json_file.stem
-                raw_messages = export_data
-            else:
-                logger.warning("Unexpected JSON structure in %s", json_file)
-                continue
-
-            for raw_msg in raw_messages:
-                parsed = self._parse_discord_message(raw_msg, channel_name)
-                if parsed:
-                    messages.append(parsed)
-
-            print(f"   📁 #{channel_name}: {len(raw_messages)} messages")
-
-        print(f"   Total messages parsed: {len(messages)}")
-        return messages
+        tasks = [(self, json_file) for json_file in json_files]
+        return self._collect_parsed(_parse_discord_file, tasks, "messages")
 
     # ------------------------------------------------------------------
     # Discord API extraction
@@ -1139,14 +1475,14 @@ class ChatToSkillConverter(DocumentSkillBuilder):
     # Content enrichment
     # ------------------------------------------------------------------
 
-    def _extract_code_snippets(self, messages: list[dict]) -> list[dict]:
+    def _extract_code_snippets(self, messages: Iterable[dict]) -> list[dict]:
         """Extract fenced code blocks from all messages.
 
         Detects triple-backtick fenced code blocks (````` ```lang ... ``` `````)
         and inline code that spans multiple lines.
 
         Args:
-            messages: List of normalized message dicts.
+            messages: Normalized message dicts (a list or a MessageStore).
 
         Returns:
             List of code snippet dicts with 'code', 'language',
@@ -1154,6 +1490,8 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         """
         snippets: list[dict] = []
         code_block_pattern = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+        if isinstance(messages, MessageStore):
+            messages = messages.containing("```")
 
         for msg in messages:
             text = msg.get("text", "")
@@ -1176,13 +1514,13 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         snippets.sort(key=lambda x: x.get("quality_score", 0), reverse=True)
         return snippets
 
-    def _extract_links(self, messages: list[dict]) -> list[dict]:
+    def _extract_links(self, messages: Iterable[dict]) -> list[dict]:
         """Extract shared URLs from all messages.
 
         Finds HTTP/HTTPS URLs in message text and deduplicates by URL.
 
         Args:
-            messages: List of normalized message dicts.
+            messages: Normalized message dicts (a list or a MessageStore).
 
         Returns:
             List of link dicts with 'url', 'channel', 'user', 'timestamp',
@@ -1191,6 +1529,8 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         links: list[dict] = []
         seen_urls: set[str] = set()
         url_pattern = re.compile(r"https?://[^\s<>\"')\]]+")
+        if isinstance(messages, MessageStore):
+            messages = messages.containing("http")
 
         for msg in messages:
             text = msg.get("text", "")
@@ -1217,7 +1557,7 @@ class ChatToSkillConverter(DocumentSkillBuilder):
 
         return links
 
-    def _identify_threads(self, messages: list[dict]) -> list[dict]:
+    def _identify_threads(self, messages: Iterable[dict]) -> list[dict]:
         """Group messages into conversation threads.
 
         Threads are identified by shared ``thread_ts`` values (Slack)
@@ -1225,7 +1565,7 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         parent message and its replies in chronological order.
 
         Args:
-            messages: List of normalized message dicts.
+            messages: Normalized message dicts (a list or a MessageStore).
 
         Returns:
             List of thread dicts with 'parent', 'replies', 'channel',
@@ -1233,17 +1573,20 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         """
         # Group by thread_ts
         thread_map: dict[str, list[dict]] = defaultdict(list)
-        msg_by_ts: dict[str, dict] = {}
+        for msg in messages.threaded() if isinstance(messages, MessageStore) else messages:
+            thread_ts = msg.get("thread_ts")
+            if thread_ts:
+                thread_map[thread_ts].append(msg)
 
+        # Second pass for the parents only, instead of indexing every message
+        msg_by_ts: dict[str, dict] = {}
+        if isinstance(messages, MessageStore):
+            messages = messages.with_ts(thread_map)
         for msg in messages:
             ts = msg.get("ts", "")
-            if ts:
+            if ts and ts in thread_map:
                 msg_by_ts[ts] = msg
 
-            thread_ts = msg.get("thread_ts")
-            if thread_ts:
-                thread_map[thread_ts].append(msg)
-
         threads: list[dict] = []
         for thread_ts, thread_msgs in thread_map.items():
             if len(thread_msgs) < 2:
@@ -1268,41 +1611,65 @@ class ChatToSkillConverter(DocumentSkillBuilder):
 
         return threads
 
-    def _summarize_channels(self, messages: list[dict]) -> dict[str, dict]:
+    def _summarize_channels(self, messages: Iterable[dict]) -> dict[str, dict]:
         """Generate summary statistics for each channel.
 
         Args:
-            messages: List of normalized message dicts.
+            messages: Normalized message dicts (a list or a MessageStore).
 
         Returns:
             Dict mapping channel names to summary dicts with message_count,
             unique_users, date_range, top_users, and has_code.
         """
-        channel_data: dict[str, list[dict]] = defaultdict(list)
-        for msg in messages:
-            channel_data[msg.get("channel", "unknown")].append(msg)
+        if isinstance(messages, MessageStore):
+            rows = messages.summary_rows()
+        else:
+            rows = (
+                (
+                    msg.get("channel", "unknown"),
+                    msg.get("user", "unknown"),
+                    msg.get("timestamp", ""),
+                    "```" in msg.get("text", ""),
+                )
+                for msg in messages
+            )
 
-        summaries: dict[str, dict] = {}
-        for channel, ch_messages in channel_data.items():
-            users = [m.get("user", "unknown") for m in ch_messages]
-            user_counts: dict[str, int] = defaultdict(int)
-            for u in users:
-                user_counts[u] += 1
+        # Running totals per channel, so messages are seen once and not kept
+        channel_stats: dict[str, dict] = {}
+        for channel, user, timestamp, has_code in rows:
+            stats = channel_stats.setdefault(
+                channel,
+                {
+                    "count": 0,
+                    "user_counts": defaultdict(int),
+                    "earliest": "",
+                    "latest": "",
+                    "has_code": False,
+                },
+            )
+            stats["count"] += 1
+            stats["user_counts"][user] += 1
+            if timestamp:
+                if not stats["earliest"] or timestamp < stats["earliest"]:
+                    stats["earliest"] = timestamp
+                if not stats["latest"] or timestamp > stats["latest"]:
+                    stats["latest"] = timestamp
+            stats["has_code"] = stats["has_code"] or has_code
 
+        summaries: dict[str, dict] = {}
+        for channel, stats in channel_stats.items():
+            user_counts = stats["user_counts"]
             top_users = sorted(user_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-            timestamps = [m.get("timestamp", "") for m in ch_messages if m.get("timestamp")]
-
-            has_code = any("```" in m.get("text", "") for m in ch_messages)
 
             summaries[channel] = {
-                "message_count": len(ch_messages),
-                "unique_users": len(set(users)),
+                "message_count": stats["count"],
+                "unique_users": len(user_counts),
                 "date_range": {
-                    "earliest": min(timestamps) if timestamps else "",
-                    "latest": max(timestamps) if timestamps else "",
+                    "earliest": stats["earliest"],
+                    "latest": stats["latest"],
                 },
                 "top_users": [{"user": u, "count": c} for u, c in top_users],
-                "has_code": has_code,
+                "has_code": stats["has_code"],
             }
 
         return summaries
@@ -1314,7 +1681,7 @@ class ChatToSkillConverter(DocumentSkillBuilder):
     # Section building
     # ------------------------------------------------------------------
 
-    def _build_sections(self, messages: list[dict], threads: list[dict]) -> list[dict]:
+    def _build_sections(self, messages: Iterable[dict], threads: list[dict]) -> list[dict]:
         """Build sections from messages, grouping by channel and date.
 
         Each section represents a chunk of conversation from a single
@@ -1322,28 +1689,24 @@ class ChatToSkillConverter(DocumentSkillBuilder):
         pipeline's intermediate JSON 'pages' format.
 
         Args:
-            messages: List of normalized message dicts.
+            messages: Normalized message dicts (a list or a MessageStore).
             threads: List of thread dicts (for enrichment).
 
         Returns:
             List of section dicts with heading, text, code_samples, etc.
         """
-        # Group by (channel, date)
-        groups: dict[tuple[str, str], list[dict]] = defaultdict(list)
-        for msg in messages:
-            channel = msg.get("channel", "general")
-            ts = msg.get("timestamp", "")
-            try:
-                date_str = ts[:10] if ts else "unknown"
-            except (TypeError, IndexError):
-                date_str = "unknown"
-            groups[(channel, date_str)].append(msg)
+        # Group by (channel, date); a MessageStore groups on disk
+        if isinstance(messages, MessageStore):
+            grouped = messages.groups()
+        else:
+            groups: dict[tuple[str, str], list[dict]] = defaultdict(list)
+            for msg in messages:
+                groups[(msg.get("channel", "general"), _section_date(msg))].append(msg)
+            grouped = iter(sorted(groups.items()))
 
         sections: list[dict] = []
 
-        for section_number, ((channel, date_str), group_msgs) in enumerate(
-            sorted(groups.items()), 1
-        ):
+        for section_number, ((channel, date_str), group_msgs) in enumerate(grouped, 1):
             # Sort messages chronologically
             group_msgs.sort(key=lambda m: m.get("timestamp", ""))
 
@@ -87,12 +87,21 @@ class CodeAnalyzer:
         """
         self.depth = depth
         self._newline_offsets: list[int] = []
+        # Caller-supplied line index for the file being analyzed (see analyze_file)
+        self._shared_line_index: list[int] | None = None
 
     def _offset_to_line(self, offset: int) -> int:
         """Convert a character offset to a 1-based line number using bisect."""
         return offset_to_line(self._newline_offsets, offset)
 
-    def analyze_file(self, file_path: str, content: str, language: str) -> dict[str, Any]:
+    def analyze_file(
+        self,
+        file_path: str,
+        content: str,
+        language: str,
+        tree: ast.Module | None = None,
+        line_index: list[int] | None = None,
+    ) -> dict[str, Any]:
         """
         Analyze a single file based on depth level.
 
@@ -100,6 +109,8 @@ class CodeAnalyzer:
             file_path: Path to file in repository
             content: File content as string
             language: Programming language (Python, JavaScript, C#, Go, Rust, Java, Ruby, PHP, etc.)
+            tree: Already-parsed AST of ``content`` (Python only), to skip re-parsing
+            line_index: Already-built ``build_line_index(content)``
 
         Returns:
             Dict containing extracted signatures
@@ -109,9 +120,10 @@ class CodeAnalyzer:
 
         logger.debug(f"Analyzing {file_path} (language: {language}, depth: {self.depth})")
 
+        self._shared_line_index = line_index
         try:
             if language == "Python":
-                return self._analyze_python(content, file_path)
+                return self._analyze_python(content, file_path, tree)
             elif language == "GDScript":
                 # GDScript has Godot-specific syntax, use dedicated parser
                 return self._analyze_gdscript(content, file_path)
@@ -145,14 +157,25 @@ class CodeAnalyzer:
         except Exception as e:
             logger.warning(f"Error analyzing {file_path}: {e}")
             return {}
-
-    def _analyze_python(self, content: str, file_path: str) -> dict[str, Any]:
+        finally:
+            self._shared_line_index = None
+
+    def _index_lines(self, content: str) -> list[int]:
+        """Line index for ``content``, reusing the one passed to analyze_file."""
+        if self._shared_line_index is not None:
+            return self._shared_line_index
+        return build_line_index(content)
+
+    def _analyze_python(
+        self, content: str, file_path: str, tree: ast.Module | None = None
+    ) -> dict[str, Any]:
         """Analyze Python file using AST."""
-        try:
-            tree = ast.parse(content)
-        except SyntaxError as e:
-            logger.debug(f"Syntax error in {file_path}: {e}")
-            return {}
+        if tree is None:
+            try:
+                tree = ast.parse(content)
+            except SyntaxError as e:
+                logger.debug(f"Syntax error in {file_path}: {e}")
+                return {}
 
         classes = []
         functions = []
@@ -285,7 +308,7 @@ class CodeAnalyzer:
         Note: This is a simplified approach. For production, consider using
         a proper JS/TS parser like esprima or ts-morph.
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         classes = []
         functions = []
 
@@ -497,7 +520,7 @@ class CodeAnalyzer:
         Note: This is a simplified approach focusing on header files.
         For production, consider using libclang or similar.
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         classes = []
         functions = []
 
@@ -879,7 +902,7 @@ class CodeAnalyzer:
         Regex patterns inspired by C# language specification:
         https://learn.microsoft.com/en-us/dotnet/csharp/language-reference/
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         classes = []
         functions = []
 
@@ -1090,7 +1113,7 @@ class CodeAnalyzer:
         Regex patterns based on Go language specification:
         https://go.dev/ref/spec
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         classes = []  # Go doesn't have classes, but we'll extract structs
         functions = []
 
@@ -1200,7 +1223,7 @@ class CodeAnalyzer:
         Regex patterns based on Rust language reference:
         https://doc.rust-lang.org/reference/
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         classes = []  # Rust uses structs/enums/traits
         functions = []
 
@@ -1319,7 +1342,7 @@ class CodeAnalyzer:
         Regex patterns based on Java language specification:
         https://docs.oracle.com/javase/specs/
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         classes = []
         functions = []
 
@@ -1523,7 +1546,7 @@ class CodeAnalyzer:
         Regex patterns based on Kotlin language specification:
         https://kotlinlang.org/spec/
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         structural_content = self._mask_c_style_non_code(
             content,
             mask_comments=True,
@@ -1815,7 +1838,7 @@ class CodeAnalyzer:
         Regex patterns based on Ruby language documentation:
         https://ruby-doc.org/
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         classes = []
         functions = []
 
@@ -1933,7 +1956,7 @@ class CodeAnalyzer:
         Regex patterns based on PHP language reference:
         https://www.php.net/manual/en/langref.php
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         classes = []
         functions = []
 
@@ -2280,7 +2303,7 @@ class CodeAnalyzer:
         - @export var speed: float = 100.0
         - @onready var sprite = $Sprite2D
         """
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = self._index_lines(content)
         classes = []
         functions = []
         signals = []
@@ -31,10 +31,11 @@ import re
 from pathlib import Path
 from typing import Any
 
+from skill_seekers.cli.analysis_cache import default_cache_path, open_analysis_cache
 from skill_seekers.cli.api_reference_builder import APIReferenceBuilder
-from skill_seekers.cli.code_analyzer import CodeAnalyzer
 from skill_seekers.cli.config_extractor import ConfigExtractor
 from skill_seekers.cli.dependency_analyzer import DependencyAnalyzer
+from skill_seekers.cli.file_analysis import DEFAULT_FILE_TIMEOUT, FileStages, analyze_files
 from skill_seekers.cli.signal_flow_analyzer import SignalFlowAnalyzer
 from skill_seekers.cli.skill_converter import SkillConverter
 
@@ -985,6 +986,9 @@ def analyze_codebase(
     doc_version: str = "",
     agent: str | None = None,
     agent_cmd: str | None = None,
+    jobs: int = 1,
+    file_timeout: float | None = DEFAULT_FILE_TIMEOUT,
+    analysis_cache: str | Path | None = None,
 ) -> dict[str, Any]:
     """
     Analyze local codebase and extract code knowledge.
@@ -1006,6 +1010,10 @@ def analyze_codebase(
         enhance_level: AI enhancement level (0=off, 1=SKILL.md only, 2=+config+arch+docs, 3=full)
         skill_name: Optional override for skill name (default: directory name)
         skill_description: Optional override for skill description
+        jobs: Worker processes for per-file analysis (1 = serial, 0 = one per CPU)
+        file_timeout: Seconds before a single file's analysis is abandoned
+        analysis_cache: SQLite database of per-file results reused across runs
+            (None = analyze every file)
 
     Returns:
         Analysis results dictionary
@@ -1051,54 +1059,32 @@ def analyze_codebase(
         files = [f for f in files if detect_language(f) in language_set]
         logger.info(f"Filtered to {len(files)} files for languages: {', '.join(languages)}")
 
-    # Initialize code analyzer
-    analyzer = CodeAnalyzer(depth=depth)
+    cache = open_analysis_cache(analysis_cache)
 
-    # Analyze each file
-    results = {"files": []}
-    analyzed_count = 0
-
-    for file_path in files:
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            language = detect_language(file_path)
-
-            if language == "Unknown":
-                continue
-
-            # Analyze file
-            analysis = analyzer.analyze_file(str(file_path), content, language)
-
-            # Only include files with actual analysis results
-            # Check for any meaningful content (classes, functions, imports, nodes, properties, etc.)
-            # IMPORTANT: Include files with imports for framework detection (fixes #239)
-            has_content = (
-                analysis.get("classes")
-                or analysis.get("functions")
-                or analysis.get("imports")  # Include import-only files (fixes #239)
-                or analysis.get("nodes")  # Godot scenes
-                or analysis.get("properties")  # Godot resources
-                or analysis.get("uniforms")  # Godot shaders
-                or analysis.get("signals")  # GDScript signals
-                or analysis.get("exports")  # GDScript exports
-            )
-
-            if analysis and has_content:
-                results["files"].append(
-                    {
-                        "file": str(file_path.relative_to(directory)),
-                        "language": language,
-                        **analysis,
-                    }
-                )
-                analyzed_count += 1
-
-                if analyzed_count % 10 == 0:
-                    logger.info(f"Analyzed {analyzed_count}/{len(files)} files...")
-
-        except Exception as e:
-            logger.warning(f"Error analyzing {file_path}: {e}")
-            continue
+    # Read and parse each file once and run every per-file stage on it (in
+    # worker processes when jobs > 1), skipping files whose results are
+    # cached. Results keep the sorted walk order, so the outputs don't depend
+    # on jobs or on the cache.
+    try:
+        file_results = analyze_files(
+            [(f, language) for f in files if (language := detect_language(f)) != "Unknown"],
+            directory,
+            FileStages(
+                depth=depth,
+                dependencies=build_dependency_graph,
+                patterns=detect_patterns,
+                test_examples=extract_test_examples,
+                test_languages=tuple(languages) if languages else None,
+            ),
+            jobs=jobs,
+            file_timeout=file_timeout,
+            cache=cache,
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+    results = {"files": [r.entry for r in file_results if r.entry is not None]}
+    analyzed_count = len(results["files"])
 
     logger.info(f"✅ Successfully analyzed {analyzed_count} files")
     if analyzed_count == 0 and depth == "surface" and files:
@@ -1130,22 +1116,15 @@ def analyze_codebase(
         logger.info("Building dependency graph...")
         dep_analyzer = DependencyAnalyzer()
 
-        # Analyze dependencies for all files
-        for file_path in files:
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-                language = detect_language(file_path)
-
-                if language != "Unknown":
-                    # Use relative path from directory for better graph
-                    # readability. as_posix() keeps node keys '/'-separated on
-                    # Windows too — import resolution matches on '/' suffixes,
-                    # so backslash keys would silently produce zero edges (#425).
-                    rel_path = file_path.relative_to(directory).as_posix()
-                    dep_analyzer.analyze_file(rel_path, content, language)
-            except Exception as e:
-                logger.warning(f"Error analyzing dependencies for {file_path}: {e}")
-                continue
+        # Dependencies were extracted per file above, keyed by the relative
+        # '/'-separated path for graph readability (#425)
+        for file_result in file_results:
+            if file_result.dependencies is not None:
+                dep_analyzer.add_file(
+                    file_result.relative.as_posix(),
+                    file_result.language,
+                    file_result.dependencies,
+                )
 
         # Build the graph
         graph = dep_analyzer.build_graph()
@@ -1225,25 +1204,10 @@ def analyze_codebase(
     # Detect design patterns if requested (C3.1)
     if detect_patterns:
         logger.info("Detecting design patterns...")
-        from skill_seekers.cli.pattern_recognizer import PatternRecognizer
-
-        # Step 1: Detect patterns WITHOUT enhancement (collect all first)
-        pattern_recognizer = PatternRecognizer(depth=depth, enhance_with_ai=False)
-        pattern_results = []
-
-        for file_path in files:
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-                language = detect_language(file_path)
 
-                if language != "Unknown":
-                    report = pattern_recognizer.analyze_file(str(file_path), content, language)
-
-                    if report.patterns:
-                        pattern_results.append(report.to_dict())
-            except Exception as e:
-                logger.warning(f"Pattern detection failed for {file_path}: {e}")
-                continue
+        # Step 1: Patterns were detected WITHOUT enhancement per file above,
+        # reusing each file's code analysis
+        pattern_results = [r.patterns for r in file_results if r.patterns]
 
         # Step 2: Enhance ALL patterns at once (batched across all files)
         if enhance_patterns and pattern_results:
@@ -1333,9 +1297,15 @@ def analyze_codebase(
             enhance_with_ai=enhance_tests,
         )
 
-        # Extract examples from directory
+        # Examples were extracted per test file above; this only builds the
+        # report (and runs AI enhancement over all examples at once)
         try:
-            example_report = test_extractor.extract_from_directory(directory, recursive=True)
+            test_files = [r for r in file_results if test_extractor.is_test_file(r.relative)]
+            logger.info(f"Found {len(test_files)} test files in {directory}")
+            example_report = test_extractor._create_report(
+                [example for r in test_files for example in r.test_examples],
+                directory=str(directory),
+            )
 
             if example_report.total_examples > 0:
                 # Save results
@@ -2206,6 +2176,10 @@ class CodebaseAnalyzer(SkillConverter):
         self.skill_name = config.get("skill_name") or self.name
         self.skill_description = config.get("skill_description")
         self.doc_version = config.get("doc_version", "")
+        self.jobs = config.get("jobs", 1)
+        self.file_timeout = config.get("file_timeout", DEFAULT_FILE_TIMEOUT)
+        # None disables the cache
+        self.analysis_cache = config.get("analysis_cache", default_cache_path())
         self._results: dict[str, Any] | None = None
 
     def extract(self):
@@ -2228,6 +2202,9 @@ class CodebaseAnalyzer(SkillConverter):
             skill_name=self.skill_name,
             skill_description=self.skill_description,
             doc_version=self.doc_version,
+            jobs=self.jobs,
+            file_timeout=self.file_timeout,
+            analysis_cache=self.analysis_cache,
         )
 
     def build_skill(self):
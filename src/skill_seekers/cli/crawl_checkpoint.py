@@ -0,0 +1,255 @@
+"""
+Incremental crawl checkpoints for the documentation scraper.
+
+The old checkpoint rewrote the whole ``visited_urls`` set and pending queue as
+indented JSON every ``checkpoint_interval`` pages, so each save cost O(crawl
+size). Checkpoints are now a snapshot plus an append-only journal:
+
+    <name>_data/checkpoint.json           snapshot (same format as before)
+    <name>_data/checkpoint.json.journal   one JSON event per line since the snapshot
+
+Between checkpoints the scraper only buffers events (``visited`` /
+``enqueued``); a checkpoint appends the buffered delta followed by a commit
+record, so its cost is proportional to the pages crawled since the previous
+one. Once the journal holds more events than the snapshot has URLs it is
+compacted into a fresh snapshot, which keeps total checkpoint work linear in
+the crawl and replay time bounded.
+
+Crash safety: the snapshot is still replaced atomically, and replay stops at
+the last commit record, so a torn journal write rolls back to the previous
+checkpoint exactly like an interrupted snapshot write used to. Each snapshot
+carries a ``journal_id``; a journal left over from before a compaction has a
+different id and is ignored.
+
+Usage:
+    journal = CheckpointJournal("output/react_data/checkpoint.json")
+    journal.record_enqueued(url)
+    journal.record_visited(url)
+    journal.save(state_fn, pages_scraped=120)   # appends only the delta
+
+    state = journal.load()   # snapshot + replayed journal, or None
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+JOURNAL_SUFFIX = ".journal"
+
+#: Never compact before the journal holds this many events.
+MIN_COMPACT_EVENTS = 10_000
+
+_VISITED = "v"
+_ENQUEUED = "e"
+_COMMIT = "c"
+_HEADER = "h"
+
+
+def _timestamp() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+class CheckpointJournal:
+    """
+    Snapshot + append-only event journal for one crawl checkpoint.
+
+    ``record_*`` calls are O(1) and only touch memory; ``save`` writes the
+    buffered events. Safe to call from the thread-pool scraper's workers.
+    """
+
+    def __init__(self, checkpoint_file: str, min_compact_events: int = MIN_COMPACT_EVENTS):
+        """
+        Initialize the journal.
+
+        Args:
+            checkpoint_file: Snapshot path (the journal lives next to it)
+            min_compact_events: Journal length below which no compaction happens
+        """
+        self.checkpoint_file = checkpoint_file
+        self.journal_file = f"{checkpoint_file}{JOURNAL_SUFFIX}"
+        self.min_compact_events = min_compact_events
+        self._lock = threading.Lock()
+        self._buffer: list[str] = []
+        self._journal_id: str | None = None  # id of the snapshot the journal extends
+        self._committed_end: int | None = None  # journal length to keep after a resume
+        self._snapshot_urls = 0
+        self._journal_events = 0
+
+    # ── Recording ────────────────────────────────────────────────────────
+
+    def record_visited(self, url: str) -> None:
+        """Buffer a "URL was taken off the queue and visited" event."""
+        event = json.dumps([_VISITED, url], ensure_ascii=False)
+        with self._lock:
+            self._buffer.append(event)
+
+    def record_enqueued(self, url: str) -> None:
+        """Buffer a "URL was added to the pending queue" event."""
+        event = json.dumps([_ENQUEUED, url], ensure_ascii=False)
+        with self._lock:
+            self._buffer.append(event)
+
+    # ── Saving ───────────────────────────────────────────────────────────
+
+    def save(
+        self,
+        snapshot_state: Callable[[], dict[str, Any]],
+        pages_scraped: int,
+        force_snapshot: bool = False,
+    ) -> bool:
+        """
+        Persist everything recorded since the previous save.
+
+        Args:
+            snapshot_state: Returns the full checkpoint dict; only called when
+                a snapshot (first save or compaction) is due
+            pages_scraped: Current page counter, stored in the commit record
+            force_snapshot: Write a full snapshot regardless of journal length
+
+        Returns:
+            True if a full snapshot was written, False if only the delta was
+        """
+        with self._lock:
+            events, self._buffer = self._buffer, []
+            if (
+                force_snapshot
+                or self._journal_id is None
+                or self._journal_events + len(events)
+                > max(self.min_compact_events, self._snapshot_urls)
+            ):
+                self._write_snapshot(snapshot_state())
+                return True
+
+            commit = json.dumps([_COMMIT, pages_scraped, _timestamp()])
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                if self._committed_end is not None:
+                    # First append after a resume: drop any uncommitted tail
+                    f.truncate(self._committed_end)
+                    self._committed_end = None
+                f.write("\n".join([*events, commit]) + "\n")
+            self._journal_events += len(events)
+            return False
+
+    def _write_snapshot(self, state: dict[str, Any]) -> None:
+        """Atomically replace the snapshot, then start a new journal for it."""
+        journal_id = uuid.uuid4().hex
+        state = {**state, "journal_id": journal_id}
+        tmp_file = f"{self.checkpoint_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_file, self.checkpoint_file)
+        # A crash here leaves the old journal, whose id no longer matches
+        tmp_journal = f"{self.journal_file}.tmp"
+        with open(tmp_journal, "w", encoding="utf-8") as f:
+            f.write(json.dumps([_HEADER, journal_id]) + "\n")
+        os.replace(tmp_journal, self.journal_file)
+
+        self._journal_id = journal_id
+        self._committed_end = None
+        self._snapshot_urls = len(state.get("visited_urls", ())) + len(
+            state.get("pending_urls", ())
+        )
+        self._journal_events = 0
+
+    # ── Loading ──────────────────────────────────────────────────────────
+
+    def load(self) -> dict[str, Any] | None:
+        """
+        Read the snapshot and replay the journal up to its last commit.
+
+        Returns:
+            Checkpoint dict (``visited_urls``, ``pending_urls``,
+            ``pages_scraped``, ``last_updated``, ...) or None if absent.
+            Subsequent saves extend the same journal.
+
+        Raises:
+            ValueError / KeyError: If the snapshot is unreadable
+        """
+        if not os.path.exists(self.checkpoint_file):
+            return None
+        with open(self.checkpoint_file, encoding="utf-8") as f:
+            state = json.load(f)
+
+        visited = set(state["visited_urls"])
+        pending = dict.fromkeys(state["pending_urls"])
+        snapshot_urls = len(visited) + len(pending)
+        journal_id = state.get("journal_id")
+        events, committed_end = self._committed_events(journal_id) if journal_id else ([], None)
+
+        replayed = 0
+        for event in events:
+            kind = event[0]
+            if kind == _VISITED:
+                visited.add(event[1])
+                pending.pop(event[1], None)
+                replayed += 1
+            elif kind == _ENQUEUED:
+                if event[1] not in visited:
+                    pending[event[1]] = None
+                replayed += 1
+            elif kind == _COMMIT:
+                state["pages_scraped"] = event[1]
+                state["last_updated"] = event[2]
+
+        state["visited_urls"] = list(visited)
+        state["pending_urls"] = list(pending)
+
+        with self._lock:
+            self._buffer = []
+            # Without a usable journal the next save starts from a new snapshot
+            self._journal_id = journal_id if committed_end is not None else None
+            self._committed_end = committed_end
+            self._snapshot_urls = snapshot_urls
+            self._journal_events = replayed
+        return state
+
+    def _committed_events(self, journal_id: str) -> tuple[list[list[Any]], int | None]:
+        """
+        Journal events for ``journal_id`` up to and including the last commit.
+
+        Returns:
+            (events, committed_end): byte offset just past the last commit, or
+            None when there is no usable journal for this snapshot
+        """
+        if not os.path.exists(self.journal_file):
+            return [], None
+        events: list[list[Any]] = []
+        committed = 0
+        committed_end: int | None = None
+        offset = 0
+        with open(self.journal_file, "rb") as f:
+            for i, raw in enumerate(f):
+                offset += len(raw)
+                try:
+                    event = json.loads(raw)
+                except ValueError:
+                    break  # Torn write: everything after it is uncommitted
+                if i == 0:
+                    if event != [_HEADER, journal_id]:
+                        return [], None  # Journal predates the current snapshot
+                    committed_end = offset
+                    continue
+                events.append(event)
+                if event[0] == _COMMIT:
+                    committed = len(events)
+                    committed_end = offset
+        return events[:committed], committed_end
+
+    def clear(self) -> None:
+        """Delete the snapshot and journal."""
+        with self._lock:
+            for path in (self.checkpoint_file, self.journal_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._buffer = []
+            self._journal_id = None
+            self._journal_events = 0
+
+
+def read_checkpoint(checkpoint_file: str) -> dict[str, Any] | None:
+    """Current checkpoint state (snapshot plus committed journal), or None."""
+    return CheckpointJournal(checkpoint_file).load()
@@ -9,6 +9,7 @@ import logging
 import argparse
 from typing import Any
 
+from skill_seekers.cli.analysis_cache import default_cache_path
 from skill_seekers.cli.source_detector import SourceDetector, SourceInfo
 from skill_seekers.cli.execution_context import ExecutionContext
 from skill_seekers.cli.skill_converter import get_converter
@@ -347,6 +348,10 @@ class CreateCommand:
                     "build_dependency_graph": not ctx.analysis.skip_dependency_graph,
                     "extract_docs": not ctx.analysis.skip_docs,
                     "extract_comments": not ctx.analysis.no_comments,
+                    "jobs": ctx.analysis.jobs,
+                    "analysis_cache": None
+                    if ctx.analysis.no_cache
+                    else ctx.analysis.cache or default_cache_path(),
                     "enhance_level": ctx.enhancement.level if ctx.enhancement.enabled else 0,
                     "skill_name": name,
                     "doc_version": ctx.output.doc_version,
@@ -427,6 +432,7 @@ class CreateCommand:
                 config["feed_path"] = file_path
             config["follow_links"] = getattr(self.args, "follow_links", True)
             config["max_articles"] = getattr(self.args, "max_articles", 50)
+            config["article_workers"] = getattr(self.args, "article_workers", 8)
 
         elif source_type == "manpage":
             file_path = parsed.get("file_path", "")
@@ -467,6 +473,7 @@ class CreateCommand:
                     "token": getattr(self.args, "token", ""),
                     "channel": getattr(self.args, "channel", ""),
                     "max_messages": getattr(self.args, "max_messages", 1000),
+                    "jobs": ctx.analysis.jobs,
                 }
             )
 
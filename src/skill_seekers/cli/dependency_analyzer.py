@@ -103,24 +103,51 @@ class DependencyAnalyzer:
         """Convert a character offset to a 1-based line number using bisect."""
         return offset_to_line(self._newline_offsets, offset)
 
-    def analyze_file(self, file_path: str, content: str, language: str) -> list[DependencyInfo]:
+    def analyze_file(
+        self,
+        file_path: str,
+        content: str,
+        language: str,
+        tree: ast.Module | None = None,
+        line_index: list[int] | None = None,
+    ) -> list[DependencyInfo]:
         """
-        Extract dependencies from a source file.
+        Extract dependencies from a source file and add it to the graph.
 
         Args:
             file_path: Path to source file
             content: File content
             language: Programming language (Python, GDScript, GodotScene, GodotResource, GodotShader,
                      JavaScript, TypeScript, C, C++, C#, Go, Rust, Java, Ruby, PHP)
+            tree: Already-parsed AST of ``content`` (Python only), to skip re-parsing
+            line_index: Already-built ``build_line_index(content)``
 
         Returns:
             List of DependencyInfo objects
         """
+        deps = self.extract_dependencies(file_path, content, language, tree, line_index)
+        self.add_file(file_path, language, deps)
+        return deps
+
+    def extract_dependencies(
+        self,
+        file_path: str,
+        content: str,
+        language: str,
+        tree: ast.Module | None = None,
+        line_index: list[int] | None = None,
+    ) -> list[DependencyInfo]:
+        """
+        Extract dependencies from a source file without recording them.
+
+        Same arguments as :meth:`analyze_file`; pair with :meth:`add_file`
+        when extraction happens elsewhere (e.g. in a worker process).
+        """
         # Build line index once for O(log n) lookups in all extractors
-        self._newline_offsets = build_line_index(content)
+        self._newline_offsets = line_index if line_index is not None else build_line_index(content)
 
         if language == "Python":
-            deps = self._extract_python_imports(content, file_path)
+            deps = self._extract_python_imports(content, file_path, tree)
         elif language == "GDScript":
             # GDScript uses preload/load, not Python imports
             deps = self._extract_gdscript_imports(content, file_path)
@@ -149,6 +176,10 @@ class DependencyAnalyzer:
             logger.warning(f"Unsupported language: {language}")
             deps = []
 
+        return deps
+
+    def add_file(self, file_path: str, language: str, deps: list[DependencyInfo]) -> None:
+        """Record a file's extracted dependencies for build_graph()."""
         self.file_dependencies[file_path] = deps
 
         # Create file node
@@ -157,9 +188,9 @@ class DependencyAnalyzer:
             file_path=file_path, language=language, dependencies=imported_modules
         )
 
-        return deps
-
-    def _extract_python_imports(self, content: str, file_path: str) -> list[DependencyInfo]:
+    def _extract_python_imports(
+        self, content: str, file_path: str, tree: ast.Module | None = None
+    ) -> list[DependencyInfo]:
         """
         Extract Python import statements using AST.
 
@@ -171,11 +202,12 @@ class DependencyAnalyzer:
         """
         deps = []
 
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            logger.warning(f"Syntax error in {file_path}, skipping import extraction")
-            return deps
+        if tree is None:
+            try:
+                tree = ast.parse(content)
+            except SyntaxError:
+                logger.warning(f"Syntax error in {file_path}, skipping import extraction")
+                return deps
 
         for node in ast.walk(tree):
             if isinstance(node, ast.Import):
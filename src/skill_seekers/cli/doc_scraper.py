@@ -11,14 +11,19 @@ Usage:
 
 import argparse
 import asyncio
-import hashlib
+import bisect
+import contextlib
 import json
 import logging
+import multiprocessing
 import os
 import re
 import sys
 import time
 from collections import defaultdict, deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
@@ -41,12 +46,24 @@ from skill_seekers.cli.constants import (
     MAX_PAGES_WARNING_THRESHOLD,
     MIN_CATEGORIZATION_SCORE,
 )
+from skill_seekers.cli.crawl_checkpoint import CheckpointJournal
 from skill_seekers.cli.defaults import DEFAULTS
-from skill_seekers.cli.html_parsing import parse_html
+from skill_seekers.cli.host_rate_limiter import HostRateLimiter
+from skill_seekers.cli.html_parsing import (
+    PARSE_TIMINGS,
+    PARSER_ENGINE_ENV,
+    LexborTag,
+    lexbor_available,
+    parse_html,
+    parse_html_lexbor,
+    parser_chain,
+)
 from skill_seekers.cli.language_detector import LanguageDetector
+from skill_seekers.cli.http_cache import CachedPage, HttpPageCache
 from skill_seekers.cli.llms_txt_detector import LlmsTxtDetector
 from skill_seekers.cli.llms_txt_downloader import LlmsTxtDownloader
 from skill_seekers.cli.llms_txt_parser import LlmsTxtParser
+from skill_seekers.cli.page_store import PageStore
 from skill_seekers.cli.skill_converter import SkillConverter
 from skill_seekers.cli.utils import (
     retry_with_backoff,
@@ -78,8 +95,6 @@ SITEMAP_PROBE_TIMEOUT = (5, 10)
 
 # Pre-compiled regex patterns for frequently called methods
 _WHITESPACE_RE = re.compile(r"\s+")
-_SAFE_TITLE_RE = re.compile(r"[^\w\s-]")
-_SAFE_TITLE_SEP_RE = re.compile(r"[-\s]+")
 _DISPLAY_NAME_RE = re.compile(r"[^a-zA-Z0-9_-]+")
 
 # Tracking / analytics query params that don't change page content. Stripping
@@ -119,6 +134,31 @@ def _normalize_url(url: str) -> str:
         return url
 
 
+# Per-process converter for the async extraction pool. Built once per worker
+# by _init_extract_worker so only (content, url) crosses the process boundary.
+_EXTRACT_WORKER: Optional["DocToSkillConverter"] = None
+
+
+def _init_extract_worker(converter_cls: type, config: dict[str, Any]) -> None:
+    """ProcessPoolExecutor initializer: build the worker-local converter."""
+    global _EXTRACT_WORKER
+    _EXTRACT_WORKER = converter_cls(config, dry_run=True)
+
+
+def _extract_page_in_worker(
+    content: bytes | str, url: str
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Extract the compact page dict inside a pool worker.
+
+    Returns the page plus this worker's parse timings since the last call so
+    the parent can fold them into its own histogram.
+    """
+    if _EXTRACT_WORKER is None:
+        raise RuntimeError("extraction worker not initialized")
+    page = _EXTRACT_WORKER._extract_html(content, url)
+    return page, PARSE_TIMINGS.drain()
+
+
 def infer_description_from_docs(
     base_url: str, first_page_content: str | None = None, name: str = ""
 ) -> str:
@@ -233,6 +273,11 @@ class DocToSkillConverter(SkillConverter):
             "browser_wait_until",
             "browser_extra_wait",
             "workers",
+            "per_host_workers",
+            "parse_workers",
+            "html_parser",
+            "http_cache",
+            "adaptive_rate_limit",
             "async_mode",
             "checkpoint",
             "doc_version",
@@ -262,6 +307,8 @@ class DocToSkillConverter(SkillConverter):
         checkpoint_config = normalized_config.get("checkpoint", {})
         self.checkpoint_enabled = checkpoint_config.get("enabled", False)
         self.checkpoint_interval = checkpoint_config.get("interval", DEFAULT_CHECKPOINT_INTERVAL)
+        # Snapshot + append-only journal: each save writes only the delta
+        self.checkpoint_journal = CheckpointJournal(self.checkpoint_file)
 
         # llms.txt detection state
         skip_llms_txt_value = normalized_config.get("skip_llms_txt", False)
@@ -286,11 +333,49 @@ class DocToSkillConverter(SkillConverter):
         # Parallel scraping config
         self.workers = normalized_config.get("workers") or DEFAULTS["scraping"]["workers"]
         self.async_mode = normalized_config.get("async_mode", DEFAULT_ASYNC_MODE)
+        # Per-host cap on concurrent fetches in the async crawl frontier.
+        # 0 (default) means "no cap beyond workers".
+        self.per_host_workers = int(normalized_config.get("per_host_workers") or 0)
+        # Processes for HTML parsing/extraction in async mode, so the event loop
+        # only does network I/O. Ignored (inline parsing) when workers == 1;
+        # 0 disables the pool.
+        parse_workers = normalized_config.get("parse_workers")
+        if parse_workers is None:
+            parse_workers = min(self.workers, os.cpu_count() or 1)
+        self.parse_workers = max(0, int(parse_workers))
+        self._extract_pool: ProcessPoolExecutor | None = None
+
+        # HTML parser engine: "html.parser" (default), "lxml" or "selectolax"
+        self.html_parser = (
+            normalized_config.get("html_parser")
+            or os.environ.get(PARSER_ENGINE_ENV)
+            or "html.parser"
+        )
+        self._parser_chain = parser_chain(self.html_parser)
+        if self.html_parser == "selectolax" and not lexbor_available():
+            logger.warning(
+                "html_parser 'selectolax' requested but selectolax is not installed; "
+                "using BeautifulSoup. Install: pip install 'skill-seekers[fast-html]'"
+            )
         # Total fetch attempts per page (#97). Transient network failures
         # (connection/timeout/5xx) previously dropped a page on the first blip;
         # now they retry with exponential backoff. 1 disables retrying.
         self.max_retries = max(1, int(normalized_config.get("max_retries", 3)))
 
+        # Per-host token bucket shared by all workers (threads or tasks).
+        # rate_limit keeps its meaning as the per-worker delay, so the starting
+        # rate matches the old fixed-sleep throughput of workers / rate_limit;
+        # with adaptive_rate_limit it then follows the server's latency and
+        # 429/503 responses. rate_limit == 0 disables pacing.
+        rate_limit = normalized_config.get("rate_limit")
+        if rate_limit is None:
+            rate_limit = DEFAULT_RATE_LIMIT
+        self.rate_limiter = HostRateLimiter(
+            base_rate=self.workers / rate_limit if rate_limit > 0 else None,
+            burst=self.workers,
+            adaptive=bool(normalized_config.get("adaptive_rate_limit", True)),
+        )
+
         # State
         self.visited_urls: set[str] = set()
         # Support multiple starting URLs
@@ -299,7 +384,11 @@ class DocToSkillConverter(SkillConverter):
         self._enqueued_urls: set[str] = set(
             start_urls
         )  # Track all ever-enqueued URLs for O(1) dedup
+        # Async crawl frontier; only set while scrape_all_async is running.
+        # Mirrors pending_urls (same FIFO order) so checkpoints stay valid.
+        self._frontier: asyncio.Queue[str] | None = None
         self.pages: list[dict[str, Any]] = []
+        self._page_store: PageStore | None = None
         self.pages_scraped = 0
         self.pages_saved = 0
         self.pages_skipped = 0
@@ -322,11 +411,19 @@ class DocToSkillConverter(SkillConverter):
         # not the ctor params — a config-supplied dry_run (the create path) was
         # otherwise ignored here and still created empty output dirs.
         if not self.dry_run:
-            os.makedirs(f"{self.data_dir}/pages", exist_ok=True)
+            os.makedirs(self.data_dir, exist_ok=True)
             os.makedirs(f"{self.skill_dir}/references", exist_ok=True)
             os.makedirs(f"{self.skill_dir}/scripts", exist_ok=True)
             os.makedirs(f"{self.skill_dir}/assets", exist_ok=True)
 
+        # Conditional-GET cache (ETag / Last-Modified) so re-scrapes of an
+        # unchanged site get 304s instead of full downloads.
+        self.http_cache: HttpPageCache | None = None
+        self._http_cache_path: str | None = None
+        if normalized_config.get("http_cache") and not self.dry_run:
+            self._http_cache_path = f"{self.data_dir}/http_cache.db"
+            self.http_cache = HttpPageCache(self._http_cache_path)
+
         # Load checkpoint if resuming
         if self.resume and not self.dry_run:
             self.load_checkpoint()
@@ -339,12 +436,23 @@ class DocToSkillConverter(SkillConverter):
         Also applies :func:`_normalize_url` so every discovery path — including
         dry-run, which bypasses extract_content's normalization — dedupes
         tracking-param variants (?utm_*, fbclid, …) the same way the real
-        crawl does.
+        crawl does. While an async crawl is running, new URLs are also pushed
+        onto the frontier queue so an idle worker picks them up immediately.
         """
         url = _normalize_url(sanitize_url(url))
         if url not in self.visited_urls and url not in self._enqueued_urls:
             self._enqueued_urls.add(url)
             self.pending_urls.append(url)
+            if self.checkpoint_enabled:
+                self.checkpoint_journal.record_enqueued(url)
+            if self._frontier is not None:
+                self._frontier.put_nowait(url)
+
+    def _mark_visited(self, url: str) -> None:
+        """Add ``url`` to visited_urls and journal it for the next checkpoint."""
+        self.visited_urls.add(url)
+        if self.checkpoint_enabled:
+            self.checkpoint_journal.record_visited(url)
 
     def is_valid_url(self, url: str) -> bool:
         """Check if URL should be scraped based on patterns.
@@ -375,12 +483,9 @@ class DocToSkillConverter(SkillConverter):
         """
         return urlparse(url).path.endswith(".md")
 
-    def save_checkpoint(self) -> None:
-        """Save progress checkpoint"""
-        if not self.checkpoint_enabled or self.dry_run:
-            return
-
-        checkpoint_data = {
+    def _checkpoint_state(self) -> dict[str, Any]:
+        """Full checkpoint snapshot (written on the first save and on compaction)."""
+        return {
             "config": self.config,
             "visited_urls": list(self.visited_urls),
             "pending_urls": list(self.pending_urls),
@@ -389,15 +494,21 @@ class DocToSkillConverter(SkillConverter):
             "checkpoint_interval": self.checkpoint_interval,
         }
 
+    def save_checkpoint(self) -> None:
+        """Save progress checkpoint
+
+        Appends the URLs visited/enqueued since the last save to the checkpoint
+        journal; a full snapshot is only written on the first save and when
+        the journal outgrows it. Both writes are crash-safe: the snapshot is
+        replaced atomically (a second Ctrl-C mid-write used to truncate it and
+        lose all crawl progress), and journal replay stops at the last
+        complete commit record.
+        """
+        if not self.checkpoint_enabled or self.dry_run:
+            return
+
         try:
-            # Atomic write: a second Ctrl-C during a direct open(...,'w') can
-            # truncate the checkpoint, and load_checkpoint then silently starts
-            # fresh — losing all crawl progress. Write a temp file, then
-            # os.replace() it into place (atomic on the same filesystem).
-            tmp_file = f"{self.checkpoint_file}.tmp"
-            with open(tmp_file, "w", encoding="utf-8") as f:
-                json.dump(checkpoint_data, f, indent=2)
-            os.replace(tmp_file, self.checkpoint_file)
+            self.checkpoint_journal.save(self._checkpoint_state, self.pages_scraped)
             logger.info("  💾 Checkpoint saved (%d pages)", self.pages_scraped)
         except Exception as e:
             logger.warning("  ⚠️  Failed to save checkpoint: %s", e)
@@ -409,8 +520,7 @@ class DocToSkillConverter(SkillConverter):
             return
 
         try:
-            with open(self.checkpoint_file, encoding="utf-8") as f:
-                checkpoint_data = json.load(f)
+            checkpoint_data = self.checkpoint_journal.load()
 
             self.visited_urls = set(checkpoint_data["visited_urls"])
             pending = checkpoint_data["pending_urls"]
@@ -430,10 +540,10 @@ class DocToSkillConverter(SkillConverter):
             logger.info("   Starting fresh")
 
     def clear_checkpoint(self) -> None:
-        """Remove checkpoint file"""
+        """Remove checkpoint snapshot and journal"""
         if os.path.exists(self.checkpoint_file):
             try:
-                os.remove(self.checkpoint_file)
+                self.checkpoint_journal.clear()
                 logger.info("✅ Checkpoint cleared")
             except Exception as e:
                 logger.warning("⚠️  Failed to clear checkpoint: %s", e)
@@ -540,6 +650,117 @@ class DocToSkillConverter(SkillConverter):
 
         return page
 
+    def _extract_html(self, content: bytes | str, url: str) -> dict[str, Any]:
+        """Parse ``content`` with the configured engine and extract the page dict."""
+        if self.html_parser == "selectolax":
+            tree = parse_html_lexbor(content, context=url)
+            if tree is not None:
+                return self._extract_content_lexbor(tree, url)
+        soup = parse_html(content, context=url, parsers=self._parser_chain)
+        return self.extract_content(soup, url)
+
+    def _extract_content_lexbor(self, tree: Any, url: str) -> dict[str, Any]:
+        """selectolax counterpart of :meth:`extract_content`.
+
+        Produces the same page dict (title, links, headings, code samples,
+        patterns, paragraphs) from a lexbor tree without building a
+        BeautifulSoup object.
+        """
+        page = {
+            "url": url,
+            "title": "",
+            "content": "",
+            "headings": [],
+            "code_samples": [],
+            "patterns": [],
+            "links": [],
+        }
+
+        selectors = self.config.get("selectors", {})
+
+        title_elem = tree.css_first(selectors.get("title", "title"))
+        if title_elem is not None:
+            page["title"] = self.clean_text(title_elem.text())
+
+        seen_links: set[str] = set()
+        for link in tree.css("a[href]"):
+            href = urljoin(url, link.attributes.get("href") or "")
+            href = _normalize_url(href.split("#")[0])
+            if href not in seen_links and self.is_valid_url(href):
+                seen_links.add(href)
+                page["links"].append(href)
+
+        main = None
+        main_selector = selectors.get("main_content")
+        for selector in ([main_selector] if main_selector else []) + FALLBACK_MAIN_SELECTORS:
+            main = tree.css_first(selector)
+            if main is not None:
+                break
+
+        if main is None:
+            logger.warning("⚠ No content: %s", url)
+            return page
+
+        # lexbor's css() includes the scope node itself; BeautifulSoup's
+        # find_all() on ``main`` does not.
+        main_id = main.mem_id
+
+        def descendants(selector: str) -> list[Any]:
+            return [node for node in main.css(selector) if node.mem_id != main_id]
+
+        for h in descendants("h1, h2, h3, h4, h5, h6"):
+            text = self.clean_text(h.text())
+            if text:
+                page["headings"].append(
+                    {"level": h.tag, "text": text, "id": h.attributes.get("id") or ""}
+                )
+
+        for code_elem in descendants(selectors.get("code_blocks", "pre code")):
+            code = code_elem.text()
+            if len(code.strip()) > 10:
+                lang = self.detect_language(LexborTag(code_elem), code)
+                page["code_samples"].append({"code": code.strip(), "language": lang})
+
+        page["patterns"] = self._extract_patterns_lexbor(tree, descendants("p, div"))
+
+        paragraphs = []
+        for p in descendants("p"):
+            text = self.clean_text(p.text())
+            if text and len(text) > 20:
+                paragraphs.append(text)
+        page["content"] = "\n\n".join(paragraphs)
+
+        return page
+
+    def _extract_patterns_lexbor(self, tree: Any, candidates: list[Any]) -> list[dict[str, str]]:
+        """selectolax counterpart of :meth:`extract_patterns`.
+
+        ``find_next("pre")`` becomes a bisect over the document-order
+        positions of every ``<pre>`` in the tree.
+        """
+        order = {node.mem_id: i for i, node in enumerate(tree.root.traverse())}
+        pres = [(order[pre.mem_id], pre) for pre in tree.css("pre")]
+        pre_positions = [pos for pos, _ in pres]
+
+        patterns = []
+        for elem in candidates:
+            text = self.clean_text(elem.text())
+            lowered_text = text.lower()
+            if not any(
+                word in lowered_text for word in ["example:", "pattern:", "usage:", "typical use"]
+            ):
+                continue
+            idx = bisect.bisect_right(pre_positions, order[elem.mem_id])
+            if idx == len(pres):
+                continue
+            next_pre = pres[idx][1]
+            next_code = next_pre.css_first("code") or next_pre
+            code = next_code.text().strip()
+            if not self._is_low_signal_code_snippet(code):
+                patterns.append({"description": text, "code": code})
+
+        return patterns[:5]
+
     def _extract_markdown_content(self, content: str, url: str) -> dict[str, Any]:
         """Extract structured content from a Markdown file.
 
@@ -742,7 +963,7 @@ class DocToSkillConverter(SkillConverter):
             "links": [],
         }
 
-        soup = parse_html(html_content, context=url)
+        soup = parse_html(html_content, context=url, parsers=self._parser_chain)
 
         # Try to extract title
         title_elem = soup.select_one("title")
@@ -922,6 +1143,13 @@ class DocToSkillConverter(SkillConverter):
         """Clean text content"""
         return _WHITESPACE_RE.sub(" ", text).strip()
 
+    @property
+    def page_store(self) -> PageStore:
+        """Page corpus under data_dir (reopened if data_dir is reassigned)."""
+        if self._page_store is None or self._page_store.data_dir != Path(self.data_dir):
+            self._page_store = PageStore(self.data_dir)
+        return self._page_store
+
     def save_page(self, page: dict[str, Any]) -> None:
         """Save page data (skip pages with empty content)"""
         # Skip pages with empty or very short content
@@ -931,16 +1159,7 @@ class DocToSkillConverter(SkillConverter):
             return
 
         self.pages_saved += 1
-
-        url_hash = hashlib.md5(page["url"].encode()).hexdigest()[:10]
-        safe_title = _SAFE_TITLE_RE.sub("", page["title"])[:50]
-        safe_title = _SAFE_TITLE_SEP_RE.sub("_", safe_title)
-
-        filename = f"{safe_title}_{url_hash}.json"
-        filepath = os.path.join(self.data_dir, "pages", filename)
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(page, f, indent=2, ensure_ascii=False)
+        self.page_store.append(page)
 
     def _render_with_browser(self, url: str) -> str:
         """Render a page using headless browser (Playwright).
@@ -966,19 +1185,41 @@ class DocToSkillConverter(SkillConverter):
             )
         return self._browser_renderer.render_page(url)
 
+    def _render_and_record(self, url: str) -> str:
+        """Render ``url`` in the browser and report the outcome to the rate limiter.
+
+        The caller takes the host's token (``rate_limiter.reserve``) first, so
+        browser renders are paced like plain HTTP fetches. Playwright does not
+        surface the status here: a render counts as 200, a failure as 500.
+        """
+        start = time.monotonic()
+        try:
+            html = self._render_with_browser(url)
+        except Exception:
+            self.rate_limiter.record(url, 500, time.monotonic() - start)
+            raise
+        self.rate_limiter.record(url, 200, time.monotonic() - start)
+        return html
+
     def _get_with_retry(self, url: str, headers: dict, timeout: float) -> requests.Response:
         """GET a URL, retrying transient network failures with backoff (#97).
 
-        Retries connection/timeout errors and 5xx responses (self.max_retries
-        attempts total). A 4xx is a definitive answer (missing/forbidden page),
-        so it is returned un-retried and surfaces via the caller's
-        raise_for_status().
+        Retries connection/timeout errors, 5xx and 429 responses
+        (self.max_retries attempts total). Any other 4xx is a definitive answer
+        (missing/forbidden page), so it is returned un-retried and surfaces via
+        the caller's raise_for_status(). Every attempt waits for a token from
+        the host's rate limiter and reports its latency/status back to it.
         """
 
         def _attempt() -> requests.Response:
+            delay = self.rate_limiter.reserve(url)
+            if delay > 0:
+                time.sleep(delay)
+            start = time.monotonic()
             resp = requests.get(url, headers=headers, timeout=timeout)
-            if resp.status_code >= 500:
-                resp.raise_for_status()  # trigger a retry on server errors
+            self._record_response(url, resp, time.monotonic() - start)
+            if resp.status_code >= 500 or resp.status_code == 429:
+                resp.raise_for_status()  # trigger a retry on server errors / throttling
             return resp
 
         return retry_with_backoff(
@@ -991,8 +1232,13 @@ class DocToSkillConverter(SkillConverter):
         """Async counterpart of _get_with_retry (#97)."""
 
         async def _attempt() -> httpx.Response:
+            delay = self.rate_limiter.reserve(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            start = time.monotonic()
             resp = await client.get(url, headers=headers, timeout=timeout)
-            if resp.status_code >= 500:
+            self._record_response(url, resp, time.monotonic() - start)
+            if resp.status_code >= 500 or resp.status_code == 429:
                 resp.raise_for_status()
             return resp
 
@@ -1000,6 +1246,51 @@ class DocToSkillConverter(SkillConverter):
             _attempt, max_attempts=self.max_retries, operation_name=f"fetch {url}"
         )
 
+    def _record_response(self, url: str, response: Any, latency: float) -> None:
+        """Feed one response's status, latency and Retry-After into the rate limiter."""
+        headers = getattr(response, "headers", None)
+        retry_after = headers.get("Retry-After") if headers is not None else None
+        self.rate_limiter.record(url, response.status_code, latency, retry_after)
+
+    def _page_cache(self) -> HttpPageCache | None:
+        """The open HTTP cache, or None when caching is off or the crawl has closed it."""
+        if self.http_cache is None or self.http_cache.closed:
+            return None
+        return self.http_cache
+
+    def _cached_response(self, url: str) -> CachedPage | None:
+        """HTTP cache entry for ``url`` (None when caching is off or on a miss)."""
+        cache = self._page_cache()
+        if cache is None:
+            return None
+        return cache.get(_normalize_url(url))
+
+    def _revalidated_page(
+        self, url: str, status_code: int, cached: CachedPage | None
+    ) -> dict[str, Any] | None:
+        """Page to reuse when the server answered ``304 Not Modified``, else None."""
+        cache = self._page_cache()
+        if status_code != 304 or cached is None or cache is None:
+            return None
+        cache.record(not_modified=True)
+        if cached.page is not None:
+            return cached.page
+        # Entry predates page caching: re-extract from the cached body
+        if self._has_md_extension(url):
+            return self._extract_markdown_content(cached.body.decode("utf-8", "replace"), url)
+        return self._extract_html(cached.body, url)
+
+    def _cache_response(self, url: str, response: Any, page: dict[str, Any]) -> None:
+        """Store a full response and its extracted page for future revalidation."""
+        cache = self._page_cache()
+        if cache is None:
+            return
+        cache.record(not_modified=False)
+        try:
+            cache.store(_normalize_url(url), response.headers, response.content, page)
+        except Exception as e:
+            logger.warning("⚠️  Failed to cache %s: %s", url, e)
+
     def scrape_page(self, url: str) -> None:
         """Scrape a single page with thread-safe operations.
 
@@ -1020,20 +1311,26 @@ class DocToSkillConverter(SkillConverter):
             # Scraping part (no lock needed - independent)
             if self.browser_mode and not self._has_md_extension(url):
                 # Use Playwright headless browser for JavaScript rendering
-                html = self._render_with_browser(url)
-                soup = parse_html(html, context=url)
-                page = self.extract_content(soup, url)
+                delay = self.rate_limiter.reserve(url)
+                if delay > 0:
+                    time.sleep(delay)
+                html = self._render_and_record(url)
+                page = self._extract_html(html, url)
             else:
                 headers = {"User-Agent": "Mozilla/5.0 (Documentation Scraper)"}
+                cached = self._cached_response(url)
+                headers.update(HttpPageCache.conditional_headers(cached))
                 response = self._get_with_retry(url, headers, 30)
-                response.raise_for_status()
+                page = self._revalidated_page(url, response.status_code, cached)
+                if page is None:
+                    response.raise_for_status()
 
-                # Check if this is a Markdown file
-                if self._has_md_extension(url):
-                    page = self._extract_markdown_content(response.text, url)
-                else:
-                    soup = parse_html(response.content, context=url)
-                    page = self.extract_content(soup, url)
+                    # Check if this is a Markdown file
+                    if self._has_md_extension(url):
+                        page = self._extract_markdown_content(response.text, url)
+                    else:
+                        page = self._extract_html(response.content, url)
+                    self._cache_response(url, response, page)
 
             # Thread-safe operations (lock required for workers > 1)
             if self.workers > 1:
@@ -1050,13 +1347,6 @@ class DocToSkillConverter(SkillConverter):
                 for link in page["links"]:
                     self._enqueue_url(link)
 
-            # Rate limiting
-            rate_limit = self.config.get("rate_limit")
-            if rate_limit is None:
-                rate_limit = DEFAULT_RATE_LIMIT
-            if rate_limit > 0:
-                time.sleep(rate_limit)
-
         except Exception as e:
             if self.workers > 1:
                 with self.lock:
@@ -1086,23 +1376,28 @@ class DocToSkillConverter(SkillConverter):
 
                 if self.browser_mode and not self._has_md_extension(url):
                     # Use Playwright in executor (sync API in async context)
+                    delay = self.rate_limiter.reserve(url)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
                     loop = asyncio.get_event_loop()
-                    html = await loop.run_in_executor(None, self._render_with_browser, url)
-                    soup = parse_html(html, context=url)
-                    page = self.extract_content(soup, url)
+                    html = await loop.run_in_executor(None, self._render_and_record, url)
+                    page = await self._extract_page_async(html, url)
                 else:
                     # Async HTTP request
                     headers = {"User-Agent": "Mozilla/5.0 (Documentation Scraper)"}
+                    cached = self._cached_response(url)
+                    headers.update(HttpPageCache.conditional_headers(cached))
                     response = await self._aget_with_retry(client, url, headers, 30.0)
-                    response.raise_for_status()
+                    page = self._revalidated_page(url, response.status_code, cached)
+                    if page is None:
+                        response.raise_for_status()
 
-                    # Check if this is a Markdown file
-                    if self._has_md_extension(url):
-                        page = self._extract_markdown_content(response.text, url)
-                    else:
-                        # BeautifulSoup parsing (still synchronous, but fast)
-                        soup = parse_html(response.content, context=url)
-                        page = self.extract_content(soup, url)
+                        # Check if this is a Markdown file
+                        if self._has_md_extension(url):
+                            page = self._extract_markdown_content(response.text, url)
+                        else:
+                            page = await self._extract_page_async(response.content, url)
+                        self._cache_response(url, response, page)
 
                 # Async-safe operations (no lock needed - single event loop)
                 logger.info("  %s", url)
@@ -1113,16 +1408,50 @@ class DocToSkillConverter(SkillConverter):
                 for link in page["links"]:
                     self._enqueue_url(link)
 
-                # Rate limiting
-                rate_limit = self.config.get("rate_limit")
-                if rate_limit is None:
-                    rate_limit = DEFAULT_RATE_LIMIT
-                if rate_limit > 0:
-                    await asyncio.sleep(rate_limit)
-
             except Exception as e:
                 logger.error("  ✗ Error scraping %s: %s: %s", url, type(e).__name__, e)
 
+    async def _extract_page_async(self, content: bytes | str, url: str) -> dict[str, Any]:
+        """Parse ``content`` and extract the page dict without blocking the event loop.
+
+        BeautifulSoup parsing, code language detection and link extraction run
+        in the extraction process pool when one is active; otherwise (workers
+        == 1, dry-run, or the pool died) they run inline.
+        """
+        pool = self._extract_pool
+        if pool is not None:
+            try:
+                loop = asyncio.get_running_loop()
+                page, timings = await loop.run_in_executor(
+                    pool, _extract_page_in_worker, content, url
+                )
+                PARSE_TIMINGS.merge(timings)
+                return page
+            except BrokenProcessPool as e:
+                logger.warning("⚠️  Extraction pool failed (%s); parsing inline", e)
+                self._extract_pool = None
+        return self._extract_html(content, url)
+
+    def _start_extract_pool(self) -> None:
+        """Start the extraction process pool for async scraping (if enabled)."""
+        if self.workers <= 1 or self.parse_workers <= 0 or self.dry_run:
+            return
+        # spawn, not fork: forking a process that runs an event loop and
+        # executor threads can deadlock in the child.
+        self._extract_pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_extract_worker,
+            initargs=(type(self), self.config),
+        )
+        logger.info("Parsing: %d extraction processes", self.parse_workers)
+
+    def _stop_extract_pool(self) -> None:
+        """Shut down the extraction process pool, if running."""
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown(wait=True, cancel_futures=True)
+            self._extract_pool = None
+
     def _convert_to_md_urls(self, urls: list[str]) -> list[str]:
         """
         Clean URLs from llms.txt: strip anchor fragments, deduplicate base URLs.
@@ -1468,7 +1797,7 @@ class DocToSkillConverter(SkillConverter):
             discovery_renderer.close()
 
             # Parse rendered DOM for all links
-            soup = parse_html(html, context=self.base_url)
+            soup = parse_html(html, context=self.base_url, parsers=self._parser_chain)
             discovered = []
             seen = set()
 
@@ -1497,6 +1826,30 @@ class DocToSkillConverter(SkillConverter):
             asyncio.run(self.scrape_all_async())
             return
 
+        self._open_http_cache()
+        try:
+            self._scrape_all_sync()
+        finally:
+            self._close_http_cache()
+
+    def _open_http_cache(self) -> None:
+        """Reopen the conditional-GET cache if an earlier crawl closed it."""
+        if self._http_cache_path is not None and self._page_cache() is None:
+            self.http_cache = HttpPageCache(self._http_cache_path)
+
+    def _close_http_cache(self) -> None:
+        """Close the conditional-GET cache database once the crawl is over.
+
+        The cache object stays attached so its hit/miss counters remain
+        readable; until the next crawl reopens it, pages are fetched uncached.
+        """
+        if self.http_cache is not None:
+            self.http_cache.close()
+
+    def _scrape_all_sync(self) -> None:
+        """Sync/thread-based body of :meth:`scrape_all`."""
+        PARSE_TIMINGS.reset()
+
         # === Three-Layer Discovery Engine ===
         # Discovers pages before the BFS crawl loop starts.
         # Layer 1: sitemap.xml — instant, no rendering needed
@@ -1564,7 +1917,7 @@ class DocToSkillConverter(SkillConverter):
                 if url in self.visited_urls:
                     continue
 
-                self.visited_urls.add(url)
+                self._mark_visited(url)
 
                 if self.dry_run:
                     # Just show what would be scraped
@@ -1573,7 +1926,7 @@ class DocToSkillConverter(SkillConverter):
                     try:
                         headers = {"User-Agent": "Mozilla/5.0 (Documentation Scraper - Dry Run)"}
                         response = requests.get(url, headers=headers, timeout=10)
-                        soup = parse_html(response.content, context=url)
+                        soup = parse_html(response.content, context=url, parsers=self._parser_chain)
 
                         # Discover links from full page (not just main content)
                         # to match real scrape path behaviour in extract_content()
@@ -1626,7 +1979,7 @@ class DocToSkillConverter(SkillConverter):
                             url = self.pending_urls.popleft()
 
                             if url not in self.visited_urls:
-                                self.visited_urls.add(url)
+                                self._mark_visited(url)
                                 batch.append(url)
 
                     # Submit batch to executor
@@ -1692,6 +2045,16 @@ class DocToSkillConverter(SkillConverter):
 
         Performance: ~2-3x faster than sync mode with same worker count.
         """
+        self._open_http_cache()
+        try:
+            await self._scrape_all_async()
+        finally:
+            self._close_http_cache()
+
+    async def _scrape_all_async(self) -> None:
+        """Body of :meth:`scrape_all_async`."""
+        PARSE_TIMINGS.reset()
+
         # Try llms.txt first (unless dry-run or explicitly disabled)
         if not self.dry_run and not self.skip_llms_txt:
             llms_result = self._try_llms_txt()
@@ -1725,99 +2088,25 @@ class DocToSkillConverter(SkillConverter):
         # an unlimited config — otherwise an async --dry-run would crawl the whole
         # site (the sync path already caps unconditionally).
         if self.dry_run:
-            unlimited = False
             preview_limit = 20
         elif max_pages is None or max_pages == -1:
             logger.warning("⚠️  UNLIMITED MODE: No page limit (will scrape all pages)\n")
-            unlimited = True
             preview_limit = float("inf")
         else:
-            unlimited = False
             preview_limit = max_pages
 
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(self.workers)
 
         # Create shared HTTP client with connection pooling
-        async with httpx.AsyncClient(
-            timeout=30.0, limits=httpx.Limits(max_connections=self.workers * 2)
-        ) as client:
-            tasks = []
-
-            while self.pending_urls and (unlimited or len(self.visited_urls) < preview_limit):
-                # Get next batch of URLs
-                batch = []
-                batch_size = min(self.workers * 2, len(self.pending_urls))
-
-                for _ in range(batch_size):
-                    if not self.pending_urls:
-                        break
-                    url = self.pending_urls.popleft()
-
-                    if url not in self.visited_urls:
-                        self.visited_urls.add(url)
-                        batch.append(url)
-
-                # Create async tasks for batch
-                for url in batch:
-                    if unlimited or len(self.visited_urls) <= preview_limit:
-                        if self.dry_run:
-                            url = sanitize_url(url)  # encode brackets (see #284)
-                            logger.info("  [Preview] %s", url)
-                            # Discover links from full page (async dry-run)
-                            try:
-                                response = await client.get(
-                                    url,
-                                    headers={
-                                        "User-Agent": "Mozilla/5.0 (Documentation Scraper - Dry Run)"
-                                    },
-                                    timeout=10,
-                                )
-                                soup = parse_html(response.content, context=url)
-                                for link in soup.find_all("a", href=True):
-                                    href = urljoin(url, str(link.get("href") or ""))
-                                    href = href.split("#")[0]
-                                    if self.is_valid_url(href):
-                                        self._enqueue_url(href)
-                            except Exception as e:
-                                logger.warning(
-                                    "⚠️  Warning: Could not extract links from %s: %s", url, e
-                                )
-                        else:
-                            task = asyncio.create_task(
-                                self.scrape_page_async(url, semaphore, client)
-                            )
-                            tasks.append(task)
-
-                # Wait for batch to complete before continuing
-                if tasks:
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    for result in results:
-                        if isinstance(result, Exception):
-                            logger.error(
-                                "  ✗ Async task failed: %s: %s", type(result).__name__, result
-                            )
-                    tasks = []
-                    self.pages_scraped = len(self.visited_urls)
-
-                    # Progress indicator
-                    if self.pages_scraped % 10 == 0 and not self.dry_run:
-                        logger.info("  [%d pages scraped]", self.pages_scraped)
-
-                    # Checkpoint saving
-                    if (
-                        not self.dry_run
-                        and self.checkpoint_enabled
-                        and self.pages_scraped % self.checkpoint_interval == 0
-                    ):
-                        self.save_checkpoint()
-
-            # Wait for any remaining tasks
-            if tasks:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for result in results:
-                    if isinstance(result, Exception):
-                        logger.error("  ✗ Async task failed: %s: %s", type(result).__name__, result)
+        self._start_extract_pool()
+        try:
+            async with httpx.AsyncClient(
+                timeout=30.0, limits=httpx.Limits(max_connections=self.workers * 2)
+            ) as client:
+                await self._run_crawl_frontier(client, semaphore, preview_limit)
+        finally:
+            self._stop_extract_pool()
 
         if self.dry_run:
             logger.info("\n✅ Dry run complete: would scrape ~%d pages", len(self.visited_urls))
@@ -1836,8 +2125,136 @@ class DocToSkillConverter(SkillConverter):
             self._browser_renderer.close()
             self._browser_renderer = None
 
+    async def _run_crawl_frontier(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, limit: float
+    ) -> None:
+        """Drain the crawl frontier with ``self.workers`` long-lived consumer tasks.
+
+        Unlike a gather-per-batch loop, a slow page only occupies one worker:
+        links discovered by any page are pushed onto the shared
+        :class:`asyncio.Queue` by :meth:`_enqueue_url` and picked up by the
+        next idle worker immediately. The crawl ends when the queue is drained
+        and every worker is idle; once ``limit`` URLs have been visited the
+        remaining frontier is drained without fetching.
+
+        Args:
+            client: Shared httpx AsyncClient for connection pooling
+            semaphore: Global bound on in-flight requests
+            limit: Maximum number of URLs to visit (``inf`` for unlimited)
+        """
+        frontier: asyncio.Queue[str] = asyncio.Queue()
+        for url in self.pending_urls:
+            frontier.put_nowait(url)
+        self._frontier = frontier
+
+        host_slots: dict[str, asyncio.Semaphore] = {}
+        workers = [
+            asyncio.create_task(self._crawl_worker(frontier, client, semaphore, host_slots, limit))
+            for _ in range(self.workers)
+        ]
+        try:
+            await frontier.join()
+        finally:
+            self._frontier = None
+            for task in workers:
+                task.cancel()
+            results = await asyncio.gather(*workers, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("  ✗ Async task failed: %s: %s", type(result).__name__, result)
+
+    async def _crawl_worker(
+        self,
+        frontier: asyncio.Queue[str],
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        host_slots: dict[str, asyncio.Semaphore],
+        limit: float,
+    ) -> None:
+        """Consume URLs from the frontier until cancelled by _run_crawl_frontier."""
+        while True:
+            url = await frontier.get()
+            try:
+                if len(self.visited_urls) >= limit:
+                    # Drain without popping pending_urls: in-flight pages still
+                    # finish, and unvisited URLs stay resumable from a checkpoint.
+                    continue
+
+                # pending_urls mirrors the frontier in FIFO order
+                if self.pending_urls:
+                    self.pending_urls.popleft()
+                if url in self.visited_urls:
+                    continue
+                self._mark_visited(url)
+
+                host_slot = self._host_slot(url, host_slots)
+                async with host_slot:
+                    if self.dry_run:
+                        await self._preview_page_async(url, client)
+                        continue
+                    await self.scrape_page_async(url, semaphore, client)
+
+                self.pages_scraped += 1
+                if self.pages_scraped % 10 == 0:
+                    logger.info("  [%d pages scraped]", self.pages_scraped)
+                if self.checkpoint_enabled and self.pages_scraped % self.checkpoint_interval == 0:
+                    self.save_checkpoint()
+            except Exception as e:
+                logger.error("  ✗ Async task failed: %s: %s", type(e).__name__, e)
+            finally:
+                frontier.task_done()
+
+    def _host_slot(
+        self, url: str, host_slots: dict[str, asyncio.Semaphore]
+    ) -> asyncio.Semaphore | contextlib.nullcontext:
+        """Return the per-host concurrency slot for ``url`` (no-op when uncapped)."""
+        if self.per_host_workers <= 0:
+            return contextlib.nullcontext()
+        host = urlparse(url).netloc
+        slot = host_slots.get(host)
+        if slot is None:
+            slot = host_slots[host] = asyncio.Semaphore(self.per_host_workers)
+        return slot
+
+    async def _preview_page_async(self, url: str, client: httpx.AsyncClient) -> None:
+        """Dry-run: log ``url`` and enqueue the links found on the full page."""
+        url = sanitize_url(url)  # encode brackets (see #284)
+        logger.info("  [Preview] %s", url)
+        try:
+            response = await client.get(
+                url,
+                headers={"User-Agent": "Mozilla/5.0 (Documentation Scraper - Dry Run)"},
+                timeout=10,
+            )
+            soup = parse_html(response.content, context=url, parsers=self._parser_chain)
+            for link in soup.find_all("a", href=True):
+                href = urljoin(url, str(link.get("href") or ""))
+                href = href.split("#")[0]
+                if self.is_valid_url(href):
+                    self._enqueue_url(href)
+        except Exception as e:
+            logger.warning("⚠️  Warning: Could not extract links from %s: %s", url, e)
+
     def _log_scrape_completion(self) -> None:
         """Log scrape completion with accurate saved/skipped counts."""
+        if self.http_cache is not None and (self.http_cache.hits or self.http_cache.misses):
+            logger.info(
+                "\n🗄️  HTTP cache: %d not modified (304), %d downloaded",
+                self.http_cache.hits,
+                self.http_cache.misses,
+            )
+        for host, stats in self.rate_limiter.summary().items():
+            if stats["achieved_rps"] is not None:
+                logger.info(
+                    "\n🚦 %s: %d requests at %.2f req/s (%d throttled)",
+                    host,
+                    stats["requests"],
+                    stats["achieved_rps"],
+                    stats["throttled"],
+                )
+        parse_report = PARSE_TIMINGS.format_report()
+        if parse_report:
+            logger.info("\n⏱️  HTML parse times:\n   %s", parse_report.replace("\n", "\n   "))
         visited = len(self.visited_urls)
         if self.pages_skipped > 0:
             logger.info(
@@ -1880,6 +2297,7 @@ class DocToSkillConverter(SkillConverter):
             "base_url": self.base_url,
             "llms_txt_detected": self.llms_txt_detected,
             "llms_txt_variant": self.llms_txt_variant,
+            "rate_limits": self.rate_limiter.summary(),
             "pages": [{"title": p["title"], "url": p["url"]} for p in self.pages],
         }
 
@@ -1890,47 +2308,40 @@ class DocToSkillConverter(SkillConverter):
             logger.error("  ✗ Failed to save summary: %s", e)
 
     def load_scraped_data(self) -> list[dict[str, Any]]:
-        """Load previously scraped data"""
-        pages = []
-        pages_dir = Path(self.data_dir) / "pages"
-
-        if not pages_dir.exists():
-            return []
+        """Load previously scraped data into memory.
 
-        for json_file in pages_dir.glob("*.json"):
-            try:
-                with open(json_file, encoding="utf-8") as f:
-                    pages.append(json.load(f))
-            except Exception as e:
-                logger.error(
-                    "⚠️  Error loading scraped data file %s: %s: %s",
-                    json_file,
-                    type(e).__name__,
-                    e,
-                )
-                logger.error(
-                    "   Suggestion: File may be corrupted, consider re-scraping with --fresh"
-                )
+        Reads the page store, including legacy pages/*.json directories.
+        build_skill streams from self.page_store instead.
+        """
+        return list(self.page_store)
 
-        return pages
+    def smart_categorize(
+        self, pages: Iterable[dict[str, Any]]
+    ) -> dict[str, Sequence[dict[str, Any]]]:
+        """Improved categorization with better pattern matching
 
-    def smart_categorize(self, pages: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
-        """Improved categorization with better pattern matching"""
+        A PageStore is streamed, and each category comes back as a lazy
+        PageView of page references rather than a list of loaded pages.
+        """
         category_defs = self.config.get("categories", {})
 
         # Default smart categories if none provided
         if not category_defs:
             category_defs = self.infer_categories(pages)
 
-        categories: dict[str, list[dict[str, Any]]] = {cat: [] for cat in category_defs}
-        categories["other"] = []
+        store = pages if isinstance(pages, PageStore) else None
+        entries: Iterable[tuple[Any, dict[str, Any]]] = (
+            store.items() if store is not None else ((page, page) for page in pages)
+        )
+        buckets: dict[str, list[Any]] = {cat: [] for cat in category_defs}
+        buckets["other"] = []
 
         # Pre-lowercase keywords once instead of per-page per-keyword
         lowered_defs = {
             cat: [kw.lower() for kw in keywords] for cat, keywords in category_defs.items()
         }
 
-        for page in pages:
+        for entry, page in entries:
             url = page["url"].lower()
             title = page["title"].lower()
             content = page.get("content", "").lower()[
@@ -1955,21 +2366,24 @@ class DocToSkillConverter(SkillConverter):
 
             if scores:
                 best_cat = max(scores, key=lambda c: scores[c])
-                categories[best_cat].append(page)
+                buckets[best_cat].append(entry)
             else:
-                categories["other"].append(page)
+                buckets["other"].append(entry)
 
         # Remove empty categories
-        categories = {k: v for k, v in categories.items() if v}
-
-        return categories
+        if store is not None:
+            return {k: store.view(v) for k, v in buckets.items() if v}
+        return {k: v for k, v in buckets.items() if v}
 
-    def infer_categories(self, pages: list[dict[str, Any]]) -> dict[str, list[str]]:
+    def infer_categories(self, pages: Iterable[dict[str, Any]]) -> dict[str, list[str]]:
         """Infer categories from URL patterns (IMPROVED)"""
         url_segments: defaultdict[str, int] = defaultdict(int)
+        has_tutorial_url = False
+        has_api_url = False
 
         for page in pages:
-            path = urlparse(page["url"]).path
+            url = page["url"]
+            path = urlparse(url).path
             segments = [
                 s for s in path.split("/") if s and s not in ["en", "stable", "latest", "docs"]
             ]
@@ -1977,6 +2391,9 @@ class DocToSkillConverter(SkillConverter):
             for seg in segments:
                 url_segments[seg] += 1
 
+            has_tutorial_url = has_tutorial_url or "tutorial" in url
+            has_api_url = has_api_url or "api" in url or "reference" in url
+
         # Top segments become categories
         top_segments = sorted(url_segments.items(), key=lambda x: x[1], reverse=True)[:8]
 
@@ -1985,95 +2402,100 @@ class DocToSkillConverter(SkillConverter):
             if count >= 3:  # At least 3 pages
                 categories[seg] = [seg]
 
-        # Add common defaults (use pre-built URL list to avoid repeated comprehensions)
-        all_urls = [p["url"] for p in pages]
-        if "tutorials" not in categories and any("tutorial" in url for url in all_urls):
+        # Add common defaults (URL flags gathered in the same single pass)
+        if "tutorials" not in categories and has_tutorial_url:
             categories["tutorials"] = ["tutorial", "guide", "getting-started"]
 
-        if "api" not in categories and any("api" in url or "reference" in url for url in all_urls):
+        if "api" not in categories and has_api_url:
             categories["api"] = ["api", "reference", "class"]
 
         return categories
 
-    def generate_quick_reference(self, pages: list[dict[str, Any]]) -> list[dict[str, str]]:
+    def generate_quick_reference(self, pages: Iterable[dict[str, Any]]) -> list[dict[str, str]]:
         """Generate quick reference from common patterns (NEW FEATURE)"""
-        quick_ref = []
+        quick_ref: list[dict[str, str]] = []
 
-        # Collect all patterns
-        all_patterns = []
-        for page in pages:
-            all_patterns.extend(page.get("patterns", []))
-
-        # Get most common code patterns
+        # Walk patterns page by page, stopping as soon as the reference is full
         seen_codes = set()
-        for pattern in all_patterns:
-            code = pattern.get("code", "")
-            description = self._normalize_pattern_description(pattern.get("description", ""))
-            normalized_code = _WHITESPACE_RE.sub(" ", code).strip()
-            if (
-                description
-                and normalized_code
-                and normalized_code not in seen_codes
-                and len(code) < 300
-                and not self._is_low_signal_code_snippet(code)
-            ):
-                quick_ref.append({"description": description, "code": code.strip()})
-                seen_codes.add(normalized_code)
-                if len(quick_ref) >= 15:
-                    break
+        for page in pages:
+            for pattern in page.get("patterns", []):
+                code = pattern.get("code", "")
+                description = self._normalize_pattern_description(pattern.get("description", ""))
+                normalized_code = _WHITESPACE_RE.sub(" ", code).strip()
+                if (
+                    description
+                    and normalized_code
+                    and normalized_code not in seen_codes
+                    and len(code) < 300
+                    and not self._is_low_signal_code_snippet(code)
+                ):
+                    quick_ref.append({"description": description, "code": code.strip()})
+                    seen_codes.add(normalized_code)
+                    if len(quick_ref) >= 15:
+                        return quick_ref
 
         return quick_ref
 
-    def create_reference_file(self, category: str, pages: list[dict[str, Any]]) -> None:
-        """Create enhanced reference file"""
+    def create_reference_file(self, category: str, pages: Sequence[dict[str, Any]]) -> None:
+        """Create enhanced reference file
+
+        Pages are rendered and written one at a time, so a PageView category
+        is streamed from the page store rather than held in memory.
+        """
         if not pages:
             return
 
-        lines = []
-        lines.append(f"# {self.name.title()} - {category.replace('_', ' ').title()}\n")
-        lines.append(f"**Pages:** {len(pages)}\n")
-        lines.append("---\n")
-
-        for page in pages:
-            lines.append(f"## {page['title']}\n")
-            lines.append(f"**URL:** {page['url']}\n")
-
-            # Table of contents from headings
-            if page.get("headings"):
-                lines.append("**Contents:**")
-                for h in page["headings"][:10]:
-                    level = int(h["level"][1]) if len(h["level"]) > 1 else 1
-                    indent = "  " * max(0, level - 2)
-                    lines.append(f"{indent}- {h['text']}")
-                lines.append("")
-
-            # Content (NO TRUNCATION)
-            if page.get("content"):
-                lines.append(page["content"])
-                lines.append("")
-
-            # Code examples with language (NO TRUNCATION)
-            if page.get("code_samples"):
-                lines.append("**Examples:**\n")
-                for i, sample in enumerate(page["code_samples"][:4], 1):
-                    lang = sample.get("language", "unknown")
-                    code = sample.get("code", sample if isinstance(sample, str) else "")
-                    lines.append(f"Example {i} ({lang}):")
-                    lines.append(f"```{lang}")
-                    lines.append(code)  # Full code, no truncation
-                    lines.append("```\n")
-
-            lines.append("---\n")
-
         filepath = os.path.join(self.skill_dir, "references", f"{category}.md")
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+            header = [
+                f"# {self.name.title()} - {category.replace('_', ' ').title()}\n",
+                f"**Pages:** {len(pages)}\n",
+                "---\n",
+            ]
+            f.write("\n".join(header))
+            for page in pages:
+                f.write("\n")
+                f.write("\n".join(self._reference_page_lines(page)))
 
         logger.info("  ✓ %s.md (%d pages)", category, len(pages))
 
+    def _reference_page_lines(self, page: dict[str, Any]) -> list[str]:
+        """Markdown lines for one page's section of a reference file."""
+        lines = []
+        lines.append(f"## {page['title']}\n")
+        lines.append(f"**URL:** {page['url']}\n")
+
+        # Table of contents from headings
+        if page.get("headings"):
+            lines.append("**Contents:**")
+            for h in page["headings"][:10]:
+                level = int(h["level"][1]) if len(h["level"]) > 1 else 1
+                indent = "  " * max(0, level - 2)
+                lines.append(f"{indent}- {h['text']}")
+            lines.append("")
+
+        # Content (NO TRUNCATION)
+        if page.get("content"):
+            lines.append(page["content"])
+            lines.append("")
+
+        # Code examples with language (NO TRUNCATION)
+        if page.get("code_samples"):
+            lines.append("**Examples:**\n")
+            for i, sample in enumerate(page["code_samples"][:4], 1):
+                lang = sample.get("language", "unknown")
+                code = sample.get("code", sample if isinstance(sample, str) else "")
+                lines.append(f"Example {i} ({lang}):")
+                lines.append(f"```{lang}")
+                lines.append(code)  # Full code, no truncation
+                lines.append("```\n")
+
+        lines.append("---\n")
+        return lines
+
     def create_enhanced_skill_md(
         self,
-        categories: dict[str, list[dict[str, Any]]],
+        categories: dict[str, Sequence[dict[str, Any]]],
         quick_ref: list[dict[str, str]],
     ) -> None:
         """Create SKILL.md with actual examples (IMPROVED)"""
@@ -2230,7 +2652,7 @@ To refresh this skill with updated documentation:
 
         logger.info("  ✓ SKILL.md (enhanced with %d examples)", len(example_codes))
 
-    def create_index(self, categories: dict[str, list[dict[str, Any]]]) -> None:
+    def create_index(self, categories: dict[str, Sequence[dict[str, Any]]]) -> None:
         """Create navigation index"""
         lines = []
         lines.append(f"# {self.name.title()} Documentation Index\n")
@@ -2254,8 +2676,8 @@ To refresh this skill with updated documentation:
     def build_skill(self) -> bool:
         """Build the skill from scraped data.
 
-        Loads scraped JSON files, categorizes pages, extracts patterns,
-        and generates SKILL.md and reference files.
+        Streams pages from the page store, categorizes them, extracts
+        patterns, and generates SKILL.md and reference files.
 
         Returns:
             bool: True if build succeeded, False otherwise
@@ -2264,9 +2686,11 @@ To refresh this skill with updated documentation:
         logger.info("BUILDING SKILL: %s", self.name)
         logger.info("=" * 60 + "\n")
 
-        # Load data
+        # Open the page store (pages stay on disk; only URL offsets are indexed)
         logger.info("Loading scraped data...")
-        pages = self.load_scraped_data()
+        pages = self.page_store
+        if pages.stale_bytes:
+            pages.compact()
 
         if not pages:
             logger.error("✗ No scraped data found!")
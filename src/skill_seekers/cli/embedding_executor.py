@@ -0,0 +1,301 @@
+"""
+Concurrent, token-budgeted batching for remote embedding APIs.
+
+Remote providers (OpenAI, Voyage) used to be called one batch at a time,
+each caller waiting for a full round trip before sending the next fixed-size
+batch. ``EmbeddingExecutor`` instead:
+
+- packs texts into batches by an estimated token budget (plus a hard item
+  cap), so many short chunks share one request and a few long ones don't
+  overflow it;
+- keeps up to ``max_in_flight`` batches in flight at once;
+- retries batches that failed transiently (429, 5xx, connection errors and
+  timeouts) with ``retry_with_backoff_async`` (the same exponential schedule
+  as the scrapers) and fails fast on anything else, such as auth errors or
+  an oversized input; it also halves the in-flight limit on
+  ``429 Too Many Requests`` before growing it back one slot per success;
+- returns embeddings in input order regardless of completion order.
+
+The provider call itself is a plain synchronous ``embed_fn(batch) ->
+vectors`` run in worker threads, so the existing SDK clients are reused
+unchanged.
+
+Usage:
+    executor = EmbeddingExecutor(openai_embed_fn(client, "text-embedding-3-small"))
+    vectors = executor.embed(texts)            # sync callers
+    vectors = await executor.embed_async(texts)  # inside an event loop
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from skill_seekers.cli.utils import retry_with_backoff_async
+
+logger = logging.getLogger(__name__)
+
+#: Rough characters-per-token ratio used for batch sizing (no tokenizer needed).
+CHARS_PER_TOKEN = 4
+
+#: Default token budget per request. OpenAI caps a request at 300k tokens and
+#: Voyage at 120k-320k depending on the model; staying well below both leaves
+#: room for estimation error.
+DEFAULT_MAX_BATCH_TOKENS = 100_000
+
+#: Provider item caps per request.
+OPENAI_MAX_BATCH_ITEMS = 2048
+VOYAGE_MAX_BATCH_ITEMS = 128
+
+EmbedFn = Callable[[list[str]], list[list[float]]]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` (at least 1)."""
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def pack_batches(texts: list[str], max_tokens: int, max_items: int) -> list[list[int]]:
+    """
+    Group text indices into batches bounded by token budget and item count.
+
+    Texts keep their order. A single text larger than ``max_tokens`` gets a
+    batch of its own rather than being split.
+
+    Args:
+        texts: Texts to batch
+        max_tokens: Estimated token budget per batch
+        max_items: Maximum texts per batch
+
+    Returns:
+        List of batches, each a list of indices into ``texts``
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if current and (current_tokens + tokens > max_tokens or len(current) >= max_items):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+#: Exception class names (anywhere in the MRO) of transient transport errors
+#: raised by the OpenAI/Voyage SDKs, httpx and requests.
+_TRANSIENT_ERROR_NAMES = frozenset(
+    {
+        "APIConnectionError",
+        "APITimeoutError",
+        "ConnectError",
+        "ConnectionError",
+        "ServiceUnavailableError",
+        "Timeout",
+        "TimeoutException",
+        "TryAgain",
+    }
+)
+
+
+def _status_of(error: BaseException) -> int | None:
+    """HTTP status carried by a provider error, if any."""
+    for status in (
+        getattr(error, "status_code", None),
+        getattr(getattr(error, "response", None), "status_code", None),
+        getattr(error, "http_status", None),  # voyageai
+    ):
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Whether ``error`` is a provider's "429 Too Many Requests"."""
+    return _status_of(error) == 429 or type(error).__name__ == "RateLimitError"
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a failed batch is worth retrying (429, 5xx, connection or timeout)."""
+    if is_rate_limited(error):
+        return True
+    status = _status_of(error)
+    if status is not None:
+        return status >= 500
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    return any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def openai_embed_fn(client, model: str) -> EmbedFn:
+    """``embed_fn`` for an OpenAI(-compatible) client's embeddings endpoint."""
+
+    def embed(batch: list[str]) -> list[list[float]]:
+        response = client.embeddings.create(input=batch, model=model)
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+    return embed
+
+
+def voyage_embed_fn(client, model: str) -> EmbedFn:
+    """``embed_fn`` for a ``voyageai.Client``."""
+
+    def embed(batch: list[str]) -> list[list[float]]:
+        return client.embed(texts=batch, model=model).embeddings
+
+    return embed
+
+
+class _AdaptiveLimit:
+    """Concurrency limit that halves on throttling and grows by one on success."""
+
+    def __init__(self, maximum: int):
+        self.maximum = maximum
+        self.limit = maximum
+        self.active = 0
+        self.peak = 0
+        self._changed = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    async def release(self, throttled: bool) -> None:
+        async with self._changed:
+            self.active -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+            else:
+                self.limit = min(self.maximum, self.limit + 1)
+            self._changed.notify_all()
+
+
+class EmbeddingExecutor:
+    """
+    Keep several token-budgeted embedding batches in flight.
+
+    Examples:
+        executor = EmbeddingExecutor(embed_fn, max_in_flight=4)
+        vectors = executor.embed(["text1", "text2"])
+        executor.stats()  # batches, retries, throttled, peak_in_flight
+    """
+
+    def __init__(
+        self,
+        embed_fn: EmbedFn,
+        max_in_flight: int = 4,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+        max_batch_items: int = OPENAI_MAX_BATCH_ITEMS,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        on_batch: Callable[[int, int], None] | None = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            embed_fn: Synchronous provider call embedding one batch
+            max_in_flight: Maximum batches sent concurrently
+            max_batch_tokens: Estimated token budget per batch
+            max_batch_items: Maximum texts per batch
+            max_attempts: Attempts per batch; only transient errors are retried
+            base_delay: First retry delay in seconds, doubled each retry
+            on_batch: Optional ``callback(texts_done, texts_total)`` called
+                after each batch completes
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.embed_fn = embed_fn
+        self.max_in_flight = max_in_flight
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_items = max_batch_items
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.on_batch = on_batch
+
+        self._stats = {"batches": 0, "attempts": 0, "throttled": 0, "peak_in_flight": 0}
+
+    async def embed_async(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed ``texts`` with up to ``max_in_flight`` concurrent requests.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings in the order of ``texts``
+
+        Raises:
+            Exception: A batch's non-retryable error, or the last error of a
+                batch that failed every attempt
+        """
+        batches = pack_batches(texts, self.max_batch_tokens, self.max_batch_items)
+        results: list[list[float] | None] = [None] * len(texts)
+        limit = _AdaptiveLimit(self.max_in_flight)
+        done = 0
+
+        async def attempt(batch: list[str]) -> list[list[float]]:
+            await limit.acquire()
+            self._stats["attempts"] += 1
+            throttled = False
+            try:
+                return await asyncio.to_thread(self.embed_fn, batch)
+            except Exception as e:
+                throttled = is_rate_limited(e)
+                if throttled:
+                    self._stats["throttled"] += 1
+                raise
+            finally:
+                await limit.release(throttled)
+
+        async def run(indices: list[int]) -> None:
+            nonlocal done
+            batch = [texts[i] for i in indices]
+            embeddings = await retry_with_backoff_async(
+                lambda: attempt(batch),
+                max_attempts=self.max_attempts,
+                base_delay=self.base_delay,
+                operation_name=f"embedding batch of {len(batch)}",
+                should_retry=is_retryable,
+            )
+            if len(embeddings) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(embeddings)}")
+            for i, embedding in zip(indices, embeddings, strict=True):
+                results[i] = embedding
+            done += len(batch)
+            self._stats["batches"] += 1
+            if self.on_batch:
+                self.on_batch(done, len(texts))
+
+        tasks = [asyncio.create_task(run(indices)) for indices in batches]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], limit.peak)
+
+        return results  # type: ignore[return-value]
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Synchronous ``embed_async``; safe to call from inside a running loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.embed_async(texts))
+
+        # Already inside an event loop: run ours on a separate thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.embed_async(texts)).result()
+
+    def stats(self) -> dict[str, int]:
+        """Batches completed, attempts made, 429s seen and peak concurrency."""
+        return dict(self._stats)
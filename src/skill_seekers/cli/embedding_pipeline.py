@@ -8,13 +8,30 @@ batch processing, caching, and cost tracking.
 
 import hashlib
 import json
+import mmap
+import os
+import struct
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 import numpy as np
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from skill_seekers.cli.embedding_executor import (
+    DEFAULT_MAX_BATCH_TOKENS,
+    OPENAI_MAX_BATCH_ITEMS,
+    EmbeddingExecutor,
+    openai_embed_fn,
+)
+
 
 @dataclass
 class EmbeddingConfig:
@@ -27,6 +44,8 @@ class EmbeddingConfig:
     cache_dir: Path | None = None
     max_retries: int = 3
     retry_delay: float = 1.0
+    max_in_flight: int = 4  # concurrent requests for remote providers
+    max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS
 
 
 @dataclass
@@ -49,6 +68,7 @@ class CostTracker:
     total_requests: int = 0
     cache_hits: int = 0
     cache_misses: int = 0
+    dedup_saved: int = 0
     estimated_cost: float = 0.0
 
     def add_request(self, token_count: int, cost: float, from_cache: bool = False):
@@ -62,6 +82,10 @@ class CostTracker:
         else:
             self.cache_misses += 1
 
+    def add_dedup(self, texts_saved: int):
+        """Record texts that were not sent to the provider thanks to dedup."""
+        self.dedup_saved += texts_saved
+
     def get_stats(self) -> dict[str, Any]:
         """Get statistics."""
         cache_rate = (self.cache_hits / self.total_requests * 100) if self.total_requests > 0 else 0
@@ -72,6 +96,7 @@ class CostTracker:
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
             "cache_rate": f"{cache_rate:.1f}%",
+            "dedup_saved": self.dedup_saved,
             "estimated_cost": f"${self.estimated_cost:.4f}",
         }
 
@@ -79,6 +104,9 @@ class CostTracker:
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
 
+    #: Batches one generate_embeddings call can have in flight at once
+    max_in_flight: int = 1
+
     @abstractmethod
     def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for texts."""
@@ -111,10 +139,31 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         "text-embedding-3-large": 3072,
     }
 
-    def __init__(self, model: str = "text-embedding-ada-002", api_key: str | None = None):
-        """Initialize OpenAI provider."""
+    def __init__(
+        self,
+        model: str = "text-embedding-ada-002",
+        api_key: str | None = None,
+        base_url: str | None = None,
+        max_in_flight: int = 4,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+        max_batch_items: int = OPENAI_MAX_BATCH_ITEMS,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ):
+        """Initialize OpenAI provider.
+
+        ``base_url`` points the client at any OpenAI-compatible endpoint.
+        Texts are sent in token-budgeted batches with up to
+        ``max_in_flight`` requests in flight (see EmbeddingExecutor).
+        """
         self.model = model
         self.api_key = api_key
+        self.base_url = base_url
+        self.max_in_flight = max_in_flight
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_items = max_batch_items
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
         self._client = None
 
     def _get_client(self):
@@ -123,7 +172,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             try:
                 from openai import OpenAI
 
-                self._client = OpenAI(api_key=self.api_key)
+                self._client = OpenAI(api_key=self.api_key, base_url=self.base_url)
             except ImportError:
                 raise ImportError(
                     "OpenAI package not installed. Install with: pip install openai"
@@ -131,15 +180,16 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         return self._client
 
     def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings using OpenAI."""
-        client = self._get_client()
-
-        embeddings = []
-        for text in texts:
-            response = client.embeddings.create(model=self.model, input=text)
-            embeddings.append(response.data[0].embedding)
-
-        return embeddings
+        """Generate embeddings using OpenAI, several batches at a time."""
+        executor = EmbeddingExecutor(
+            openai_embed_fn(self._get_client(), self.model),
+            max_in_flight=self.max_in_flight,
+            max_batch_tokens=self.max_batch_tokens,
+            max_batch_items=self.max_batch_items,
+            max_attempts=self.max_retries,
+            base_delay=self.retry_delay,
+        )
+        return executor.embed(texts)
 
     def get_dimension(self) -> int:
         """Get embedding dimension."""
@@ -180,16 +230,170 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         return 0.0
 
 
+@contextmanager
+def _exclusive_lock(path: Path):
+    """Hold an exclusive inter-process lock on ``path`` (created if missing)."""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class VectorStore:
+    """
+    Sharded, append-only vector file with a hash -> offset index.
+
+    Vectors are appended as raw little-endian float32 to
+    ``vectors-XX.bin`` (one file per shard, chosen by the key's leading
+    byte) and read back through ``mmap`` without parsing. Each shard has an
+    ``vectors-XX.idx`` file of fixed-size (sha256 digest, offset, dimension)
+    records, loaded into memory on open. A vector is written before its index
+    record, so a torn write leaves at most an unindexed tail that is ignored.
+    Appends hold an exclusive lock on ``vectors-XX.lock``, so several
+    processes can share one store without recording each other's offsets.
+    """
+
+    RECORD = struct.Struct("<32sQI")
+    DTYPE = np.dtype("<f4")
+
+    def __init__(self, root: Path, shards: int = 16):
+        """
+        Open (or create) a store.
+
+        Args:
+            root: Directory holding the shard files
+            shards: Number of shards (1-256); must match across runs
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.shards = shards
+        self._index: dict[str, tuple[int, int, int]] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+
+        for shard in range(shards):
+            self._load_index(shard)
+
+    def _bin_path(self, shard: int) -> Path:
+        return self.root / f"vectors-{shard:02x}.bin"
+
+    def _idx_path(self, shard: int) -> Path:
+        return self.root / f"vectors-{shard:02x}.idx"
+
+    def _lock_path(self, shard: int) -> Path:
+        return self.root / f"vectors-{shard:02x}.lock"
+
+    def _shard(self, key: str) -> int:
+        return int(key[:2], 16) % self.shards
+
+    def _load_index(self, shard: int) -> None:
+        idx_path = self._idx_path(shard)
+        if not idx_path.exists():
+            return
+
+        data = idx_path.read_bytes()
+        usable = len(data) - len(data) % self.RECORD.size
+        if usable != len(data):
+            # A partial trailing record is either torn by a crash or still
+            # being appended by another process; only truncate it under the lock
+            with _exclusive_lock(self._lock_path(shard)), open(idx_path, "r+b") as f:
+                data = f.read()
+                usable = len(data) - len(data) % self.RECORD.size
+                f.truncate(usable)
+
+        for digest, offset, dim in self.RECORD.iter_unpack(data[:usable]):
+            self._index[digest.hex()] = (shard, offset, dim)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _view(self, shard: int, offset: int, dim: int) -> np.ndarray:
+        """Zero-copy view of one vector, remapping the shard if it grew."""
+        end = offset + dim * self.DTYPE.itemsize
+        mm = self._maps.get(shard)
+        if mm is None or len(mm) < end:
+            if mm is not None:
+                mm.close()
+            with open(self._bin_path(shard), "rb") as f:
+                mm = self._maps[shard] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return np.frombuffer(mm, dtype=self.DTYPE, count=dim, offset=offset)
+
+    def get(self, key: str) -> list[float] | None:
+        """Vector stored under ``key``, or None."""
+        location = self._index.get(key)
+        if location is None:
+            return None
+        return self._view(*location).tolist()
+
+    def put_many(self, items: list[tuple[str, list[float]]]) -> None:
+        """Append vectors for keys not already stored, grouped by shard."""
+        by_shard: dict[int, list[tuple[str, np.ndarray]]] = {}
+        for key, vector in items:
+            if key not in self._index:
+                by_shard.setdefault(self._shard(key), []).append(
+                    (key, np.asarray(vector, dtype=self.DTYPE))
+                )
+
+        for shard, entries in by_shard.items():
+            records = []
+            # Offsets come from the end of the shard, which another process
+            # sharing the store may move between our open and our writes
+            with _exclusive_lock(self._lock_path(shard)):
+                with open(self._bin_path(shard), "ab") as f:
+                    offset = f.seek(0, os.SEEK_END)
+                    for key, vector in entries:
+                        f.write(vector.tobytes())
+                        records.append((key, offset, len(vector)))
+                        offset += vector.nbytes
+                with open(self._idx_path(shard), "ab") as f:
+                    f.write(
+                        b"".join(
+                            self.RECORD.pack(bytes.fromhex(key), offset, dim)
+                            for key, offset, dim in records
+                        )
+                    )
+            for key, offset, dim in records:
+                self._index[key] = (shard, offset, dim)
+
+    def close(self) -> None:
+        """Release memory maps."""
+        for mm in self._maps.values():
+            mm.close()
+        self._maps = {}
+
+
 class EmbeddingCache:
-    """Cache for embeddings to avoid recomputation."""
+    """
+    Content-addressed cache for embeddings to avoid recomputation.
+
+    Keys are ``sha256(model:text)``, so identical chunks share one vector
+    across documents and, when several skills point at the same
+    ``cache_dir``, across skills. On disk, vectors live in a
+    :class:`VectorStore`; per-vector ``{hash}.json`` files written by older
+    versions are still read and imported on first access.
+    """
 
     def __init__(self, cache_dir: Path | None = None):
         """Initialize cache."""
         self.cache_dir = Path(cache_dir) if cache_dir else None
         self._memory_cache: dict[str, list[float]] = {}
+        self._store: VectorStore | None = None
 
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._store = VectorStore(self.cache_dir / "vectors")
 
     def _compute_hash(self, text: str, model: str) -> str:
         """Compute cache key."""
@@ -198,49 +402,51 @@ class EmbeddingCache:
 
     def get(self, text: str, model: str) -> list[float] | None:
         """Get embedding from cache."""
-        cache_key = self._compute_hash(text, model)
+        return self.get_by_key(self._compute_hash(text, model))
 
+    def get_by_key(self, cache_key: str) -> list[float] | None:
+        """Get embedding by precomputed cache key."""
         # Check memory cache
         if cache_key in self._memory_cache:
             return self._memory_cache[cache_key]
 
-        # Check disk cache
-        if self.cache_dir:
-            cache_file = self.cache_dir / f"{cache_key}.json"
-            if cache_file.exists():
-                try:
-                    data = json.loads(cache_file.read_text())
-                    embedding = data["embedding"]
-                    self._memory_cache[cache_key] = embedding
-                    return embedding
-                except Exception:
-                    pass
+        if self._store is None:
+            return None
+
+        # Check vector store
+        embedding = self._store.get(cache_key)
+        if embedding is not None:
+            return embedding
+
+        # Legacy per-vector JSON file
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        if cache_file.exists():
+            try:
+                embedding = json.loads(cache_file.read_text())["embedding"]
+                self._store.put_many([(cache_key, embedding)])
+                return embedding
+            except Exception:
+                pass
 
         return None
 
     def set(self, text: str, model: str, embedding: list[float]) -> None:
         """Store embedding in cache."""
-        cache_key = self._compute_hash(text, model)
+        self.set_many([(self._compute_hash(text, model), embedding)])
 
-        # Store in memory
-        self._memory_cache[cache_key] = embedding
+    def set_many(self, items: list[tuple[str, list[float]]]) -> None:
+        """Store (cache_key, embedding) pairs with one append per shard."""
+        if self._store is None:
+            for cache_key, embedding in items:
+                self._memory_cache[cache_key] = embedding
+            return
 
-        # Store on disk
-        if self.cache_dir:
-            cache_file = self.cache_dir / f"{cache_key}.json"
-            try:
-                cache_file.write_text(
-                    json.dumps(
-                        {
-                            "text_hash": cache_key,
-                            "model": model,
-                            "embedding": embedding,
-                            "timestamp": time.time(),
-                        }
-                    )
-                )
-            except Exception as e:
-                print(f"⚠️  Warning: Failed to write cache: {e}")
+        try:
+            self._store.put_many(items)
+        except Exception as e:
+            print(f"⚠️  Warning: Failed to write cache: {e}")
+            for cache_key, embedding in items:
+                self._memory_cache[cache_key] = embedding
 
 
 class EmbeddingPipeline:
@@ -260,7 +466,14 @@ class EmbeddingPipeline:
     def _create_provider(self) -> EmbeddingProvider:
         """Create provider based on config."""
         if self.config.provider == "openai":
-            return OpenAIEmbeddingProvider(self.config.model)
+            return OpenAIEmbeddingProvider(
+                self.config.model,
+                max_in_flight=self.config.max_in_flight,
+                max_batch_tokens=self.config.max_batch_tokens,
+                max_batch_items=self.config.batch_size,
+                max_retries=self.config.max_retries,
+                retry_delay=self.config.retry_delay,
+            )
         elif self.config.provider == "local":
             return LocalEmbeddingProvider(self.config.dimension)
         else:
@@ -275,6 +488,10 @@ class EmbeddingPipeline:
         """
         Generate embeddings for batch of texts.
 
+        Texts are deduplicated by content hash first: each distinct text is
+        looked up in the cache once and sent to the provider at most once,
+        and its vector is fanned back out to every position it occurs at.
+
         Args:
             texts: List of texts to embed
             show_progress: Show progress output
@@ -283,66 +500,70 @@ class EmbeddingPipeline:
             EmbeddingResult with embeddings and metadata
         """
         start_time = time.time()
-        embeddings = []
-        cached_count = 0
-        generated_count = 0
+        model = self.config.model
 
         if show_progress:
             print(f"🔄 Generating embeddings...")
             print(f"   Texts: {len(texts)}")
             print(f"   Provider: {self.config.provider}")
-            print(f"   Model: {self.config.model}")
+            print(f"   Model: {model}")
             print(f"   Batch size: {self.config.batch_size}")
 
-        # Process in batches
-        for i in range(0, len(texts), self.config.batch_size):
-            batch = texts[i : i + self.config.batch_size]
-            batch_embeddings = []
-            to_generate = []
-            to_generate_indices = []
-
-            # Check cache
-            for j, text in enumerate(batch):
-                cached = self.cache.get(text, self.config.model)
-                if cached:
-                    batch_embeddings.append(cached)
-                    cached_count += 1
-                else:
-                    to_generate.append(text)
-                    to_generate_indices.append(j)
-
-            # Generate missing embeddings
-            if to_generate:
-                new_embeddings = self.provider.generate_embeddings(to_generate)
-
-                # Store in cache
-                for text, embedding in zip(to_generate, new_embeddings, strict=False):
-                    self.cache.set(text, self.config.model, embedding)
-
-                # Track cost
-                total_tokens = sum(self._estimate_tokens(t) for t in to_generate)
-                cost = self.provider.estimate_cost(total_tokens)
-                self.cost_tracker.add_request(total_tokens, cost, from_cache=False)
-
-                # Merge with cached
-                for idx, embedding in zip(to_generate_indices, new_embeddings, strict=False):
-                    batch_embeddings.insert(idx, embedding)
-
-                generated_count += len(to_generate)
-
-            embeddings.extend(batch_embeddings)
+        # Content-address every text; the first occurrence represents the key
+        keys = [self.cache._compute_hash(text, model) for text in texts]
+        unique: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            unique.setdefault(key, text)
+
+        vectors: dict[str, list[float]] = {}
+        for key in unique:
+            cached = self.cache.get_by_key(key)
+            if cached is not None:
+                vectors[key] = cached
+        cached_keys = set(vectors)
+        missing = [key for key in unique if key not in cached_keys]
+
+        # Generate missing embeddings, distinct texts only. Each provider call
+        # gets enough texts to keep its concurrent requests busy; results are
+        # cached and progress reported once per call.
+        chunk_size = self.config.batch_size * max(1, self.provider.max_in_flight)
+        for i in range(0, len(missing), chunk_size):
+            batch_keys = missing[i : i + chunk_size]
+            batch_texts = [unique[key] for key in batch_keys]
+            new_embeddings = self.provider.generate_embeddings(batch_texts)
+
+            # Store in cache
+            self.cache.set_many(list(zip(batch_keys, new_embeddings, strict=True)))
+            vectors.update(zip(batch_keys, new_embeddings, strict=True))
+
+            # Track cost
+            total_tokens = sum(self._estimate_tokens(t) for t in batch_texts)
+            cost = self.provider.estimate_cost(total_tokens)
+            self.cost_tracker.add_request(total_tokens, cost, from_cache=False)
+
+            if show_progress and len(missing) > chunk_size:
+                progress = min(i + chunk_size, len(missing))
+                print(
+                    f"   Progress: {progress}/{len(missing)} unique "
+                    f"({progress / len(missing) * 100:.1f}%)"
+                )
 
-            if show_progress and len(texts) > self.config.batch_size:
-                progress = min(i + self.config.batch_size, len(texts))
-                print(f"   Progress: {progress}/{len(texts)} ({progress / len(texts) * 100:.1f}%)")
+        # Fan results back out to every position
+        embeddings = [vectors[key] for key in keys]
+        cached_count = sum(1 for key in keys if key in cached_keys)
+        generated_count = len(texts) - cached_count
+        duplicate_count = len(texts) - len(unique)
+        calls_saved = generated_count - len(missing)
+        self.cost_tracker.add_dedup(calls_saved)
 
         total_time = time.time() - start_time
 
         if show_progress:
             print(f"\n✅ Embeddings generated!")
             print(f"   Total: {len(embeddings)}")
+            print(f"   Unique: {len(unique)} ({duplicate_count} duplicates)")
             print(f"   Cached: {cached_count}")
-            print(f"   Generated: {generated_count}")
+            print(f"   Generated: {len(missing)} (saved {calls_saved} by dedup)")
             print(f"   Time: {total_time:.2f}s")
 
             if self.config.provider != "local":
@@ -353,8 +574,13 @@ class EmbeddingPipeline:
             embeddings=embeddings,
             metadata={
                 "provider": self.config.provider,
-                "model": self.config.model,
+                "model": model,
                 "dimension": self.provider.get_dimension(),
+                "unique_texts": len(unique),
+                "duplicate_texts": duplicate_count,
+                "dedup_ratio": duplicate_count / len(texts) if texts else 0.0,
+                "provider_texts": len(missing),
+                "provider_calls_saved": calls_saved,
             },
             cached_count=cached_count,
             generated_count=generated_count,
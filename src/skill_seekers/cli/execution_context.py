@@ -130,6 +130,13 @@ class AnalysisSettings(BaseModel):
     skip_docs: bool = Field(default=False, description="Skip documentation extraction")
     no_comments: bool = Field(default=False, description="Skip comment extraction")
     file_patterns: list[str] | None = Field(default=None, description="File patterns to analyze")
+    jobs: int = Field(
+        default=1, ge=0, description="Worker processes for per-file analysis (0 = one per CPU)"
+    )
+    cache: str | None = Field(
+        default=None, description="Per-file analysis cache database (None = default location)"
+    )
+    no_cache: bool = Field(default=False, description="Disable the per-file analysis cache")
 
 
 class ExecutionContext(BaseModel):
@@ -351,6 +358,9 @@ class ExecutionContext(BaseModel):
                 "skip_docs": analysis["skip_docs"],
                 "no_comments": analysis["no_comments"],
                 "file_patterns": None,
+                "jobs": analysis["jobs"],
+                "cache": None,
+                "no_cache": analysis["no_cache"],
             },
         }
 
@@ -511,6 +521,12 @@ class ExecutionContext(BaseModel):
             config.setdefault("analysis", {})["file_patterns"] = [
                 p.strip() for p in args.file_patterns.split(",")
             ]
+        if getattr(args, "jobs", None) is not None:
+            config.setdefault("analysis", {})["jobs"] = args.jobs
+        if getattr(args, "analysis_cache", None):
+            config.setdefault("analysis", {})["cache"] = args.analysis_cache
+        if getattr(args, "no_analysis_cache", False):
+            config.setdefault("analysis", {})["no_cache"] = True
 
         # Enhancement timeout (also accepted on the create path, not just enhance).
         if getattr(args, "timeout", None) is not None:
@@ -0,0 +1,563 @@
+"""
+Parallel, single-parse per-file analysis for analyze_codebase().
+
+Each source file is read once into a :class:`FileModel` (content, language,
+line index and, for Python, one AST parse). Every per-file stage — code
+signatures, dependency extraction, design pattern detection and test example
+extraction — takes its input from that model, so no stage re-reads or
+re-parses the file.
+
+Files are analyzed in a pool of worker processes (AST parsing and the
+regex-based analyzers are pure CPU, so threads would not help). Files are
+handed out in small chunks and results come back in input order, so
+``code_analysis.json`` and the other outputs are identical for any ``jobs``.
+
+Each file gets a wall-clock budget (``file_timeout``); a file that exceeds it
+is skipped with a warning instead of stalling the run.
+
+With an :class:`~skill_seekers.cli.analysis_cache.AnalysisCache`, files whose
+content, path, language and stage settings match a previous run reuse that
+run's results and are not analyzed again. In a git work tree, files that
+``git diff`` reports unchanged since the last analyzed commit are not even
+read.
+
+Usage:
+    from skill_seekers.cli.file_analysis import FileStages, analyze_files
+
+    results = analyze_files(
+        [(path, "Python") for path in files],
+        root,
+        FileStages(depth="deep", dependencies=True, patterns=True),
+        jobs=8,
+    )
+"""
+
+import ast
+import dataclasses
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from skill_seekers._version import __version__
+from skill_seekers.cli import git_changes
+from skill_seekers.cli.analysis_cache import AnalysisCache, cache_key
+from skill_seekers.cli.code_analyzer import CodeAnalyzer
+from skill_seekers.cli.dependency_analyzer import DependencyAnalyzer, DependencyInfo
+from skill_seekers.cli.utils import build_line_index
+
+logger = logging.getLogger(__name__)
+
+#: Default per-file analysis budget in seconds.
+DEFAULT_FILE_TIMEOUT = 60.0
+
+#: Part of every analysis cache key. Bump when an analyzer's output changes
+#: without a package version change.
+ANALYSIS_CACHE_VERSION = 2
+
+#: One file to analyze: (path, language)
+SourceFile = tuple[Path, str]
+
+#: Analysis result keys that make a file worth keeping. Import-only files
+#: are kept for framework detection (#239).
+CONTENT_KEYS = (
+    "classes",
+    "functions",
+    "imports",
+    "nodes",  # Godot scenes
+    "properties",  # Godot resources
+    "uniforms",  # Godot shaders
+    "signals",  # GDScript signals
+    "exports",  # GDScript exports
+)
+
+
+class FileAnalysisTimeout(BaseException):
+    """Raised inside an analysis when a file exceeds its time budget.
+
+    Derives from BaseException so the analyzers' own ``except Exception``
+    fallbacks cannot swallow it.
+    """
+
+
+@dataclass
+class FileModel:
+    """
+    One source file, read once and parsed at most once.
+
+    ``line_index`` and ``tree`` are built on first use and then shared by
+    every stage that needs them.
+    """
+
+    path: Path
+    relative: Path
+    language: str
+    content: str
+    parses: int = 0
+
+    @classmethod
+    def read(cls, path: Path, root: Path, language: str) -> "FileModel":
+        content = path.read_text(encoding="utf-8", errors="ignore")
+        return cls(path, path.relative_to(root), language, content)
+
+    @cached_property
+    def line_index(self) -> list[int]:
+        return build_line_index(self.content)
+
+    @cached_property
+    def tree(self) -> ast.Module | None:
+        """Python AST (None for other languages or on a syntax error)."""
+        if self.language != "Python":
+            return None
+        self.parses += 1
+        try:
+            return ast.parse(self.content)
+        except SyntaxError:
+            return None
+
+
+@dataclass(frozen=True)
+class FileStages:
+    """Which per-file stages analyze_files runs, and their settings."""
+
+    depth: str = "deep"
+    dependencies: bool = False
+    patterns: bool = False
+    test_examples: bool = False
+    test_languages: tuple[str, ...] | None = None
+    test_min_confidence: float = 0.5
+    test_max_per_file: int = 10
+
+    @property
+    def has_work(self) -> bool:
+        # Surface depth skips signature extraction
+        return self.depth != "surface" or self.dependencies or self.patterns or self.test_examples
+
+
+@dataclass
+class FileResult:
+    """Everything the stages produced for one file (picklable, no content)."""
+
+    relative: Path
+    language: str
+    entry: dict[str, Any] | None = None  # code_analysis.json entry
+    dependencies: list | None = None  # DependencyInfo list; None if not extracted
+    patterns: dict[str, Any] | None = None  # PatternReport.to_dict(), if any found
+    test_examples: list = field(default_factory=list)  # TestExample list
+    errors: list[str] = field(default_factory=list)
+    bytes_read: int = 0
+    parses: int = 0
+
+
+class FileStageRunner:
+    """The analyzers for every enabled stage, built once and reused per file."""
+
+    def __init__(self, stages: FileStages):
+        self.stages = stages
+        self.code_analyzer = CodeAnalyzer(depth=stages.depth)
+        # Pattern detection needs deep signatures even when the run is surface
+        self.pattern_analyzer = (
+            CodeAnalyzer(depth="deep")
+            if stages.patterns and stages.depth == "surface"
+            else self.code_analyzer
+        )
+        self.dependency_analyzer = DependencyAnalyzer() if stages.dependencies else None
+
+        self.pattern_recognizer = None
+        if stages.patterns:
+            from skill_seekers.cli.pattern_recognizer import PatternRecognizer
+
+            self.pattern_recognizer = PatternRecognizer(depth=stages.depth, enhance_with_ai=False)
+
+        self.test_extractor = None
+        if stages.test_examples:
+            from skill_seekers.cli.test_example_extractor import TestExampleExtractor
+
+            # AI enhancement runs once over all examples in the parent process
+            self.test_extractor = TestExampleExtractor(
+                min_confidence=stages.test_min_confidence,
+                max_per_file=stages.test_max_per_file,
+                languages=list(stages.test_languages) if stages.test_languages else None,
+                enhance_with_ai=False,
+            )
+
+    def run(self, model: FileModel) -> FileResult:
+        """Run every enabled stage on one file; stage failures are collected, not raised."""
+        result = FileResult(model.relative, model.language, bytes_read=len(model.content))
+        file_path = str(model.path)
+
+        analysis: dict[str, Any] = {}
+        if self.stages.depth != "surface":
+            analysis = self.code_analyzer.analyze_file(
+                file_path, model.content, model.language, model.tree, model.line_index
+            )
+            if analysis and any(analysis.get(key) for key in CONTENT_KEYS):
+                result.entry = {"file": str(model.relative), "language": model.language, **analysis}
+
+        if self.dependency_analyzer is not None:
+            try:
+                # '/'-separated keys on Windows too: import resolution matches
+                # on '/' suffixes (#425)
+                result.dependencies = self.dependency_analyzer.extract_dependencies(
+                    model.relative.as_posix(),
+                    model.content,
+                    model.language,
+                    model.tree,
+                    model.line_index,
+                )
+            except Exception as e:
+                result.errors.append(f"Error analyzing dependencies for {model.path}: {e}")
+
+        if self.pattern_recognizer is not None:
+            try:
+                if self.pattern_analyzer is not self.code_analyzer:
+                    analysis = self.pattern_analyzer.analyze_file(
+                        file_path, model.content, model.language, model.tree, model.line_index
+                    )
+                report = self.pattern_recognizer.analyze_file(
+                    file_path, model.content, model.language, analysis=analysis
+                )
+                if report.patterns:
+                    result.patterns = report.to_dict()
+            except Exception as e:
+                result.errors.append(f"Pattern detection failed for {model.path}: {e}")
+
+        if self.test_extractor is not None and self.test_extractor.is_test_file(model.path):
+            try:
+                result.test_examples = self.test_extractor.extract_from_source(
+                    model.path, model.content, model.tree
+                )
+            except Exception as e:
+                result.errors.append(f"Test example extraction failed for {model.path}: {e}")
+
+        result.parses = model.parses
+        return result
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """Worker count for ``--jobs`` (0 or None = one per CPU)."""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+@contextmanager
+def _deadline(seconds: float | None) -> Iterator[None]:
+    """Raise FileAnalysisTimeout if the block runs longer than ``seconds``.
+
+    Uses SIGALRM, so it is a no-op off the main thread and on platforms
+    without ``setitimer`` (Windows).
+    """
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def _expire(_signum, _frame):
+        raise FileAnalysisTimeout
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def analyze_source_file(
+    runner: FileStageRunner,
+    file_path: Path,
+    language: str,
+    root: Path,
+    file_timeout: float | None = DEFAULT_FILE_TIMEOUT,
+) -> FileResult:
+    """
+    Read one file once and run every enabled stage on it.
+
+    Args:
+        runner: Stage analyzers to use
+        file_path: Absolute path to the file
+        language: Language from ``detect_language``
+        root: Directory results are made relative to
+        file_timeout: Seconds before the file is abandoned (None = no limit)
+
+    Returns:
+        The file's FileResult; if the file could not be read or timed out,
+        only ``errors`` is set
+    """
+    relative = file_path.relative_to(root)
+    if not runner.stages.has_work:
+        return FileResult(relative, language)
+    try:
+        with _deadline(file_timeout):
+            return runner.run(FileModel.read(file_path, root, language))
+    except FileAnalysisTimeout:
+        error = f"Timed out analyzing {file_path} after {file_timeout:g}s, skipping"
+    except Exception as e:
+        error = f"Error analyzing {file_path}: {e}"
+    return FileResult(relative, language, errors=[error])
+
+
+# Per-process stage runner for the analyze_files pool, built once per worker
+# by _init_analysis_worker so only paths and results cross the process boundary.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_analysis_worker(stages: FileStages, root: str, file_timeout: float | None) -> None:
+    """ProcessPoolExecutor initializer: build the worker-local analyzers."""
+    _WORKER_STATE.update(runner=FileStageRunner(stages), root=Path(root), file_timeout=file_timeout)
+
+
+def _analyze_in_worker(source: SourceFile) -> FileResult:
+    """Analyze one file inside a pool worker."""
+    if not _WORKER_STATE:
+        raise RuntimeError("analysis worker not initialized")
+    return analyze_source_file(
+        _WORKER_STATE["runner"],
+        source[0],
+        source[1],
+        _WORKER_STATE["root"],
+        _WORKER_STATE["file_timeout"],
+    )
+
+
+def _chunksize(count: int, workers: int) -> int:
+    # Several chunks per worker so one slow chunk doesn't leave the others idle
+    return max(1, min(64, count // (workers * 8)))
+
+
+def _analyze_uncached(
+    sources: Sequence[SourceFile],
+    root: Path,
+    stages: FileStages,
+    runner: FileStageRunner,
+    jobs: int,
+    file_timeout: float | None,
+) -> list[FileResult]:
+    """Run the stages on every source, in a worker pool when ``jobs`` allows."""
+    results: list[FileResult] = []
+    analyzed = 0
+
+    def collect(result: FileResult):
+        nonlocal analyzed
+        results.append(result)
+        for error in result.errors:
+            logger.warning(error)
+        if result.entry is not None:
+            analyzed += 1
+            if analyzed % 10 == 0:
+                logger.info(f"Analyzed {analyzed}/{len(sources)} files...")
+
+    workers = min(resolve_jobs(jobs), len(sources)) if stages.has_work else 1
+    if workers > 1:
+        logger.info(f"Analyzing {len(sources)} files with {workers} worker processes")
+        # spawn, not fork: callers may hold threads or open pools
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_analysis_worker,
+                initargs=(stages, str(root), file_timeout),
+            ) as pool:
+                for result in pool.map(
+                    _analyze_in_worker, sources, chunksize=_chunksize(len(sources), workers)
+                ):
+                    collect(result)
+        except BrokenProcessPool as e:
+            logger.warning(
+                f"⚠️  Analysis pool failed ({e}); analyzing the remaining "
+                f"{len(sources) - len(results)} files in-process"
+            )
+
+    for file_path, language in sources[len(results) :]:
+        collect(analyze_source_file(runner, file_path, language, root, file_timeout))
+
+    if results:
+        logger.info(
+            f"Read {len(results)} files once "
+            f"({sum(r.bytes_read for r in results) / 1_000_000:.1f} MB), "
+            f"{sum(r.parses for r in results)} ASTs parsed and shared across stages"
+        )
+    return results
+
+
+def _relocate(value: Any, old: str, new: str) -> Any:
+    """Replace the string ``old`` with ``new`` anywhere in a cached result."""
+    if isinstance(value, str):
+        return new if value == old else value
+    if isinstance(value, list):
+        return [_relocate(item, old, new) for item in value]
+    if isinstance(value, dict):
+        return {key: _relocate(item, old, new) for key, item in value.items()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        for f in dataclasses.fields(value):
+            setattr(value, f.name, _relocate(getattr(value, f.name), old, new))
+    return value
+
+
+def _result_to_json(result: FileResult) -> dict[str, Any]:
+    """A FileResult as plain JSON values, for the analysis cache."""
+    data = dataclasses.asdict(result)
+    data["relative"] = result.relative.as_posix()
+    return data
+
+
+def _result_from_json(data: dict[str, Any]) -> FileResult:
+    """Rebuild a FileResult stored by :func:`_result_to_json`."""
+    from skill_seekers.cli.test_example_extractor import TestExample
+
+    result = FileResult(**data)
+    result.relative = Path(data["relative"])
+    if result.dependencies is not None:
+        result.dependencies = [DependencyInfo(**dep) for dep in result.dependencies]
+    result.test_examples = [TestExample(**example) for example in result.test_examples]
+    return result
+
+
+def _git_unchanged(
+    root: Path, fingerprint: str, cache: AnalysisCache
+) -> tuple[str | None, dict[str, str]]:
+    """HEAD of ``root``, and the recorded keys of files git says are unchanged since the last run."""
+    head = git_changes.head_commit(root)
+    snapshot = cache.get_snapshot(str(root), fingerprint) if head else None
+    if snapshot is None:
+        return head, {}
+
+    commit, keys = snapshot
+    changed = git_changes.changed_paths(root, commit)
+    if changed is None:
+        logger.info(f"Commit {commit[:12]} is not in the local history; hashing every file")
+        return head, {}
+    logger.info(f"{len(changed)} files changed since {commit[:12]} (git diff)")
+    return head, {path: key for path, key in keys.items() if path not in changed}
+
+
+def _lookup_cached(
+    sources: Sequence[SourceFile],
+    root: Path,
+    fingerprint: str,
+    cache: AnalysisCache,
+    unchanged: dict[str, str],
+) -> tuple[list[FileResult | None], dict[int, str]]:
+    """Cached results by source index (None = miss), and the key of every readable source."""
+    keys: dict[int, str] = {}
+    for i, (file_path, language) in enumerate(sources):
+        relative = file_path.relative_to(root).as_posix()
+        if relative in unchanged:
+            keys[i] = unchanged[relative]
+            continue
+        try:
+            content = file_path.read_bytes()
+        except OSError:
+            continue  # analyze_source_file reports the error
+        keys[i] = cache_key(relative, content, language, fingerprint)
+
+    found = cache.get_many(list(keys.values()))
+    cached: list[FileResult | None] = [None] * len(sources)
+    for i, key in keys.items():
+        if key in found:
+            # Stored as (absolute path when analyzed, result): results carry
+            # absolute paths, which move when the repository is checked out elsewhere
+            try:
+                analyzed_path, data = found[key]
+                result = _result_from_json(data)
+            except (TypeError, ValueError):
+                continue  # not a result this version wrote; analyze again
+            cached[i] = _relocate(result, analyzed_path, str(sources[i][0]))
+    return cached, keys
+
+
+def _record_snapshot(
+    sources: Sequence[SourceFile],
+    root: Path,
+    fingerprint: str,
+    cache: AnalysisCache,
+    head: str,
+    keys: dict[int, str],
+) -> None:
+    """Remember the keys of files whose content is exactly their content at ``head``."""
+    dirty = git_changes.changed_paths(root, head)
+    tracked = git_changes.tracked_paths(root)
+    if dirty is None or tracked is None:
+        return
+    clean = {}
+    for i, key in keys.items():
+        relative = sources[i][0].relative_to(root).as_posix()
+        if relative in tracked and relative not in dirty:
+            clean[relative] = key
+    cache.set_snapshot(str(root), fingerprint, head, clean)
+
+
+def analyze_files(
+    sources: Sequence[SourceFile],
+    root: Path,
+    stages: FileStages | None = None,
+    jobs: int = 1,
+    file_timeout: float | None = DEFAULT_FILE_TIMEOUT,
+    cache: AnalysisCache | None = None,
+    use_git: bool = True,
+) -> list[FileResult]:
+    """
+    Analyze source files, optionally in parallel worker processes.
+
+    Args:
+        sources: (path, language) pairs, in the order results should appear
+        root: Directory results are made relative to
+        stages: Stages to run (default: code signatures at deep depth only)
+        jobs: Worker processes (1 = analyze in this process, 0 = one per CPU)
+        file_timeout: Per-file budget in seconds (None = no limit)
+        cache: Reuse and store per-file results across runs; files that
+            failed or timed out are not stored
+        use_git: With ``cache``, when ``root`` is in a git work tree, reuse
+            files git reports unchanged since the last run without reading
+            them (falls back to hashing every file without that history)
+
+    Returns:
+        One FileResult per source, in the order of ``sources`` regardless
+        of ``jobs`` or of which results came from ``cache``
+    """
+    stages = stages or FileStages()
+    # Built up front so missing optional dependencies fail here, not in a worker
+    runner = FileStageRunner(stages)
+
+    if cache is None or not stages.has_work:
+        return _analyze_uncached(sources, root, stages, runner, jobs, file_timeout)
+
+    fingerprint = f"{__version__}/{ANALYSIS_CACHE_VERSION}/{stages!r}"
+    head, unchanged = _git_unchanged(root, fingerprint, cache) if use_git else (None, {})
+    results, keys = _lookup_cached(sources, root, fingerprint, cache, unchanged)
+    misses = [i for i, result in enumerate(results) if result is None]
+    logger.info(
+        f"Analysis cache: reusing {len(sources) - len(misses)}/{len(sources)} files "
+        f"({(len(sources) - len(misses)) / len(sources):.0%} hit rate), "
+        f"analyzing {len(misses)}"
+        if sources
+        else "Analysis cache: no files to analyze"
+    )
+
+    fresh = _analyze_uncached(
+        [sources[i] for i in misses], root, stages, runner, jobs, file_timeout
+    )
+    store = []
+    for i, result in zip(misses, fresh, strict=True):
+        results[i] = result
+        if i in keys and not result.errors:
+            store.append((keys[i], (str(sources[i][0]), _result_to_json(result))))
+    if store:
+        cache.set_many(store)
+    if head is not None:
+        _record_snapshot(sources, root, fingerprint, cache, head, keys)
+    return results
@@ -0,0 +1,77 @@
+"""
+Git-based change detection for incremental codebase analysis.
+
+Thin wrappers around the ``git`` CLI. Every function returns None when git
+is missing, the directory is not inside a work tree, or the requested
+history is unavailable (e.g. a commit outside a shallow clone), so callers
+can fall back to a full scan.
+
+Paths are '/'-separated and relative to the directory passed in, which may
+be a subdirectory of the repository.
+"""
+
+import subprocess
+from pathlib import Path
+
+#: Seconds before a git command is abandoned.
+GIT_TIMEOUT = 60
+
+
+def _git(directory: Path, *args: str) -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(directory), *args],
+            capture_output=True,
+            text=True,
+            timeout=GIT_TIMEOUT,
+        )
+    except (FileNotFoundError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _split(output: str) -> set[str]:
+    return {path for path in output.split("\0") if path}
+
+
+def head_commit(directory: Path) -> str | None:
+    """Full SHA of HEAD for the work tree containing ``directory``."""
+    output = _git(directory, "rev-parse", "--verify", "-q", "HEAD")
+    return output.strip() if output else None
+
+
+def changed_paths(directory: Path, since: str) -> set[str] | None:
+    """
+    Files under ``directory`` that differ from commit ``since``.
+
+    Covers committed, staged and unstaged changes to tracked files
+    (``git diff --name-status`` against the work tree, renames as a delete
+    plus an add) and untracked files that are not ignored.
+
+    Args:
+        directory: Directory inside a git work tree
+        since: Commit SHA to compare against
+
+    Returns:
+        Changed (added, modified, deleted or renamed) paths, or None if
+        ``since`` is not in the local history
+    """
+    if _git(directory, "cat-file", "-e", f"{since}^{{commit}}") is None:
+        return None
+    diff = _git(directory, "diff", "--name-status", "--no-renames", "--relative", "-z", since, "--")
+    untracked = _git(directory, "ls-files", "-z", "--others", "--exclude-standard")
+    if diff is None or untracked is None:
+        return None
+
+    # -z --name-status output alternates status and path fields
+    fields = diff.split("\0")
+    changed = {path for path in fields[1::2] if path}
+    return changed | _split(untracked)
+
+
+def tracked_paths(directory: Path) -> set[str] | None:
+    """Files under ``directory`` that are tracked in the index."""
+    output = _git(directory, "ls-files", "-z")
+    return _split(output) if output is not None else None
@@ -0,0 +1,707 @@
+"""
+Bulk GitHub repository fetching for remote (API-mode) scrapes.
+
+GitHubAPIClient lists a whole repository in one recursive Git Trees call
+(``GET /repos/{owner}/{repo}/git/trees/{sha}?recursive=1``) and downloads
+file contents concurrently through a bounded async pool:
+
+- Few files: one ``raw.githubusercontent.com`` request per file. Raw
+  downloads do not count against the REST API rate limit.
+- Many files: one tarball of the commit (a single API call), from which only
+  the wanted files are read.
+
+Downloaded blobs are kept in a SQLite BlobCache keyed by git blob SHA, so
+files that did not change since an earlier run (on any branch or fork) are
+never downloaded again. REST rate-limit responses are handed to the shared
+RateLimitHandler, which waits, switches profile or aborts per its strategy.
+
+IssueSyncStore keeps fetched issues between runs so that a refresh only asks
+for issues updated since the last sync (see GitHubThreeStreamFetcher).
+
+Usage:
+    from skill_seekers.cli.github_api import BlobCache, GitHubAPIClient, default_blob_cache_path
+
+    client = GitHubAPIClient("facebook/react", token=token)
+    tree = client.fetch_tree("main")
+    blobs = [e for e in tree.entries if e.path.endswith(".js")]
+    with BlobCache(default_blob_cache_path()) as cache:
+        contents = client.fetch_blobs(blobs, tree.commit, cache)  # {path: bytes}
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import tarfile
+import tempfile
+import time
+import zlib
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, TypeVar
+from urllib.parse import parse_qs, quote, urlparse
+
+import httpx
+
+from .analysis_cache import default_cache_path
+from .rate_limit_handler import RateLimitError, RateLimitHandler, create_github_headers
+from .utils import retry_with_backoff_async
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: REST API root (override for GitHub Enterprise or a test server).
+GITHUB_API_URL = "https://api.github.com"
+#: Raw file host; downloads here are not charged to the REST rate limit.
+GITHUB_RAW_URL = "https://raw.githubusercontent.com"
+#: Above this many files to download, one tarball beats per-file requests.
+TARBALL_THRESHOLD = 200
+#: Concurrent downloads.
+DEFAULT_WORKERS = 8
+
+#: Stay below SQLite's default host-parameter limit (999 before 3.32).
+_SQL_BATCH = 500
+
+
+def default_blob_cache_path() -> Path:
+    """``github_blobs.db`` next to the analysis cache."""
+    return default_cache_path().parent / "github_blobs.db"
+
+
+def default_github_cache_path() -> Path:
+    """``github_api.db`` (ETag pages and synced issues) next to the analysis cache."""
+    return default_cache_path().parent / "github_api.db"
+
+
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+
+def parse_link_header(value: str | None) -> dict[str, str]:
+    """
+    Parse a pagination ``Link`` header.
+
+    Args:
+        value: Header value, e.g. ``<...?page=2>; rel="next", <...?page=9>; rel="last"``
+
+    Returns:
+        Mapping of rel -> URL (empty when there is no header)
+    """
+    if not isinstance(value, str):
+        return {}
+    return {rel: url for url, rel in _LINK_RE.findall(value)}
+
+
+def link_page_number(url: str | None) -> int | None:
+    """``page`` query parameter of a pagination URL."""
+    if not url:
+        return None
+    pages = parse_qs(urlparse(url).query).get("page")
+    try:
+        return int(pages[0]) if pages else None
+    except ValueError:
+        return None
+
+
+def git_blob_sha(content: bytes) -> str:
+    """SHA1 git assigns to a blob with ``content``."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    """One entry of a Git tree."""
+
+    path: str
+    type: str  # "blob", "tree" or "commit" (submodule)
+    sha: str
+    size: int | None = None
+
+
+@dataclass
+class RepoTree:
+    """Every entry of a repository at one commit."""
+
+    commit: str
+    entries: list[TreeEntry]
+
+
+class BlobCache:
+    """
+    SQLite-backed cache of git blob contents keyed by blob SHA.
+
+    A blob SHA identifies content, not a path, so entries are shared by
+    every repository, branch and commit that contains the same file. Only
+    content whose SHA verifies is stored. Entries not used for ``ttl_days``
+    are pruned when the cache is opened.
+    """
+
+    def __init__(self, db_path: str | Path = ":memory:", ttl_days: int = 30):
+        """
+        Open (or create) a blob cache.
+
+        Args:
+            db_path: Path to SQLite database (":memory:" for in-memory)
+            ttl_days: Days an unused entry is kept
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            self.db_path = str(Path(self.db_path).expanduser())
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        if self.db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    sha TEXT PRIMARY KEY,
+                    content BLOB NOT NULL,
+                    accessed_at TEXT NOT NULL
+                )
+            """)
+            cutoff = (datetime.utcnow() - timedelta(days=ttl_days)).isoformat()
+            self.conn.execute("DELETE FROM blobs WHERE accessed_at < ?", (cutoff,))
+
+    def get_many(self, shas: list[str]) -> dict[str, bytes]:
+        """
+        Look up blobs, refreshing the access time of every hit.
+
+        Args:
+            shas: Git blob SHAs
+
+        Returns:
+            Mapping of SHA -> content for the blobs that were found
+        """
+        found: dict[str, bytes] = {}
+        unique_shas = list(dict.fromkeys(shas))
+        for start in range(0, len(unique_shas), _SQL_BATCH):
+            batch = unique_shas[start : start + _SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT sha, content FROM blobs WHERE sha IN ({placeholders})", batch
+            ).fetchall()
+            for sha, blob in rows:
+                try:
+                    found[sha] = zlib.decompress(blob)
+                except zlib.error:
+                    continue
+
+        if found:
+            now = datetime.utcnow().isoformat()
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE blobs SET accessed_at = ? WHERE sha = ?",
+                    [(now, sha) for sha in found],
+                )
+        return found
+
+    def set_many(self, items: dict[str, bytes]) -> int:
+        """
+        Store blobs whose content matches their SHA.
+
+        Args:
+            items: Mapping of git blob SHA -> content
+
+        Returns:
+            Number of blobs stored
+        """
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (sha, zlib.compress(content), now)
+            for sha, content in items.items()
+            if git_blob_sha(content) == sha
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO blobs (sha, content, accessed_at) VALUES (?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "BlobCache":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+def open_blob_cache(db_path: str | Path | None) -> BlobCache | None:
+    """
+    Open the blob cache at ``db_path`` for a remote-mode download.
+
+    A cache that cannot be opened (unwritable home, locked database) must not
+    fail the scrape, so errors are logged and None (download every file) is
+    returned.
+
+    Args:
+        db_path: Database path, or None to disable caching
+
+    Returns:
+        The open cache, or None
+    """
+    if db_path is None:
+        return None
+    try:
+        return BlobCache(db_path)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"⚠️  Blob cache {db_path} unavailable ({e}), not caching")
+        return None
+
+
+class IssueSyncStore:
+    """
+    SQLite store of fetched issues, for incremental refreshes.
+
+    Issues are grouped by a query key (repository plus the filters they were
+    fetched with). Each query records when it was last synced and whether
+    that full fetch stopped at its ``max_count`` (``truncated``). A refresh
+    then only needs the issues updated since the sync: an issue that was not
+    updated kept its comment count, so it keeps its rank too.
+
+    Examples:
+        store = IssueSyncStore("~/.skill-seekers/cache/github_api.db")
+        store.replace(query, issues, synced_at, truncated=True)
+        store.merge(query, updated_issues, removed=[12], synced_at=now)
+        store.issues(query)  # most-commented first
+    """
+
+    def __init__(self, db_path: str | Path = ":memory:"):
+        """
+        Open (or create) an issue store.
+
+        Args:
+            db_path: Path to SQLite database (":memory:" for in-memory)
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            self.db_path = str(Path(self.db_path).expanduser())
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS issue_syncs (
+                    query TEXT PRIMARY KEY,
+                    synced_at TEXT NOT NULL,
+                    truncated INTEGER NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS synced_issues (
+                    query TEXT NOT NULL,
+                    number INTEGER NOT NULL,
+                    comments INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (query, number)
+                )
+            """)
+
+    def get_sync(self, query: str) -> tuple[str, bool] | None:
+        """
+        Last sync of a query.
+
+        Returns:
+            (synced_at ISO timestamp, truncated) or None if never synced
+        """
+        row = self.conn.execute(
+            "SELECT synced_at, truncated FROM issue_syncs WHERE query = ?", (query,)
+        ).fetchone()
+        return (row[0], bool(row[1])) if row else None
+
+    def issues(self, query: str) -> list[dict[str, Any]]:
+        """Stored issues of a query, most-commented first."""
+        rows = self.conn.execute(
+            "SELECT data FROM synced_issues WHERE query = ? ORDER BY comments DESC, number DESC",
+            (query,),
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def replace(
+        self, query: str, issues: list[dict[str, Any]], synced_at: str, truncated: bool
+    ) -> None:
+        """Record a full fetch, dropping whatever the query held before."""
+        with self.conn:
+            self.conn.execute("DELETE FROM synced_issues WHERE query = ?", (query,))
+            self._upsert(query, issues)
+            self._record_sync(query, synced_at, truncated)
+
+    def merge(
+        self, query: str, issues: list[dict[str, Any]], removed: list[int], synced_at: str
+    ) -> None:
+        """
+        Record an incremental fetch.
+
+        Args:
+            query: Query key
+            issues: Issues updated since the last sync that still match
+            removed: Numbers of updated issues that no longer match (e.g. closed)
+            synced_at: Timestamp the next refresh should start from
+        """
+        sync = self.get_sync(query)
+        truncated = sync[1] if sync else False
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM synced_issues WHERE query = ? AND number = ?",
+                [(query, number) for number in removed],
+            )
+            self._upsert(query, issues)
+            self._record_sync(query, synced_at, truncated)
+
+    def _upsert(self, query: str, issues: list[dict[str, Any]]) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO synced_issues (query, number, comments, data) VALUES (?, ?, ?, ?)",
+            [
+                (query, issue["number"], issue.get("comments", 0), json.dumps(issue))
+                for issue in issues
+            ],
+        )
+
+    def _record_sync(self, query: str, synced_at: str, truncated: bool) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO issue_syncs (query, synced_at, truncated) VALUES (?, ?, ?)",
+            (query, synced_at, int(truncated)),
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "IssueSyncStore":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+def _is_rate_limited(response: httpx.Response) -> bool:
+    """Primary or secondary REST rate limit (not a plain 403)."""
+    if response.status_code not in (403, 429):
+        return False
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        return True
+    return "rate limit" in response.text.lower()
+
+
+class GitHubAPIClient:
+    """
+    Concurrent fetcher for one GitHub repository.
+
+    Each public method runs its own event loop, so the client can be used
+    from synchronous code (and from inside a running loop, on a helper
+    thread). ``stats`` counts API calls, downloads and cache hits.
+
+    Examples:
+        client = GitHubAPIClient("owner/repo", token=token, workers=16)
+        tree = client.fetch_tree("main")
+        contents = client.fetch_blobs(tree.entries[:10], tree.commit)
+    """
+
+    def __init__(
+        self,
+        repo_name: str,
+        token: str | None = None,
+        rate_limiter: RateLimitHandler | None = None,
+        workers: int = DEFAULT_WORKERS,
+        tarball_threshold: int = TARBALL_THRESHOLD,
+        api_url: str | None = None,
+        raw_url: str | None = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            repo_name: Repository as "owner/repo"
+            token: GitHub token (ignored when ``rate_limiter`` is given)
+            rate_limiter: Handler consulted when the API reports a rate limit
+                (default: a non-interactive handler for ``token``)
+            workers: Maximum concurrent requests
+            tarball_threshold: Download a tarball above this many files
+            api_url: REST API root (default GITHUB_API_URL)
+            raw_url: Raw file host (default GITHUB_RAW_URL)
+        """
+        self.owner, self.repo = repo_name.split("/", 1)
+        self.rate_limiter = rate_limiter or RateLimitHandler(token=token, interactive=False)
+        self.workers = max(1, workers)
+        self.tarball_threshold = tarball_threshold
+        self.api_url = (api_url or GITHUB_API_URL).rstrip("/")
+        self.raw_url = (raw_url or GITHUB_RAW_URL).rstrip("/")
+        self.stats = {"api_calls": 0, "raw_downloads": 0, "tarballs": 0, "cached_blobs": 0}
+        self._resumed_at = 0.0
+
+    @property
+    def repo_api(self) -> str:
+        return f"{self.api_url}/repos/{self.owner}/{self.repo}"
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def fetch_tree(self, ref: str) -> RepoTree:
+        """
+        List every file and directory at ``ref``.
+
+        One recursive Git Trees call covers repositories up to GitHub's
+        limit (100,000 entries / 7 MB); beyond it, each subtree is listed
+        separately (concurrently).
+
+        Args:
+            ref: Branch, tag or commit SHA
+
+        Returns:
+            The resolved commit and its tree entries
+
+        Raises:
+            httpx.HTTPError: If the repository or ref cannot be read
+            RateLimitError: If the rate limit cannot be handled
+        """
+        return self._run(self._fetch_tree(ref))
+
+    def fetch_blobs(
+        self, entries: list[TreeEntry], commit: str, cache: BlobCache | None = None
+    ) -> dict[str, bytes]:
+        """
+        Download file contents, reusing cached blobs.
+
+        Files sharing a blob SHA are downloaded once. Files that cannot be
+        downloaded are logged and left out of the result.
+
+        Args:
+            entries: Blob entries from :meth:`fetch_tree`
+            commit: Commit the entries belong to
+            cache: Blob cache to read from and fill (None to download all)
+
+        Returns:
+            Mapping of path -> content
+        """
+        paths_by_sha: dict[str, list[str]] = {}
+        for entry in entries:
+            paths_by_sha.setdefault(entry.sha, []).append(entry.path)
+
+        blobs = cache.get_many(list(paths_by_sha)) if cache is not None else {}
+        self.stats["cached_blobs"] += len(blobs)
+        missing = {sha: paths[0] for sha, paths in paths_by_sha.items() if sha not in blobs}
+        if missing:
+            fetched = self._run(self._download(commit, missing))
+            if cache is not None:
+                cache.set_many(fetched)
+            blobs.update(fetched)
+
+        logger.info(
+            f"Fetched {len(blobs)}/{len(paths_by_sha)} blobs "
+            f"({self.stats['cached_blobs']} cached, {self.stats['raw_downloads']} raw, "
+            f"{self.stats['tarballs']} tarball, {self.stats['api_calls']} API calls)"
+        )
+        return {
+            path: blobs[sha]
+            for sha, paths in paths_by_sha.items()
+            if sha in blobs
+            for path in paths
+        }
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Already inside an event loop: run ours on a separate thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.workers),
+        )
+
+    def _headers(self, accept: str = "application/vnd.github+json") -> dict[str, str]:
+        return {"Accept": accept, **create_github_headers(self.rate_limiter.token)}
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        accept: str = "application/vnd.github+json",
+        params: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """
+        GET an API URL, retrying server errors and waiting out rate limits.
+
+        Raises:
+            httpx.HTTPStatusError: On any other error status
+            RateLimitError: If the rate limit cannot be handled
+        """
+
+        async def _attempt() -> httpx.Response:
+            response = await client.get(url, headers=self._headers(accept), params=params)
+            self.stats["api_calls"] += 1
+            if response.status_code >= 500:
+                response.raise_for_status()
+            return response
+
+        while True:
+            started = time.monotonic()
+            response = await retry_with_backoff_async(_attempt, operation_name=f"GET {url}")
+            if not _is_rate_limited(response):
+                response.raise_for_status()
+                return response
+            await self._wait_for_quota(response, started)
+
+    async def _wait_for_quota(self, response: httpx.Response, started: float) -> None:
+        """
+        Let the RateLimitHandler deal with a rate-limited response.
+
+        Requests that were already in flight when another request waited
+        the limit out just retry, so the handler runs once per limit.
+        """
+        async with self._quota_lock:
+            if self._resumed_at > started:
+                return
+            info = self.rate_limiter.extract_rate_limit_info(response)
+            # The handler may sleep or prompt; keep the event loop responsive
+            if not await asyncio.to_thread(self.rate_limiter.handle_rate_limit, info):
+                raise RateLimitError("GitHub rate limit exceeded and cannot continue")
+            self._resumed_at = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Trees
+    # ------------------------------------------------------------------
+
+    async def _fetch_tree(self, ref: str) -> RepoTree:
+        self._quota_lock = asyncio.Lock()
+        async with self._client() as client:
+            response = await self._get(
+                client,
+                f"{self.repo_api}/commits/{quote(ref, safe='')}",
+                accept="application/vnd.github.sha",
+            )
+            commit = response.text.strip()
+            entries = await self._walk_tree(client, commit, "")
+        logger.info(f"Git tree for {self.owner}/{self.repo}@{commit[:7]}: {len(entries)} entries")
+        return RepoTree(commit=commit, entries=entries)
+
+    async def _walk_tree(self, client: httpx.AsyncClient, sha: str, prefix: str) -> list[TreeEntry]:
+        url = f"{self.repo_api}/git/trees/{sha}"
+        data = (await self._get(client, url, params={"recursive": "1"})).json()
+        if not data.get("truncated"):
+            return [self._entry(item, prefix) for item in data["tree"]]
+
+        # Over the recursive limit: list this level, then each subtree
+        logger.debug(f"Tree {prefix or '/'} truncated, listing subtrees separately")
+        data = (await self._get(client, url)).json()
+        entries = [self._entry(item, prefix) for item in data["tree"]]
+        subtrees = await asyncio.gather(
+            *(
+                self._walk_tree(client, entry.sha, f"{entry.path}/")
+                for entry in entries
+                if entry.type == "tree"
+            )
+        )
+        return entries + [entry for subtree in subtrees for entry in subtree]
+
+    @staticmethod
+    def _entry(item: dict[str, Any], prefix: str) -> TreeEntry:
+        return TreeEntry(
+            path=prefix + item["path"], type=item["type"], sha=item["sha"], size=item.get("size")
+        )
+
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+
+    async def _download(self, commit: str, wanted: dict[str, str]) -> dict[str, bytes]:
+        """Download ``{sha: path}``: one tarball for many files, else raw files."""
+        self._quota_lock = asyncio.Lock()
+        fetched: dict[str, bytes] = {}
+        async with self._client() as client:
+            if len(wanted) > self.tarball_threshold:
+                try:
+                    fetched = await self._download_tarball(client, commit, wanted)
+                except (httpx.HTTPError, tarfile.TarError, OSError) as e:
+                    logger.warning(f"Tarball download failed ({e}), fetching files one by one")
+            rest = {sha: path for sha, path in wanted.items() if sha not in fetched}
+            fetched.update(await self._download_raw(client, commit, rest))
+        return fetched
+
+    async def _download_raw(
+        self, client: httpx.AsyncClient, commit: str, wanted: dict[str, str]
+    ) -> dict[str, bytes]:
+        """Download ``{sha: path}`` from the raw host, ``workers`` at a time."""
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def _download(sha: str, path: str) -> tuple[str, bytes | None]:
+            url = f"{self.raw_url}/{self.owner}/{self.repo}/{commit}/{quote(path)}"
+
+            async def _attempt() -> httpx.Response:
+                response = await client.get(url, headers=self._headers("*/*"))
+                # Retry throttling and server errors only; a 404 will not change
+                if response.status_code >= 500 or response.status_code == 429:
+                    response.raise_for_status()
+                return response
+
+            async with semaphore:
+                try:
+                    response = await retry_with_backoff_async(
+                        _attempt, operation_name=f"GET {path}"
+                    )
+                    response.raise_for_status()
+                    content = response.content
+                except httpx.HTTPError as e:
+                    logger.debug(f"Could not download {path}: {e}")
+                    return sha, None
+            self.stats["raw_downloads"] += 1
+            return sha, content
+
+        results = await asyncio.gather(*(_download(sha, path) for sha, path in wanted.items()))
+        return {sha: content for sha, content in results if content is not None}
+
+    async def _download_tarball(
+        self, client: httpx.AsyncClient, commit: str, wanted: dict[str, str]
+    ) -> dict[str, bytes]:
+        """Read ``{sha: path}`` out of the commit's tarball, spooled to disk."""
+        by_path = {path: sha for sha, path in wanted.items()}
+        url = f"{self.repo_api}/tarball/{commit}"
+        found: dict[str, bytes] = {}
+
+        with tempfile.TemporaryFile() as spool:
+            while True:
+                started = time.monotonic()
+                async with client.stream("GET", url, headers=self._headers()) as response:
+                    self.stats["api_calls"] += 1
+                    if response.status_code in (403, 429):
+                        await response.aread()
+                    if not _is_rate_limited(response):
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes():
+                            spool.write(chunk)
+                        break
+                await self._wait_for_quota(response, started)
+            self.stats["tarballs"] += 1
+
+            spool.seek(0)
+            with tarfile.open(fileobj=spool, mode="r:*") as tar:
+                for member in tar:
+                    # Members are "<owner>-<repo>-<sha>/<path>"
+                    sha = by_path.get(member.name.partition("/")[2])
+                    if sha is None or not member.isfile():
+                        continue
+                    extracted = tar.extractfile(member)
+                    if extracted is not None:
+                        found[sha] = extracted.read()
+        return found
@@ -9,18 +9,36 @@ Fetches from GitHub and splits into 3 streams:
 This is the foundation of the unified codebase analyzer architecture.
 """
 
+import json
+import math
 import os
+import sqlite3
 import subprocess
 import tempfile
+import threading
 from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
 
 import requests
 
 from .config_manager import get_config_manager
+from .github_api import IssueSyncStore, link_page_number, parse_link_header
+from .http_cache import HttpPageCache
 from .rate_limit_handler import RateLimitError, RateLimitHandler, create_github_headers
 
+#: Concurrent page requests once the page count is known.
+PAGE_WORKERS = 4
+#: Overlap between incremental issue syncs, to absorb clock skew.
+SYNC_OVERLAP = timedelta(minutes=5)
+#: File under .git/ that marks a checkout as created by clone_repo().
+CLONE_MARKER = "skill-seekers-clone"
+
 
 @dataclass
 class CodeStream:
@@ -85,6 +103,7 @@ class GitHubThreeStreamFetcher:
         issue_since: str | None = None,
         issue_labels: list[str] | None = None,
         issue_state: str | None = None,
+        api_cache: str | Path | None = None,
     ):
         """
         Initialize fetcher.
@@ -97,6 +116,8 @@ class GitHubThreeStreamFetcher:
             issue_since: Only fetch issues updated after this ISO8601 date
             issue_labels: Filter issues by these label names
             issue_state: Filter issues by state ("open", "closed", or "all")
+            api_cache: SQLite file for ETag-revalidated API pages and synced
+                issues, so a refresh only fetches what changed (None disables it)
         """
         self.repo_url = repo_url
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
@@ -114,6 +135,18 @@ class GitHubThreeStreamFetcher:
         self.rate_limiter = RateLimitHandler(
             token=self.github_token, interactive=interactive, profile_name=profile_name
         )
+        # Pages are fetched on several threads; one rate-limit prompt/wait at a time
+        self._rate_limit_lock = threading.Lock()
+
+        self.page_cache: HttpPageCache | None = None
+        self.issue_store: IssueSyncStore | None = None
+        if api_cache is not None:
+            try:
+                self.page_cache = HttpPageCache(str(Path(api_cache).expanduser()))
+                self.issue_store = IssueSyncStore(api_cache)
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️  GitHub API cache {api_cache} unavailable ({e}), not caching")
+                self.page_cache = self.issue_store = None
 
     def parse_repo_url(self, url: str) -> tuple[str, str]:
         """
@@ -211,6 +244,14 @@ class GitHubThreeStreamFetcher:
             Path to cloned repository
         """
         repo_dir = output_dir / self.repo
+
+        # An earlier clone of ours is updated in place with a shallow fetch,
+        # which also keeps its last analyzed commit around for git-based
+        # change detection. Any other checkout is left alone and the clone
+        # below fails on the non-empty directory.
+        if self._is_own_clone(repo_dir):
+            self._update_clone(repo_dir)
+            return repo_dir
         repo_dir.mkdir(parents=True, exist_ok=True)
 
         # Clone with depth 1 for speed
@@ -220,8 +261,54 @@ class GitHubThreeStreamFetcher:
         if result.returncode != 0:
             raise RuntimeError(f"Failed to clone repository: {result.stderr}")
 
+        (repo_dir / ".git" / CLONE_MARKER).write_text(self.repo_url, encoding="utf-8")
         return repo_dir
 
+    def _is_own_clone(self, repo_dir: Path) -> bool:
+        """
+        Check whether repo_dir is a clone_repo() checkout of this repository.
+
+        Both the marker written after cloning and remote.origin.url must
+        match self.repo_url, so a user's own checkout is never reset.
+
+        Args:
+            repo_dir: Candidate clone directory
+
+        Returns:
+            True if the directory may be updated in place
+        """
+        marker = repo_dir / ".git" / CLONE_MARKER
+        try:
+            if marker.read_text(encoding="utf-8").strip() != self.repo_url:
+                return False
+        except OSError:
+            return False
+        result = subprocess.run(
+            ["git", "-C", str(repo_dir), "config", "--get", "remote.origin.url"],
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode == 0 and result.stdout.strip() == self.repo_url
+
+    def _update_clone(self, repo_dir: Path) -> None:
+        """
+        Move an existing clone to the remote's latest commit with a depth-1 fetch.
+
+        Args:
+            repo_dir: Directory of an earlier clone_repo() call
+
+        Raises:
+            RuntimeError: If fetching or resetting the clone fails
+        """
+        for cmd in (
+            ["git", "-C", str(repo_dir), "fetch", "--depth", "1", self.repo_url, "HEAD"],
+            ["git", "-C", str(repo_dir), "reset", "--hard", "FETCH_HEAD"],
+            ["git", "-C", str(repo_dir), "clean", "-fdx"],
+        ):
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"Failed to update existing clone: {result.stderr}")
+
     def fetch_github_metadata(self) -> dict:
         """
         Fetch repo metadata via GitHub API.
@@ -233,17 +320,9 @@ class GitHubThreeStreamFetcher:
             RateLimitError: If rate limit cannot be handled
         """
         url = f"https://api.github.com/repos/{self.owner}/{self.repo}"
-        headers = create_github_headers(self.github_token)
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-
-            # Check for rate limit
-            if not self.rate_limiter.check_response(response):
-                raise RateLimitError("Rate limit exceeded and cannot continue")
-
-            response.raise_for_status()
-            data = response.json()
+            data, _ = self._get_json(url)
 
             return {
                 "stars": data.get("stargazers_count", 0),
@@ -303,7 +382,10 @@ class GitHubThreeStreamFetcher:
 
     def _fetch_issues_page(self, state: str, max_count: int) -> list[dict]:
         """
-        Fetch one page of issues.
+        Fetch up to ``max_count`` issues of one state, most-commented first.
+
+        With an API cache, the first call records the issues; later calls
+        only fetch issues updated since then and merge them in.
 
         Args:
             state: 'open' or 'closed'
@@ -316,8 +398,6 @@ class GitHubThreeStreamFetcher:
             RateLimitError: If rate limit cannot be handled
         """
         url = f"https://api.github.com/repos/{self.owner}/{self.repo}/issues"
-        headers = create_github_headers(self.github_token)
-
         params = {
             "state": state,
             # Don't over-fetch: with a small remaining quota (e.g. 5 after the
@@ -332,40 +412,162 @@ class GitHubThreeStreamFetcher:
         if self.issue_labels:
             params["labels"] = ",".join(self.issue_labels)
 
-        # Follow Link: rel="next" pagination until we have max_count issues.
-        # A single page caps at 100, so without this any max_count > 100 was
-        # silently truncated (and PR filtering reduced it further).
-        collected: list[dict] = []
-        try:
-            page = 1
-            while len(collected) < max_count:
-                params["page"] = page
-                response = requests.get(url, headers=headers, params=params, timeout=10)
-
-                if not self.rate_limiter.check_response(response):
-                    raise RateLimitError("Rate limit exceeded and cannot continue")
+        if self.issue_store is None:
+            return self._fetch_issue_pages(url, params, state, max_count)[0]
+
+        query = json.dumps({"repo": f"{self.owner}/{self.repo}", **params}, sort_keys=True)
+        started = (datetime.now(timezone.utc) - SYNC_OVERLAP).isoformat(timespec="seconds")
+        sync = self.issue_store.get_sync(query)
+        if sync is not None:
+            synced_at, truncated = sync
+            # state=all: issues that were closed or reopened must leave this list
+            updated, complete = self._fetch_issue_pages(
+                url, {**params, "state": "all", "since": synced_at}, None, max_count
+            )
+            if complete and len(updated) < max_count:
+                self.issue_store.merge(
+                    query,
+                    [issue for issue in updated if issue.get("state") == state],
+                    [issue["number"] for issue in updated if issue.get("state") != state],
+                    started,
+                )
+                stored = self.issue_store.issues(query)
+                # Issues that left this state may have freed a slot for an
+                # issue beyond the last full fetch: fall back to a full fetch
+                if not truncated or len(stored) >= max_count:
+                    print(f"  - {state}: {len(updated)} issues updated since {synced_at}")
+                    return stored[:max_count]
+
+        issues, complete = self._fetch_issue_pages(url, params, state, max_count)
+        if complete:
+            self.issue_store.replace(query, issues, started, truncated=len(issues) >= max_count)
+        return issues
+
+    def _fetch_issue_pages(
+        self, url: str, params: dict, state: str | None, max_count: int
+    ) -> tuple[list[dict], bool]:
+        """
+        Fetch issues (pull requests filtered out), keeping partial results.
 
-                response.raise_for_status()
-                batch = response.json()
-                if not batch:
-                    break
+        Args:
+            url: Issues endpoint
+            params: Query parameters
+            state: State for the failure message, or None
+            max_count: Maximum issues to return
 
+        Returns:
+            (issues, complete); complete is False if a page failed
+        """
+        collected: list[dict] = []
+        try:
+            self._fetch_pages(
+                url,
+                params,
+                max_count,
                 # Filter out pull requests (they appear in the issues endpoint).
-                collected.extend(i for i in batch if "pull_request" not in i)
-
-                link_header = response.headers.get("Link", "") or ""
-                if not isinstance(link_header, str) or 'rel="next"' not in link_header:
-                    break
-                page += 1
-
-            return collected[:max_count]
+                lambda batch: collected.extend(i for i in batch if "pull_request" not in i),
+                lambda: len(collected),
+            )
+            return collected[:max_count], True
         except RateLimitError:
             raise
         except Exception as e:
-            print(f"⚠️  Failed to fetch {state} issues: {e}")
+            print(f"⚠️  Failed to fetch {state or 'updated'} issues: {e}")
             # Keep the pages already fetched: returning [] discarded them AND
             # let fetch_issues spend the full quota on the other state.
-            return collected[:max_count]
+            return collected[:max_count], False
+
+    def _fetch_pages(
+        self,
+        url: str,
+        params: dict,
+        max_count: int,
+        on_page: Callable[[list], None],
+        collected: Callable[[], int],
+    ) -> None:
+        """
+        Walk a paginated list endpoint until ``max_count`` items are kept.
+
+        Follows ``Link: rel="next"`` one page at a time. Once a ``rel="last"``
+        link reveals the page count, the pages still needed are requested
+        concurrently (PAGE_WORKERS at a time) and handed to ``on_page`` in
+        order. A failing page raises after the pages before it were handed over.
+
+        Args:
+            url: List endpoint
+            params: Query parameters (``per_page`` sets the page size)
+            max_count: Stop once ``collected()`` reaches this
+            on_page: Receives each page's items, in page order
+            collected: Number of items kept so far (after any filtering)
+        """
+        per_page = params.get("per_page", 30)
+        page = 1
+        while collected() < max_count:
+            batch, link = self._get_json(url, {**params, "page": page})
+            if not batch:
+                return
+            on_page(batch)
+
+            links = parse_link_header(link)
+            last = link_page_number(links.get("last"))
+            if last is not None and last > page + 1 and collected() < max_count:
+                needed = math.ceil((max_count - collected()) / per_page)
+                pages = range(page + 1, min(last, page + needed) + 1)
+                with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as pool:
+                    for batch, _ in pool.map(
+                        lambda n: self._get_json(url, {**params, "page": n}), pages
+                    ):
+                        on_page(batch)
+                page = pages[-1]
+                if page >= last:
+                    return
+            elif "next" not in links:
+                return
+            page += 1
+
+    def _get_json(self, url: str, params: dict | None = None) -> tuple[Any, str]:
+        """
+        GET a GitHub API URL, revalidating cached pages with ``If-None-Match``.
+
+        A ``304 Not Modified`` answer does not count against the rate limit
+        and reuses the cached body.
+
+        Returns:
+            (decoded JSON, Link header or "")
+
+        Raises:
+            RateLimitError: If rate limit cannot be handled
+            requests.HTTPError: On an error status
+        """
+        cache_key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        cached = self.page_cache.get(cache_key) if self.page_cache is not None else None
+        headers = {
+            **create_github_headers(self.github_token),
+            **HttpPageCache.conditional_headers(cached),
+        }
+
+        if params is None:
+            response = requests.get(url, headers=headers, timeout=10)
+        else:
+            response = requests.get(url, headers=headers, params=params, timeout=10)
+
+        with self._rate_limit_lock:
+            if not self.rate_limiter.check_response(response):
+                raise RateLimitError("Rate limit exceeded and cannot continue")
+
+        if response.status_code == 304 and cached is not None:
+            self.page_cache.record(not_modified=True)
+            return json.loads(cached.body), (cached.page or {}).get("link", "")
+
+        response.raise_for_status()
+        data = response.json()
+        link = response.headers.get("Link", "") or ""
+        if not isinstance(link, str):
+            link = ""
+        if self.page_cache is not None and response.status_code == 200:
+            self.page_cache.record(not_modified=False)
+            self.page_cache.store(cache_key, response.headers, response.content, {"link": link})
+        return data, link
 
     def classify_files(self, repo_path: Path) -> tuple[list[Path], list[Path]]:
         """
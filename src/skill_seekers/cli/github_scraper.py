@@ -24,6 +24,8 @@ import sys
 from pathlib import Path
 from typing import Any, Optional
 
+import httpx
+
 try:
     from github import Github, GithubException, Repository
     from github.GithubException import RateLimitExceededException
@@ -31,6 +33,15 @@ except ImportError:
     print("Error: PyGithub not installed. Run: pip install PyGithub")
     sys.exit(1)
 
+from skill_seekers.cli.analysis_cache import default_cache_path
+from skill_seekers.cli.github_api import (
+    DEFAULT_WORKERS,
+    GitHubAPIClient,
+    RepoTree,
+    default_blob_cache_path,
+    open_blob_cache,
+)
+from skill_seekers.cli.rate_limit_handler import RateLimitError, RateLimitHandler
 from skill_seekers.cli.skill_converter import SkillConverter
 
 # Try to import pathspec for .gitignore support
@@ -250,7 +261,11 @@ class GitHubScraper(SkillConverter):
 
         # GitHub client setup (C1.1)
         token = self._get_token()
+        self.github_token = token
         self.github = Github(token) if token else Github()
+        # Issues and releases are paged lazily; the API maximum is 100 per
+        # page (PyGithub defaults to 30), a third of the round trips
+        self.github.per_page = 100
         self.repo: Repository.Repository | None = None
 
         # Options
@@ -275,6 +290,13 @@ class GitHubScraper(SkillConverter):
             "code_analysis_depth", "deep"
         )  # 'surface', 'deep', 'full'
         self.file_patterns = config.get("file_patterns", [])
+        # Per-file analysis cache for local mode (None disables it)
+        self.analysis_cache = config.get("analysis_cache", default_cache_path())
+        # Remote mode: concurrent downloads and the blob cache (None disables it)
+        self.fetch_workers = config.get("fetch_workers", DEFAULT_WORKERS)
+        self.blob_cache = config.get("blob_cache", default_blob_cache_path())
+        self.api_client: GitHubAPIClient | None = None
+        self.remote_tree: RepoTree | None = None
 
         # Initialize code analyzer if deep analysis requested
         self.code_analyzer = None
@@ -356,7 +378,7 @@ class GitHubScraper(SkillConverter):
             logger.info(f"✅ Scraping complete! Data saved to: {self.data_file}")
             return self.extracted_data
 
-        except RateLimitExceededException:
+        except (RateLimitExceededException, RateLimitError):
             logger.error("GitHub API rate limit exceeded. Please wait or use authentication token.")
             raise
         except GithubException as e:
@@ -690,43 +712,39 @@ class GitHubScraper(SkillConverter):
             f"File tree built (local mode): {len(file_tree)} items ({excluded_count} directories excluded)"
         )
 
+    def _get_api_client(self) -> GitHubAPIClient:
+        """Client for remote-mode tree listing and file downloads (created once)."""
+        if self.api_client is None:
+            self.api_client = GitHubAPIClient(
+                self.repo_name,
+                rate_limiter=RateLimitHandler(token=self.github_token, interactive=False),
+                workers=self.fetch_workers,
+            )
+        return self.api_client
+
     def _extract_file_tree_github(self):
-        """Extract file tree from GitHub API (rate-limited)."""
+        """Extract file tree from GitHub API (one recursive Git Trees call)."""
+        ref = self.repo.default_branch or "HEAD"
         try:
-            from collections import deque
-
-            # Cap the walk: each directory is a separate API call, so an unbounded
-            # tree on a huge repo could exhaust the rate-limit quota.
-            max_tree_items = 5000
-            contents = deque(self.repo.get_contents(""))
-            file_tree = []
-            truncated = False
-
-            while contents:
-                if len(file_tree) >= max_tree_items:
-                    truncated = True
-                    break
-                file_content = contents.popleft()
-
-                file_info = {
-                    "path": file_content.path,
-                    "type": file_content.type,
-                    "size": file_content.size if file_content.type == "file" else None,
-                }
-                file_tree.append(file_info)
-
-                if file_content.type == "dir":
-                    contents.extend(self.repo.get_contents(file_content.path))
+            self.remote_tree = self._get_api_client().fetch_tree(ref)
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not build file tree: {e}")
+            return
 
-            self.extracted_data["file_tree"] = file_tree
-            if truncated:
-                logger.warning(
-                    "File tree truncated at %d items to preserve API quota", max_tree_items
-                )
-            logger.info(f"File tree built (GitHub API mode): {len(file_tree)} items")
+        # Submodules ("commit" entries) have no content in this repository
+        type_names = {"blob": "file", "tree": "dir"}
+        file_tree = [
+            {
+                "path": entry.path,
+                "type": type_names[entry.type],
+                "size": entry.size if entry.type == "blob" else None,
+            }
+            for entry in self.remote_tree.entries
+            if entry.type in type_names
+        ]
 
-        except GithubException as e:
-            logger.warning(f"Could not build file tree: {e}")
+        self.extracted_data["file_tree"] = file_tree
+        logger.info(f"File tree built (GitHub API mode): {len(file_tree)} items")
 
     def _extract_signatures_and_tests(self):
         """
@@ -777,9 +795,8 @@ class GitHubScraper(SkillConverter):
             logger.info(f"Language filter from config: {', '.join(sorted(target_languages))}")
 
         # Analyze ALL files, detecting language per-file from extension
-        analyzed_files = []
+        candidates = []
         file_tree = self.extracted_data.get("file_tree", [])
-        languages_found = set()
 
         for file_info in file_tree:
             file_path = file_info["path"]
@@ -800,29 +817,13 @@ class GitHubScraper(SkillConverter):
             ):
                 continue
 
-            # Analyze this file with the correct language
-            try:
-                if self.local_repo_path:
-                    full_path = os.path.join(self.local_repo_path, file_path)
-                    with open(full_path, encoding="utf-8") as f:
-                        content = f.read()
-                else:
-                    file_content = self.repo.get_contents(file_path)
-                    content = file_content.decoded_content.decode("utf-8")
-
-                analysis_result = self.code_analyzer.analyze_file(file_path, content, language)
-
-                if analysis_result and (
-                    analysis_result.get("classes") or analysis_result.get("functions")
-                ):
-                    analyzed_files.append(
-                        {"file": file_path, "language": language, **analysis_result}
-                    )
-                    languages_found.add(language)
+            candidates.append((file_path, language))
 
-            except Exception as e:
-                logger.debug(f"Could not analyze {file_path}: {e}")
-                continue
+        if self.local_repo_path:
+            analyzed_files = self._analyze_local_files(candidates)
+        else:
+            analyzed_files = self._analyze_remote_files(candidates)
+        languages_found = {f["language"] for f in analyzed_files}
 
         # Determine primary language for backward compat in output
         repo_languages = self.extracted_data.get("languages", {})
@@ -849,6 +850,89 @@ class GitHubScraper(SkillConverter):
             f"Code analysis complete: {len(analyzed_files)} files, {total_classes} classes, {total_functions} functions ({lang_summary})"
         )
 
+    def _analyze_local_files(self, candidates: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """
+        Analyze local repository files through the shared per-file engine.
+
+        Unchanged files are served from the analysis cache; in a git work
+        tree only files changed since the last analyzed commit are read.
+
+        Args:
+            candidates: (path relative to the repository, language) pairs
+
+        Returns:
+            Analysis entries for files with classes or functions
+        """
+        from skill_seekers.cli.analysis_cache import open_analysis_cache
+        from skill_seekers.cli.file_analysis import FileStages, analyze_files
+
+        root = Path(self.local_repo_path).resolve()
+        cache = open_analysis_cache(self.analysis_cache)
+        try:
+            results = analyze_files(
+                [(root / file_path, language) for file_path, language in candidates],
+                root,
+                FileStages(depth=self.code_analysis_depth),
+                cache=cache,
+            )
+        finally:
+            if cache is not None:
+                cache.close()
+
+        return [
+            # Keep the tree's relative path as the file key, whatever the analyzer reports
+            {**result.entry, "file": file_path}
+            for (file_path, _), result in zip(candidates, results, strict=True)
+            if result.entry and (result.entry.get("classes") or result.entry.get("functions"))
+        ]
+
+    def _analyze_remote_files(self, candidates: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """
+        Download candidate files concurrently and analyze them.
+
+        Contents come from the blob cache, raw downloads or one tarball,
+        whichever is cheapest (see github_api.GitHubAPIClient).
+
+        Args:
+            candidates: (path in the repository, language) pairs
+
+        Returns:
+            Analysis entries for files with classes or functions
+        """
+        if self.remote_tree is None:
+            logger.warning("No remote file tree - skipping code analysis")
+            return []
+
+        entries = {entry.path: entry for entry in self.remote_tree.entries}
+        wanted = [entries[file_path] for file_path, _ in candidates if file_path in entries]
+        cache = open_blob_cache(self.blob_cache)
+        try:
+            contents = self._get_api_client().fetch_blobs(wanted, self.remote_tree.commit, cache)
+        finally:
+            if cache is not None:
+                cache.close()
+
+        analyzed_files = []
+        for file_path, language in candidates:
+            if file_path not in contents:
+                continue
+            # Analyze this file with the correct language
+            try:
+                content = contents[file_path].decode("utf-8")
+                analysis_result = self.code_analyzer.analyze_file(file_path, content, language)
+
+                if analysis_result and (
+                    analysis_result.get("classes") or analysis_result.get("functions")
+                ):
+                    analyzed_files.append(
+                        {"file": file_path, "language": language, **analysis_result}
+                    )
+
+            except Exception as e:
+                logger.debug(f"Could not analyze {file_path}: {e}")
+                continue
+        return analyzed_files
+
     def _extract_issues(self):
         """C1.7: Extract GitHub Issues (open/closed, labels, milestones)."""
         logger.info(f"Extracting GitHub Issues (max {self.max_issues})...")
@@ -0,0 +1,217 @@
+"""
+Per-host adaptive rate limiting for documentation scraping.
+
+Replaces the fixed ``time.sleep(rate_limit)`` each worker used to do after
+every page. One token bucket per host is shared by every worker — threads in
+the sync scraper and tasks in the async one — so throughput is governed by
+how the *server* responds rather than by ``workers / rate_limit``:
+
+- Fast, successful responses raise the host's rate additively (up to
+  ``MAX_RATE_FACTOR`` times the base rate).
+- Slow responses ease it off slightly.
+- ``429 Too Many Requests`` / ``503 Service Unavailable`` halve it, and a
+  ``Retry-After`` header pauses the host entirely until that time.
+
+Usage:
+    limiter = HostRateLimiter(base_rate=4.0, burst=4)
+
+    time.sleep(limiter.reserve(url))          # or: await asyncio.sleep(...)
+    start = time.monotonic()
+    response = requests.get(url)
+    limiter.record(url, response.status_code, time.monotonic() - start,
+                   response.headers.get("Retry-After"))
+
+    limiter.summary()  # {"docs.example.com": {"achieved_rps": 6.3, ...}}
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+#: Responses slower than this (seconds) stop the rate from growing; twice this
+#: starts shrinking it.
+TARGET_LATENCY = 1.0
+
+#: Status codes that mean "slow down".
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+#: Adaptive bounds relative to the configured base rate.
+MAX_RATE_FACTOR = 4.0
+MIN_RATE_FACTOR = 1 / 16
+
+_INCREASE_STEP = 0.1  # fraction of base_rate added per fast response
+_SLOW_DECREASE = 0.9
+_THROTTLE_DECREASE = 0.5
+_MAX_RETRY_AFTER = 300.0
+_LATENCY_EWMA = 0.2
+
+
+@dataclass
+class _HostBucket:
+    rate: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    requests: int = 0
+    throttled: int = 0
+    first_request: float | None = None
+    last_response: float | None = None
+    avg_latency: float | None = None  # exponentially weighted
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError, IndexError):
+            return None
+        seconds = retry_at - (time.time() if now is None else now)
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER)
+
+
+class HostRateLimiter:
+    """
+    Thread-safe token bucket per host with AIMD rate adaptation.
+
+    ``base_rate`` is the starting rate in requests/second per host; ``None``
+    disables pacing (only ``Retry-After`` pauses are enforced), but request
+    counts and achieved RPS are still tracked for the scrape summary.
+    """
+
+    def __init__(self, base_rate: float | None, burst: int = 1, adaptive: bool = True):
+        """
+        Initialize the limiter.
+
+        Args:
+            base_rate: Starting requests/second per host (None = unlimited)
+            burst: Bucket capacity, i.e. requests allowed back-to-back
+            adaptive: Adjust the rate from latency and throttle responses
+        """
+        self.base_rate = base_rate
+        self.burst = max(1, burst)
+        self.adaptive = adaptive and base_rate is not None
+        self._buckets: dict[str, _HostBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Bucket key for ``url``."""
+        return urlparse(url).netloc
+
+    def _bucket(self, host: str, now: float) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _HostBucket(
+                rate=self.base_rate or 0.0, tokens=float(self.burst), updated=now
+            )
+        return bucket
+
+    def reserve(self, url: str) -> float:
+        """
+        Take a token for ``url``'s host.
+
+        Returns:
+            Seconds the caller must sleep before sending the request
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(self.host_of(url), now)
+            bucket.requests += 1
+            if bucket.first_request is None:
+                bucket.first_request = now
+
+            wait = max(0.0, bucket.blocked_until - now)
+            if self.base_rate is None:
+                return wait
+
+            bucket.tokens = min(
+                float(self.burst), bucket.tokens + (now - bucket.updated) * bucket.rate
+            )
+            bucket.updated = now
+            bucket.tokens -= 1
+            if bucket.tokens < 0:
+                wait = max(wait, -bucket.tokens / bucket.rate)
+            return wait
+
+    def record(
+        self,
+        url: str,
+        status_code: int,
+        latency: float,
+        retry_after: str | None = None,
+    ) -> None:
+        """
+        Feed a response back into the host's rate.
+
+        Args:
+            url: Requested URL
+            status_code: HTTP status of the response
+            latency: Seconds from sending the request to receiving the response
+            retry_after: Raw ``Retry-After`` header value, if any
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(self.host_of(url), now)
+            bucket.last_response = now
+            bucket.avg_latency = (
+                latency
+                if bucket.avg_latency is None
+                else _LATENCY_EWMA * latency + (1 - _LATENCY_EWMA) * bucket.avg_latency
+            )
+
+            if status_code in THROTTLE_STATUS_CODES:
+                bucket.throttled += 1
+                pause = parse_retry_after(retry_after)
+                if pause:
+                    bucket.blocked_until = max(bucket.blocked_until, now + pause)
+                if self.adaptive:
+                    bucket.rate = max(
+                        self.base_rate * MIN_RATE_FACTOR, bucket.rate * _THROTTLE_DECREASE
+                    )
+                return
+
+            if not self.adaptive or status_code >= 400:
+                return
+            if latency <= TARGET_LATENCY:
+                bucket.rate = min(
+                    self.base_rate * MAX_RATE_FACTOR,
+                    bucket.rate + self.base_rate * _INCREASE_STEP,
+                )
+            elif latency > 2 * TARGET_LATENCY:
+                bucket.rate = max(self.base_rate * MIN_RATE_FACTOR, bucket.rate * _SLOW_DECREASE)
+
+    def current_rate(self, url: str) -> float | None:
+        """Current requests/second allowed for ``url``'s host (None = unlimited)."""
+        if self.base_rate is None:
+            return None
+        with self._lock:
+            return self._bucket(self.host_of(url), time.monotonic()).rate
+
+    def summary(self) -> dict[str, dict[str, float | int | None]]:
+        """Per-host request count, throttle count, achieved and final rate."""
+        result: dict[str, dict[str, float | int | None]] = {}
+        with self._lock:
+            for host, bucket in sorted(self._buckets.items()):
+                elapsed = (
+                    bucket.last_response - bucket.first_request
+                    if bucket.first_request is not None and bucket.last_response is not None
+                    else 0.0
+                )
+                result[host] = {
+                    "requests": bucket.requests,
+                    "throttled": bucket.throttled,
+                    "achieved_rps": round(bucket.requests / elapsed, 2) if elapsed > 0 else None,
+                    "final_rate": round(bucket.rate, 2) if self.base_rate is not None else None,
+                    "avg_latency": round(bucket.avg_latency, 3)
+                    if bucket.avg_latency is not None
+                    else None,
+                }
+        return result
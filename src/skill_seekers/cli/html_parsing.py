@@ -7,13 +7,27 @@ all, and the page would be scraped as empty. ``parse_html`` detects both
 failure modes and retries with more lenient parsers — ``lxml`` if installed,
 then ``html5lib`` (browser-grade error recovery).
 
-``html.parser`` stays first in the chain so output for well-formed
+``html.parser`` stays first in the default chain so output for well-formed
 documents is byte-identical to what BeautifulSoup produced before this
-module existed.
+module existed. Faster engines are opt-in (``SKILL_SEEKERS_HTML_PARSER`` or a
+scraper's ``html_parser`` config key):
+
+- ``lxml`` — same fallback semantics, but the C-backed ``lxml`` builder is
+  tried first.
+- ``selectolax`` — BeautifulSoup is bypassed entirely for page extraction
+  (see :func:`parse_html_lexbor`); anything that still needs a soup uses the
+  ``lxml`` chain.
+
+Every parse is timed into :data:`PARSE_TIMINGS`, a per-parser histogram
+that scrapers report at the end of a run.
 """
 
 import logging
+import os
 import re
+import threading
+import time
+from typing import Any
 
 from bs4 import BeautifulSoup
 from bs4.builder import builder_registry
@@ -24,6 +38,23 @@ logger = logging.getLogger(__name__)
 #: skipped silently when their backing library is not installed.
 PARSER_CHAIN = ("html.parser", "lxml", "html5lib")
 
+#: Same fallbacks, fastest BeautifulSoup backend first.
+LXML_PARSER_CHAIN = ("lxml", "html.parser", "html5lib")
+
+#: Engine name -> BeautifulSoup parser chain. ``selectolax`` only replaces
+#: page extraction; soups it still needs come from the lxml chain.
+PARSER_ENGINES: dict[str, tuple[str, ...]] = {
+    "html.parser": PARSER_CHAIN,
+    "lxml": LXML_PARSER_CHAIN,
+    "selectolax": LXML_PARSER_CHAIN,
+}
+
+#: Environment override for the default engine (used when callers don't pass
+#: an explicit chain).
+PARSER_ENGINE_ENV = "SKILL_SEEKERS_HTML_PARSER"
+
+_HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
 _TAG_PATTERN_STR = re.compile(r"<[a-zA-Z]")
 _TAG_PATTERN_BYTES = re.compile(rb"<[a-zA-Z]")
 
@@ -39,6 +70,109 @@ def _looks_like_html(markup: str | bytes) -> bool:
     return _TAG_PATTERN_STR.search(markup) is not None
 
 
+class ParseTimings:
+    """Thread-safe per-parser parse-time histogram.
+
+    Buckets are upper bounds in milliseconds; the last bucket is open-ended.
+    Timings recorded in worker processes are shipped back with :meth:`drain`
+    and folded in with :meth:`merge`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    def record(self, parser: str, seconds: float) -> None:
+        """Add one parse of ``seconds`` for ``parser``."""
+        ms = seconds * 1000
+        bucket = next(
+            (f"<={bound}ms" for bound in _HISTOGRAM_BOUNDS_MS if ms <= bound),
+            f">{_HISTOGRAM_BOUNDS_MS[-1]}ms",
+        )
+        with self._lock:
+            stats = self._stats.get(parser)
+            if stats is None:
+                stats = self._stats[parser] = _empty_stats()
+            stats["count"] += 1
+            stats["total_ms"] += ms
+            stats["buckets"][bucket] += 1
+
+    def merge(self, other: dict[str, dict[str, Any]]) -> None:
+        """Fold in statistics drained from another process."""
+        with self._lock:
+            for parser, theirs in other.items():
+                stats = self._stats.get(parser)
+                if stats is None:
+                    stats = self._stats[parser] = _empty_stats()
+                stats["count"] += theirs["count"]
+                stats["total_ms"] += theirs["total_ms"]
+                for bucket, n in theirs["buckets"].items():
+                    stats["buckets"][bucket] += n
+
+    def drain(self) -> dict[str, dict[str, Any]]:
+        """Return the raw statistics and reset them."""
+        with self._lock:
+            stats, self._stats = self._stats, {}
+        return stats
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        with self._lock:
+            self._stats = {}
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Per-parser ``count``, ``total_ms``, ``mean_ms`` and ``buckets``."""
+        with self._lock:
+            return {
+                parser: {
+                    "count": stats["count"],
+                    "total_ms": round(stats["total_ms"], 3),
+                    "mean_ms": round(stats["total_ms"] / stats["count"], 3),
+                    "buckets": dict(stats["buckets"]),
+                }
+                for parser, stats in self._stats.items()
+            }
+
+    def format_report(self) -> str:
+        """One line per parser (empty string if nothing was recorded)."""
+        lines = []
+        for parser, stats in sorted(self.snapshot().items()):
+            histogram = ", ".join(f"{k}: {v}" for k, v in stats["buckets"].items() if v)
+            lines.append(
+                f"{parser}: {stats['count']} parses, mean {stats['mean_ms']:.2f} ms ({histogram})"
+            )
+        return "\n".join(lines)
+
+
+def _empty_stats() -> dict[str, Any]:
+    buckets = {f"<={bound}ms": 0 for bound in _HISTOGRAM_BOUNDS_MS}
+    buckets[f">{_HISTOGRAM_BOUNDS_MS[-1]}ms"] = 0
+    return {"count": 0, "total_ms": 0.0, "buckets": buckets}
+
+
+#: Process-wide parse-time histogram fed by parse_html / parse_html_lexbor.
+PARSE_TIMINGS = ParseTimings()
+
+
+def parser_chain(engine: str | None = None) -> tuple[str, ...]:
+    """BeautifulSoup parser chain for ``engine``.
+
+    ``None`` reads :data:`PARSER_ENGINE_ENV` (default ``html.parser``). An
+    unknown engine logs a warning and returns the historical default chain.
+    """
+    if engine is None:
+        engine = os.environ.get(PARSER_ENGINE_ENV) or "html.parser"
+    chain = PARSER_ENGINES.get(engine)
+    if chain is None:
+        logger.warning(
+            "Unknown HTML parser engine %r (expected one of %s); using html.parser",
+            engine,
+            ", ".join(PARSER_ENGINES),
+        )
+        return PARSER_CHAIN
+    return chain
+
+
 def available_parsers(chain: tuple[str, ...] = PARSER_CHAIN) -> list[str]:
     """Subset of ``chain`` whose backing libraries are importable."""
     return [name for name in chain if builder_registry.lookup(name) is not None]
@@ -47,18 +181,21 @@ def available_parsers(chain: tuple[str, ...] = PARSER_CHAIN) -> list[str]:
 def parse_html(
     markup: str | bytes,
     context: str = "",
-    parsers: tuple[str, ...] = PARSER_CHAIN,
+    parsers: tuple[str, ...] | None = None,
 ) -> BeautifulSoup:
     """Parse HTML, falling back to lenient parsers on failure.
 
     A parse counts as failed when the parser raises, or when it returns a
     tree with no tags for markup that clearly contains tags. ``context``
-    (e.g. the page URL) is only used in log messages.
+    (e.g. the page URL) is only used in log messages. ``parsers`` defaults to
+    :func:`parser_chain` for the environment-selected engine.
 
     Always returns a soup: if every parser fails, the least-bad result is
     returned so callers keep their existing "empty page" behaviour instead
     of crashing.
     """
+    if parsers is None:
+        parsers = parser_chain()
     primary = parsers[0] if parsers else "html.parser"
     empty_soup = None
     last_error: Exception | None = None
@@ -67,7 +204,9 @@ def parse_html(
         if builder_registry.lookup(parser) is None:
             continue
         try:
+            start = time.perf_counter()
             soup = BeautifulSoup(markup, parser)
+            PARSE_TIMINGS.record(parser, time.perf_counter() - start)
         except Exception as e:
             last_error = e
             logger.debug("HTML parser %s failed%s: %s", parser, _ctx(context), e)
@@ -97,5 +236,69 @@ def parse_html(
     return BeautifulSoup(markup, "html.parser")
 
 
+def lexbor_available() -> bool:
+    """True when selectolax (lexbor backend) is importable."""
+    try:
+        import selectolax.lexbor  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def parse_html_lexbor(markup: str | bytes, context: str = "") -> Any | None:
+    """Parse with selectolax's lexbor backend, or return ``None``.
+
+    ``None`` means "use :func:`parse_html` instead": selectolax is not
+    installed, lexbor raised, or it produced a tag-free tree for tag-bearing
+    markup (the same failure test as the BeautifulSoup chain).
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return None
+    try:
+        start = time.perf_counter()
+        tree = LexborHTMLParser(markup)
+        PARSE_TIMINGS.record("selectolax", time.perf_counter() - start)
+    except Exception as e:
+        logger.debug("HTML parser selectolax failed%s: %s", _ctx(context), e)
+        return None
+    # lexbor always builds the html/head/body skeleton; nothing inside it
+    # means the markup was swallowed (e.g. an unterminated comment).
+    if _looks_like_html(markup) and tree.css_first("head *, body *") is None:
+        return None
+    return tree
+
+
+class LexborTag:
+    """Minimal BeautifulSoup-``Tag``-shaped view of a selectolax node.
+
+    Just enough (``name``, ``parent``, ``get``) for
+    :meth:`LanguageDetector.detect_from_html`, which reads the ``class``
+    attribute of a code element and its parent ``<pre>``.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: Any) -> None:
+        self._node = node
+
+    @property
+    def name(self) -> str:
+        return self._node.tag
+
+    @property
+    def parent(self) -> "LexborTag | None":
+        parent = self._node.parent
+        return LexborTag(parent) if parent is not None else None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._node.attributes.get(key, default)
+        if key == "class" and isinstance(value, str):
+            # BeautifulSoup treats class as multi-valued
+            return value.split()
+        return default if value is None else value
+
+
 def _ctx(context: str) -> str:
     return f" for {context}" if context else ""
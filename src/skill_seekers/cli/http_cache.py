@@ -0,0 +1,203 @@
+"""
+Conditional-GET page cache for documentation re-scrapes.
+
+Stores, per normalized URL, the validators a server sent (``ETag`` /
+``Last-Modified``), the zlib-compressed response body and the extracted page
+dict. On the next run the scraper sends ``If-None-Match`` /
+``If-Modified-Since``; a ``304 Not Modified`` then reuses the cached page
+without downloading or re-parsing anything.
+
+Examples:
+    cache = HttpPageCache("output/react_data/http_cache.db")
+
+    entry = cache.get(url)
+    headers = {**base_headers, **HttpPageCache.conditional_headers(entry)}
+    response = requests.get(url, headers=headers)
+    if response.status_code == 304 and entry:
+        page = entry.page
+    else:
+        page = extract(response.content)
+        cache.store(url, response.headers, response.content, page)
+"""
+
+import json
+import sqlite3
+import threading
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class CachedPage:
+    """One cached response."""
+
+    url: str
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+    page: dict[str, Any] | None
+
+
+class HttpPageCache:
+    """
+    SQLite-backed HTTP cache keyed by normalized URL.
+
+    Safe to share between the thread-pool scraper's workers; all access is
+    serialized on an internal lock. Only responses carrying a validator are
+    stored — without one there is nothing to revalidate with.
+    """
+
+    def __init__(self, db_path: str = ":memory:"):
+        """
+        Initialize the page cache.
+
+        Args:
+            db_path: Path to SQLite database (":memory:" for in-memory)
+        """
+        self.db_path = db_path
+        self.hits = 0  # 304 responses served from cache
+        self.misses = 0  # full downloads
+        self.closed = False
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._lock:
+            if self.db_path != ":memory:":
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB NOT NULL,
+                    page TEXT,
+                    fetched_at TEXT NOT NULL
+                )
+            """)
+            self.conn.commit()
+
+    @staticmethod
+    def conditional_headers(entry: CachedPage | None) -> dict[str, str]:
+        """Request headers that revalidate ``entry`` (empty when not cached)."""
+        headers: dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def get(self, url: str) -> CachedPage | None:
+        """
+        Look up a cached response.
+
+        Args:
+            url: Normalized page URL
+
+        Returns:
+            The cached entry, or None if absent or unreadable
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, body, page FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        etag, last_modified, body, page_json = row
+        try:
+            return CachedPage(
+                url=url,
+                etag=etag,
+                last_modified=last_modified,
+                body=zlib.decompress(body),
+                page=json.loads(page_json) if page_json else None,
+            )
+        except (zlib.error, json.JSONDecodeError):
+            # Corrupt entry: behave as a miss so the page is fetched again
+            self.delete(url)
+            return None
+
+    def store(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes,
+        page: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Cache a full (200) response.
+
+        Args:
+            url: Normalized page URL
+            headers: Response headers (case-insensitive mapping)
+            body: Raw response body
+            page: Extracted page dict to reuse on a 304
+
+        Returns:
+            True if stored, False if the response had no validator
+        """
+        etag = headers.get("ETag") or headers.get("etag")
+        last_modified = headers.get("Last-Modified") or headers.get("last-modified")
+        if not etag and not last_modified:
+            return False
+
+        now = datetime.now(timezone.utc).isoformat()
+        page_json = json.dumps(page, ensure_ascii=False) if page is not None else None
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO pages
+                (url, etag, last_modified, body, page, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                (url, etag, last_modified, zlib.compress(body), page_json, now),
+            )
+            self.conn.commit()
+        return True
+
+    def record(self, not_modified: bool) -> None:
+        """Count one fetch as a 304 hit or a full download."""
+        with self._lock:
+            if not_modified:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def delete(self, url: str) -> None:
+        """Remove one entry."""
+        with self._lock:
+            self.conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+            self.conn.commit()
+
+    def size(self) -> int:
+        """Number of cached pages."""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            self.conn.close()
+            self.closed = True
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
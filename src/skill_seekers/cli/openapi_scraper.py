@@ -34,6 +34,8 @@ try:
     import yaml
 
     YAML_AVAILABLE = True
+    # libyaml's C parser is an order of magnitude faster on large specs
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     YAML_AVAILABLE = False
 
@@ -59,6 +61,103 @@ def _check_yaml_deps():
         )
 
 
+class _RefIndex:
+    """$ref targets, reference cycles and flattened schemas of one spec.
+
+    Each JSON pointer is walked once. Reference cycles are the strongly
+    connected components of the graph of local $refs: a schema's flattened
+    form only depends on the $refs being expanded around it through the
+    members of its own cycle, which makes it reusable wherever else the
+    schema is referenced at the same depth.
+    """
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        self.spec = spec
+        self.flattened: dict[tuple[str, int, frozenset[str]], dict[str, Any]] = {}
+        self._targets: dict[str, Any] = {}
+        self._cycles: dict[str, frozenset[str]] = {}
+
+    def target(self, ref_path: str) -> Any:
+        """Object a local ``#/...`` pointer points to, or None if unresolvable."""
+        if ref_path not in self._targets:
+            current: Any = self.spec
+            for part in ref_path[2:].split("/"):
+                # Handle JSON Pointer escaping
+                part = part.replace("~1", "/").replace("~0", "~")
+                if not isinstance(current, dict):
+                    logger.warning("  Could not resolve $ref: %s", ref_path)
+                    current = None
+                    break
+                current = current.get(part)
+                if current is None:
+                    logger.warning("  $ref target not found: %s", ref_path)
+                    break
+            self._targets[ref_path] = current
+        return self._targets[ref_path]
+
+    def cycle(self, ref_path: str) -> frozenset[str]:
+        """$refs that both reach and are reachable from ``ref_path`` (itself included)."""
+        if ref_path not in self._cycles:
+            self._find_cycles(ref_path)
+        return self._cycles[ref_path]
+
+    def _refs_in(self, ref_path: str) -> list[str]:
+        """Local $refs anywhere inside a target."""
+        refs: list[str] = []
+        stack = [self.target(ref_path)]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                ref = node.get("$ref")
+                if isinstance(ref, str) and ref.startswith("#/"):
+                    refs.append(ref)
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return list(dict.fromkeys(refs))
+
+    def _find_cycles(self, root: str) -> None:
+        """Tarjan's strongly connected components, iteratively, from ``root``."""
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        work = [(root, iter(self._refs_in(root)))]
+        index[root] = lowlink[root] = 0
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child in self._cycles:
+                    continue  # component finished by an earlier search
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(self._refs_in(child))))
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        members.append(member)
+                        if member == node:
+                            break
+                    component = frozenset(members)
+                    for member in members:
+                        self._cycles[member] = component
+
+
 def infer_description_from_spec(info: dict | None = None, name: str = "") -> str:
     """Infer skill description from OpenAPI info object.
 
@@ -143,6 +242,7 @@ class OpenAPIToSkillConverter(SkillConverter):
         self.spec_data: dict[str, Any] = {}
         self.extracted_data: dict[str, Any] = {}
         self.openapi_version: str = ""
+        self._ref_index: _RefIndex | None = None
 
     def extract(self):
         """Extract content from OpenAPI spec (SkillConverter interface)."""
@@ -307,7 +407,7 @@ class OpenAPIToSkillConverter(SkillConverter):
 
         # Try YAML (handles both YAML and JSON)
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_YAML_LOADER)
             if isinstance(data, dict):
                 return data
             raise RuntimeError(
@@ -782,36 +882,47 @@ class OpenAPIToSkillConverter(SkillConverter):
         """Flatten a schema by resolving references and simplifying structure.
 
         Handles $ref, allOf, oneOf, anyOf composition. Limits recursion depth
-        and tracks visited $ref names so a self-referential schema is stubbed
-        on cycle (rather than expanded to the depth cap).
+        and tracks the $refs being expanded so a self-referential schema is
+        stubbed on cycle (rather than expanded to the depth cap).
+
+        A flattened $ref is memoized per (ref, depth) and the part of
+        ``_visited`` inside the ref's own reference cycle, the only context
+        its result depends on, so shared models are flattened once per depth.
 
         Args:
             schema: Schema object to flatten.
             spec: Full spec for $ref resolution.
             depth: Current recursion depth (max 10).
-            _visited: $ref names currently being expanded (cycle guard).
+            _visited: $refs currently being expanded (cycle guard).
 
         Returns:
             Flattened schema dictionary.
         """
         if _visited is None:
-            _visited = set()
+            _visited = frozenset()
         if not schema or not isinstance(schema, dict) or depth > 10:
             return schema if isinstance(schema, dict) else {}
 
         # Resolve top-level $ref
         if "$ref" in schema:
-            ref_name = schema["$ref"].split("/")[-1]
-            if ref_name in _visited:
+            ref_path = schema["$ref"]
+            ref_name = ref_path.split("/")[-1]
+            if ref_path in _visited:
                 # Cycle: emit a stub instead of re-expanding the same type.
                 return {"type": "object", "_ref_name": ref_name, "_circular_ref": True}
             resolved = self._resolve_ref(schema, spec)
             if resolved is schema:
                 # Could not resolve — return stub
-                return {"type": "object", "$ref": schema["$ref"], "_ref_name": ref_name}
-            result = self._flatten_schema(resolved, spec, depth + 1, _visited | {ref_name})
-            result["_ref_name"] = ref_name
-            return result
+                return {"type": "object", "$ref": ref_path, "_ref_name": ref_name}
+
+            index = self._get_ref_index(spec)
+            key = (ref_path, depth, _visited & index.cycle(ref_path))
+            if key not in index.flattened:
+                result = self._flatten_schema(resolved, spec, depth + 1, _visited | {ref_path})
+                result["_ref_name"] = ref_name
+                index.flattened[key] = result
+            # Shallow copy, like _resolve_ref: callers may annotate the top level
+            return dict(index.flattened[key])
 
         result = dict(schema)
 
@@ -930,26 +1041,18 @@ class OpenAPIToSkillConverter(SkillConverter):
             logger.debug("  External $ref not supported: %s", ref_path)
             return obj
 
-        parts = ref_path[2:].split("/")
-        current: Any = spec
-        for part in parts:
-            # Handle JSON Pointer escaping
-            part = part.replace("~1", "/").replace("~0", "~")
-            if isinstance(current, dict):
-                current = current.get(part)
-            else:
-                logger.warning("  Could not resolve $ref: %s", ref_path)
-                return obj
-
-            if current is None:
-                logger.warning("  $ref target not found: %s", ref_path)
-                return obj
-
+        current = self._get_ref_index(spec).target(ref_path)
         if isinstance(current, dict):
             # Return a copy to avoid mutation
             return copy.copy(current)
         return obj
 
+    def _get_ref_index(self, spec: dict[str, Any]) -> _RefIndex:
+        """Ref index of ``spec``, rebuilt when a different spec is parsed."""
+        if self._ref_index is None or self._ref_index.spec is not spec:
+            self._ref_index = _RefIndex(spec)
+        return self._ref_index
+
     # ──────────────────────────────────────────────────────────────────────
     # Categorization
     # ──────────────────────────────────────────────────────────────────────
@@ -68,6 +68,7 @@ def package_skill(
     chunk_max_tokens=DEFAULT_CHUNK_TOKENS,
     preserve_code_blocks=True,
     chunk_overlap_tokens=DEFAULT_CHUNK_OVERLAP_TOKENS,
+    chunk_workers=1,
 ):
     """
     Package a skill directory into platform-specific format
@@ -85,6 +86,7 @@ def package_skill(
         enable_chunking: Enable intelligent chunking for RAG platforms
         chunk_max_tokens: Maximum tokens per chunk (default: 512)
         preserve_code_blocks: Preserve code blocks during chunking
+        chunk_workers: Worker processes for RAG chunking (default: 1)
 
     Returns:
         tuple: (success, package_path) where success is bool and package_path is Path or None
@@ -120,7 +122,12 @@ def package_skill(
     try:
         from skill_seekers.cli.adaptors import get_adaptor
 
-        adaptor = get_adaptor(target, {"custom_model": model} if model else None)
+        adaptor_config = {}
+        if model:
+            adaptor_config["custom_model"] = model
+        if chunk_workers > 1:
+            adaptor_config["chunk_workers"] = chunk_workers
+        adaptor = get_adaptor(target, adaptor_config or None)
     except (ImportError, ValueError) as e:
         print(f"❌ Error: {e}")
         return False, None
@@ -153,7 +160,8 @@ def package_skill(
         print(f"   Mode: Streaming (chunk_size={chunk_size}, overlap={chunk_overlap})")
     elif enable_chunking:
         print(
-            f"   Chunking: Enabled (max_tokens={chunk_max_tokens}, preserve_code={preserve_code_blocks})"
+            f"   Chunking: Enabled (max_tokens={chunk_max_tokens}, preserve_code={preserve_code_blocks}"
+            f", workers={max(1, chunk_workers)})"
         )
 
     try:
@@ -256,6 +264,7 @@ Examples:
         chunk_max_tokens=args.chunk_tokens,
         preserve_code_blocks=not args.no_preserve_code_blocks,
         chunk_overlap_tokens=args.chunk_overlap_tokens,
+        chunk_workers=args.chunk_workers,
     )
 
     if not success:
@@ -0,0 +1,291 @@
+"""
+Single-file page store for scraped documentation.
+
+Replaces the one-JSON-file-per-page layout (``<name>_data/pages/*.json``) with
+an append-only JSONL corpus plus a tab-separated offset index:
+
+    <name>_data/pages.jsonl       one compact JSON page per line
+    <name>_data/pages.jsonl.idx   "<offset>\\t<length>\\t<url>" per record
+
+Saving a page is one ``write`` to each file. Re-saving a URL appends a new
+record that supersedes the old one (last write wins, like overwriting the old
+per-page file did), and ``compact()`` drops superseded records. The index is
+only an accelerator: if it is missing or behind the data file (e.g. after a
+crash) the tail is rebuilt by scanning ``pages.jsonl``.
+
+Iterating a store streams pages from disk one at a time, so building a skill
+never needs the whole corpus in memory. Legacy ``pages/*.json`` directories
+are read through the same interface and are shadowed by any newer record for
+the same URL.
+
+Usage:
+    store = PageStore("output/react_data")
+    store.append(page)
+
+    for page in store:                # streaming, one page in memory at a time
+        ...
+    refs = [ref for ref, page in store.items() if "hooks" in page["url"]]
+    hooks = store.view(refs)          # lazy sequence: len(), [i], [:5], iteration
+"""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, overload
+
+logger = logging.getLogger(__name__)
+
+PAGES_FILE = "pages.jsonl"
+INDEX_SUFFIX = ".idx"
+LEGACY_PAGES_DIR = "pages"
+
+#: Reference to one stored page: a byte offset into pages.jsonl, or the path of
+#: a legacy pages/*.json file.
+PageRef = int | str
+
+
+class PageStore:
+    """
+    Append-only JSONL page corpus with an in-memory URL → offset index.
+
+    Thread-safe for concurrent ``append`` calls from the thread-pool scraper.
+    The index holds only URLs and offsets, never page bodies.
+    """
+
+    def __init__(self, data_dir: str | os.PathLike[str]):
+        """
+        Open (or lazily create) the store under ``data_dir``.
+
+        Args:
+            data_dir: Scrape data directory (``output/<name>_data``)
+        """
+        self.data_dir = Path(data_dir)
+        self.path = self.data_dir / PAGES_FILE
+        self.index_path = self.data_dir / f"{PAGES_FILE}{INDEX_SUFFIX}"
+        self._lock = threading.Lock()
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._size = 0  # bytes in pages.jsonl
+        self._live_bytes = 0  # bytes of the latest record per URL
+        self._legacy: dict[str, str] | None = None
+        self._load_index()
+
+    # ── Index ────────────────────────────────────────────────────────────
+
+    def _load_index(self) -> None:
+        """Read the offset index, then scan any data-file tail it does not cover."""
+        if not self.path.exists():
+            return
+        indexed_end = 0
+        if self.index_path.exists():
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    parts = line.rstrip("\n").split("\t", 2)
+                    if len(parts) != 3 or not parts[0].isdigit() or not parts[1].isdigit():
+                        break  # Torn write: rebuild from here
+                    offset, length = int(parts[0]), int(parts[1])
+                    if offset < indexed_end:
+                        break  # Out of order: rebuild from here
+                    self._set(parts[2], offset, length)
+                    indexed_end = offset + length
+
+        data_size = self.path.stat().st_size
+        if indexed_end > data_size:
+            # Index is ahead of the data file (data truncated): start over
+            self._offsets.clear()
+            self._live_bytes = 0
+            indexed_end = 0
+        self._size = indexed_end
+        if indexed_end < data_size:
+            self._scan_tail(indexed_end)
+
+    def _set(self, url: str, offset: int, length: int) -> None:
+        previous = self._offsets.get(url)
+        if previous is not None:
+            self._live_bytes -= previous[1]
+        self._offsets[url] = (offset, length)
+        self._live_bytes += length
+
+    def _scan_tail(self, start: int) -> None:
+        """Index records from byte ``start`` onwards and rewrite the index file."""
+        valid_end = start
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for raw in f:
+                length = len(raw)
+                if not raw.endswith(b"\n"):
+                    break  # Partial last record from an interrupted write
+                try:
+                    url = json.loads(raw)["url"]
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(
+                        "⚠️  Skipping unreadable record at byte %d of %s", offset, self.path
+                    )
+                    offset += length
+                    valid_end = offset
+                    continue
+                self._set(url, offset, length)
+                offset += length
+                valid_end = offset
+
+        if valid_end < self.path.stat().st_size:
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_end)
+        self._size = valid_end
+        self._rewrite_index()
+
+    def _rewrite_index(self) -> None:
+        """Write the index for the live records only (stale ones are found by size)."""
+        entries = sorted((span, url) for url, span in self._offsets.items())
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for (offset, length), url in entries:
+                f.write(f"{offset}\t{length}\t{url}\n")
+        os.replace(tmp_path, self.index_path)
+
+    def _legacy_files(self) -> dict[str, str]:
+        """URL → path for legacy pages/*.json files not superseded by the store."""
+        if self._legacy is None:
+            self._legacy = {}
+            legacy_dir = self.data_dir / LEGACY_PAGES_DIR
+            if legacy_dir.is_dir():
+                for json_file in sorted(legacy_dir.glob("*.json")):
+                    page = self._read_legacy(str(json_file))
+                    if page is not None and page.get("url"):
+                        self._legacy[page["url"]] = str(json_file)
+        return {url: path for url, path in self._legacy.items() if url not in self._offsets}
+
+    @staticmethod
+    def _read_legacy(path: str) -> dict[str, Any] | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error("⚠️  Error loading scraped data file %s: %s: %s", path, type(e).__name__, e)
+            logger.error("   Suggestion: File may be corrupted, consider re-scraping with --fresh")
+            return None
+
+    # ── Writing ──────────────────────────────────────────────────────────
+
+    def append(self, page: dict[str, Any]) -> None:
+        """Persist ``page``, superseding any earlier record with the same URL."""
+        data = (json.dumps(page, ensure_ascii=False) + "\n").encode("utf-8")
+        url = page["url"]
+        with self._lock:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                f.write(data)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(f"{offset}\t{len(data)}\t{url}\n")
+            self._set(url, offset, len(data))
+            self._size = offset + len(data)
+
+    @property
+    def stale_bytes(self) -> int:
+        """Bytes of pages.jsonl taken by records superseded by a later save."""
+        return self._size - self._live_bytes
+
+    def compact(self) -> None:
+        """Rewrite pages.jsonl keeping only the latest record per URL."""
+        with self._lock:
+            if not self.stale_bytes:
+                return
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            new_offsets: dict[str, tuple[int, int]] = {}
+            with open(self.path, "rb") as src, open(tmp_path, "wb") as dst:
+                for url, (offset, length) in self._offsets.items():
+                    src.seek(offset)
+                    new_offsets[url] = (dst.tell(), length)
+                    dst.write(src.read(length))
+            os.replace(tmp_path, self.path)
+            self._offsets = new_offsets
+            self._size = self._live_bytes
+            self._rewrite_index()
+
+    # ── Reading ──────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._legacy_files())
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._offsets or url in self._legacy_files()
+
+    def refs(self) -> list[PageRef]:
+        """References to every stored page (legacy files first, then by first save)."""
+        return [*self._legacy_files().values(), *(offset for offset, _ in self._offsets.values())]
+
+    def load(self, ref: PageRef) -> dict[str, Any] | None:
+        """Read one page by reference (None if a legacy file is unreadable)."""
+        return next(self.load_many([ref]), None)
+
+    def load_many(self, refs: Sequence[PageRef]) -> Iterator[dict[str, Any]]:
+        """Stream the pages behind ``refs`` in order, skipping unreadable ones."""
+        f = None
+        try:
+            for ref in refs:
+                if isinstance(ref, str):
+                    page = self._read_legacy(ref)
+                    if page is not None:
+                        yield page
+                    continue
+                if f is None:
+                    f = open(self.path, "rb")  # noqa: SIM115 - kept open across yields
+                f.seek(ref)
+                yield json.loads(f.readline())
+        finally:
+            if f is not None:
+                f.close()
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """Latest stored page for ``url``, or None."""
+        span = self._offsets.get(url)
+        if span is not None:
+            return self.load(span[0])
+        path = self._legacy_files().get(url)
+        return self._read_legacy(path) if path else None
+
+    def items(self) -> Iterator[tuple[PageRef, dict[str, Any]]]:
+        """Stream ``(ref, page)`` pairs, one page in memory at a time."""
+        refs = self.refs()
+        yield from zip(refs, self.load_many(refs), strict=False)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self.load_many(self.refs())
+
+    def view(self, refs: Sequence[PageRef]) -> "PageView":
+        """Lazy sequence over a subset of pages (e.g. one category)."""
+        return PageView(self, refs)
+
+
+class PageView(Sequence[dict[str, Any]]):
+    """
+    Read-only sequence of stored pages, loaded from disk on access.
+
+    Stands in for ``list[dict]`` in category maps so reference-file and
+    SKILL.md generation can slice, index and iterate without holding pages.
+    """
+
+    def __init__(self, store: PageStore, refs: Sequence[PageRef]):
+        self.store = store
+        self.refs = list(refs)
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PageView": ...
+
+    def __getitem__(self, index: int | slice) -> "dict[str, Any] | PageView":
+        if isinstance(index, slice):
+            return PageView(self.store, self.refs[index])
+        return self.store.load(self.refs[index]) or {}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self.store.load_many(self.refs)
@@ -268,7 +268,13 @@ class PatternRecognizer:
         self.detectors.append(TemplateMethodDetector(self.depth))
         self.detectors.append(ChainOfResponsibilityDetector(self.depth))
 
-    def analyze_file(self, file_path: str, content: str, language: str) -> PatternReport:
+    def analyze_file(
+        self,
+        file_path: str,
+        content: str,
+        language: str,
+        analysis: dict | None = None,
+    ) -> PatternReport:
         """
         Analyze a single file for design patterns.
 
@@ -276,15 +282,18 @@ class PatternRecognizer:
             file_path: Path to source file
             content: File content
             language: Programming language
+            analysis: Deep ``CodeAnalyzer.analyze_file`` result for this file,
+                if the caller already has one (skips re-parsing)
 
         Returns:
             PatternReport with detected patterns
         """
         # Step 1: Analyze code structure using CodeAnalyzer
-        from skill_seekers.cli.code_analyzer import CodeAnalyzer
+        if analysis is None:
+            from skill_seekers.cli.code_analyzer import CodeAnalyzer
 
-        analyzer = CodeAnalyzer(depth="deep")
-        analysis = analyzer.analyze_file(file_path, content, language)
+            analyzer = CodeAnalyzer(depth="deep")
+            analysis = analyzer.analyze_file(file_path, content, language)
 
         if not analysis:
             return PatternReport(
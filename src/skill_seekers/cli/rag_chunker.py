@@ -12,17 +12,53 @@ Usage:
 
     chunker = RAGChunker(chunk_size=512, chunk_overlap=50)
     chunks = chunker.chunk_skill(Path("output/react"))
+
+    # Chunk reference files in 4 worker processes (same output, same order)
+    chunks = chunker.chunk_skill(Path("output/react"), workers=4)
 """
 
 from skill_seekers.cli.arguments.common import DEFAULT_CHUNK_TOKENS, DEFAULT_CHUNK_OVERLAP_TOKENS
 
+import bisect
+import multiprocessing
 import re
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+_PARAGRAPH_RE = re.compile(r"\n\n+")
+_HEADER_RE = re.compile(r"\n#{1,6}\s+.+\n")
+_NEWLINE_RE = re.compile(r"\n")
+# Same whitespace definition as str.strip()
+_NON_SPACE_RE = re.compile(r"\S")
+_PLACEHOLDER_PREFIX = "<<CODE_BLOCK_"
+_PLACEHOLDER_RE = re.compile(r"<<CODE_BLOCK_\d+>>")
+
+#: One document to chunk: (text, metadata, source_file)
+Document = tuple[str, dict, str | None]
+
+# Per-process chunker for the chunk_documents pool. Built once per worker by
+# _init_chunk_worker so only documents and chunks cross the process boundary.
+_CHUNK_WORKER: "RAGChunker | None" = None
+
+
+def _init_chunk_worker(params: dict) -> None:
+    """ProcessPoolExecutor initializer: build the worker-local chunker."""
+    global _CHUNK_WORKER
+    _CHUNK_WORKER = RAGChunker(**params)
+
+
+def _chunk_in_worker(document: Document) -> list[dict]:
+    """Chunk one document inside a pool worker."""
+    if _CHUNK_WORKER is None:
+        raise RuntimeError("chunk worker not initialized")
+    return _CHUNK_WORKER.chunk_document(*document)
+
 
 class RAGChunker:
     """
@@ -139,17 +175,64 @@ class RAGChunker:
 
         return result
 
-    def chunk_skill(self, skill_dir: Path) -> list[dict]:
+    def chunk_documents(self, documents: Sequence[Document], workers: int = 1) -> list[list[dict]]:
+        """
+        Chunk many documents, optionally in parallel worker processes.
+
+        Results are returned in input order and are identical to calling
+        ``chunk_document`` on each document in turn, so chunk ordering and
+        ``chunk_id`` values do not depend on ``workers``.
+
+        Args:
+            documents: (text, metadata, source_file) tuples
+            workers: Worker processes to use (1 = chunk in this process)
+
+        Returns:
+            One list of chunks per input document
+        """
+        workers = min(workers, len(documents))
+        if workers > 1:
+            # spawn, not fork: callers may hold threads or open pools
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_chunk_worker,
+                    initargs=(self._worker_params(),),
+                ) as pool:
+                    return list(
+                        pool.map(
+                            _chunk_in_worker,
+                            documents,
+                            chunksize=max(1, len(documents) // (workers * 4)),
+                        )
+                    )
+            except BrokenProcessPool as e:
+                logger.warning(f"⚠️  Chunking pool failed ({e}); chunking in-process")
+        return [self.chunk_document(*document) for document in documents]
+
+    def _worker_params(self) -> dict:
+        """Constructor arguments that rebuild this chunker in a worker process."""
+        return {
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "preserve_code_blocks": self.preserve_code_blocks,
+            "preserve_paragraphs": self.preserve_paragraphs,
+            "min_chunk_size": self.min_chunk_size,
+        }
+
+    def chunk_skill(self, skill_dir: Path, workers: int = 1) -> list[dict]:
         """
         Chunk entire skill directory.
 
         Args:
             skill_dir: Path to skill directory (contains SKILL.md and references/)
+            workers: Worker processes for chunking (1 = sequential)
 
         Returns:
             List of all chunks with metadata
         """
-        all_chunks = []
+        documents: list[Document] = []
 
         # Chunk main SKILL.md
         skill_md = skill_dir / "SKILL.md"
@@ -158,9 +241,7 @@ class RAGChunker:
                 content = f.read()
 
             metadata = {"source": skill_dir.name, "category": "overview", "file_type": "skill_md"}
-
-            chunks = self.chunk_document(content, metadata, source_file="SKILL.md")
-            all_chunks.extend(chunks)
+            documents.append((content, metadata, "SKILL.md"))
 
         # Chunk reference files
         references_dir = skill_dir / "references"
@@ -174,11 +255,11 @@ class RAGChunker:
                     "category": ref_file.stem,
                     "file_type": "reference",
                 }
+                documents.append((content, metadata, str(ref_file.relative_to(skill_dir))))
 
-                chunks = self.chunk_document(
-                    content, metadata, source_file=str(ref_file.relative_to(skill_dir))
-                )
-                all_chunks.extend(chunks)
+        all_chunks = [
+            chunk for chunks in self.chunk_documents(documents, workers) for chunk in chunks
+        ]
 
         logger.info(f"Chunked skill directory {skill_dir.name}: {len(all_chunks)} total chunks")
 
@@ -221,6 +302,9 @@ class RAGChunker:
         """
         Re-insert code blocks into chunks.
 
+        Each chunk is scanned once for placeholders instead of being searched
+        once per code block.
+
         Args:
             chunks: Text chunks with placeholders
             code_blocks: Extracted code blocks
@@ -228,41 +312,58 @@ class RAGChunker:
         Returns:
             Chunks with code blocks re-inserted
         """
-        result = []
-        for chunk in chunks:
-            # Find all placeholders in this chunk
-            for block in code_blocks:
-                placeholder = f"<<CODE_BLOCK_{block['index']}>>"
-                if placeholder in chunk:
-                    chunk = chunk.replace(placeholder, block["content"])
-            result.append(chunk)
-
-        return result
+        if not code_blocks:
+            return list(chunks)
+
+        if any(_PLACEHOLDER_PREFIX in block["content"] for block in code_blocks):
+            # A code block that itself contains placeholder text: replace
+            # block by block so nested placeholders resolve in the same order
+            result = []
+            for chunk in chunks:
+                for block in code_blocks:
+                    placeholder = f"<<CODE_BLOCK_{block['index']}>>"
+                    if placeholder in chunk:
+                        chunk = chunk.replace(placeholder, block["content"])
+                result.append(chunk)
+            return result
+
+        contents = {f"<<CODE_BLOCK_{block['index']}>>": block["content"] for block in code_blocks}
+
+        def lookup(match: re.Match) -> str:
+            return contents.get(match.group(0), match.group(0))
+
+        return [
+            _PLACEHOLDER_RE.sub(lookup, chunk) if _PLACEHOLDER_PREFIX in chunk else chunk
+            for chunk in chunks
+        ]
 
     def _find_semantic_boundaries(self, text: str) -> list[int]:
         """
         Find paragraph and section boundaries.
 
+        Every newline is a boundary, so section headers (which start at a
+        newline) never add new positions; their regex is only run when its
+        match count can decide whether artificial boundaries are needed.
+
         Args:
             text: Document content
 
         Returns:
             List of character positions for boundaries (sorted)
         """
-        boundaries = [0]  # Start is always a boundary
-
         # Paragraph boundaries (double newline)
-        if self.preserve_paragraphs:
-            for match in re.finditer(r"\n\n+", text):
-                boundaries.append(match.end())
-
-        # Section headers (# Header)
-        for match in re.finditer(r"\n#{1,6}\s+.+\n", text):
-            boundaries.append(match.start())
+        paragraph_ends = (
+            [match.end() for match in _PARAGRAPH_RE.finditer(text)]
+            if self.preserve_paragraphs
+            else []
+        )
 
         # Single newlines (less preferred, but useful)
-        for match in re.finditer(r"\n", text):
-            boundaries.append(match.start())
+        newlines = [match.start() for match in _NEWLINE_RE.finditer(text)]
+
+        positions = set(newlines)
+        positions.update(paragraph_ends)
+        positions.add(0)  # Start is always a boundary
 
         # Add artificial boundaries for large documents
         # This ensures chunking works even when natural boundaries are sparse/clustered
@@ -270,30 +371,33 @@ class RAGChunker:
 
         # Only add artificial boundaries if:
         # 1. Document is large enough (> target_size_chars)
-        # 2. We have sparse boundaries (< 1 boundary per chunk_size on average)
+        # 2. We have sparse boundaries (< 1 boundary per chunk_size on average),
+        #    counting every candidate found above, duplicates included
         if len(text) > target_size_chars:
             expected_chunks = len(text) // target_size_chars
-            # If we don't have at least one boundary per expected chunk, add artificial ones
-            if len(boundaries) < expected_chunks:
-                for i in range(target_size_chars, len(text), target_size_chars):
-                    if i not in boundaries:  # Don't duplicate existing boundaries
-                        boundaries.append(i)
+            candidates = 1 + len(paragraph_ends) + len(newlines)
+            if candidates < expected_chunks:
+                # Section headers (# Header)
+                candidates += sum(1 for _ in _HEADER_RE.finditer(text))
+            if candidates < expected_chunks:
+                positions.update(range(target_size_chars, len(text), target_size_chars))
 
         # End is always a boundary
-        boundaries.append(len(text))
+        positions.add(len(text))
 
-        # Remove duplicates and sort
-        boundaries = sorted(set(boundaries))
-
-        return boundaries
+        return sorted(positions)
 
     def _split_with_overlap(self, text: str, boundaries: list[int]) -> list[str]:
         """
         Split text at semantic boundaries with overlap.
 
+        Works on boundary offsets only: the end of each chunk and the start of
+        the overlap are found by bisecting ``boundaries``, and text is sliced
+        once per emitted chunk.
+
         Args:
             text: Document content
-            boundaries: Character positions for boundaries
+            boundaries: Character positions for boundaries (sorted)
 
         Returns:
             List of text chunks
@@ -309,55 +413,34 @@ class RAGChunker:
                 return [text]
             return []
 
+        n = len(boundaries)
         i = 0
-        while i < len(boundaries) - 1:
+        while i < n - 1:
             start_pos = boundaries[i]
 
-            # Find boundaries that fit within chunk_size
-            j = i + 1
-            while j < len(boundaries):
-                potential_end = boundaries[j]
-                potential_chunk = text[start_pos:potential_end]
+            # Furthest boundary that keeps the chunk within chunk_size,
+            # advancing at least two boundaries
+            first_over = bisect.bisect_right(boundaries, start_pos + target_size_chars, i + 1)
+            j = n if first_over == n else max(first_over - 1, i + 2)
 
-                if len(potential_chunk) > target_size_chars:
-                    # Use previous boundary if we have one
-                    if j > i + 1:
-                        j -= 1
-                    break
-
-                j += 1
-
-            # If we didn't advance, force at least one boundary
-            if j == i + 1:
-                j = min(i + 2, len(boundaries))
-
-            # Extract chunk
-            end_pos = boundaries[min(j, len(boundaries) - 1)]
-            chunk_text = text[start_pos:end_pos]
-
-            # Add chunk if it meets minimum size requirement
-            # (unless the entire text is smaller than target size)
-            if chunk_text.strip() and (
-                len(text) <= target_size_chars or len(chunk_text) >= min_size_chars
+            # Extract chunk if it meets minimum size requirement and is not blank
+            end_pos = boundaries[min(j, n - 1)]
+            if end_pos - start_pos >= min_size_chars and _NON_SPACE_RE.search(
+                text, start_pos, end_pos
             ):
-                chunks.append(chunk_text)
-
-            # Move to next chunk with overlap
-            if j < len(boundaries) - 1:
-                # Find boundary for overlap
-                overlap_start = max(start_pos, end_pos - overlap_chars)
-                # Find nearest boundary to overlap_start
-                overlap_boundary_idx = min(j - 1, i + 1)
-                for k in range(i + 1, j):
-                    if boundaries[k] >= overlap_start:
-                        overlap_boundary_idx = k
-                        break
-
-                i = overlap_boundary_idx if overlap_boundary_idx > i else i + 1
-            else:
+                chunks.append(text[start_pos:end_pos])
+
+            if j >= n - 1:
                 # No more chunks
                 break
 
+            # Move to next chunk with overlap: first boundary inside the
+            # chunk at or after the overlap start
+            overlap_start = max(start_pos, end_pos - overlap_chars)
+            k = bisect.bisect_left(boundaries, overlap_start, i + 1, j)
+            overlap_boundary_idx = k if k < j else min(j - 1, i + 1)
+            i = overlap_boundary_idx if overlap_boundary_idx > i else i + 1
+
         return chunks
 
     def save_chunks(self, chunks: list[dict], output_path: Path) -> None:
@@ -396,6 +479,12 @@ def main():
     )
     parser.add_argument("--no-code-blocks", action="store_true", help="Don't preserve code blocks")
     parser.add_argument("--no-paragraphs", action="store_true", help="Don't preserve paragraphs")
+    parser.add_argument(
+        "--chunk-workers",
+        type=int,
+        default=1,
+        help="Worker processes for chunking reference files (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -408,7 +497,7 @@ def main():
     )
 
     # Chunk skill
-    chunks = chunker.chunk_skill(args.skill_dir)
+    chunks = chunker.chunk_skill(args.skill_dir, workers=args.chunk_workers)
 
     # Save to file
     output_path = args.output or args.skill_dir / "rag_chunks.json"
@@ -28,6 +28,7 @@ Example usage:
 """
 
 import ast
+import fnmatch
 import hashlib
 import json
 import logging
@@ -176,15 +177,18 @@ class PythonTestAnalyzer:
             "assertIsNotNone(None)",
         }
 
-    def extract(self, file_path: str, code: str) -> list[TestExample]:
-        """Extract examples from Python test file"""
+    def extract(
+        self, file_path: str, code: str, tree: ast.Module | None = None
+    ) -> list[TestExample]:
+        """Extract examples from Python test file (``tree``: already-parsed AST of ``code``)"""
         examples = []
 
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
-            logger.warning(f"Failed to parse {file_path}: {e}")
-            return []
+        if tree is None:
+            try:
+                tree = ast.parse(code)
+            except SyntaxError as e:
+                logger.warning(f"Failed to parse {file_path}: {e}")
+                return []
 
         # Extract imports for dependency tracking
         imports = self._extract_imports(tree)
@@ -1033,9 +1037,34 @@ class TestExampleExtractor:
             logger.warning(f"Failed to read {file_path} (encoding error)")
             return []
 
+        return self.extract_from_source(file_path, code)
+
+    def is_test_file(self, file_path: Path) -> bool:
+        """Whether the file name matches one of TEST_PATTERNS."""
+        return any(fnmatch.fnmatchcase(file_path.name, pattern) for pattern in self.TEST_PATTERNS)
+
+    def extract_from_source(
+        self, file_path: Path, code: str, tree: ast.Module | None = None
+    ) -> list[TestExample]:
+        """
+        Extract examples from a test file that has already been read.
+
+        Args:
+            file_path: Path to the test file
+            code: File content
+            tree: Already-parsed AST of ``code`` (Python only)
+
+        Returns:
+            Filtered examples, at most ``max_per_file``
+        """
+        file_path = Path(file_path)
+        language = self._detect_language(file_path)
+        if self.languages and language.lower() not in self.languages:
+            return []
+
         # Extract examples based on language
         if language == "Python":
-            examples = self.python_analyzer.extract(str(file_path), code)
+            examples = self.python_analyzer.extract(str(file_path), code, tree)
         else:
             examples = self.generic_analyzer.extract(str(file_path), code, language)
 
@@ -16,6 +16,7 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
+from skill_seekers.cli.github_api import default_github_cache_path
 from skill_seekers.cli.github_fetcher import GitHubThreeStreamFetcher
 
 
@@ -124,7 +125,12 @@ class UnifiedCodebaseAnalyzer:
             AnalysisResult with all 3 streams
         """
         # Use three-stream fetcher
-        fetcher = GitHubThreeStreamFetcher(repo_url, self.github_token, interactive=interactive)
+        fetcher = GitHubThreeStreamFetcher(
+            repo_url,
+            self.github_token,
+            interactive=interactive,
+            api_cache=default_github_cache_path(),
+        )
         three_streams = fetcher.fetch(output_dir)
 
         # Analyze code with specified depth
@@ -250,6 +256,7 @@ class UnifiedCodebaseAnalyzer:
             # Import codebase analyzer
             import tempfile
 
+            from .analysis_cache import default_cache_path
             from .codebase_scraper import analyze_codebase
 
             # Create temporary output directory for C3.x analysis
@@ -269,6 +276,7 @@ class UnifiedCodebaseAnalyzer:
                 build_how_to_guides=True,
                 extract_config_patterns=True,
                 enhance_level=0,  # Disable AI for speed
+                analysis_cache=default_cache_path(),
             )
 
             # Load C3.x results from output files
@@ -28,6 +28,7 @@ try:
     from skill_seekers.cli.conflict_detector import ConflictDetector
     from skill_seekers.cli.defaults import DEFAULTS
     from skill_seekers.cli.merge_sources import AIEnhancedMerger, RuleBasedMerger
+    from skill_seekers.cli.page_store import PageStore
     from skill_seekers.cli.skill_converter import SkillConverter
     from skill_seekers.cli.unified_skill_builder import UnifiedSkillBuilder
 except ImportError as e:
@@ -221,29 +222,27 @@ class UnifiedScraper(SkillConverter):
     def _enrich_docs_json(docs_json: dict, data_file_path: str) -> dict:
         """Enrich docs summary with page content from individual page files.
 
-        summary.json only has {title, url} per page; full content lives in pages/*.json.
-        ConflictDetector needs content to extract APIs, so we load page files and convert
-        to the dict format {url: page_data} that the detector's dict branch understands.
+        summary.json only has {title, url} per page; full content lives in the page
+        store (pages.jsonl, or pages/*.json from older scrapes). ConflictDetector needs
+        content to extract APIs, so we load the pages and convert to the dict format
+        {url: page_data} that the detector's dict branch understands.
         """
         pages = docs_json.get("pages", [])
         if not isinstance(pages, list) or not pages or "content" in pages[0]:
             return docs_json
 
-        pages_dir = os.path.join(os.path.dirname(data_file_path), "pages")
-        if not os.path.isdir(pages_dir):
+        data_dir = os.path.dirname(data_file_path)
+        if not os.path.isdir(data_dir):
             return docs_json
 
         enriched_pages = {}
-        for page_file in os.listdir(pages_dir):
-            if page_file.endswith(".json"):
-                try:
-                    with open(os.path.join(pages_dir, page_file), encoding="utf-8") as pf:
-                        page_data = json.load(pf)
-                    url = page_data.get("url", "")
-                    if url:
-                        enriched_pages[url] = page_data
-                except (json.JSONDecodeError, OSError):
-                    continue
+        try:
+            for page_data in PageStore(data_dir):
+                url = page_data.get("url", "")
+                if url:
+                    enriched_pages[url] = page_data
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Could not read page store in {data_dir}: {e}")
 
         if enriched_pages:
             docs_json = {**docs_json, "pages": enriched_pages}
@@ -568,6 +567,12 @@ class UnifiedScraper(SkillConverter):
         if "exclude_dirs_additional" in source:
             github_config["exclude_dirs_additional"] = source["exclude_dirs_additional"]
 
+        # Remote-mode download tuning (optional; "blob_cache": null disables the cache)
+        if "fetch_workers" in source:
+            github_config["fetch_workers"] = source["fetch_workers"]
+        if "blob_cache" in source:
+            github_config["blob_cache"] = source["blob_cache"]
+
         # Write the GitHub sub-skill + its data file straight into the cache
         # (no output/ staging, no move). Clean any stale copy first.
         github_skill_dir = os.path.join(self.sources_dir, github_config["name"])
@@ -855,6 +860,7 @@ class UnifiedScraper(SkillConverter):
         - Local source code for C3.x analysis
         """
         try:
+            from skill_seekers.cli.analysis_cache import default_cache_path
             from skill_seekers.cli.codebase_scraper import analyze_codebase
         except ImportError:
             logger.error("codebase_scraper.py not found")
@@ -926,6 +932,9 @@ class UnifiedScraper(SkillConverter):
                 extract_config_patterns=extract_config_patterns,
                 extract_docs=extract_docs,
                 enhance_level=enhance_level,
+                jobs=source.get("jobs", 1),
+                # "analysis_cache": null in the source disables the cache
+                analysis_cache=source.get("analysis_cache", default_cache_path()),
             )
 
             # Load analysis outputs into memory.
@@ -1229,6 +1238,8 @@ class UnifiedScraper(SkillConverter):
                 "feed_path": source.get("path"),
                 "follow_links": source.get("follow_links", True),
                 "max_articles": source.get("max_articles", 50),
+                "article_workers": source.get("article_workers", 8),
+                "http_cache": source.get("http_cache", True),
                 "description": source.get("description", f"{feed_id} RSS/Atom feed"),
             },
             record={"feed_url": feed_url, "feed_id": feed_id, "idx": idx},
@@ -1286,6 +1297,7 @@ class UnifiedScraper(SkillConverter):
                 "token": source.get("token"),
                 "channel": channel,
                 "max_messages": source.get("max_messages", 10000),
+                "jobs": source.get("jobs", 1),
                 "description": source.get("description", f"{chat_id} chat export"),
             },
             record={"chat_id": chat_id, "platform": source.get("platform", "slack"), "idx": idx},
@@ -1688,6 +1700,7 @@ class UnifiedScraper(SkillConverter):
             config_patterns, architecture
         """
         try:
+            from skill_seekers.cli.analysis_cache import default_cache_path
             from skill_seekers.cli.codebase_scraper import analyze_codebase
         except ImportError:
             logger.error("codebase_scraper.py not found")
@@ -1723,6 +1736,7 @@ class UnifiedScraper(SkillConverter):
                 enhance_level=0 if source.get("ai_mode", "auto") == "none" else 2,
                 agent=agent,
                 agent_cmd=agent_cmd,
+                analysis_cache=source.get("analysis_cache", default_cache_path()),
             )
 
             # Load C3.x outputs into memory.
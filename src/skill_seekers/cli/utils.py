@@ -419,6 +419,7 @@ async def retry_with_backoff_async(
     max_attempts: int = 3,
     base_delay: float = 1.0,
     operation_name: str = "operation",
+    should_retry: Callable[[Exception], bool] | None = None,
 ) -> T:
     """Async version of retry_with_backoff for async operations.
 
@@ -427,6 +428,8 @@ async def retry_with_backoff_async(
         max_attempts: Maximum number of attempts (default: 3)
         base_delay: Base delay in seconds, doubles each retry (default: 1.0)
         operation_name: Name for logging purposes (default: "operation")
+        should_retry: Optional predicate; an exception it rejects is re-raised
+            at once instead of being retried (default: retry every exception)
 
     Returns:
         Result of successful operation
@@ -449,6 +452,8 @@ async def retry_with_backoff_async(
         try:
             return await operation()
         except Exception as e:
+            if should_retry is not None and not should_retry(e):
+                raise
             last_exception = e
             if attempt < max_attempts:
                 delay = base_delay * (2 ** (attempt - 1))
@@ -0,0 +1,665 @@
+#!/usr/bin/env python3
+"""
+Local on-disk vector index for packaged skills.
+
+Query a packaged skill without standing up a vector database. The index is
+an IVF (inverted file) index built with NumPy only:
+
+- ``vectors.f32`` — unit-normalized float32 rows, appended in slot order and
+  read through ``np.memmap``.
+- ``lists.npy`` — the IVF list each slot belongs to (``-1`` = deleted).
+- ``centroids.npy`` — spherical k-means centroids, one per list.
+- ``records.jsonl`` — ``{"id", "metadata"}`` per slot, appended.
+- ``manifest.json`` — dimension, list count, the committed slot count and
+  the file generation. It is replaced atomically after every write, so a
+  crash mid-append only leaves an uncommitted tail that is truncated on the
+  next open. ``lists.npy`` and ``centroids.npy`` are likewise written to a
+  temporary file and renamed into place.
+
+``compact`` writes the surviving rows to a new file generation
+(``vectors.<n>.f32``, ``records.<n>.jsonl``, ...) and commits it with the
+single manifest swap; files of any other generation are leftovers of an
+interrupted compaction and are removed on open.
+
+Search scores the ``nprobe`` lists closest to the query by cosine similarity
+and takes the top-k with ``argpartition``. Metadata filters (e.g. category,
+file) are applied before scoring; when a filter leaves fewer than ``k``
+candidates in the probed lists, every matching vector is scored instead so
+selective filters never come back short.
+
+Records are keyed by the deterministic chunk IDs the RAG adaptors emit
+(``SkillAdaptor._generate_deterministic_id``). Adding an existing ID replaces
+it, ``delete`` tombstones it, and ``compact`` drops tombstoned rows.
+
+Usage:
+    index = VectorIndex("output/react-index")
+    index.add(ids, embeddings, metadatas)
+    index.search(query_embedding, k=10, filters={"category": "api"})
+
+    # Or build straight from a Chroma/FAISS/LangChain package:
+    python -m skill_seekers.cli.vector_index build output/react-chroma.json output/react-index
+    python -m skill_seekers.cli.vector_index search output/react-index "useEffect cleanup"
+
+The CLI embeds with ``EmbeddingGenerator`` (``--model``, default the local
+sentence-transformers model ``all-MiniLM-L6-v2``).
+"""
+
+import json
+import logging
+import os
+import re
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 2
+
+#: Index data files as ``kind -> (stem, suffix)``; generation ``n > 0`` is
+#: stored as ``<stem>.<n><suffix>``.
+_DATA_FILES = {
+    "vectors": ("vectors", ".f32"),
+    "records": ("records", ".jsonl"),
+    "lists": ("lists", ".npy"),
+    "centroids": ("centroids", ".npy"),
+}
+_DATA_FILE_RE = re.compile(r"^(vectors|records|lists|centroids)(\.\d+)?\.(f32|jsonl|npy)$")
+
+#: Below this many vectors an index stays flat (one list, exact search).
+MIN_IVF_VECTORS = 1024
+
+#: Training points sampled per list for k-means.
+_TRAIN_POINTS_PER_LIST = 64
+_KMEANS_ITERATIONS = 10
+_ASSIGN_CHUNK = 65_536
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _data_file_name(kind: str, generation: int) -> str:
+    stem, suffix = _DATA_FILES[kind]
+    return f"{stem}{suffix}" if generation == 0 else f"{stem}.{generation}{suffix}"
+
+
+def _save_array(path: Path, array: np.ndarray) -> None:
+    """``np.save`` through a temporary file so a torn write never replaces ``path``."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def default_nlist(count: int) -> int:
+    """Number of IVF lists for ``count`` vectors (about sqrt(n), 1 when small)."""
+    if count < MIN_IVF_VECTORS:
+        return 1
+    return int(min(4096, max(1, round(np.sqrt(count)))))
+
+
+def train_centroids(vectors: np.ndarray, nlist: int, seed: int = 0) -> np.ndarray:
+    """
+    Spherical k-means over (a sample of) unit vectors.
+
+    Args:
+        vectors: Unit-normalized float32 matrix
+        nlist: Number of centroids
+        seed: RNG seed (training is deterministic for a given seed)
+
+    Returns:
+        ``(nlist, dim)`` float32 matrix of unit centroids
+    """
+    rng = np.random.default_rng(seed)
+    n = len(vectors)
+    nlist = min(nlist, n)
+    sample_size = min(n, nlist * _TRAIN_POINTS_PER_LIST)
+    sample = np.asarray(vectors[np.sort(rng.choice(n, sample_size, replace=False))])
+    centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+    for _ in range(_KMEANS_ITERATIONS):
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, sample)
+        empty = ~np.bincount(assignment, minlength=nlist).astype(bool)
+        # Re-seed empty lists with random points so every list stays in use
+        sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+        centroids = _normalize(sums).astype(np.float32)
+
+    return centroids
+
+
+def assign_lists(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Nearest-centroid list for each row of ``vectors``."""
+    out = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), _ASSIGN_CHUNK):
+        block = np.asarray(vectors[start : start + _ASSIGN_CHUNK])
+        out[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` largest scores, best first."""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+class VectorIndex:
+    """
+    Persistent IVF vector index with metadata filtering.
+
+    Examples:
+        index = VectorIndex("react-index")
+        index.add(["id1", "id2"], [[...], [...]], [{"category": "api"}, {...}])
+        hits = index.search([...], k=5, filters={"file": "hooks.md"})
+        index.delete(["id2"])
+        index.train()     # re-cluster after large incremental growth
+        index.compact()   # drop deleted rows from disk
+    """
+
+    def __init__(self, root: str | Path, nprobe: int = 8):
+        """
+        Open (or create) an index directory.
+
+        Args:
+            root: Index directory
+            nprobe: IVF lists scanned per query (more = higher recall, slower)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.nprobe = nprobe
+
+        self.dimension: int | None = None
+        self.count = 0
+        self.generation = 0
+        self._centroids: np.ndarray | None = None
+        self._lists = np.empty(0, dtype=np.int32)
+        self._ids: list[str] = []
+        self._metadata: list[dict] = []
+        self._slots: dict[str, int] = {}
+        self._vectors: np.ndarray | None = None
+        self._list_order: tuple[np.ndarray, np.ndarray] | None = None
+        self._field_cache: dict[str, dict[Any, np.ndarray]] = {}
+
+        self._load()
+
+    # ----------------------------------------------------------------- storage
+
+    def _path(self, kind: str, generation: int | None = None) -> Path:
+        """Data file of ``kind`` for ``generation`` (default: the committed one)."""
+        return self.root / _data_file_name(
+            kind, self.generation if generation is None else generation
+        )
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self._path("vectors")
+
+    @property
+    def _records_path(self) -> Path:
+        return self._path("records")
+
+    def _remove_stale_files(self) -> None:
+        """Delete temp files and data files not belonging to the committed generation."""
+        current = {_data_file_name(kind, self.generation) for kind in _DATA_FILES}
+        for path in self.root.iterdir():
+            if path.name.endswith(".tmp") or (
+                _DATA_FILE_RE.match(path.name) and path.name not in current
+            ):
+                path.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        manifest_path = self.root / "manifest.json"
+        if not manifest_path.exists():
+            # Nothing committed yet: data files left by an interrupted first
+            # add are uncommitted and must not be appended to
+            for kind in _DATA_FILES:
+                self._path(kind).unlink(missing_ok=True)
+            self._remove_stale_files()
+            return
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        self.dimension = manifest["dimension"]
+        self.count = manifest["count"]
+        self.generation = manifest.get("generation", 0)
+        self._remove_stale_files()
+
+        centroids_path = self._path("centroids")
+        if centroids_path.exists():
+            self._centroids = np.load(centroids_path)
+        self._lists = np.load(self._path("lists"))[: self.count]
+
+        # Drop any uncommitted tail left by an interrupted write
+        row_bytes = self.dimension * 4
+        with open(self._vectors_path, "r+b") as f:
+            f.truncate(self.count * row_bytes)
+        records: list[dict] = []
+        committed = 0
+        with open(self._records_path, "r+b") as f:
+            for line in f:
+                if len(records) == self.count:
+                    break
+                records.append(json.loads(line))
+                committed += len(line)
+            f.truncate(committed)
+
+        self._ids = [r["id"] for r in records]
+        self._metadata = [r["metadata"] for r in records]
+        self._slots = {
+            record_id: slot for slot, record_id in enumerate(self._ids) if self._lists[slot] >= 0
+        }
+
+    def _save_state(self) -> None:
+        """Persist list assignments and centroids, then commit the manifest."""
+        _save_array(self._path("lists"), self._lists)
+        if self._centroids is not None:
+            _save_array(self._path("centroids"), self._centroids)
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "dimension": self.dimension,
+            "count": self.count,
+            "nlist": self.nlist,
+            "generation": self.generation,
+            "metric": "cosine",
+        }
+        tmp = self.root / "manifest.json.tmp"
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp, self.root / "manifest.json")
+
+        self._vectors = None
+        self._list_order = None
+        self._field_cache = {}
+
+    def _matrix(self) -> np.ndarray:
+        """Memory-mapped view of every committed row."""
+        if self._vectors is None:
+            if self.count == 0:
+                return np.empty((0, self.dimension or 0), dtype=np.float32)
+            self._vectors = np.memmap(
+                self._vectors_path, dtype=np.float32, mode="r", shape=(self.count, self.dimension)
+            )
+        return self._vectors
+
+    # ----------------------------------------------------------------- writes
+
+    @property
+    def nlist(self) -> int:
+        return 0 if self._centroids is None else len(self._centroids)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._slots
+
+    def add(
+        self,
+        ids: list[str],
+        vectors: list[list[float]] | np.ndarray,
+        metadatas: list[dict] | None = None,
+    ) -> None:
+        """
+        Add or replace vectors.
+
+        New rows are assigned to the nearest existing centroid. The first add
+        to an empty index trains the centroids on that batch; call
+        :meth:`train` after the index has grown a lot to re-cluster.
+
+        Args:
+            ids: Record IDs (e.g. the package's deterministic chunk IDs)
+            vectors: One embedding per ID
+            metadatas: Optional metadata dict per ID (used by filters)
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or len(matrix) != len(ids):
+            raise ValueError(f"Expected {len(ids)} vectors, got shape {matrix.shape}")
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate IDs in one add() call")
+        if not len(ids):
+            return
+        if self.dimension is None:
+            self.dimension = matrix.shape[1]
+        elif matrix.shape[1] != self.dimension:
+            raise ValueError(f"Expected {self.dimension}-dim vectors, got {matrix.shape[1]}")
+
+        metadatas = metadatas or [{} for _ in ids]
+        matrix = _normalize(matrix).astype(np.float32)
+
+        self._tombstone(record_id for record_id in ids if record_id in self._slots)
+        if self._centroids is None:
+            self._centroids = train_centroids(matrix, default_nlist(len(matrix)))
+        new_lists = assign_lists(matrix, self._centroids)
+
+        with open(self._vectors_path, "ab") as f:
+            f.write(matrix.tobytes())
+        with open(self._records_path, "a", encoding="utf-8") as f:
+            for record_id, meta in zip(ids, metadatas, strict=True):
+                f.write(json.dumps({"id": record_id, "metadata": meta}, ensure_ascii=False) + "\n")
+
+        for record_id, meta in zip(ids, metadatas, strict=True):
+            self._slots[record_id] = len(self._ids)
+            self._ids.append(record_id)
+            self._metadata.append(meta)
+        self._lists = np.concatenate([self._lists, new_lists])
+        self.count += len(ids)
+        self._save_state()
+
+    def _tombstone(self, ids: Iterable[str]) -> int:
+        removed = 0
+        for record_id in ids:
+            slot = self._slots.pop(record_id, None)
+            if slot is not None:
+                self._lists[slot] = -1
+                removed += 1
+        return removed
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """
+        Delete records by ID.
+
+        Returns:
+            Number of records that existed and were removed
+        """
+        removed = self._tombstone(ids)
+        if removed:
+            self._save_state()
+        return removed
+
+    def train(self, nlist: int | None = None, seed: int = 0) -> None:
+        """
+        Re-cluster every live vector and reassign lists.
+
+        Args:
+            nlist: Number of lists (default: about sqrt of the live count)
+            seed: k-means seed
+        """
+        live = np.flatnonzero(self._lists >= 0)
+        if not len(live):
+            return
+        vectors = np.asarray(self._matrix()[live])
+        self._centroids = train_centroids(vectors, nlist or default_nlist(len(live)), seed)
+        self._lists[live] = assign_lists(vectors, self._centroids)
+        self._save_state()
+
+    def compact(self) -> None:
+        """
+        Rewrite the index without deleted rows.
+
+        The compacted files are written as a new generation and only become
+        visible with the manifest commit, so a crash at any point leaves
+        either the old or the new index, never a mix.
+        """
+        live = np.flatnonzero(self._lists >= 0)
+        if len(live) == self.count:
+            return
+
+        old_generation = self.generation
+        new_generation = old_generation + 1
+        vectors = np.asarray(self._matrix()[live])
+        self._vectors = None
+        self._path("vectors", new_generation).write_bytes(vectors.tobytes())
+
+        ids = [self._ids[slot] for slot in live]
+        metadata = [self._metadata[slot] for slot in live]
+        with open(self._path("records", new_generation), "w", encoding="utf-8") as f:
+            for record_id, meta in zip(ids, metadata, strict=True):
+                f.write(json.dumps({"id": record_id, "metadata": meta}, ensure_ascii=False) + "\n")
+
+        self._ids = ids
+        self._metadata = metadata
+        self._lists = self._lists[live]
+        self._slots = {record_id: slot for slot, record_id in enumerate(self._ids)}
+        self.count = len(live)
+        self.generation = new_generation
+        self._save_state()
+
+        for kind in _DATA_FILES:
+            self._path(kind, old_generation).unlink(missing_ok=True)
+
+    # ----------------------------------------------------------------- search
+
+    def _lists_slots(self, lists: np.ndarray) -> np.ndarray:
+        """Live slots belonging to any of ``lists`` (sorted by list)."""
+        if self._list_order is None:
+            order = np.argsort(self._lists, kind="stable").astype(np.int64)
+            bounds = np.searchsorted(self._lists[order], np.arange(self.nlist + 1))
+            self._list_order = (order, bounds)
+        order, bounds = self._list_order
+        return np.concatenate([order[bounds[i] : bounds[i + 1]] for i in lists])
+
+    def _field_slots(self, field: str, value: Any) -> np.ndarray:
+        index = self._field_cache.get(field)
+        if index is None:
+            groups: dict[Any, list[int]] = {}
+            for slot, meta in enumerate(self._metadata):
+                key = meta.get(field)
+                if isinstance(key, (str, int, float, bool)) or key is None:
+                    groups.setdefault(key, []).append(slot)
+            index = self._field_cache[field] = {
+                key: np.asarray(slots, dtype=np.int64) for key, slots in groups.items()
+            }
+        return index.get(value, np.empty(0, dtype=np.int64))
+
+    def _filter_mask(self, filters: dict[str, Any]) -> np.ndarray:
+        """Boolean mask of live slots matching every filter (list = any of)."""
+        mask = self._lists >= 0
+        for field, wanted in filters.items():
+            values = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            field_mask = np.zeros(self.count, dtype=bool)
+            for value in values:
+                field_mask[self._field_slots(field, value)] = True
+            mask &= field_mask
+        return mask
+
+    def search(
+        self,
+        query: list[float] | np.ndarray,
+        k: int = 10,
+        filters: dict[str, Any] | None = None,
+        nprobe: int | None = None,
+        exact: bool = False,
+    ) -> list[dict]:
+        """
+        Top-k records by cosine similarity.
+
+        Args:
+            query: Query embedding
+            k: Number of results
+            filters: Metadata equality filters, e.g. ``{"category": "api"}``
+                or ``{"file": ["a.md", "b.md"]}``
+            nprobe: Lists to scan (default: the index's ``nprobe``)
+            exact: Scan every vector (brute force) instead of probing lists
+
+        Returns:
+            List of ``{"id", "score", "metadata"}`` dicts, best first
+        """
+        if not self._slots or k <= 0:
+            return []
+        q = _normalize(np.asarray(query, dtype=np.float32).reshape(-1))
+        if len(q) != self.dimension:
+            raise ValueError(f"Expected a {self.dimension}-dim query, got {len(q)}")
+
+        mask = self._filter_mask(filters) if filters else self._lists >= 0
+        if exact or self.nlist <= 1:
+            candidates = np.flatnonzero(mask)
+        else:
+            probe = top_k(self._centroids @ q, min(nprobe or self.nprobe, self.nlist))
+            candidates = self._lists_slots(probe)
+            candidates = candidates[mask[candidates]]
+            if filters and len(candidates) < k:
+                candidates = np.flatnonzero(mask)
+
+        if not len(candidates):
+            return []
+        candidates.sort()  # sequential reads from the memory map
+        scores = self._matrix()[candidates] @ q
+        best = top_k(scores, k)
+        return [
+            {
+                "id": self._ids[candidates[i]],
+                "score": float(scores[i]),
+                "metadata": self._metadata[candidates[i]],
+            }
+            for i in best
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """Record counts, dimension and IVF layout."""
+        return {
+            "records": len(self._slots),
+            "deleted": self.count - len(self._slots),
+            "dimension": self.dimension,
+            "nlist": self.nlist,
+            "nprobe": self.nprobe,
+        }
+
+
+def load_package_records(package_path: str | Path) -> tuple[list[str], list[str], list[dict]]:
+    """
+    Read ``(ids, documents, metadatas)`` from a packaged skill.
+
+    Supports the ``documents``/``metadatas``/``ids`` layout (Chroma, FAISS)
+    and lists of ``{"page_content"|"text", "metadata"}`` (LangChain,
+    LlamaIndex). Packages without IDs get the same deterministic IDs the
+    adaptors generate.
+    """
+    data = json.loads(Path(package_path).read_text(encoding="utf-8"))
+
+    if isinstance(data, dict) and "documents" in data:
+        documents = data["documents"]
+        metadatas = data.get("metadatas") or [{} for _ in documents]
+        ids = data.get("ids")
+    elif isinstance(data, list):
+        documents = [item.get("page_content", item.get("text", "")) for item in data]
+        metadatas = [item.get("metadata", {}) for item in data]
+        ids = [item.get("id") or item.get("id_") for item in data]
+        if not all(ids):
+            ids = None
+    else:
+        raise ValueError(f"Unsupported package format: {package_path}")
+
+    if ids is None:
+        from skill_seekers.cli.adaptors import get_adaptor
+
+        adaptor = get_adaptor("chroma")
+        ids = [
+            adaptor._generate_id(doc, meta) for doc, meta in zip(documents, metadatas, strict=True)
+        ]
+
+    return ids, documents, metadatas
+
+
+def build_from_package(
+    package_path: str | Path,
+    index_dir: str | Path,
+    embed_fn: Callable[[list[str]], list[list[float]]],
+    batch_size: int = 256,
+) -> VectorIndex:
+    """
+    Embed a packaged skill's chunks and add them to an index.
+
+    Chunks whose ID is already indexed are skipped, so re-running after a
+    re-package only embeds new or changed chunks. IDs no longer in the
+    package are deleted.
+
+    Args:
+        package_path: Chroma/FAISS/LangChain/LlamaIndex package JSON
+        index_dir: Index directory (created or updated)
+        embed_fn: Embeds a list of texts
+        batch_size: Texts embedded and added per step
+
+    Returns:
+        The updated index
+    """
+    ids, documents, metadatas = load_package_records(package_path)
+    index = VectorIndex(index_dir)
+
+    stale = set(index._slots) - set(ids)
+    if stale:
+        index.delete(stale)
+
+    todo = [i for i, record_id in enumerate(ids) if record_id not in index]
+    for start in range(0, len(todo), batch_size):
+        batch = todo[start : start + batch_size]
+        index.add(
+            [ids[i] for i in batch],
+            embed_fn([documents[i] for i in batch]),
+            [metadatas[i] for i in batch],
+        )
+
+    if len(index) >= MIN_IVF_VECTORS and index.nlist < default_nlist(len(index)) // 2:
+        index.train()
+    logger.info(
+        "Indexed %d chunks (%d new, %d removed) into %s",
+        len(index),
+        len(todo),
+        len(stale),
+        index_dir,
+    )
+    return index
+
+
+def main():
+    """CLI entry point: build or query a local index."""
+    import argparse
+    import sys
+
+    from skill_seekers.embedding.generator import EmbeddingGenerator
+
+    parser = argparse.ArgumentParser(description="Local vector index for packaged skills")
+    parser.add_argument(
+        "--model",
+        default="all-MiniLM-L6-v2",
+        choices=sorted(EmbeddingGenerator.MODELS),
+        help=(
+            "Embedding model; use the same one for build and search. Sentence-transformers "
+            "models run locally (default: all-MiniLM-L6-v2)"
+        ),
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Build/update an index from a package JSON")
+    build.add_argument("package", type=Path)
+    build.add_argument("index_dir", type=Path)
+
+    search = sub.add_parser("search", help="Query an index")
+    search.add_argument("index_dir", type=Path)
+    search.add_argument("query")
+    search.add_argument("-k", type=int, default=5)
+    search.add_argument("--category")
+    search.add_argument("--file")
+
+    args = parser.parse_args()
+    generator = EmbeddingGenerator()
+
+    def embed(texts: list[str]) -> list[list[float]]:
+        return generator.generate_batch(texts, model=args.model)[0]
+
+    try:
+        if args.command == "build":
+            index = build_from_package(args.package, args.index_dir, embed)
+            print(f"✅ Indexed {len(index)} chunks into {args.index_dir}")
+            return
+
+        filters = {k: v for k, v in (("category", args.category), ("file", args.file)) if v}
+        index = VectorIndex(args.index_dir)
+        hits = index.search(embed([args.query])[0], k=args.k, filters=filters or None)
+    except (ImportError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for hit in hits:
+        meta = hit["metadata"]
+        print(f"{hit['score']:.3f}  {hit['id']}  {meta.get('category', '')}/{meta.get('file', '')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Dynamic micro-batching for the embedding server.
+
+Concurrent requests for the same model and normalize flag are gathered into
+one ``generate_batch`` call. A batch is dispatched as soon as it reaches
+``max_batch_size`` texts, or ``max_wait_ms`` after its first text arrived,
+whichever comes first. Inference runs in a thread pool so the event loop
+keeps accepting requests while the model is busy. Identical texts that are
+already queued or running share one result instead of being embedded twice.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+from .generator import EmbeddingGenerator
+
+# Histogram upper bounds; the last bucket is open-ended.
+_BATCH_SIZE_BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+_QUEUE_DEPTH_BOUNDS = (0, 1, 4, 16, 64, 256, 1024)
+
+
+def _histogram(bounds: tuple[int, ...]) -> dict[str, int]:
+    buckets = {f"<={bound}": 0 for bound in bounds}
+    buckets[f">{bounds[-1]}"] = 0
+    return buckets
+
+
+def _bucket(value: int, bounds: tuple[int, ...]) -> str:
+    return next((f"<={bound}" for bound in bounds if value <= bound), f">{bounds[-1]}")
+
+
+@dataclass
+class _Group:
+    """Texts waiting for the next batch of one (model, normalize) pair."""
+
+    pending: list[tuple[str, asyncio.Future]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent embedding requests into model-sized batches.
+
+    Examples:
+        batcher = EmbeddingBatcher(generator, max_batch_size=64, max_wait_ms=5)
+
+        # Inside an async handler; concurrent calls share batches
+        embeddings = await batcher.embed(["text1", "text2"], model="all-MiniLM-L6-v2")
+
+        batcher.metrics()  # queue depth, batch-size histogram, dedup count
+    """
+
+    def __init__(
+        self,
+        generator: EmbeddingGenerator,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        workers: int = 1,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            generator: Generator used to run inference
+            max_batch_size: Maximum texts per generate_batch call
+            max_wait_ms: Longest a text waits for its batch to fill
+            workers: Inference threads (batches that may run concurrently)
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.generator = generator
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.workers = workers
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._groups: dict[tuple[str, bool], _Group] = {}
+        self._inflight: dict[tuple[str, bool, str], asyncio.Future] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        self._lock = threading.Lock()
+        self._reset_metrics()
+
+    def _reset_metrics(self) -> None:
+        with self._lock:
+            self._queue_depth = 0
+            self._max_queue_depth = 0
+            self._requests = 0
+            self._texts = 0
+            self._deduplicated = 0
+            self._batches = 0
+            self._batched_texts = 0
+            self._errors = 0
+            self._batch_sizes = _histogram(_BATCH_SIZE_BOUNDS)
+            self._queue_depths = _histogram(_QUEUE_DEPTH_BOUNDS)
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Drop per-loop state when called from a new event loop."""
+        if self._loop is not loop:
+            self._loop = loop
+            self._groups = {}
+            self._inflight = {}
+            self._tasks = set()
+            with self._lock:
+                self._queue_depth = 0
+
+    async def embed(
+        self,
+        texts: list[str],
+        model: str = "text-embedding-3-small",
+        normalize: bool = True,
+    ) -> list[list[float]]:
+        """
+        Embed ``texts``, sharing batches with concurrent callers.
+
+        Args:
+            texts: Texts to embed
+            model: Model name
+            normalize: Whether to normalize to unit length
+
+        Returns:
+            Embeddings in the order of ``texts``
+
+        Raises:
+            Exception: Whatever generate_batch raised for a batch containing
+                one of ``texts``
+        """
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+        # Validate before queueing so unknown models fail this request only
+        self.generator.get_model_info(model)
+
+        futures = []
+        with self._lock:
+            self._requests += 1
+            self._texts += len(texts)
+        for text in texts:
+            key = (model, normalize, text)
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = loop.create_future()
+                self._enqueue(loop, (model, normalize), text, future)
+            else:
+                with self._lock:
+                    self._deduplicated += 1
+            futures.append(future)
+
+        # Shield shared futures so one cancelled request doesn't fail the others
+        return list(await asyncio.gather(*(asyncio.shield(f) for f in futures)))
+
+    def _enqueue(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        group_key: tuple[str, bool],
+        text: str,
+        future: asyncio.Future,
+    ) -> None:
+        group = self._groups.setdefault(group_key, _Group())
+        group.pending.append((text, future))
+        with self._lock:
+            self._queue_depth += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+
+        if len(group.pending) >= self.max_batch_size:
+            self._dispatch(loop, group_key)
+        elif group.timer is None:
+            group.timer = loop.call_later(self.max_wait_ms / 1000, self._dispatch, loop, group_key)
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, group_key: tuple[str, bool]) -> None:
+        """Send the group's pending texts to the thread pool as one batch."""
+        group = self._groups.get(group_key)
+        if group is None:
+            return
+        if group.timer is not None:
+            group.timer.cancel()
+            group.timer = None
+
+        batch = group.pending[: self.max_batch_size]
+        group.pending = group.pending[self.max_batch_size :]
+        if group.pending:
+            group.timer = loop.call_later(self.max_wait_ms / 1000, self._dispatch, loop, group_key)
+        if not batch:
+            return
+
+        with self._lock:
+            self._batches += 1
+            self._batched_texts += len(batch)
+            self._batch_sizes[_bucket(len(batch), _BATCH_SIZE_BOUNDS)] += 1
+            self._queue_depths[_bucket(self._queue_depth, _QUEUE_DEPTH_BOUNDS)] += 1
+
+        task = loop.create_task(self._run(loop, group_key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        group_key: tuple[str, bool],
+        batch: list[tuple[str, asyncio.Future]],
+    ) -> None:
+        model, normalize = group_key
+        texts = [text for text, _ in batch]
+        try:
+            embeddings = await loop.run_in_executor(
+                self._executor, partial(self._generate, texts, model, normalize)
+            )
+        except Exception as e:
+            with self._lock:
+                self._errors += 1
+            results: list[Any] = [e] * len(batch)
+        else:
+            results = embeddings
+
+        with self._lock:
+            self._queue_depth -= len(batch)
+        for (text, future), result in zip(batch, results, strict=True):
+            self._inflight.pop((model, normalize, text), None)
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _generate(self, texts: list[str], model: str, normalize: bool) -> list[list[float]]:
+        """Run inference for one batch (called in a worker thread)."""
+        if len(texts) == 1:
+            return [self.generator.generate(texts[0], model=model, normalize=normalize)]
+
+        embeddings, _ = self.generator.generate_batch(
+            texts, model=model, normalize=normalize, batch_size=len(texts)
+        )
+        if len(embeddings) != len(texts):
+            raise ValueError(
+                f"Expected {len(texts)} embeddings from {model}, got {len(embeddings)}"
+            )
+        return embeddings
+
+    def metrics(self) -> dict:
+        """
+        Scheduler statistics.
+
+        Returns:
+            Dictionary with current and peak queue depth, request/text/batch
+            counts, deduplicated texts, mean batch size, and histograms of
+            batch sizes and of queue depth sampled at each dispatch
+        """
+        with self._lock:
+            return {
+                "queue_depth": self._queue_depth,
+                "max_queue_depth": self._max_queue_depth,
+                "requests": self._requests,
+                "texts": self._texts,
+                "deduplicated": self._deduplicated,
+                "batches": self._batches,
+                "errors": self._errors,
+                "mean_batch_size": (
+                    round(self._batched_texts / self._batches, 2) if self._batches else 0.0
+                ),
+                "batch_size_histogram": dict(self._batch_sizes),
+                "queue_depth_histogram": dict(self._queue_depths),
+                "config": {
+                    "max_batch_size": self.max_batch_size,
+                    "max_wait_ms": self.max_wait_ms,
+                    "workers": self.workers,
+                },
+            }
+
+    def close(self) -> None:
+        """Shut down the inference threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -4,9 +4,30 @@ Caching layer for embeddings.
 
 import json
 import sqlite3
+import struct
 from pathlib import Path
 from datetime import datetime, timedelta
 
+#: Current on-disk schema. Version 1 (user_version 0) stored JSON text vectors.
+SCHEMA_VERSION = 2
+
+#: Supported vector encodings -> struct format code (little-endian).
+DTYPES = {"float16": "e", "float32": "f", "float64": "d"}
+
+# Stay below SQLite's default host-parameter limit (999 before 3.32).
+_SQL_BATCH = 500
+
+
+def encode_vector(embedding: list[float], dtype: str = "float32") -> bytes:
+    """Pack an embedding into a little-endian BLOB of ``dtype`` values."""
+    return struct.pack(f"<{len(embedding)}{DTYPES[dtype]}", *embedding)
+
+
+def decode_vector(blob: bytes, dtype: str = "float32") -> list[float]:
+    """Unpack a BLOB written by :func:`encode_vector`."""
+    code = DTYPES[dtype]
+    return list(struct.unpack(f"<{len(blob) // struct.calcsize(code)}{code}", blob))
+
 
 class EmbeddingCache:
     """
@@ -15,6 +36,12 @@ class EmbeddingCache:
     Stores embeddings with their text hashes to avoid regeneration.
     Supports TTL (time-to-live) for cache entries.
 
+    Vectors are stored as packed float32 BLOBs (float16 or float64 via
+    ``dtype``). File databases run in WAL mode, ``get_many``/``set_many``
+    touch any number of entries in one transaction, and access statistics
+    are buffered in memory and written in bulk. Databases created with the
+    old JSON-text schema are migrated on open.
+
     Examples:
         cache = EmbeddingCache("/path/to/cache.db")
 
@@ -27,18 +54,40 @@ class EmbeddingCache:
         # Check if cached
         if cache.has("hash123"):
             print("Embedding is cached")
+
+        # Batch operations
+        cache.set_many([("h1", [0.1], "m"), ("h2", [0.2], "m")])
+        hits = cache.get_many(["h1", "h2", "h3"])  # {"h1": [...], "h2": [...]}
     """
 
-    def __init__(self, db_path: str = ":memory:", ttl_days: int = 30):
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        ttl_days: int = 30,
+        dtype: str = "float32",
+        access_flush_threshold: int = 1000,
+    ):
         """
         Initialize embedding cache.
 
         Args:
             db_path: Path to SQLite database (":memory:" for in-memory)
             ttl_days: Time-to-live for cache entries in days
+            dtype: Storage precision for new vectors ("float32", "float16"
+                or "float64")
+            access_flush_threshold: Number of buffered cache hits that
+                triggers a write of access statistics
         """
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported dtype {dtype!r}; choose from {sorted(DTYPES)}")
+
         self.db_path = db_path
         self.ttl_days = ttl_days
+        self.dtype = dtype
+        self.access_flush_threshold = access_flush_threshold
+
+        # hash -> (hits since last flush, last access time)
+        self._pending_access: dict[str, tuple[int, str]] = {}
 
         # Create database directory if needed
         if db_path != ":memory:":
@@ -46,16 +95,35 @@ class EmbeddingCache:
 
         # Initialize database
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
         self._init_db()
 
     def _init_db(self):
-        """Initialize database schema."""
+        """Initialize database schema, migrating a v1 (JSON) cache if present."""
         cursor = self.conn.cursor()
 
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        columns = {
+            row[1]: row[2].upper()
+            for row in cursor.execute("PRAGMA table_info(embeddings)").fetchall()
+        }
+
+        with self.conn:
+            if version < SCHEMA_VERSION and columns.get("embedding") == "TEXT":
+                self._migrate_v1(cursor)
+            else:
+                self._create_schema(cursor)
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @staticmethod
+    def _create_schema(cursor: sqlite3.Cursor) -> None:
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS embeddings (
                 hash TEXT PRIMARY KEY,
-                embedding TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                dtype TEXT NOT NULL,
                 model TEXT NOT NULL,
                 dimensions INTEGER NOT NULL,
                 created_at TEXT NOT NULL,
@@ -72,7 +140,52 @@ class EmbeddingCache:
             CREATE INDEX IF NOT EXISTS idx_created_at ON embeddings(created_at)
         """)
 
-        self.conn.commit()
+    def _migrate_v1(self, cursor: sqlite3.Cursor) -> None:
+        """Convert JSON-text vectors to BLOBs, keeping timestamps and counts."""
+        cursor.execute("DROP INDEX IF EXISTS idx_model")
+        cursor.execute("DROP INDEX IF EXISTS idx_created_at")
+        cursor.execute("ALTER TABLE embeddings RENAME TO embeddings_v1")
+        self._create_schema(cursor)
+
+        reader = self.conn.execute("""
+            SELECT hash, embedding, model, dimensions, created_at, accessed_at, access_count
+            FROM embeddings_v1
+        """)
+        while rows := reader.fetchmany(_SQL_BATCH):
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO embeddings
+                (hash, embedding, dtype, model, dimensions, created_at, accessed_at, access_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        hash_key,
+                        encode_vector(json.loads(embedding_json), self.dtype),
+                        self.dtype,
+                        model,
+                        dimensions,
+                        created_at,
+                        accessed_at,
+                        access_count,
+                    )
+                    for (
+                        hash_key,
+                        embedding_json,
+                        model,
+                        dimensions,
+                        created_at,
+                        accessed_at,
+                        access_count,
+                    ) in rows
+                ],
+            )
+
+        cursor.execute("DROP TABLE embeddings_v1")
+
+    def _cutoff(self) -> str:
+        """ISO timestamp before which entries are expired."""
+        return (datetime.utcnow() - timedelta(days=self.ttl_days)).isoformat()
 
     def set(self, hash_key: str, embedding: list[float], model: str) -> None:
         """
@@ -83,22 +196,40 @@ class EmbeddingCache:
             embedding: Embedding vector
             model: Model name
         """
-        cursor = self.conn.cursor()
+        self.set_many([(hash_key, embedding, model)])
 
-        now = datetime.utcnow().isoformat()
-        embedding_json = json.dumps(embedding)
-        dimensions = len(embedding)
+    def set_many(self, items: list[tuple[str, list[float], str]]) -> None:
+        """
+        Store multiple embeddings in a single transaction.
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO embeddings
-            (hash, embedding, model, dimensions, created_at, accessed_at, access_count)
-            VALUES (?, ?, ?, ?, ?, ?, 1)
-        """,
-            (hash_key, embedding_json, model, dimensions, now, now),
-        )
+        Args:
+            items: List of (hash_key, embedding, model) tuples
+        """
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (
+                hash_key,
+                encode_vector(embedding, self.dtype),
+                self.dtype,
+                model,
+                len(embedding),
+                now,
+                now,
+            )
+            for hash_key, embedding, model in items
+        ]
 
-        self.conn.commit()
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO embeddings
+                (hash, embedding, dtype, model, dimensions, created_at, accessed_at, access_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+            """,
+                rows,
+            )
+        for hash_key, _, _ in items:
+            self._pending_access.pop(hash_key, None)
 
     def get(self, hash_key: str) -> list[float] | None:
         """
@@ -110,44 +241,56 @@ class EmbeddingCache:
         Returns:
             Embedding vector if cached and not expired, None otherwise
         """
-        cursor = self.conn.cursor()
+        return self.get_many([hash_key]).get(hash_key)
 
-        # Get embedding
-        cursor.execute(
-            """
-            SELECT embedding, created_at
-            FROM embeddings
-            WHERE hash = ?
-        """,
-            (hash_key,),
-        )
+    def get_many(self, hash_keys: list[str]) -> dict[str, list[float]]:
+        """
+        Retrieve multiple embeddings with one query per 500 keys.
 
-        row = cursor.fetchone()
-        if not row:
-            return None
+        Expired entries are deleted. Access statistics for hits are buffered
+        and written once ``access_flush_threshold`` hits have accumulated.
 
-        embedding_json, created_at = row
+        Args:
+            hash_keys: List of hashes
 
-        # Check TTL
-        created = datetime.fromisoformat(created_at)
-        if datetime.utcnow() - created > timedelta(days=self.ttl_days):
-            # Expired, delete and return None
-            self.delete(hash_key)
-            return None
+        Returns:
+            Mapping of hash -> embedding for cached, unexpired entries
+        """
+        cutoff = self._cutoff()
+        found: dict[str, list[float]] = {}
+        expired: list[str] = []
+
+        unique_keys = list(dict.fromkeys(hash_keys))
+        for start in range(0, len(unique_keys), _SQL_BATCH):
+            batch = unique_keys[start : start + _SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"""
+                SELECT hash, embedding, dtype, created_at
+                FROM embeddings
+                WHERE hash IN ({placeholders})
+            """,
+                batch,
+            ).fetchall()
 
-        # Update access stats
-        now = datetime.utcnow().isoformat()
-        cursor.execute(
-            """
-            UPDATE embeddings
-            SET accessed_at = ?, access_count = access_count + 1
-            WHERE hash = ?
-        """,
-            (now, hash_key),
-        )
-        self.conn.commit()
+            for hash_key, blob, dtype, created_at in rows:
+                if created_at < cutoff:
+                    expired.append(hash_key)
+                else:
+                    found[hash_key] = decode_vector(blob, dtype)
+
+        if expired:
+            self._delete_many(expired)
+
+        if found:
+            now = datetime.utcnow().isoformat()
+            for hash_key in found:
+                count, _ = self._pending_access.get(hash_key, (0, now))
+                self._pending_access[hash_key] = (count + 1, now)
+            if len(self._pending_access) >= self.access_flush_threshold:
+                self.flush_access_stats()
 
-        return json.loads(embedding_json)
+        return found
 
     def get_batch(self, hash_keys: list[str]) -> tuple[list[list[float] | None], list[bool]]:
         """
@@ -160,16 +303,31 @@ class EmbeddingCache:
             Tuple of (embeddings list, cached flags)
             embeddings list contains None for cache misses
         """
-        embeddings = []
-        cached_flags = []
-
-        for hash_key in hash_keys:
-            embedding = self.get(hash_key)
-            embeddings.append(embedding)
-            cached_flags.append(embedding is not None)
+        found = self.get_many(hash_keys)
+        embeddings = [found.get(hash_key) for hash_key in hash_keys]
+        cached_flags = [embedding is not None for embedding in embeddings]
 
         return embeddings, cached_flags
 
+    def flush_access_stats(self) -> None:
+        """Write buffered access counts and timestamps in one transaction."""
+        if not self._pending_access:
+            return
+
+        pending, self._pending_access = self._pending_access, {}
+        with self.conn:
+            self.conn.executemany(
+                """
+                UPDATE embeddings
+                SET accessed_at = ?, access_count = access_count + ?
+                WHERE hash = ?
+            """,
+                [
+                    (accessed_at, count, hash_key)
+                    for hash_key, (count, accessed_at) in pending.items()
+                ],
+            )
+
     def has(self, hash_key: str) -> bool:
         """
         Check if embedding is cached and not expired.
@@ -196,8 +354,7 @@ class EmbeddingCache:
             return False
 
         # Check TTL
-        created = datetime.fromisoformat(row[0])
-        if datetime.utcnow() - created > timedelta(days=self.ttl_days):
+        if row[0] < self._cutoff():
             # Expired
             self.delete(hash_key)
             return False
@@ -211,17 +368,20 @@ class EmbeddingCache:
         Args:
             hash_key: Hash of text+model
         """
-        cursor = self.conn.cursor()
+        self._delete_many([hash_key])
 
-        cursor.execute(
-            """
-            DELETE FROM embeddings
-            WHERE hash = ?
-        """,
-            (hash_key,),
-        )
+    def _delete_many(self, hash_keys: list[str]) -> None:
+        for hash_key in hash_keys:
+            self._pending_access.pop(hash_key, None)
 
-        self.conn.commit()
+        with self.conn:
+            self.conn.executemany(
+                """
+                DELETE FROM embeddings
+                WHERE hash = ?
+            """,
+                [(hash_key,) for hash_key in hash_keys],
+            )
 
     def clear(self, model: str | None = None) -> int:
         """
@@ -233,6 +393,7 @@ class EmbeddingCache:
         Returns:
             Number of entries deleted
         """
+        self.flush_access_stats()
         cursor = self.conn.cursor()
 
         if model:
@@ -258,16 +419,15 @@ class EmbeddingCache:
         Returns:
             Number of entries deleted
         """
+        self.flush_access_stats()
         cursor = self.conn.cursor()
 
-        cutoff = (datetime.utcnow() - timedelta(days=self.ttl_days)).isoformat()
-
         cursor.execute(
             """
             DELETE FROM embeddings
             WHERE created_at < ?
         """,
-            (cutoff,),
+            (self._cutoff(),),
         )
 
         deleted = cursor.rowcount
@@ -294,6 +454,7 @@ class EmbeddingCache:
         Returns:
             Dictionary with cache stats
         """
+        self.flush_access_stats()
         cursor = self.conn.cursor()
 
         # Total entries
@@ -320,14 +481,13 @@ class EmbeddingCache:
         ]
 
         # Expired entries
-        cutoff = (datetime.utcnow() - timedelta(days=self.ttl_days)).isoformat()
         cursor.execute(
             """
             SELECT COUNT(*)
             FROM embeddings
             WHERE created_at < ?
         """,
-            (cutoff,),
+            (self._cutoff(),),
         )
         expired = cursor.fetchone()[0]
 
@@ -337,10 +497,13 @@ class EmbeddingCache:
             "top_accessed": top_accessed,
             "expired": expired,
             "ttl_days": self.ttl_days,
+            "dtype": self.dtype,
+            "schema_version": SCHEMA_VERSION,
         }
 
     def close(self):
-        """Close database connection."""
+        """Flush buffered access stats and close database connection."""
+        self.flush_access_stats()
         self.conn.close()
 
     def __enter__(self):
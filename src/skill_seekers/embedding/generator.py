@@ -6,6 +6,15 @@ import os
 import hashlib
 import numpy as np
 
+from skill_seekers.cli.embedding_executor import (
+    DEFAULT_MAX_BATCH_TOKENS,
+    OPENAI_MAX_BATCH_ITEMS,
+    VOYAGE_MAX_BATCH_ITEMS,
+    EmbeddingExecutor,
+    openai_embed_fn,
+    voyage_embed_fn,
+)
+
 # OpenAI support
 try:
     from openai import OpenAI
@@ -133,6 +142,8 @@ class EmbeddingGenerator:
         api_key: str | None = None,
         voyage_api_key: str | None = None,
         cache_dir: str | None = None,
+        max_in_flight: int = 4,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
     ):
         """
         Initialize embedding generator.
@@ -141,10 +152,14 @@ class EmbeddingGenerator:
             api_key: API key for OpenAI
             voyage_api_key: API key for Voyage AI (Anthropic's recommended embeddings)
             cache_dir: Directory for caching models (sentence-transformers)
+            max_in_flight: Concurrent requests per batch call (OpenAI/Voyage)
+            max_batch_tokens: Estimated token budget per request (OpenAI/Voyage)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.voyage_api_key = voyage_api_key or os.getenv("VOYAGE_API_KEY")
         self.cache_dir = cache_dir
+        self.max_in_flight = max_in_flight
+        self.max_batch_tokens = max_batch_tokens
 
         # Initialize OpenAI client
         if OPENAI_AVAILABLE and self.api_key:
@@ -228,7 +243,9 @@ class EmbeddingGenerator:
             texts: List of texts to embed
             model: Model name
             normalize: Whether to normalize to unit length
-            batch_size: Batch size for processing
+            batch_size: Batch size for processing. For OpenAI and Voyage this
+                caps texts per request; requests are otherwise sized by token
+                budget and sent ``max_in_flight`` at a time
 
         Returns:
             Tuple of (embeddings list, dimensions)
@@ -282,24 +299,16 @@ class EmbeddingGenerator:
         if not self.openai_client:
             raise ValueError("OpenAI API key not provided")
 
-        all_embeddings = []
-
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-
-            try:
-                response = self.openai_client.embeddings.create(input=batch, model=model)
-
-                batch_embeddings = [item.embedding for item in response.data]
-
-                if normalize:
-                    batch_embeddings = [self._normalize(emb) for emb in batch_embeddings]
-
-                all_embeddings.extend(batch_embeddings)
+        executor = self._executor(
+            openai_embed_fn(self.openai_client, model), min(batch_size, OPENAI_MAX_BATCH_ITEMS)
+        )
+        try:
+            all_embeddings = executor.embed(texts)
+        except Exception as e:
+            raise Exception(f"OpenAI batch embedding generation failed: {e}") from e
 
-            except Exception as e:
-                raise Exception(f"OpenAI batch embedding generation failed: {e}") from e
+        if normalize:
+            all_embeddings = [self._normalize(emb) for emb in all_embeddings]
 
         dimensions = len(all_embeddings[0]) if all_embeddings else 0
         return all_embeddings, dimensions
@@ -337,28 +346,29 @@ class EmbeddingGenerator:
         if not self.voyage_client:
             raise ValueError("Voyage API key not provided")
 
-        all_embeddings = []
-
-        # Process in batches (Voyage AI supports up to 128 texts per request)
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-
-            try:
-                result = self.voyage_client.embed(texts=batch, model=model)
-
-                batch_embeddings = result.embeddings
-
-                if normalize:
-                    batch_embeddings = [self._normalize(emb) for emb in batch_embeddings]
-
-                all_embeddings.extend(batch_embeddings)
+        executor = self._executor(
+            voyage_embed_fn(self.voyage_client, model), min(batch_size, VOYAGE_MAX_BATCH_ITEMS)
+        )
+        try:
+            all_embeddings = executor.embed(texts)
+        except Exception as e:
+            raise Exception(f"Voyage AI batch embedding generation failed: {e}") from e
 
-            except Exception as e:
-                raise Exception(f"Voyage AI batch embedding generation failed: {e}") from e
+        if normalize:
+            all_embeddings = [self._normalize(emb) for emb in all_embeddings]
 
         dimensions = len(all_embeddings[0]) if all_embeddings else 0
         return all_embeddings, dimensions
 
+    def _executor(self, embed_fn, max_batch_items: int) -> EmbeddingExecutor:
+        """Concurrent, token-budgeted executor for a remote provider call."""
+        return EmbeddingExecutor(
+            embed_fn,
+            max_in_flight=self.max_in_flight,
+            max_batch_tokens=self.max_batch_tokens,
+            max_batch_items=max(1, max_batch_items),
+        )
+
     def _generate_sentence_transformer(self, text: str, model: str, normalize: bool) -> list[float]:
         """Generate embedding using sentence-transformers."""
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
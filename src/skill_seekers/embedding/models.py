@@ -46,7 +46,11 @@ class BatchEmbeddingRequest(BaseModel):
     model: str = Field(default="text-embedding-3-small", description="Embedding model to use")
     normalize: bool = Field(default=True, description="Normalize embeddings to unit length")
     batch_size: int | None = Field(
-        default=32, description="Batch size for processing (default: 32)"
+        default=32,
+        description=(
+            "Accepted for compatibility; the server batches concurrent requests itself "
+            "(EMBEDDING_MAX_BATCH_SIZE)"
+        ),
     )
 
 
@@ -128,3 +132,45 @@ class ModelsResponse(BaseModel):
 
     models: list[ModelInfo] = Field(..., description="List of available models")
     count: int = Field(..., description="Number of available models")
+
+
+class SearchRequest(BaseModel):
+    """Request model for similarity search over a skill's embeddings."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "skill": "react",
+                "queries": ["How do I clean up an effect?"],
+                "model": "text-embedding-3-small",
+                "k": 10,
+            }
+        }
+    )
+
+    skill: str = Field(..., description="Skill name (as embedded via /embed/skill)")
+    queries: list[str] | None = Field(
+        default=None, description="Query texts (embedded with `model`)"
+    )
+    query_embeddings: list[list[float]] | None = Field(
+        default=None, description="Precomputed query embeddings (instead of `queries`)"
+    )
+    model: str = Field(default="text-embedding-3-small", description="Embedding model to use")
+    k: int = Field(default=10, ge=1, le=1000, description="Results per query")
+
+
+class SearchHit(BaseModel):
+    """One search result."""
+
+    id: str = Field(..., description="Chunk ID")
+    score: float = Field(..., description="Cosine similarity")
+    metadata: dict[str, Any] = Field(default_factory=dict, description="Chunk metadata")
+
+
+class SearchResponse(BaseModel):
+    """Response model for similarity search."""
+
+    skill: str = Field(..., description="Skill searched")
+    results: list[list[SearchHit]] = Field(..., description="Top-k hits per query, best first")
+    count: int = Field(..., description="Number of queries answered")
+    latency_ms: float = Field(..., description="Search time for the whole batch (ms)")
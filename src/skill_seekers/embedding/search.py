@@ -0,0 +1,279 @@
+"""
+Vectorized top-k similarity search over skill embeddings.
+
+Each skill's chunk embeddings are held as one contiguous, unit-normalized
+float32 matrix. A batch of queries is answered with a single matrix multiply
+followed by ``argpartition`` (no Python loop over chunks), so the cost is one
+pass over the matrix per batch rather than per query.
+
+Matrices are cached per skill in an LRU bounded by a memory budget. When a
+skill is evicted (or was never loaded) and a ``loader`` is configured, it is
+read back from disk on the next query, e.g. from a
+:class:`~skill_seekers.cli.vector_index.VectorIndex` directory.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+#: Queries scored per matrix multiply (bounds the score matrix size).
+QUERY_BLOCK = 64
+
+#: Recent query latencies kept for percentile reporting.
+LATENCY_WINDOW = 10_000
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def top_k_batch(matrix: np.ndarray, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Top-k rows of ``matrix`` by dot product for every query.
+
+    Args:
+        matrix: ``(n, d)`` float32 matrix (unit rows for cosine similarity)
+        queries: ``(q, d)`` float32 query matrix
+        k: Results per query
+
+    Returns:
+        ``(indices, scores)``, each ``(q, min(k, n))``, best first
+    """
+    n = len(matrix)
+    k = min(k, n)
+    indices = np.empty((len(queries), k), dtype=np.int64)
+    scores = np.empty((len(queries), k), dtype=np.float32)
+    if k == 0:
+        return indices, scores
+
+    for start in range(0, len(queries), QUERY_BLOCK):
+        block = queries[start : start + QUERY_BLOCK]
+        sims = block @ matrix.T
+        if k < n:
+            part = np.argpartition(sims, n - k, axis=1)[:, n - k :]
+        else:
+            part = np.broadcast_to(np.arange(n), sims.shape)
+        part_scores = np.take_along_axis(sims, part, axis=1)
+        order = np.argsort(-part_scores, axis=1, kind="stable")
+        indices[start : start + len(block)] = np.take_along_axis(part, order, axis=1)
+        scores[start : start + len(block)] = np.take_along_axis(part_scores, order, axis=1)
+
+    return indices, scores
+
+
+@dataclass
+class SkillMatrix:
+    """One skill's embeddings as a contiguous normalized matrix."""
+
+    skill: str
+    ids: list[str]
+    matrix: np.ndarray
+    metadata: list[dict] = field(default_factory=list)
+    model: str | None = None
+
+    @classmethod
+    def from_embeddings(
+        cls,
+        skill: str,
+        ids: list[str],
+        embeddings: list[list[float]] | np.ndarray,
+        metadata: list[dict] | None = None,
+        model: str | None = None,
+    ) -> "SkillMatrix":
+        matrix = np.array(embeddings, dtype=np.float32, order="C", copy=True)
+        if matrix.ndim != 2 or len(matrix) != len(ids):
+            raise ValueError(f"Expected {len(ids)} embeddings, got shape {matrix.shape}")
+        return cls(skill, list(ids), _normalize_rows(matrix), metadata or [{} for _ in ids], model)
+
+    @property
+    def nbytes(self) -> int:
+        return self.matrix.nbytes
+
+    @property
+    def dimension(self) -> int:
+        return self.matrix.shape[1]
+
+
+def load_vector_index(skill: str, path: str | Path) -> SkillMatrix:
+    """Load the live vectors of a ``VectorIndex`` directory into memory."""
+    from skill_seekers.cli.vector_index import VectorIndex
+
+    index = VectorIndex(path)
+    live = np.flatnonzero(index._lists >= 0)
+    matrix = np.ascontiguousarray(index._matrix()[live])
+    return SkillMatrix(
+        skill,
+        [index._ids[slot] for slot in live],
+        matrix,
+        [index._metadata[slot] for slot in live],
+    )
+
+
+class SkillSearchCache:
+    """
+    Per-skill similarity search with an LRU matrix cache.
+
+    Examples:
+        searcher = SkillSearchCache(memory_budget_mb=512)
+        searcher.put(SkillMatrix.from_embeddings("react", ids, embeddings))
+        hits = searcher.search("react", query_embeddings, k=10)
+        searcher.stats()  # cached skills, bytes, evictions, p50/p99 latency
+    """
+
+    def __init__(
+        self,
+        memory_budget_mb: float = 1024,
+        loader: Callable[[str], SkillMatrix | None] | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            memory_budget_mb: Total matrix memory kept resident
+            loader: Optional ``loader(skill)`` used on a cache miss
+        """
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self.loader = loader
+
+        self._skills: OrderedDict[str, SkillMatrix] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._counters = {"queries": 0, "hits": 0, "misses": 0, "loads": 0, "evictions": 0}
+
+    def put(self, skill_matrix: SkillMatrix) -> None:
+        """Cache (or replace) a skill's matrix, evicting least recently used ones."""
+        with self._lock:
+            old = self._skills.pop(skill_matrix.skill, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._skills[skill_matrix.skill] = skill_matrix
+            self._bytes += skill_matrix.nbytes
+
+            # Always keep the newest matrix, even if it alone exceeds the budget
+            while self._bytes > self.memory_budget and len(self._skills) > 1:
+                _, evicted = self._skills.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self._counters["evictions"] += 1
+
+    def get(self, skill: str) -> SkillMatrix | None:
+        """Cached matrix for ``skill``, loading it on a miss if possible."""
+        with self._lock:
+            skill_matrix = self._skills.get(skill)
+            if skill_matrix is not None:
+                self._skills.move_to_end(skill)
+                self._counters["hits"] += 1
+                return skill_matrix
+            self._counters["misses"] += 1
+
+        if self.loader is None:
+            return None
+        skill_matrix = self.loader(skill)
+        if skill_matrix is not None:
+            with self._lock:
+                self._counters["loads"] += 1
+            self.put(skill_matrix)
+        return skill_matrix
+
+    def remove(self, skill: str) -> bool:
+        """Drop a skill from the cache."""
+        with self._lock:
+            skill_matrix = self._skills.pop(skill, None)
+            if skill_matrix is None:
+                return False
+            self._bytes -= skill_matrix.nbytes
+            return True
+
+    def search(
+        self, skill: str, queries: list[list[float]] | np.ndarray, k: int = 10
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Top-k chunks of ``skill`` for each query embedding.
+
+        Args:
+            skill: Skill name
+            queries: One or more query embeddings
+            k: Results per query
+
+        Returns:
+            One list of ``{"id", "score", "metadata"}`` per query, best first
+
+        Raises:
+            KeyError: If the skill is not cached and cannot be loaded
+            ValueError: If query dimensions don't match the skill's matrix
+        """
+        skill_matrix = self.get(skill)
+        if skill_matrix is None:
+            raise KeyError(f"Unknown skill: {skill}")
+        return self.search_matrix(skill_matrix, queries, k)
+
+    def search_matrix(
+        self, skill_matrix: SkillMatrix, queries: list[list[float]] | np.ndarray, k: int = 10
+    ) -> list[list[dict[str, Any]]]:
+        """Like :meth:`search`, for a matrix already obtained with :meth:`get`."""
+        skill = skill_matrix.skill
+        q = np.array(queries, dtype=np.float32, ndmin=2, order="C", copy=True)
+        if q.shape[1] != skill_matrix.dimension:
+            raise ValueError(
+                f"Query dimension {q.shape[1]} does not match skill "
+                f"'{skill}' ({skill_matrix.dimension})"
+            )
+
+        start = time.perf_counter()
+        indices, scores = top_k_batch(skill_matrix.matrix, _normalize_rows(q), k)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self._counters["queries"] += len(q)
+            # Per-query latency: a batch's cost is shared by its queries
+            self._latencies.extend([elapsed_ms / len(q)] * len(q))
+
+        return [
+            [
+                {
+                    "id": skill_matrix.ids[i],
+                    "score": float(s),
+                    "metadata": skill_matrix.metadata[i],
+                }
+                for i, s in zip(row_indices, row_scores, strict=True)
+            ]
+            for row_indices, row_scores in zip(indices, scores, strict=True)
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Cache and latency statistics.
+
+        Returns:
+            Cached skills with their sizes, memory use and budget, hit/miss/
+            load/eviction counts, and p50/p99 per-query latency in ms over
+            the last ``LATENCY_WINDOW`` queries
+        """
+        with self._lock:
+            latencies = np.fromiter(self._latencies, dtype=np.float64)
+            return {
+                "skills": {
+                    name: {"chunks": len(m.ids), "dimension": m.dimension, "bytes": m.nbytes}
+                    for name, m in self._skills.items()
+                },
+                "memory_bytes": self._bytes,
+                "memory_budget_bytes": self.memory_budget,
+                **self._counters,
+                "latency_ms": {
+                    "p50": round(float(np.percentile(latencies, 50)), 3)
+                    if len(latencies)
+                    else None,
+                    "p99": round(float(np.percentile(latencies, 99)), 3)
+                    if len(latencies)
+                    else None,
+                },
+            }
@@ -8,6 +8,8 @@ Provides endpoints for:
 - Model listing and information
 - Cache management
 - Health checks
+- Batching metrics
+- Similarity search over embedded skills
 
 Usage:
     # Start server
@@ -17,8 +19,10 @@ Usage:
     uvicorn skill_seekers.embedding.server:app --host 0.0.0.0 --port 8000
 """
 
+import asyncio
 import os
 import sys
+import time
 from pathlib import Path
 
 try:
@@ -40,9 +44,13 @@ from .models import (
     HealthResponse,
     ModelInfo,
     ModelsResponse,
+    SearchRequest,
+    SearchResponse,
 )
 from .generator import EmbeddingGenerator
 from .cache import EmbeddingCache
+from .batcher import EmbeddingBatcher
+from .search import SkillMatrix, SkillSearchCache, load_vector_index
 from ..cors_config import resolve_cors_config
 
 
@@ -79,6 +87,32 @@ if FASTAPI_AVAILABLE:
     )
     cache = EmbeddingCache(cache_db) if cache_enabled else None
 
+    # Concurrent requests are coalesced into batches and run off the event loop
+    batcher = EmbeddingBatcher(
+        generator,
+        max_batch_size=int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", "64")),
+        max_wait_ms=float(os.getenv("EMBEDDING_MAX_WAIT_MS", "5")),
+        workers=int(os.getenv("EMBEDDING_WORKERS", "1")),
+    )
+
+    # Per-skill embedding matrices for /search, LRU-evicted by memory budget.
+    # With EMBEDDING_INDEX_DIR set, skills not embedded by this process are
+    # loaded from <dir>/<skill> (a `skill-seekers-index` directory).
+    index_dir = os.getenv("EMBEDDING_INDEX_DIR")
+
+    def _load_skill(skill: str) -> SkillMatrix | None:
+        if not index_dir or Path(skill).name != skill:
+            return None
+        path = Path(index_dir) / skill
+        if not (path / "manifest.json").exists():
+            return None
+        return load_vector_index(skill, path)
+
+    searcher = SkillSearchCache(
+        memory_budget_mb=float(os.getenv("EMBEDDING_SEARCH_MEMORY_MB", "1024")),
+        loader=_load_skill,
+    )
+
     @app.get("/", response_model=dict)
     async def root():
         """Root endpoint."""
@@ -140,13 +174,13 @@ if FASTAPI_AVAILABLE:
             cached = False
             hash_key = generator.compute_hash(request.text, request.model, request.normalize)
 
-            if cache and cache.has(hash_key):
-                embedding = cache.get(hash_key)
+            embedding = cache.get(hash_key) if cache else None
+            if embedding is not None:
                 cached = True
             else:
-                # Generate embedding
-                embedding = generator.generate(
-                    request.text, model=request.model, normalize=request.normalize
+                # Generate embedding (batched with concurrent requests)
+                (embedding,) = await batcher.embed(
+                    [request.text], model=request.model, normalize=request.normalize
                 )
 
                 # Store in cache
@@ -181,11 +215,16 @@ if FASTAPI_AVAILABLE:
             texts_to_generate = []
             text_indices = []
 
-            for idx, text in enumerate(request.texts):
-                hash_key = generator.compute_hash(text, request.model, request.normalize)
+            hash_keys = [
+                generator.compute_hash(text, request.model, request.normalize)
+                for text in request.texts
+            ]
+            cached_embeddings = cache.get_many(hash_keys) if cache else {}
+
+            for idx, (text, hash_key) in enumerate(zip(request.texts, hash_keys, strict=True)):
+                cached_embedding = cached_embeddings.get(hash_key)
 
-                if cache and cache.has(hash_key):
-                    cached_embedding = cache.get(hash_key)
+                if cached_embedding is not None:
                     embeddings.append(cached_embedding)
                     cached_count += 1
                 else:
@@ -195,22 +234,23 @@ if FASTAPI_AVAILABLE:
 
             # Generate embeddings for uncached texts
             if texts_to_generate:
-                generated_embeddings, dimensions = generator.generate_batch(
-                    texts_to_generate,
-                    model=request.model,
-                    normalize=request.normalize,
-                    batch_size=request.batch_size,
+                generated_embeddings = await batcher.embed(
+                    texts_to_generate, model=request.model, normalize=request.normalize
                 )
 
-                # Fill in placeholders and cache
-                for idx, text, embedding in zip(
-                    text_indices, texts_to_generate, generated_embeddings, strict=False
-                ):
+                # Fill in placeholders and cache in one transaction
+                for idx, embedding in zip(text_indices, generated_embeddings, strict=False):
                     embeddings[idx] = embedding
 
-                    if cache:
-                        hash_key = generator.compute_hash(text, request.model, request.normalize)
-                        cache.set(hash_key, embedding, request.model)
+                if cache:
+                    cache.set_many(
+                        [
+                            (hash_keys[idx], embedding, request.model)
+                            for idx, embedding in zip(
+                                text_indices, generated_embeddings, strict=False
+                            )
+                        ]
+                    )
 
             dimensions = len(embeddings[0]) if embeddings else 0
 
@@ -264,12 +304,20 @@ if FASTAPI_AVAILABLE:
             ]
 
             # Generate embeddings for chunks
-            embeddings, dimensions = generator.generate_batch(
-                chunks, model=request.model, normalize=True, batch_size=32
-            )
+            embeddings = await batcher.embed(chunks, model=request.model, normalize=True)
+            dimensions = len(embeddings[0]) if embeddings else 0
 
-            # TODO: Store embeddings in vector database
-            # This would integrate with the vector database adaptors
+            # Keep the skill's matrix resident for /search
+            if chunks:
+                searcher.put(
+                    SkillMatrix.from_embeddings(
+                        skill_path.name,
+                        [f"{skill_path.name}:{i}" for i in range(len(chunks))],
+                        embeddings,
+                        [{"chunk_index": i, "content": chunk} for i, chunk in enumerate(chunks)],
+                        model=request.model,
+                    )
+                )
 
             return SkillEmbeddingResponse(
                 skill_name=skill_path.name,
@@ -288,6 +336,78 @@ if FASTAPI_AVAILABLE:
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    @app.post("/search", response_model=SearchResponse)
+    async def search(request: SearchRequest):
+        """
+        Top-k chunks of an embedded skill for one or more queries.
+
+        Queries are scored together with one matrix multiply against the
+        skill's cached embedding matrix.
+
+        Args:
+            request: Search request with query texts or query embeddings
+
+        Returns:
+            Search response with hits per query
+
+        Raises:
+            HTTPException: If the skill is unknown or the queries don't match it
+        """
+        if (request.queries is None) == (request.query_embeddings is None):
+            raise HTTPException(
+                status_code=400, detail="Provide exactly one of queries or query_embeddings"
+            )
+
+        try:
+            skill_matrix = await asyncio.to_thread(searcher.get, request.skill)
+            if skill_matrix is None:
+                raise HTTPException(status_code=404, detail=f"Skill not found: {request.skill}")
+
+            if request.queries is not None:
+                if skill_matrix.model and skill_matrix.model != request.model:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=(
+                            f"Skill '{request.skill}' was embedded with {skill_matrix.model}, "
+                            f"not {request.model}"
+                        ),
+                    )
+                query_embeddings = await batcher.embed(
+                    request.queries, model=request.model, normalize=True
+                )
+            else:
+                query_embeddings = request.query_embeddings
+
+            start = time.perf_counter()
+            results = await asyncio.to_thread(
+                searcher.search_matrix, skill_matrix, query_embeddings, request.k
+            )
+            latency_ms = (time.perf_counter() - start) * 1000
+
+            return SearchResponse(
+                skill=request.skill,
+                results=results,
+                count=len(results),
+                latency_ms=round(latency_ms, 3),
+            )
+
+        except HTTPException:
+            raise
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e)) from e
+
+    @app.get("/search/stats", response_model=dict)
+    async def search_stats():
+        """Search cache contents and p50/p99 query latency."""
+        return searcher.stats()
+
+    @app.get("/metrics", response_model=dict)
+    async def metrics():
+        """Batching scheduler metrics (queue depth, batch-size histogram)."""
+        return batcher.metrics()
+
     @app.get("/cache/stats", response_model=dict)
     async def cache_stats():
         """Get cache statistics."""
@@ -340,6 +460,10 @@ def main():
 
     if cache_enabled:
         print(f"💾 Cache database: {cache_db}")
+    print(
+        f"📦 Batching: up to {batcher.max_batch_size} texts, "
+        f"{batcher.max_wait_ms} ms window, {batcher.workers} worker(s)"
+    )
 
     uvicorn.run("skill_seekers.embedding.server:app", host=host, port=port, reload=reload)
 
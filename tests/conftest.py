@@ -31,6 +31,16 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Point the default analysis and GitHub caches at a per-test directory.
+
+    Scrapers cache under ~/.skill-seekers/cache by default, which would let
+    tests write to the real home directory and reuse earlier runs' results.
+    """
+    monkeypatch.setenv("SKILL_SEEKERS_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture(autouse=True)
 def _reset_execution_context():
     """Reset the ExecutionContext singleton before and after every test.
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental streaming package writer.
+
+package_streaming() used to collect every chunk, build the whole platform
+payload and json.dumps() it in memory. It now writes each chunk's array
+elements to spool files as StreamingIngester yields them and stitches the
+final JSON at the end. Output must stay byte-identical to
+``json.dumps(_convert_chunks_to_platform_format(all_chunks), indent=2)``.
+
+Usage:
+    pytest tests/test_adaptors/test_streaming_package_writer.py -v
+    pytest tests/test_adaptors/test_streaming_package_writer.py -v -m benchmark -s
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from skill_seekers.cli.adaptors import get_adaptor
+from skill_seekers.cli.adaptors.streaming_adaptor import SPOOL_SUFFIX, StreamingPackageWriter
+from skill_seekers.cli.streaming_ingest import StreamingIngester
+
+RAG_PLATFORMS = [
+    "langchain",
+    "llama-index",
+    "haystack",
+    "weaviate",
+    "chroma",
+    "faiss",
+    "qdrant",
+    "pinecone",
+]
+
+
+@pytest.fixture
+def skill_dir(tmp_path):
+    sk = tmp_path / "my_skill"
+    (sk / "references").mkdir(parents=True)
+    (sk / "SKILL.md").write_text("# Hello\n" + 'héllo wörld, "quoted"\n' * 120)
+    (sk / "references" / "api.md").write_text("# API\n" + "detail\n" * 400)
+    (sk / "references" / "empty.md").write_text("   \n")
+    return sk
+
+
+def _expected(adaptor, skill_dir, chunk_size=500, chunk_overlap=50):
+    chunks = list(
+        StreamingIngester(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        ).stream_skill_directory(skill_dir)
+    )
+    data = adaptor._convert_chunks_to_platform_format(chunks, skill_dir.name)
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class TestStreamingPackageParity:
+    @pytest.mark.parametrize("platform", RAG_PLATFORMS)
+    def test_byte_identical_to_in_memory_package(self, platform, skill_dir, tmp_path):
+        adaptor = get_adaptor(platform)
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+
+        out = adaptor.package_streaming(skill_dir, out_dir, chunk_size=500, chunk_overlap=50)
+
+        assert out.read_text(encoding="utf-8") == _expected(adaptor, skill_dir)
+        # Spools are removed once the package is assembled
+        assert [p.name for p in out_dir.iterdir()] == [out.name]
+
+    def test_empty_skill_writes_empty_arrays(self, tmp_path):
+        sk = tmp_path / "empty_skill"
+        sk.mkdir()
+        adaptor = get_adaptor("chroma")
+
+        out = adaptor.package_streaming(sk, tmp_path)
+
+        data = json.loads(out.read_text())
+        assert data["documents"] == [] and data["ids"] == []
+        assert out.read_text() == json.dumps(
+            adaptor._convert_chunks_to_platform_format([], sk.name), indent=2, ensure_ascii=False
+        )
+
+
+class TestStreamingPackageResume:
+    def _interrupt_after(self, n):
+        def callback(progress):
+            if progress.processed_chunks == n:
+                raise KeyboardInterrupt
+
+        return callback
+
+    def test_resume_from_checkpoint(self, skill_dir, tmp_path, capsys):
+        adaptor = get_adaptor("weaviate")
+        checkpoint = tmp_path / "package.ckpt.json"
+
+        with pytest.raises(KeyboardInterrupt):
+            adaptor.package_streaming(
+                skill_dir,
+                tmp_path,
+                chunk_size=500,
+                chunk_overlap=50,
+                batch_size=3,
+                progress_callback=self._interrupt_after(8),
+                checkpoint_path=checkpoint,
+            )
+        saved = json.loads(checkpoint.read_text())["state"]
+        assert saved["writer"]["chunks_written"] == 6
+
+        out = adaptor.package_streaming(
+            skill_dir,
+            tmp_path,
+            chunk_size=500,
+            chunk_overlap=50,
+            batch_size=3,
+            checkpoint_path=checkpoint,
+        )
+
+        assert "Resuming after 6 chunks" in capsys.readouterr().out
+        assert out.read_text(encoding="utf-8") == _expected(adaptor, skill_dir)
+        assert not checkpoint.exists()
+        assert not list(tmp_path.glob(f"*{SPOOL_SUFFIX}"))
+
+    def test_changed_settings_start_over(self, skill_dir, tmp_path):
+        adaptor = get_adaptor("chroma")
+        checkpoint = tmp_path / "package.ckpt.json"
+
+        with pytest.raises(KeyboardInterrupt):
+            adaptor.package_streaming(
+                skill_dir,
+                tmp_path,
+                chunk_size=500,
+                chunk_overlap=50,
+                batch_size=2,
+                progress_callback=self._interrupt_after(5),
+                checkpoint_path=checkpoint,
+            )
+
+        out = adaptor.package_streaming(
+            skill_dir, tmp_path, chunk_size=400, chunk_overlap=40, checkpoint_path=checkpoint
+        )
+
+        assert out.read_text(encoding="utf-8") == _expected(adaptor, skill_dir, 400, 40)
+
+    def test_interrupt_without_checkpoint_removes_spools(self, skill_dir, tmp_path):
+        with pytest.raises(KeyboardInterrupt):
+            get_adaptor("chroma").package_streaming(
+                skill_dir,
+                tmp_path,
+                chunk_size=500,
+                chunk_overlap=50,
+                progress_callback=self._interrupt_after(3),
+            )
+
+        assert not list(tmp_path.glob(f"*{SPOOL_SUFFIX}"))
+
+    def test_truncated_spool_is_not_resumed(self, tmp_path):
+        writer = StreamingPackageWriter(tmp_path / "pkg.json", ["items"])
+        writer.write({"items": {"a": 1}})
+        state = writer.state()
+        writer.close()
+        (tmp_path / f"pkg.json.items{SPOOL_SUFFIX}").write_bytes(b"")
+
+        assert StreamingPackageWriter(tmp_path / "pkg.json", ["items"]).resume(state) is False
+
+
+_BENCH_SCRIPT = textwrap.dedent(
+    """
+    import contextlib, io, sys, tracemalloc
+    from pathlib import Path
+    from skill_seekers.cli.adaptors import get_adaptor
+
+    skill_dir, out_dir = Path(sys.argv[1]), Path(sys.argv[2])
+    adaptor = get_adaptor("chroma")
+    # Trace only what packaging allocates, relative to the imported baseline
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    with contextlib.redirect_stdout(io.StringIO()):
+        out = adaptor.package_streaming(skill_dir, out_dir, batch_size=1000)
+    _, peak = tracemalloc.get_traced_memory()
+    print(peak - base, out.stat().st_size)
+    """
+)
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+class TestStreamingPackageBenchmark:
+    """Peak heap growth stays flat from 64 MB to 1 GB of skill references."""
+
+    FILE_MB = 8
+
+    def _peak_heap_mb(self, tmp_path, total_mb):
+        sk = tmp_path / f"skill_{total_mb}mb"
+        (sk / "references").mkdir(parents=True)
+        (sk / "SKILL.md").write_text("# Benchmark\n")
+        line = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 140 + "\n"
+        block = line * (self.FILE_MB * 2**20 // len(line))
+        for i in range(total_mb // self.FILE_MB):
+            (sk / "references" / f"ref_{i:04d}.md").write_text(block)
+
+        out_dir = tmp_path / f"out_{total_mb}mb"
+        out_dir.mkdir()
+        result = subprocess.run(
+            [sys.executable, "-c", _BENCH_SCRIPT, str(sk), str(out_dir)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        peak, size = (int(v) for v in result.stdout.split())
+        peak_mb = peak / 2**20
+        print(
+            f"\n{total_mb:>5} MB input -> {size / 2**20:7.1f} MB package, peak heap {peak_mb:.0f} MB"
+        )
+        return peak_mb
+
+    def test_constant_memory_at_1gb(self, tmp_path):
+        small = self._peak_heap_mb(tmp_path, 64)
+        large = self._peak_heap_mb(tmp_path, 1024)
+
+        # 16x the input adds no more than a couple of source files' worth
+        assert large < small + 4 * self.FILE_MB
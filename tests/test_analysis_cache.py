@@ -0,0 +1,315 @@
+"""
+Tests for the persistent per-file analysis cache and its use by
+analyze_files() / analyze_codebase().
+"""
+
+import json
+import pickle
+import shutil
+import sqlite3
+import time
+
+import pytest
+
+from skill_seekers.cli import file_analysis
+from skill_seekers.cli.analysis_cache import AnalysisCache, cache_key, default_cache_path
+from skill_seekers.cli.file_analysis import FileStageRunner, FileStages, analyze_files
+
+ALL_STAGES = FileStages(dependencies=True, patterns=True, test_examples=True)
+
+MODULE = '''
+import os
+
+from .helpers import helper
+
+
+class Widget{n}:
+    """Widget number {n}."""
+
+    def grow(self, by: int) -> int:
+        return by + {n}
+'''
+
+TEST_MODULE = """
+from pkg.mod_0 import Widget0
+
+
+def test_widget_grows():
+    widget = Widget0(size=3)
+    assert widget.grow(2) == 5
+"""
+
+
+def _write_tree(root, count):
+    (root / "pkg").mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (root / "pkg" / f"mod_{i}.py").write_text(MODULE.format(n=i))
+    (root / "test_widgets.py").write_text(TEST_MODULE)
+    return sorted(root.rglob("*.py"))
+
+
+def _sources(files):
+    return [(f, "Python") for f in files]
+
+
+@pytest.fixture
+def count_runs(monkeypatch):
+    """Paths of the files the stages actually ran on."""
+    ran = []
+    run = FileStageRunner.run
+
+    def counting_run(self, model):
+        ran.append(model.relative.as_posix())
+        return run(self, model)
+
+    monkeypatch.setattr(FileStageRunner, "run", counting_run)
+    return ran
+
+
+def test_cache_round_trip_and_stats(tmp_path):
+    db = tmp_path / "cache" / "analysis.db"
+    with AnalysisCache(db) as cache:
+        assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": None, "entries": 0}
+        cache.set_many([("a", {"x": 1}), ("b", [1, 2])])
+        assert cache.get_many(["a", "c", "a"]) == {"a": {"x": 1}}
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 2}
+
+    with AnalysisCache(db) as reopened:
+        assert reopened.get_many(["b"]) == {"b": [1, 2]}
+        assert reopened.clear() == 2
+
+
+def test_unreadable_and_expired_entries_are_misses(tmp_path):
+    db = tmp_path / "analysis.db"
+    with AnalysisCache(db) as cache:
+        cache.set_many([("good", 1), ("old", 2)])
+        with cache.conn:
+            cache.conn.execute("UPDATE file_results SET result = ? WHERE key = 'good'", (b"junk",))
+            cache.conn.execute(
+                "UPDATE file_results SET accessed_at = '2000-01-01' WHERE key = 'old'"
+            )
+
+    with AnalysisCache(db) as cache:
+        assert cache.get_many(["good", "old"]) == {}
+        assert cache.stats()["entries"] == 1
+
+
+class _Exploit:
+    def __reduce__(self):
+        return (exec, ("raise SystemExit('unpickled')",))
+
+
+def test_pickled_entries_are_never_loaded(tmp_path):
+    db = tmp_path / "analysis.db"
+    with AnalysisCache(db) as cache:
+        cache.set_many([("a", {"x": 1})])
+        (stored,) = cache.conn.execute("SELECT result FROM file_results").fetchone()
+        assert json.loads(stored) == {"x": 1}
+        with cache.conn:
+            cache.conn.execute(
+                "UPDATE file_results SET result = ? WHERE key = 'a'", (pickle.dumps(_Exploit()),)
+            )
+        assert cache.get_many(["a"]) == {}
+
+
+def test_cache_key_covers_content_path_language_and_settings():
+    key = cache_key("pkg/a.py", b"x = 1", "Python", "v1")
+    assert key == cache_key("pkg/a.py", b"x = 1", "Python", "v1")
+    assert key != cache_key("pkg/a.py", b"x = 2", "Python", "v1")
+    assert key != cache_key("pkg/b.py", b"x = 1", "Python", "v1")
+    assert key != cache_key("pkg/a.py", b"x = 1", "Cython", "v1")
+    assert key != cache_key("pkg/a.py", b"x = 1", "Python", "v2")
+
+
+def test_default_cache_path_honours_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("SKILL_SEEKERS_CACHE_DIR", str(tmp_path))
+    assert default_cache_path() == tmp_path / "analysis.db"
+
+
+def test_only_changed_files_are_reanalyzed(tmp_path, count_runs):
+    files = _write_tree(tmp_path, 5)
+    cache = AnalysisCache()
+
+    first = analyze_files(_sources(files), tmp_path, ALL_STAGES, cache=cache)
+    assert len(count_runs) == 6
+
+    count_runs.clear()
+    second = analyze_files(_sources(files), tmp_path, ALL_STAGES, cache=cache)
+    assert count_runs == []
+    assert second == first
+    assert second[-1].test_examples
+
+    (tmp_path / "pkg" / "mod_3.py").write_text(MODULE.format(n=33))
+    count_runs.clear()
+    third = analyze_files(_sources(files), tmp_path, ALL_STAGES, cache=cache)
+    assert count_runs == ["pkg/mod_3.py"]
+    assert third[3].entry["classes"][0]["name"] == "Widget33"
+    assert third[:3] == first[:3]
+
+    assert cache.stats()["hits"] == 6 + 5
+    assert cache.stats()["misses"] == 6 + 1
+
+
+def test_stage_settings_change_misses(tmp_path, count_runs):
+    files = _write_tree(tmp_path, 2)
+    cache = AnalysisCache()
+
+    analyze_files(_sources(files), tmp_path, ALL_STAGES, cache=cache)
+    count_runs.clear()
+    analyze_files(_sources(files), tmp_path, FileStages(), cache=cache)
+    assert len(count_runs) == 3
+
+    count_runs.clear()
+    cache.set_many([])
+    file_analysis.ANALYSIS_CACHE_VERSION += 1
+    try:
+        analyze_files(_sources(files), tmp_path, FileStages(), cache=cache)
+    finally:
+        file_analysis.ANALYSIS_CACHE_VERSION -= 1
+    assert len(count_runs) == 3
+
+
+def test_cached_results_follow_a_moved_checkout(tmp_path, count_runs):
+    first_root = tmp_path / "a" / "repo"
+    _write_tree(first_root, 3)
+    moved_root = tmp_path / "b" / "repo"
+    shutil.copytree(first_root, moved_root)
+    moved = _sources(sorted(moved_root.rglob("*.py")))
+    cache = AnalysisCache()
+
+    analyze_files(_sources(sorted(first_root.rglob("*.py"))), first_root, ALL_STAGES, cache=cache)
+    count_runs.clear()
+    cached = analyze_files(moved, moved_root, ALL_STAGES, cache=cache)
+    assert count_runs == []
+
+    assert cached == analyze_files(moved, moved_root, ALL_STAGES)
+    assert cached[-1].test_examples[0].file_path == str(moved_root / "test_widgets.py")
+    assert str(first_root) not in repr(cached)
+
+
+def test_failed_files_are_not_cached(tmp_path, monkeypatch):
+    files = _write_tree(tmp_path, 2)
+    cache = AnalysisCache()
+    from skill_seekers.cli.dependency_analyzer import DependencyAnalyzer
+
+    extract = DependencyAnalyzer.extract_dependencies
+
+    def flaky(self, file_path, *args):
+        if file_path == "pkg/mod_1.py":
+            raise RuntimeError("flaky")
+        return extract(self, file_path, *args)
+
+    monkeypatch.setattr(DependencyAnalyzer, "extract_dependencies", flaky)
+    analyze_files(_sources(files), tmp_path, ALL_STAGES, cache=cache)
+    assert cache.stats()["entries"] == 2
+
+    monkeypatch.setattr(DependencyAnalyzer, "extract_dependencies", extract)
+    results = analyze_files(_sources(files), tmp_path, ALL_STAGES, cache=cache)
+    assert results[1].dependencies is not None and not results[1].errors
+    assert cache.stats()["entries"] == 3
+
+
+def test_analyze_codebase_outputs_identical_with_cache(tmp_path, caplog):
+    from skill_seekers.cli.codebase_scraper import analyze_codebase
+
+    _write_tree(tmp_path / "src", 8)
+    db = tmp_path / "analysis.db"
+    outputs = []
+    for run, cache in enumerate([None, db, db]):
+        out = tmp_path / f"out{run}"
+        caplog.clear()
+        with caplog.at_level("INFO", logger=file_analysis.__name__):
+            analyze_codebase(
+                tmp_path / "src",
+                out,
+                depth="deep",
+                build_api_reference=False,
+                build_how_to_guides=False,
+                extract_config_patterns=False,
+                extract_docs=False,
+                analysis_cache=cache,
+            )
+        refs = out / "references"
+        outputs.append(
+            [
+                (out / "code_analysis.json").read_text(),
+                (refs / "dependencies" / "dependency_graph.json").read_text(),
+                (refs / "test_examples" / "test_examples.json").read_text(),
+            ]
+        )
+
+    assert "reusing 9/9 files (100% hit rate)" in caplog.text
+    assert outputs[0] == outputs[1] == outputs[2]
+    assert len(json.loads(outputs[0][0])["files"]) == 9
+
+
+def test_analyze_codebase_survives_unusable_cache(tmp_path, caplog):
+    from skill_seekers.cli.codebase_scraper import analyze_codebase
+
+    _write_tree(tmp_path / "src", 1)
+    (tmp_path / "not-a-db").write_text("plain text")
+
+    analyze_codebase(
+        tmp_path / "src",
+        tmp_path / "out",
+        depth="deep",
+        build_api_reference=False,
+        build_how_to_guides=False,
+        extract_config_patterns=False,
+        extract_docs=False,
+        analysis_cache=tmp_path / "not-a-db",
+    )
+
+    assert "Analysis cache" in caplog.text
+    assert (tmp_path / "out" / "code_analysis.json").exists()
+    with pytest.raises(sqlite3.DatabaseError):
+        AnalysisCache(tmp_path / "not-a-db")
+
+
+def test_cache_flags_reach_analyzer_config(tmp_path):
+    import argparse
+
+    from skill_seekers.cli.arguments.create import add_create_arguments
+    from skill_seekers.cli.execution_context import ExecutionContext
+
+    parser = argparse.ArgumentParser()
+    add_create_arguments(parser, mode="all")
+
+    ctx = ExecutionContext.initialize(
+        args=parser.parse_args(["./repo", "--analysis-cache", str(tmp_path / "c.db")])
+    )
+    assert ctx.analysis.cache == str(tmp_path / "c.db") and not ctx.analysis.no_cache
+
+    ExecutionContext.reset()
+    ctx = ExecutionContext.initialize(args=parser.parse_args(["./repo", "--no-analysis-cache"]))
+    assert ctx.analysis.cache is None and ctx.analysis.no_cache
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+class TestAnalysisCacheBenchmark:
+    """Cold vs warm re-analysis of a tree where a few files changed."""
+
+    def test_warm_run_reanalyzes_only_changed_files(self, tmp_path, count_runs):
+        files = _write_tree(tmp_path, 1000)
+        cache = AnalysisCache(tmp_path / "analysis.db")
+
+        start = time.perf_counter()
+        cold = analyze_files(_sources(files), tmp_path, ALL_STAGES, cache=cache)
+        cold_seconds = time.perf_counter() - start
+
+        for i in range(10):
+            (tmp_path / "pkg" / f"mod_{i * 97}.py").write_text(MODULE.format(n=i + 5000))
+        count_runs.clear()
+        start = time.perf_counter()
+        warm = analyze_files(_sources(files), tmp_path, ALL_STAGES, cache=cache)
+        warm_seconds = time.perf_counter() - start
+
+        stats = cache.stats()
+        print(
+            f"\n{len(files)} files: cold {cold_seconds:.2f}s, 10 changed warm "
+            f"{warm_seconds:.2f}s, hit rate {stats['hits']}/{stats['hits'] + stats['misses']}"
+        )
+        assert len(count_runs) == 10
+        assert len(warm) == len(cold)
+        assert warm_seconds < cold_seconds
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Tests for the async crawl frontier (worker-pool scrape_all_async).
+
+Runs DocToSkillConverter against a local threaded HTTP fixture server and
+checks max_pages / checkpoint semantics, per-host concurrency caps, the
+off-loop extraction pool, and throughput against the previous
+gather-per-batch crawl loop.
+
+Usage:
+    pytest tests/test_async_frontier.py -v
+    pytest tests/test_async_frontier.py -v -m benchmark -s
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from skill_seekers.cli.crawl_checkpoint import read_checkpoint
+from skill_seekers.cli.doc_scraper import DocToSkillConverter
+
+pytestmark = pytest.mark.serial
+
+_SECTIONS = 6
+_LEAVES_PER_SECTION = 6
+_SLOW_DELAY = 0.25
+_FAST_DELAY = 0.005
+
+
+def _page_html(title: str, links: list[str]) -> str:
+    anchors = "".join(f'<a href="{href}">{href}</a>' for href in links)
+    return (
+        f"<html><head><title>{title}</title></head><body><nav>{anchors}</nav>"
+        f"<article><h1>{title}</h1>"
+        f"<p>{title} explains a documented feature in enough detail to be kept.</p>"
+        f"</article></body></html>"
+    )
+
+
+def _build_site() -> dict[str, tuple[str, float]]:
+    """Return ``{path: (html, delay_seconds)}`` for a small two-level docs tree.
+
+    Every 5th leaf is slow, so a batch that contains one stalls the whole
+    batch in a gather-per-batch crawler.
+    """
+    site = {}
+    sections = [f"/docs/s{i}" for i in range(_SECTIONS)]
+    site["/docs/"] = (_page_html("Home", sections), _FAST_DELAY)
+    n = 0
+    for section in sections:
+        leaves = [f"{section}/p{j}" for j in range(_LEAVES_PER_SECTION)]
+        site[section] = (_page_html(section, leaves), _FAST_DELAY)
+        for leaf in leaves:
+            delay = _SLOW_DELAY if n % 5 == 0 else _FAST_DELAY
+            site[leaf] = (_page_html(leaf, ["/docs/"]), delay)
+            n += 1
+    return site
+
+
+_SITE = _build_site()
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    """Serve _SITE pages with per-page latency and track peak concurrency."""
+
+    in_flight = 0
+    peak_in_flight = 0
+    counter_lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.counter_lock:
+            cls.in_flight += 1
+            cls.peak_in_flight = max(cls.peak_in_flight, cls.in_flight)
+        try:
+            entry = _SITE.get(self.path.split("?")[0])
+            if entry is None:
+                self.send_error(404)
+                return
+            html, delay = entry
+            time.sleep(delay)
+            body = html.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.counter_lock:
+                cls.in_flight -= 1
+
+    def log_message(self, format, *args):  # noqa: ARG002
+        pass  # Suppress request logging during tests
+
+
+async def _legacy_batch_crawl(converter: DocToSkillConverter, limit: float) -> None:
+    """The pre-frontier crawl loop: pop ``workers*2`` URLs, gather, repeat."""
+    semaphore = asyncio.Semaphore(converter.workers)
+    async with httpx.AsyncClient(
+        timeout=30.0, limits=httpx.Limits(max_connections=converter.workers * 2)
+    ) as client:
+        while converter.pending_urls and len(converter.visited_urls) < limit:
+            batch = []
+            for _ in range(min(converter.workers * 2, len(converter.pending_urls))):
+                url = converter.pending_urls.popleft()
+                if url not in converter.visited_urls:
+                    converter.visited_urls.add(url)
+                    batch.append(url)
+            await asyncio.gather(
+                *(converter.scrape_page_async(url, semaphore, client) for url in batch)
+            )
+
+
+class _FrontierTestBase(unittest.TestCase):
+    """Start the fixture server once and run each test in a temp cwd."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+        cls.server.daemon_threads = True
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/docs/"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        # Let requests from a previous test finish before measuring concurrency
+        deadline = time.monotonic() + 5
+        while _FixtureHandler.in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        _FixtureHandler.peak_in_flight = 0
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+
+    def _converter(self, **overrides) -> DocToSkillConverter:
+        config = {
+            "name": "frontier_test",
+            "base_url": self.base_url,
+            "selectors": {"main_content": "article"},
+            "async_mode": True,
+            "workers": 4,
+            "rate_limit": 0,
+            "max_retries": 1,
+            "skip_llms_txt": True,
+            "max_pages": -1,
+        }
+        config.update(overrides)
+        return DocToSkillConverter(config)
+
+
+class TestAsyncCrawlFrontier(_FrontierTestBase):
+    """Functional behaviour of the worker-pool frontier."""
+
+    def test_crawls_every_reachable_page(self):
+        converter = self._converter()
+        asyncio.run(converter.scrape_all_async())
+
+        self.assertEqual(len(converter.visited_urls), len(_SITE))
+        self.assertEqual(converter.pages_scraped, len(_SITE))
+        self.assertEqual(len(converter.pages), len(_SITE))
+        self.assertEqual(len(converter.pending_urls), 0)
+        self.assertIsNone(converter._frontier)
+
+    def test_respects_max_pages_and_keeps_pending_for_resume(self):
+        converter = self._converter(max_pages=10, checkpoint={"enabled": True, "interval": 5})
+        asyncio.run(converter.scrape_all_async())
+
+        self.assertEqual(len(converter.visited_urls), 10)
+        # Discovered-but-unvisited URLs survive for the checkpoint
+        self.assertTrue(converter.pending_urls)
+        self.assertFalse(set(converter.pending_urls) & converter.visited_urls)
+
+        checkpoint = read_checkpoint(converter.checkpoint_file)
+        self.assertEqual(checkpoint["pages_scraped"], 10)
+
+    def test_per_host_cap_bounds_concurrency(self):
+        converter = self._converter(workers=6, per_host_workers=2)
+        asyncio.run(converter.scrape_all_async())
+
+        self.assertEqual(len(converter.pages), len(_SITE))
+        self.assertLessEqual(_FixtureHandler.peak_in_flight, 2)
+
+    def test_dry_run_previews_through_frontier(self):
+        converter = self._converter()
+        converter.dry_run = True
+        asyncio.run(converter.scrape_all_async())
+
+        self.assertEqual(len(converter.visited_urls), 20)
+        self.assertEqual(converter.pages, [])
+
+
+class TestAsyncExtractionPool(_FrontierTestBase):
+    """HTML parsing/extraction off the event loop."""
+
+    @staticmethod
+    def _by_url(pages: list[dict]) -> dict[str, dict]:
+        return {page["url"]: page for page in pages}
+
+    def test_pool_output_matches_inline_parsing(self):
+        pooled = self._converter(parse_workers=2)
+        inline = self._converter(parse_workers=0)
+
+        with patch(
+            "skill_seekers.cli.doc_scraper.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool_cls:
+            asyncio.run(pooled.scrape_all_async())
+        asyncio.run(inline.scrape_all_async())
+
+        self.assertEqual(pool_cls.call_args.kwargs["max_workers"], 2)
+        self.assertIsNone(pooled._extract_pool)
+        self.assertEqual(self._by_url(pooled.pages), self._by_url(inline.pages))
+
+    def test_single_worker_parses_inline(self):
+        converter = self._converter(workers=1)
+        with patch(
+            "skill_seekers.cli.doc_scraper.ProcessPoolExecutor", side_effect=AssertionError
+        ) as pool_cls:
+            asyncio.run(converter.scrape_all_async())
+
+        pool_cls.assert_not_called()
+        self.assertEqual(len(converter.pages), len(_SITE))
+
+    def test_broken_pool_falls_back_to_inline(self):
+        converter = self._converter()
+        converter._extract_pool = MagicMock()
+
+        async def run():
+            with patch.object(
+                asyncio.get_running_loop(),
+                "run_in_executor",
+                side_effect=BrokenProcessPool("worker died"),
+            ):
+                return await converter._extract_page_async(_SITE["/docs/"][0], self.base_url)
+
+        page = asyncio.run(run())
+        self.assertIsNone(converter._extract_pool)
+        self.assertEqual(page["title"], "Home")
+        self.assertEqual(len(page["links"]), _SECTIONS)
+
+
+@pytest.mark.benchmark
+class TestAsyncFrontierBenchmark(_FrontierTestBase):
+    """Pages/sec of the frontier vs the previous gather-per-batch loop."""
+
+    def _timed(self, crawl) -> tuple[int, float]:
+        start = time.perf_counter()
+        pages = crawl()
+        return pages, time.perf_counter() - start
+
+    def test_frontier_outpaces_batch_loop(self):
+        def run_batch():
+            converter = self._converter()
+            asyncio.run(_legacy_batch_crawl(converter, float("inf")))
+            return len(converter.pages)
+
+        def run_frontier():
+            # Inline parsing, like the batch loop: measure the frontier alone
+            converter = self._converter(parse_workers=0)
+            asyncio.run(converter.scrape_all_async())
+            return len(converter.pages)
+
+        batch_pages, batch_time = self._timed(run_batch)
+        frontier_pages, frontier_time = self._timed(run_frontier)
+
+        batch_rate = batch_pages / batch_time
+        frontier_rate = frontier_pages / frontier_time
+        print(f"\nbatch loop: {batch_pages} pages in {batch_time:.2f}s ({batch_rate:.1f} pages/s)")
+        print(
+            f"frontier:   {frontier_pages} pages in {frontier_time:.2f}s "
+            f"({frontier_rate:.1f} pages/s, {frontier_rate / batch_rate:.2f}x)"
+        )
+
+        self.assertEqual(batch_pages, frontier_pages)
+        self.assertGreater(frontier_rate, batch_rate)
+
+
+if __name__ == "__main__":
+    unittest.main()
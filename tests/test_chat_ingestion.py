@@ -0,0 +1,247 @@
+"""
+Tests for Slack/Discord export ingestion: ZIP exports read in place,
+channels parsed in worker processes, and large exports spilled to a
+MessageStore with the same extracted output.
+"""
+
+import json
+import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from skill_seekers.cli import chat_scraper
+from skill_seekers.cli.chat_scraper import ChatToSkillConverter, MessageStore
+
+USERS = [
+    {"id": "U1", "profile": {"display_name": "alice"}},
+    {"id": "U2", "profile": {"display_name": "bob"}},
+]
+
+
+def _slack_day(channel: int, day: int) -> list[dict]:
+    base = 1709280000 + day * 86400 + channel * 600
+    parent = f"{base}.000100"
+    return [
+        {
+            "user": "U1",
+            "text": "We hit an error, see https://example.com/issue",
+            "ts": parent,
+            "thread_ts": parent,
+            "reply_count": 1,
+        },
+        {
+            "user": "U2",
+            "text": "Try this:\n```python\nprint('patched')\n```",
+            "ts": f"{base + 60}.000200",
+            "thread_ts": parent,
+        },
+        {"user": "U1", "text": "thanks <@U2>", "ts": f"{base + 120}.000300"},
+        {"user": "U2", "subtype": "channel_join", "text": "joined", "ts": f"{base}.9"},
+    ]
+
+
+@pytest.fixture
+def slack_export(tmp_path) -> Path:
+    root = tmp_path / "slack-export"
+    root.mkdir()
+    (root / "users.json").write_text(json.dumps(USERS))
+    for channel in range(3):
+        channel_dir = root / f"channel-{channel}"
+        channel_dir.mkdir()
+        for day in range(2):
+            (channel_dir / f"2024-03-0{day + 1}.json").write_text(
+                json.dumps(_slack_day(channel, day))
+            )
+    (root / "channel-0" / "2024-03-09.json").write_text("{not json")
+    return root
+
+
+@pytest.fixture
+def slack_zip(slack_export, tmp_path) -> Path:
+    archive = shutil.make_archive(str(tmp_path / "archive" / "workspace"), "zip", slack_export)
+    return Path(archive)
+
+
+def _extract(tmp_path, export_path, platform="slack", **config) -> dict:
+    converter = ChatToSkillConverter(
+        {
+            "name": "team",
+            "export_path": str(export_path),
+            "platform": platform,
+            "output_dir": str(tmp_path / "out"),
+            **config,
+        }
+    )
+    converter.data_file = str(tmp_path / "extracted.json")
+    converter.extract_chat()
+    data = converter.extracted_data
+    data.pop("source")
+    return data
+
+
+def test_zip_export_is_read_without_extracting(tmp_path, slack_export, slack_zip):
+    from_dir = _extract(tmp_path, slack_export)
+    from_zip = _extract(tmp_path, slack_zip)
+
+    assert from_zip == from_dir
+    assert from_zip["metadata"]["total_messages"] == 18
+    assert from_zip["metadata"]["channels"] == ["channel-0", "channel-1", "channel-2"]
+    assert "@bob" in from_zip["pages"][0]["text"]
+    # Nothing unpacked next to the archive
+    assert sorted(p.name for p in slack_zip.parent.iterdir()) == ["workspace.zip"]
+
+
+def test_zip_without_channels_is_rejected(tmp_path):
+    archive = tmp_path / "empty.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("users.json", json.dumps(USERS))
+
+    converter = ChatToSkillConverter({"name": "team", "export_path": str(archive)})
+    with pytest.raises(ValueError, match="No channel directories"):
+        converter._extract_slack_export()
+
+
+def test_spilled_export_matches_in_memory(tmp_path, slack_zip, monkeypatch):
+    in_memory = _extract(tmp_path, slack_zip)
+
+    stores = []
+    store_init = MessageStore.__init__
+
+    def tracking_init(self):
+        store_init(self)
+        stores.append(self)
+
+    monkeypatch.setattr(MessageStore, "__init__", tracking_init)
+    monkeypatch.setattr(chat_scraper, "SPOOL_MESSAGES", 5)
+    spilled = _extract(tmp_path, slack_zip)
+
+    assert spilled == in_memory
+    assert len(stores) == 1
+    assert not Path(stores[0].db_path).exists()  # deleted after extraction
+
+
+def test_channels_are_parsed_in_worker_processes(tmp_path, slack_export):
+    serial = _extract(tmp_path, slack_export)
+    parallel = _extract(tmp_path, slack_export, jobs=2)
+
+    assert parallel == serial
+
+
+def test_large_channel_streams_in_bounded_batches(tmp_path, monkeypatch):
+    root = tmp_path / "slack-export"
+    (root / "general").mkdir(parents=True)
+    (root / "users.json").write_text(json.dumps(USERS))
+    for day in range(20):
+        (root / "general" / f"2024-03-{day + 1:02d}.json").write_text(
+            json.dumps(_slack_day(0, day))
+        )
+    day_bytes = (root / "general" / "2024-03-01.json").stat().st_size
+    whole = _extract(tmp_path, root)
+
+    batch_sizes = []
+    map_tasks = ChatToSkillConverter._map_tasks
+
+    def recording_map_tasks(self, func, tasks):
+        for result in map_tasks(self, func, tasks):
+            batch_sizes.append(len(result[2]))
+            yield result
+
+    monkeypatch.setattr(ChatToSkillConverter, "_map_tasks", recording_map_tasks)
+    monkeypatch.setattr(chat_scraper, "PARSE_BATCH_BYTES", 3 * day_bytes + 10)
+    monkeypatch.setattr(chat_scraper, "SPOOL_MESSAGES", 10)
+    batched = _extract(tmp_path, root)
+
+    assert batched == whole
+    # 20 day files of 3 parsed messages each, at most 3 day files per batch
+    assert len(batch_sizes) == 7
+    assert max(batch_sizes) <= 9
+    assert sum(batch_sizes) == batched["metadata"]["total_messages"] == 60
+
+
+def _echo_task(i):
+    return i
+
+
+class _ThreadPool(ThreadPoolExecutor):
+    """Stands in for the process pool and counts submitted tasks."""
+
+    submitted = 0
+
+    def __init__(self, max_workers, mp_context=None):  # noqa: ARG002
+        super().__init__(max_workers=max_workers)
+
+    def submit(self, fn, /, *args, **kwargs):
+        type(self).submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_parse_results_in_flight_are_bounded(monkeypatch):
+    monkeypatch.setattr(chat_scraper, "ProcessPoolExecutor", _ThreadPool)
+    _ThreadPool.submitted = 0
+    converter = ChatToSkillConverter({"name": "team", "jobs": 2})
+    window = 2 * chat_scraper.TASKS_IN_FLIGHT_PER_WORKER
+
+    results = converter._map_tasks(_echo_task, [(i,) for i in range(50)])
+    consumed = []
+    for result in results:
+        consumed.append(result)
+        # Only a fixed window of tasks runs ahead of the consumer
+        assert _ThreadPool.submitted <= window + len(consumed)
+
+    assert consumed == list(range(50))
+
+
+def test_discord_export_spills_with_same_output(tmp_path, monkeypatch):
+    export = tmp_path / "discord"
+    export.mkdir()
+    for channel in ("general", "help"):
+        messages = [
+            {
+                "id": str(1000 + i),
+                "type": "Default",
+                "content": f"message {i} ```py\nx = {i}\n```" if i % 2 else f"message {i}",
+                "author": {"id": "7", "name": f"user{i % 3}"},
+                "timestamp": f"2024-03-0{1 + i % 3}T10:00:0{i}+00:00",
+                "reference": {"messageId": "1000"} if i else None,
+            }
+            for i in range(6)
+        ]
+        (export / f"{channel}.json").write_text(
+            json.dumps({"channel": {"name": channel}, "messages": messages})
+        )
+
+    in_memory = _extract(tmp_path, export, platform="discord")
+    monkeypatch.setattr(chat_scraper, "SPOOL_MESSAGES", 0)
+    spilled = _extract(tmp_path, export, platform="discord")
+
+    assert spilled == in_memory
+    assert spilled["metadata"]["total_messages"] == 12
+
+
+def test_message_store_queries():
+    messages = [
+        {"channel": "b", "ts": "1", "thread_ts": "1", "timestamp": "2024-03-02T00:00", "text": "a"},
+        {
+            "channel": "a",
+            "ts": "2",
+            "thread_ts": "1",
+            "timestamp": "2024-03-01T00:00",
+            "text": "```",
+        },
+        {"channel": "a", "ts": "3", "timestamp": "2024-03-01T01:00", "text": "http://x"},
+    ]
+    with MessageStore() as store:
+        store.add_many(messages)
+
+        assert len(store) == 3
+        assert list(store) == messages
+        assert [m["ts"] for m in store.threaded()] == ["1", "2"]
+        assert [m["ts"] for m in store.with_ts({"1", "3"})] == ["1", "3"]
+        assert [m["ts"] for m in store.containing("```")] == ["2"]
+        assert [key for key, _ in store.groups()] == [
+            ("a", "2024-03-01"),
+            ("b", "2024-03-02"),
+        ]
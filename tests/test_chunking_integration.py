@@ -462,3 +462,108 @@ class TestChunkingCLIIntegration:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def create_multi_reference_skill(tmp_path: Path, n_refs: int = 6) -> Path:
+    """Create a skill with several large reference files for parallel chunking tests."""
+    skill_dir = create_test_skill(tmp_path, large_doc=True)
+    refs_dir = skill_dir / "references"
+    for i in range(n_refs):
+        sections = "\n\n".join(
+            f"## Section {j}\n\n"
+            + f"Reference file {i} explains option {j} in detail. " * 40
+            + f"\n\n```python\nconfigure(option={j})\n```"
+            for j in range(8)
+        )
+        (refs_dir / f"topic_{i}.md").write_text(f"# Topic {i}\n\n{sections}")
+    return skill_dir
+
+
+class TestParallelChunking:
+    """--chunk-workers chunks in a process pool with identical output."""
+
+    @pytest.mark.parametrize(
+        "platform",
+        [
+            "langchain",
+            "llama-index",
+            "haystack",
+            "weaviate",
+            "chroma",
+            "faiss",
+            "qdrant",
+            "pinecone",
+        ],
+    )
+    def test_parallel_output_matches_sequential(self, platform, tmp_path):
+        """Chunk order, chunk ids and document ids do not depend on the worker count."""
+        skill_dir = create_multi_reference_skill(tmp_path)
+        sequential = get_adaptor(platform)
+        parallel = get_adaptor(platform, {"chunk_workers": 3})
+        metadata = sequential._build_skill_metadata(skill_dir)
+
+        kwargs = {"enable_chunking": True, "chunk_max_tokens": 256}
+        expected = sequential.format_skill_md(skill_dir, metadata, **kwargs)
+        actual = parallel.format_skill_md(skill_dir, metadata, **kwargs)
+
+        assert actual == expected
+        assert parallel.chunk_workers == 3
+        assert sequential.chunk_workers == 1
+
+    def test_chunk_documents_mixes_small_and_large(self):
+        """Small documents pass through unchanged; large ones are chunked in order."""
+        from skill_seekers.cli.adaptors.langchain import LangChainAdaptor
+
+        adaptor = LangChainAdaptor({"chunk_workers": 2})
+        documents = [
+            ("Small document", {"source": "small", "file": "small.md"}, "small.md"),
+            ("Lorem ipsum dolor sit amet. " * 2000, {"source": "a", "file": "a.md"}, "a.md"),
+            ("Another small one", {"source": "small2"}, None),
+            ("Function details here. " * 1000, {"source": "b", "file": "b.md"}, "b.md"),
+        ]
+
+        results = adaptor._chunk_documents(documents, enable_chunking=True)
+
+        assert results[0] == [("Small document", documents[0][1])]
+        assert results[2] == [("Another small one", documents[2][1])]
+        for result, (content, metadata, source_file) in zip(
+            results[1::2], documents[1::2], strict=True
+        ):
+            assert result == adaptor._maybe_chunk_content(
+                content, metadata, enable_chunking=True, source_file=source_file
+            )
+            assert [meta["chunk_id"] for _, meta in result] == [
+                f"{metadata['source']}_{i}" for i in range(len(result))
+            ]
+
+    def test_package_with_chunk_workers(self, tmp_path):
+        """package_skill(chunk_workers=N) writes the same package as a single worker."""
+        from skill_seekers.cli.package_skill import package_skill
+
+        skill_dir = create_multi_reference_skill(tmp_path)
+        common = {
+            "open_folder_after": False,
+            "skip_quality_check": True,
+            "target": "chroma",
+            "chunk_max_tokens": 256,
+        }
+
+        success, package_path = package_skill(skill_dir=skill_dir, **common)
+        assert success
+        expected = package_path.read_text()
+
+        success, package_path = package_skill(skill_dir=skill_dir, chunk_workers=2, **common)
+        assert success
+        assert package_path.read_text() == expected
+
+    def test_chunk_workers_argument(self):
+        """The package parser accepts --chunk-workers (default 1)."""
+        import argparse
+
+        from skill_seekers.cli.arguments.package import add_package_arguments
+
+        parser = argparse.ArgumentParser()
+        add_package_arguments(parser)
+
+        assert parser.parse_args(["output/react/"]).chunk_workers == 1
+        assert parser.parse_args(["output/react/", "--chunk-workers", "4"]).chunk_workers == 4
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental crawl checkpoints (crawl_checkpoint.CheckpointJournal)
+and their use by DocToSkillConverter save/load/clear.
+
+Usage:
+    pytest tests/test_crawl_checkpoint.py -v
+    pytest tests/test_crawl_checkpoint.py -v -m benchmark -s
+"""
+
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import unittest
+
+import pytest
+
+from skill_seekers.cli.crawl_checkpoint import CheckpointJournal, read_checkpoint
+from skill_seekers.cli.doc_scraper import DocToSkillConverter
+
+
+def _url(n: int) -> str:
+    return f"https://example.com/docs/page{n}"
+
+
+class _Crawl:
+    """Minimal crawl state that feeds a journal the way the scraper does."""
+
+    def __init__(self, journal: CheckpointJournal, start: int = 0):
+        self.journal = journal
+        self.visited: set[str] = set()
+        self.pending: dict[str, None] = {_url(start): None}
+        self.pages = 0
+
+    def state(self) -> dict:
+        return {
+            "visited_urls": list(self.visited),
+            "pending_urls": list(self.pending),
+            "pages_scraped": self.pages,
+            "last_updated": "now",
+        }
+
+    def enqueue(self, url: str) -> None:
+        if url not in self.visited and url not in self.pending:
+            self.pending[url] = None
+            self.journal.record_enqueued(url)
+
+    def visit_next(self, links: int = 2) -> None:
+        url = next(iter(self.pending))
+        del self.pending[url]
+        self.visited.add(url)
+        self.journal.record_visited(url)
+        self.pages += 1
+        n = int(url.rsplit("page", 1)[1])
+        for i in range(1, links + 1):
+            self.enqueue(_url(n * links + i))
+
+    def save(self) -> bool:
+        return self.journal.save(self.state, self.pages)
+
+
+class TestCheckpointJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.checkpoint_file = os.path.join(self.temp_dir, "checkpoint.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _assert_resumes_to(self, crawl: _Crawl) -> None:
+        state = read_checkpoint(self.checkpoint_file)
+        self.assertEqual(set(state["visited_urls"]), crawl.visited)
+        self.assertEqual(state["pending_urls"], list(crawl.pending))
+        self.assertEqual(state["pages_scraped"], crawl.pages)
+
+    def test_first_save_is_snapshot_then_deltas(self):
+        crawl = _Crawl(CheckpointJournal(self.checkpoint_file))
+        self.assertTrue(crawl.save())
+        snapshot = os.path.getmtime(self.checkpoint_file), os.path.getsize(self.checkpoint_file)
+
+        for _ in range(3):
+            for _ in range(5):
+                crawl.visit_next()
+            self.assertFalse(crawl.save())
+
+        # Snapshot untouched; the journal carries the progress
+        self.assertEqual(
+            (os.path.getmtime(self.checkpoint_file), os.path.getsize(self.checkpoint_file)),
+            snapshot,
+        )
+        self._assert_resumes_to(crawl)
+
+    def test_uncommitted_and_torn_events_are_rolled_back(self):
+        crawl = _Crawl(CheckpointJournal(self.checkpoint_file))
+        crawl.save()
+        for _ in range(4):
+            crawl.visit_next()
+        crawl.save()
+        expected = read_checkpoint(self.checkpoint_file)
+
+        # Events written without a commit record, then a torn line
+        with open(crawl.journal.journal_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(["v", _url(99)]) + "\n")
+            f.write('["c", 5, "2026-')
+
+        self.assertEqual(read_checkpoint(self.checkpoint_file), expected)
+
+    def test_resume_truncates_torn_tail_and_keeps_appending(self):
+        crawl = _Crawl(CheckpointJournal(self.checkpoint_file))
+        crawl.save()
+        crawl.visit_next()
+        crawl.save()
+        with open(crawl.journal.journal_file, "a", encoding="utf-8") as f:
+            f.write('["v", "https://exa')
+
+        resumed = CheckpointJournal(self.checkpoint_file)
+        state = resumed.load()
+        crawl.journal = resumed
+        crawl.visited = set(state["visited_urls"])
+        crawl.pending = dict.fromkeys(state["pending_urls"])
+        for _ in range(3):
+            crawl.visit_next()
+        self.assertFalse(crawl.save())
+
+        self._assert_resumes_to(crawl)
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        crawl = _Crawl(CheckpointJournal(self.checkpoint_file, min_compact_events=20))
+        crawl.save()
+        snapshots = 0
+        for _ in range(20):
+            for _ in range(5):
+                crawl.visit_next()
+            snapshots += crawl.save()
+
+        self.assertGreater(snapshots, 1)
+        # The journal never outgrows the snapshot it extends
+        with open(crawl.journal.journal_file, encoding="utf-8") as f:
+            events = [line for line in f if line[2] in "ve"]
+        self.assertLessEqual(len(events), len(crawl.visited) + len(crawl.pending))
+        self._assert_resumes_to(crawl)
+
+    def test_stale_journal_from_before_compaction_is_ignored(self):
+        crawl = _Crawl(CheckpointJournal(self.checkpoint_file))
+        crawl.save()
+        crawl.visit_next()
+        crawl.save()
+        with open(crawl.journal.journal_file, encoding="utf-8") as f:
+            old_journal = f.read()
+
+        crawl.visit_next()
+        crawl.journal.save(crawl.state, crawl.pages, force_snapshot=True)
+        # Simulate a crash between the snapshot replace and the journal reset
+        with open(crawl.journal.journal_file, "w", encoding="utf-8") as f:
+            f.write(old_journal + json.dumps(["v", _url(999)]) + "\n" + '["c", 99, "x"]\n')
+
+        self._assert_resumes_to(crawl)
+
+    def test_legacy_snapshot_without_journal(self):
+        legacy = {
+            "visited_urls": [_url(0)],
+            "pending_urls": [_url(1), _url(2)],
+            "pages_scraped": 1,
+            "last_updated": "2026-01-01T00:00:00Z",
+        }
+        with open(self.checkpoint_file, "w", encoding="utf-8") as f:
+            json.dump(legacy, f, indent=2)
+
+        journal = CheckpointJournal(self.checkpoint_file)
+        self.assertEqual(journal.load(), legacy)
+        # The first save after resuming a legacy checkpoint writes a snapshot
+        self.assertTrue(journal.save(lambda: legacy, 1))
+        self.assertIn("journal_id", read_checkpoint(self.checkpoint_file))
+
+    def test_checkpoint_appends_do_not_grow_with_the_crawl(self):
+        appended = {}
+        for size in (1_000, 20_000):
+            checkpoint_file = os.path.join(self.temp_dir, f"crawl_{size}.json")
+            crawl = _Crawl(CheckpointJournal(checkpoint_file))
+            while len(crawl.visited) + len(crawl.pending) < size:
+                crawl.visit_next()
+            self.assertTrue(crawl.save())
+            snapshot_bytes = os.path.getsize(checkpoint_file)
+
+            deltas = []
+            for _ in range(3):
+                before = os.path.getsize(crawl.journal.journal_file)
+                for _ in range(100):
+                    crawl.visit_next()
+                self.assertFalse(crawl.save())
+                deltas.append(os.path.getsize(crawl.journal.journal_file) - before)
+            self.assertEqual(os.path.getsize(checkpoint_file), snapshot_bytes)
+            appended[size] = max(deltas)
+
+        # Same number of events per checkpoint; only the URLs get a digit longer
+        self.assertLess(appended[20_000], 1.1 * appended[1_000])
+
+    def test_clear_removes_both_files(self):
+        crawl = _Crawl(CheckpointJournal(self.checkpoint_file))
+        crawl.save()
+        crawl.visit_next()
+        crawl.save()
+        crawl.journal.clear()
+        self.assertFalse(os.path.exists(self.checkpoint_file))
+        self.assertFalse(os.path.exists(crawl.journal.journal_file))
+        self.assertIsNone(read_checkpoint(self.checkpoint_file))
+
+
+class TestConverterCheckpoint(unittest.TestCase):
+    """save_checkpoint / load_checkpoint round-trip through the journal."""
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        self.config = {
+            "name": "checkpoint_test",
+            "base_url": "https://example.com/docs/",
+            "checkpoint": {"enabled": True, "interval": 2},
+        }
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_resume_restores_visited_and_pending(self):
+        converter = DocToSkillConverter(self.config)
+        converter.save_checkpoint()
+        for n in range(6):
+            url = converter.pending_urls.popleft()
+            converter._mark_visited(url)
+            converter._enqueue_url(_url(n))
+            converter.pages_scraped += 1
+            if converter.pages_scraped % 2 == 0:
+                converter.save_checkpoint()
+
+        resumed = DocToSkillConverter(self.config, resume=True)
+        self.assertEqual(resumed.visited_urls, converter.visited_urls)
+        self.assertEqual(list(resumed.pending_urls), list(converter.pending_urls))
+        self.assertEqual(resumed.pages_scraped, 6)
+
+        resumed.clear_checkpoint()
+        self.assertFalse(resumed.checkpoint_exists())
+        self.assertFalse(os.path.exists(resumed.checkpoint_journal.journal_file))
+
+    def test_disabled_checkpoint_records_nothing(self):
+        converter = DocToSkillConverter({**self.config, "checkpoint": {"enabled": False}})
+        converter._enqueue_url(_url(1))
+        converter._mark_visited(_url(1))
+        self.assertEqual(converter.checkpoint_journal._buffer, [])
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+class TestCheckpointBenchmark(unittest.TestCase):
+    """Per-checkpoint latency stays flat as the crawl grows from 1k to 100k URLs."""
+
+    INTERVAL = 100
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _crawl_of(self, size: int, name: str) -> _Crawl:
+        crawl = _Crawl(CheckpointJournal(os.path.join(self.temp_dir, f"{name}.json")))
+        while len(crawl.visited) + len(crawl.pending) < size:
+            crawl.visit_next()
+        crawl.save()  # initial snapshot, not measured
+        return crawl
+
+    def _median_checkpoint(self, crawl: _Crawl, save) -> float:
+        timings = []
+        for _ in range(10):
+            for _ in range(self.INTERVAL):
+                crawl.visit_next()
+            start = time.perf_counter()
+            save()
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings)
+
+    def test_checkpoint_latency_is_flat(self):
+        journal_ms = {}
+        snapshot_ms = {}
+        for size in (1_000, 10_000, 100_000):
+            crawl = self._crawl_of(size, f"journal_{size}")
+            journal_ms[size] = self._median_checkpoint(crawl, crawl.save) * 1000
+
+            full = self._crawl_of(size, f"full_{size}")
+            snapshot_ms[size] = (
+                self._median_checkpoint(
+                    full, lambda c=full: c.journal.save(c.state, c.pages, force_snapshot=True)
+                )
+                * 1000
+            )
+            print(
+                f"\n{size:>7} URLs: journal {journal_ms[size]:.2f} ms, "
+                f"full snapshot {snapshot_ms[size]:.2f} ms"
+            )
+
+        # Full snapshots grow with the crawl; journal appends do not
+        self.assertGreater(snapshot_ms[100_000], 10 * snapshot_ms[1_000])
+        self.assertLess(journal_ms[100_000], 3 * max(journal_ms[1_000], 0.5))
+        self.assertLess(journal_ms[100_000] * 10, snapshot_ms[100_000])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -41,7 +41,8 @@ def test_cache_set_get():
     cache.set("hash123", embedding, "test-model")
 
     retrieved = cache.get("hash123")
-    assert retrieved == embedding
+    # Stored as float32
+    assert retrieved == pytest.approx(embedding, rel=1e-6)
 
 
 def test_cache_has():
@@ -121,6 +122,111 @@ def test_cache_context_manager():
         Path(tmp_path).unlink(missing_ok=True)
 
 
+def test_cache_get_many_set_many():
+    """Test multi-row get/set in one transaction."""
+    cache = EmbeddingCache(":memory:", dtype="float64")
+
+    cache.set_many([("h1", [0.1, 0.2], "m"), ("h2", [0.3, 0.4], "m")])
+
+    hits = cache.get_many(["h1", "missing", "h2", "h1"])
+    assert hits == {"h1": [0.1, 0.2], "h2": [0.3, 0.4]}
+    assert cache.get_many([]) == {}
+
+
+def test_cache_float16_storage():
+    """Test optional float16 vectors."""
+    cache = EmbeddingCache(":memory:", dtype="float16")
+    cache.set("h1", [0.5, -0.25, 0.1], "m")
+
+    assert cache.get("h1") == pytest.approx([0.5, -0.25, 0.1], abs=1e-3)
+
+    with pytest.raises(ValueError):
+        EmbeddingCache(":memory:", dtype="int8")
+
+
+def test_cache_deferred_access_stats():
+    """Test access counts are buffered and flushed in bulk."""
+    cache = EmbeddingCache(":memory:", access_flush_threshold=3)
+    cache.set_many([("h1", [0.1], "m"), ("h2", [0.2], "m"), ("h3", [0.3], "m")])
+
+    cache.get("h1")
+    cache.get("h1")
+    count = cache.conn.execute("SELECT access_count FROM embeddings WHERE hash = 'h1'")
+    assert count.fetchone()[0] == 1  # Still buffered
+
+    cache.get_many(["h2", "h3"])  # Third distinct key triggers a flush
+    assert cache._pending_access == {}
+
+    top = {entry["hash"]: entry["access_count"] for entry in cache.stats()["top_accessed"]}
+    assert top == {"h1": 3, "h2": 2, "h3": 2}
+
+
+def test_cache_expired_entries_dropped_by_get_many():
+    """Test TTL applies to batch lookups."""
+    cache = EmbeddingCache(":memory:", ttl_days=1)
+    cache.set_many([("old", [0.1], "m"), ("new", [0.2], "m")])
+    cache.conn.execute(
+        "UPDATE embeddings SET created_at = '2000-01-01T00:00:00' WHERE hash = 'old'"
+    )
+
+    assert list(cache.get_many(["old", "new"])) == ["new"]
+    assert cache.size() == 1
+
+
+def test_cache_wal_mode(tmp_path):
+    """Test file caches use WAL journaling."""
+    with EmbeddingCache(str(tmp_path / "cache.db")) as cache:
+        mode = cache.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+
+def test_cache_migrates_json_schema(tmp_path):
+    """Test a v1 cache with JSON text vectors is converted on open."""
+    import json
+    import sqlite3
+
+    db_path = tmp_path / "cache.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE embeddings (
+            hash TEXT PRIMARY KEY,
+            embedding TEXT NOT NULL,
+            model TEXT NOT NULL,
+            dimensions INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+            accessed_at TEXT NOT NULL,
+            access_count INTEGER DEFAULT 1
+        )
+    """)
+    conn.execute("CREATE INDEX idx_model ON embeddings(model)")
+    conn.execute("CREATE INDEX idx_created_at ON embeddings(created_at)")
+    now = "2999-01-01T00:00:00"
+    conn.executemany(
+        "INSERT INTO embeddings VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            ("h1", json.dumps([0.1, 0.2]), "model1", 2, now, now, 7),
+            ("h2", json.dumps([0.3]), "model2", 1, now, now, 1),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    with EmbeddingCache(str(db_path)) as cache:
+        assert cache.size() == 2
+        assert cache.get("h1") == pytest.approx([0.1, 0.2], rel=1e-6)
+        assert cache.stats()["by_model"] == {"model1": 1, "model2": 1}
+        assert cache.stats()["top_accessed"][0] == {
+            "hash": "h1",
+            "model": "model1",
+            "access_count": 8,
+        }
+        assert cache.conn.execute("PRAGMA user_version").fetchone()[0] == 2
+
+    # Reopening a migrated cache is a no-op
+    with EmbeddingCache(str(db_path)) as cache:
+        assert cache.get("h2") == pytest.approx([0.3], rel=1e-6)
+
+
 # ========================================
 # Generator Tests
 # ========================================
@@ -326,10 +432,10 @@ def test_cache_batch_operations():
     embeddings, cached_flags = cache.get_batch(["hash1", "hash2", "hash999", "hash3"])
 
     assert len(embeddings) == 4
-    assert embeddings[0] == [0.1, 0.2]
-    assert embeddings[1] == [0.3, 0.4]
+    assert embeddings[0] == pytest.approx([0.1, 0.2], rel=1e-6)
+    assert embeddings[1] == pytest.approx([0.3, 0.4], rel=1e-6)
     assert embeddings[2] is None  # Cache miss
-    assert embeddings[3] == [0.5, 0.6]
+    assert embeddings[3] == pytest.approx([0.5, 0.6], rel=1e-6)
 
     assert cached_flags == [True, True, False, True]
 
@@ -360,7 +466,7 @@ def test_cache_persistence():
         # Reopen cache and verify data persists
         cache2 = EmbeddingCache(tmp_path)
         retrieved = cache2.get("hash1")
-        assert retrieved == [0.1, 0.2, 0.3]
+        assert retrieved == pytest.approx([0.1, 0.2, 0.3], rel=1e-6)
         cache2.close()
 
     finally:
@@ -0,0 +1,181 @@
+"""
+Tests for the embedding server's micro-batching scheduler.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from skill_seekers.embedding.batcher import EmbeddingBatcher
+
+
+class FakeGenerator:
+    """Records every inference call; embeds a text as [len(text), flag]."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[list[str]] = []
+        self.threads: set[str] = set()
+
+    def get_model_info(self, model):
+        if model == "unknown":
+            raise ValueError(f"Unknown model: {model}")
+        return {"provider": "fake"}
+
+    def _embed(self, texts, normalize):
+        self.calls.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("model exploded")
+        return [[float(len(text)), float(normalize)] for text in texts]
+
+    def generate(self, text, model, normalize=True):
+        return self._embed([text], normalize)[0]
+
+    def generate_batch(self, texts, model, normalize=True, batch_size=32):
+        embeddings = self._embed(texts, normalize)
+        return embeddings, 2
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_requests_share_one_batch():
+    generator = FakeGenerator()
+    batcher = EmbeddingBatcher(generator, max_batch_size=64, max_wait_ms=20)
+
+    async def main():
+        return await asyncio.gather(*(batcher.embed([f"text-{i:02d}"]) for i in range(10)))
+
+    results = _run(main())
+
+    assert [r[0][0] for r in results] == [7.0] * 10
+    assert generator.calls == [[f"text-{i:02d}" for i in range(10)]]
+    assert all(name.startswith("embed") for name in generator.threads)
+
+
+def test_full_batches_dispatch_without_waiting():
+    generator = FakeGenerator()
+    batcher = EmbeddingBatcher(generator, max_batch_size=4, max_wait_ms=10_000)
+
+    async def main():
+        return await asyncio.wait_for(batcher.embed([f"t{i}" for i in range(8)]), timeout=5)
+
+    assert len(_run(main())) == 8
+    assert [len(call) for call in generator.calls] == [4, 4]
+
+
+def test_partial_batch_flushes_after_max_wait():
+    generator = FakeGenerator()
+    batcher = EmbeddingBatcher(generator, max_batch_size=4, max_wait_ms=10)
+
+    assert _run(batcher.embed(["a", "bb", "ccc", "dddd", "eeeee"])) == [
+        [1.0, 1.0],
+        [2.0, 1.0],
+        [3.0, 1.0],
+        [4.0, 1.0],
+        [5.0, 1.0],
+    ]
+    assert [len(call) for call in generator.calls] == [4, 1]
+
+
+def test_identical_texts_in_flight_are_deduplicated():
+    generator = FakeGenerator(delay=0.05)
+    batcher = EmbeddingBatcher(generator, max_batch_size=64, max_wait_ms=5)
+
+    async def main():
+        return await asyncio.gather(
+            batcher.embed(["same", "other"]),
+            batcher.embed(["same"]),
+            batcher.embed(["same", "same"]),
+        )
+
+    first, second, third = _run(main())
+
+    assert second == [first[0]] and third == [first[0], first[0]]
+    assert sorted(text for call in generator.calls for text in call) == ["other", "same"]
+    assert batcher.metrics()["deduplicated"] == 3
+
+
+def test_models_and_normalize_are_batched_separately():
+    generator = FakeGenerator()
+    batcher = EmbeddingBatcher(generator, max_batch_size=64, max_wait_ms=5)
+
+    async def main():
+        return await asyncio.gather(
+            batcher.embed(["x"], normalize=True),
+            batcher.embed(["x"], normalize=False),
+        )
+
+    normalized, raw = _run(main())
+
+    assert normalized == [[1.0, 1.0]] and raw == [[1.0, 0.0]]
+    assert len(generator.calls) == 2
+
+
+def test_inference_does_not_block_event_loop():
+    generator = FakeGenerator(delay=0.2)
+    batcher = EmbeddingBatcher(generator, max_wait_ms=1)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await batcher.embed(["slow"])
+        task.cancel()
+        return ticks
+
+    assert _run(main()) >= 5
+
+
+def test_errors_reach_every_waiting_request():
+    batcher = EmbeddingBatcher(FakeGenerator(fail=True), max_wait_ms=5)
+
+    async def main():
+        return await asyncio.gather(
+            batcher.embed(["a"]), batcher.embed(["b"]), return_exceptions=True
+        )
+
+    results = _run(main())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert batcher.metrics()["errors"] == 1
+    assert batcher.metrics()["queue_depth"] == 0
+
+    with pytest.raises(ValueError, match="Unknown model"):
+        _run(batcher.embed(["a"], model="unknown"))
+
+
+def test_metrics_histograms():
+    batcher = EmbeddingBatcher(FakeGenerator(), max_batch_size=3, max_wait_ms=5)
+
+    _run(batcher.embed(["a", "b", "c", "d"]))
+    metrics = batcher.metrics()
+
+    assert metrics["requests"] == 1
+    assert metrics["texts"] == 4
+    assert metrics["batches"] == 2
+    assert metrics["mean_batch_size"] == 2.0
+    assert metrics["max_queue_depth"] == 4
+    assert metrics["batch_size_histogram"]["<=1"] == 1
+    assert metrics["batch_size_histogram"]["<=4"] == 1
+    assert sum(metrics["queue_depth_histogram"].values()) == 2
+    assert metrics["queue_depth"] == 0
+
+
+def test_batcher_survives_a_new_event_loop():
+    batcher = EmbeddingBatcher(FakeGenerator(), max_wait_ms=1)
+
+    assert _run(batcher.embed(["a"])) == [[1.0, 1.0]]
+    assert _run(batcher.embed(["a"])) == [[1.0, 1.0]]
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the v2 EmbeddingCache.
+
+The cache stores float32 BLOBs in a WAL database and reads/writes batches in
+one transaction. The v1 cache stored JSON text and committed on every
+``set`` and ``get``. A minimal copy of it is kept below as
+``_JsonReferenceCache`` for comparison.
+
+Usage:
+    pytest tests/test_embedding_cache_performance.py -v -m benchmark -s
+"""
+
+import json
+import random
+import sqlite3
+import time
+from datetime import datetime
+
+import pytest
+
+from skill_seekers.embedding.cache import EmbeddingCache
+
+DIMENSIONS = 384
+BATCH = 1000
+
+
+class _JsonReferenceCache:
+    """The v1 storage path: JSON text column, commit per set/get."""
+
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE embeddings (
+                hash TEXT PRIMARY KEY, embedding TEXT NOT NULL, model TEXT NOT NULL,
+                dimensions INTEGER NOT NULL, created_at TEXT NOT NULL,
+                accessed_at TEXT NOT NULL, access_count INTEGER DEFAULT 1
+            )
+        """)
+
+    def set(self, hash_key, embedding, model):
+        now = datetime.utcnow().isoformat()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?, ?, 1)",
+            (hash_key, json.dumps(embedding), model, len(embedding), now, now),
+        )
+        self.conn.commit()
+
+    def get(self, hash_key):
+        row = self.conn.execute(
+            "SELECT embedding FROM embeddings WHERE hash = ?", (hash_key,)
+        ).fetchone()
+        self.conn.execute(
+            "UPDATE embeddings SET accessed_at = ?, access_count = access_count + 1 WHERE hash = ?",
+            (datetime.utcnow().isoformat(), hash_key),
+        )
+        self.conn.commit()
+        return json.loads(row[0])
+
+
+def _vector(dimensions=DIMENSIONS):
+    rng = random.Random(0)
+    return [rng.uniform(-1, 1) for _ in range(dimensions)]
+
+
+def _throughput(cache, n, dimensions=DIMENSIONS):
+    vector = _vector(dimensions)
+    keys = [f"{i:064x}" for i in range(n)]
+
+    start = time.perf_counter()
+    for i in range(0, n, BATCH):
+        cache.set_many([(key, vector, "bench-model") for key in keys[i : i + BATCH]])
+    set_rate = n / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    hits = 0
+    for i in range(0, n, BATCH):
+        hits += len(cache.get_many(keys[i : i + BATCH]))
+    get_rate = n / (time.perf_counter() - start)
+
+    assert hits == n
+    return set_rate, get_rate
+
+
+@pytest.mark.benchmark
+class TestEmbeddingCacheBenchmark:
+    """get/set throughput at 1k, 100k and 1M entries."""
+
+    @pytest.mark.parametrize(
+        "n",
+        [1_000, 100_000, pytest.param(1_000_000, marks=pytest.mark.slow)],
+    )
+    def test_batch_throughput(self, n, tmp_path):
+        # 64-dim vectors keep the 1M-entry database around 300 MB
+        with EmbeddingCache(str(tmp_path / "cache.db")) as cache:
+            set_rate, get_rate = _throughput(cache, n, dimensions=64)
+        print(f"\n{n:>9,} entries: set {set_rate:>10,.0f}/s  get {get_rate:>10,.0f}/s")
+
+    @pytest.mark.slow
+    def test_faster_than_json_reference(self, tmp_path):
+        n = 1_000
+        vector = _vector()
+        keys = [f"{i:064x}" for i in range(n)]
+
+        reference = _JsonReferenceCache(tmp_path / "v1.db")
+        start = time.perf_counter()
+        for key in keys:
+            reference.set(key, vector, "bench-model")
+        for key in keys:
+            reference.get(key)
+        old = time.perf_counter() - start
+        reference.conn.close()
+
+        with EmbeddingCache(str(tmp_path / "v2.db")) as cache:
+            start = time.perf_counter()
+            _throughput(cache, n)
+            new = time.perf_counter() - start
+
+        print(f"\n{n} x {DIMENSIONS}-dim set+get: {new * 1000:.1f} ms vs v1 {old * 1000:.1f} ms")
+        assert new < old
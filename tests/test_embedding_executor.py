@@ -0,0 +1,299 @@
+"""
+Tests for the concurrent, token-budgeted embedding executor.
+
+Provider paths are exercised end to end against a local stub of the OpenAI
+``/v1/embeddings`` endpoint.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from skill_seekers.cli.embedding_executor import (
+    EmbeddingExecutor,
+    estimate_tokens,
+    is_rate_limited,
+    is_retryable,
+    openai_embed_fn,
+    pack_batches,
+)
+
+openai = pytest.importorskip("openai")
+
+
+class StubEmbeddingServer:
+    """OpenAI-compatible embeddings endpoint embedding a text as [len(text), 1.0].
+
+    ``throttle`` requests are answered with ``status`` (429 by default) first.
+    ``delay`` is a function of the batch so tests can make early batches
+    finish last.
+    """
+
+    def __init__(self, throttle: int = 0, delay=lambda _batch: 0.02, status: int = 429):
+        self.throttle = throttle
+        self.delay = delay
+        self.status = status
+        self.batches: list[list[str]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                batch = body["input"] if isinstance(body["input"], list) else [body["input"]]
+                with stub.lock:
+                    if stub.throttle > 0:
+                        stub.throttle -= 1
+                        self._send(
+                            stub.status, {"error": {"message": "slow down", "type": "rate_limit"}}
+                        )
+                        return
+                    stub.batches.append(batch)
+                    stub.in_flight += 1
+                    stub.peak_in_flight = max(stub.peak_in_flight, stub.in_flight)
+                time.sleep(stub.delay(batch))
+                with stub.lock:
+                    stub.in_flight -= 1
+                # Return items shuffled; clients must order by index
+                data = [
+                    {"object": "embedding", "index": i, "embedding": [float(len(t)), 1.0]}
+                    for i, t in enumerate(batch)
+                ][::-1]
+                self._send(
+                    200,
+                    {
+                        "object": "list",
+                        "data": data,
+                        "model": body["model"],
+                        "usage": {"prompt_tokens": 1, "total_tokens": 1},
+                    },
+                )
+
+            def _send(self, status, payload):
+                raw = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    server = StubEmbeddingServer()
+    yield server
+    server.close()
+
+
+def _client(url):
+    # SDK-level retries off so the executor's own backoff is what's tested
+    return openai.OpenAI(api_key="test", base_url=url, max_retries=0)
+
+
+def test_pack_batches_respects_token_budget_and_item_cap():
+    texts = ["a" * 400, "b" * 400, "c" * 40, "d" * 40, "e" * 4000]
+
+    assert [estimate_tokens(t) for t in texts] == [100, 100, 10, 10, 1000]
+    assert pack_batches(texts, max_tokens=220, max_items=10) == [[0, 1, 2, 3], [4]]
+    assert pack_batches(texts, max_tokens=10_000, max_items=2) == [[0, 1], [2, 3], [4]]
+    assert pack_batches([], max_tokens=10, max_items=10) == []
+
+
+def test_is_rate_limited():
+    class RateLimitError(Exception):
+        pass
+
+    class StatusError(Exception):
+        status_code = 500
+
+    assert is_rate_limited(RateLimitError())
+    assert not is_rate_limited(StatusError())
+    assert not is_rate_limited(ValueError())
+
+
+def test_is_retryable():
+    class StatusError(Exception):
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+    class APIConnectionError(Exception):
+        pass
+
+    class APITimeoutError(APIConnectionError):
+        pass
+
+    assert is_retryable(StatusError(429))
+    assert is_retryable(StatusError(503))
+    assert is_retryable(APITimeoutError())
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(StatusError(400))
+    assert not is_retryable(StatusError(401))
+    assert not is_retryable(ValueError("bad input"))
+
+
+def test_batches_run_concurrently_and_keep_order():
+    # The first batch is the slowest, so completion order is reversed
+    server = StubEmbeddingServer(delay=lambda batch: 0.3 if batch[0] == "t0" else 0.05)
+    try:
+        texts = [f"t{i}" + "x" * i for i in range(40)]
+        executor = EmbeddingExecutor(
+            openai_embed_fn(_client(server.url), "text-embedding-3-small"),
+            max_in_flight=4,
+            max_batch_items=5,
+        )
+
+        embeddings = executor.embed(texts)
+    finally:
+        server.close()
+
+    assert embeddings == [[float(len(t)), 1.0] for t in texts]
+    assert len(server.batches) == 8
+    assert server.peak_in_flight > 1
+    assert executor.stats()["batches"] == 8
+
+
+def test_in_flight_never_exceeds_limit():
+    server = StubEmbeddingServer(delay=lambda _batch: 0.05)
+    try:
+        executor = EmbeddingExecutor(
+            openai_embed_fn(_client(server.url), "m"), max_in_flight=2, max_batch_items=1
+        )
+        executor.embed([f"t{i}" for i in range(8)])
+    finally:
+        server.close()
+
+    assert server.peak_in_flight <= 2
+    assert executor.stats()["peak_in_flight"] == 2
+
+
+def test_backs_off_on_429_and_recovers():
+    server = StubEmbeddingServer(throttle=3)
+    try:
+        executor = EmbeddingExecutor(
+            openai_embed_fn(_client(server.url), "m"),
+            max_in_flight=4,
+            max_batch_items=1,
+            max_attempts=5,
+            base_delay=0.01,
+        )
+        embeddings = executor.embed(["a", "bb", "ccc"])
+    finally:
+        server.close()
+
+    assert embeddings == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+    assert executor.stats()["throttled"] == 3
+    assert executor.stats()["attempts"] == 6
+
+
+def test_gives_up_after_max_attempts():
+    server = StubEmbeddingServer(throttle=100)
+    try:
+        executor = EmbeddingExecutor(
+            openai_embed_fn(_client(server.url), "m"), max_attempts=2, base_delay=0.01
+        )
+        with pytest.raises(openai.RateLimitError):
+            executor.embed(["a"])
+    finally:
+        server.close()
+
+    assert executor.stats()["attempts"] == 2
+
+
+def test_retries_server_errors():
+    server = StubEmbeddingServer(throttle=2, status=500)
+    try:
+        executor = EmbeddingExecutor(
+            openai_embed_fn(_client(server.url), "m"), max_attempts=3, base_delay=0.01
+        )
+        embeddings = executor.embed(["abc"])
+    finally:
+        server.close()
+
+    assert embeddings == [[3.0, 1.0]]
+    assert executor.stats()["attempts"] == 3
+    assert executor.stats()["throttled"] == 0
+
+
+@pytest.mark.parametrize("status", [400, 401])
+def test_client_errors_fail_without_retry(status):
+    server = StubEmbeddingServer(throttle=100, status=status)
+    try:
+        executor = EmbeddingExecutor(
+            openai_embed_fn(_client(server.url), "m"), max_attempts=5, base_delay=10
+        )
+        with pytest.raises(openai.APIStatusError):
+            executor.embed(["a"])
+    finally:
+        server.close()
+
+    assert executor.stats()["attempts"] == 1
+
+
+def test_embed_from_inside_running_loop(stub):
+    import asyncio
+
+    executor = EmbeddingExecutor(openai_embed_fn(_client(stub.url), "m"))
+
+    async def main():
+        sync_result = executor.embed(["abc"])
+        async_result = await executor.embed_async(["abcd"])
+        return sync_result, async_result
+
+    assert asyncio.run(main()) == ([[3.0, 1.0]], [[4.0, 1.0]])
+
+
+def test_pipeline_openai_provider(stub):
+    from skill_seekers.cli.embedding_pipeline import OpenAIEmbeddingProvider
+
+    provider = OpenAIEmbeddingProvider(
+        "text-embedding-3-small", api_key="test", base_url=stub.url, max_batch_items=2
+    )
+    texts = ["one", "three", "fives", "x"]
+
+    assert provider.generate_embeddings(texts) == [[float(len(t)), 1.0] for t in texts]
+    assert [len(b) for b in stub.batches] == [2, 2]
+
+
+def test_generator_openai_batch(stub, monkeypatch):
+    monkeypatch.setenv("OPENAI_BASE_URL", stub.url)
+    from skill_seekers.embedding.generator import EmbeddingGenerator
+
+    generator = EmbeddingGenerator(api_key="test")
+    embeddings, dimensions = generator.generate_batch(
+        ["ab", "abcd"], model="text-embedding-3-small", normalize=False, batch_size=1
+    )
+
+    assert embeddings == [[2.0, 1.0], [4.0, 1.0]]
+    assert dimensions == 2
+    assert len(stub.batches) == 2
+
+
+def test_adaptor_openai_embeddings(stub, monkeypatch):
+    monkeypatch.setenv("OPENAI_BASE_URL", stub.url)
+    from skill_seekers.cli.adaptors import get_adaptor
+
+    adaptor = get_adaptor("chroma")
+    texts = [f"doc {i}" for i in range(5)]
+
+    assert adaptor._generate_openai_embeddings(texts, api_key="test") == [
+        [float(len(t)), 1.0] for t in texts
+    ]
+    # Short documents share a single token-budgeted request
+    assert len(stub.batches) == 1
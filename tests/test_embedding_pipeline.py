@@ -10,6 +10,9 @@ Validates:
 - Dimension validation
 """
 
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from pathlib import Path
 import sys
@@ -27,6 +30,7 @@ from skill_seekers.cli.embedding_pipeline import (
     LocalEmbeddingProvider,
     EmbeddingCache,
     CostTracker,
+    VectorStore,
 )
 
 
@@ -100,9 +104,9 @@ def test_cache_disk():
         # Create new cache instance (clears memory)
         cache2 = EmbeddingCache(cache_dir=Path(tmpdir))
 
-        # Should retrieve from disk
+        # Should retrieve from disk (vectors are stored as float32)
         retrieved = cache2.get(text, model)
-        assert retrieved == embedding
+        assert retrieved == pytest.approx(embedding, rel=1e-6)
 
 
 def test_cost_tracker():
@@ -283,5 +287,136 @@ def test_different_dimensions():
         assert len(result.embeddings[0]) == dim
 
 
+class CountingProvider(LocalEmbeddingProvider):
+    """Local provider that records what it was asked to embed."""
+
+    def __init__(self, dimension: int = 8):
+        super().__init__(dimension)
+        self.calls: list[list[str]] = []
+
+    def generate_embeddings(self, texts):
+        self.calls.append(list(texts))
+        return super().generate_embeddings(texts)
+
+
+def _counting_pipeline(cache_dir=None, batch_size=100):
+    config = EmbeddingConfig(
+        provider="local",
+        model="test-model",
+        dimension=8,
+        batch_size=batch_size,
+        cache_dir=cache_dir,
+    )
+    pipeline = EmbeddingPipeline(config)
+    pipeline.provider = CountingProvider(8)
+    return pipeline
+
+
+def test_duplicates_embedded_once():
+    """Test duplicate texts are sent to the provider once and fanned out."""
+    pipeline = _counting_pipeline(batch_size=2)
+    texts = ["nav", "body 1", "nav", "license", "body 2", "license", "nav"]
+
+    result = pipeline.generate_batch(texts, show_progress=False)
+
+    sent = [text for call in pipeline.provider.calls for text in call]
+    assert sorted(sent) == ["body 1", "body 2", "license", "nav"]
+    assert [len(call) for call in pipeline.provider.calls] == [2, 2]
+    assert result.embeddings[0] == result.embeddings[2] == result.embeddings[6]
+    assert result.embeddings[3] == result.embeddings[5]
+    assert result.generated_count == 7
+    assert result.metadata["unique_texts"] == 4
+    assert result.metadata["dedup_ratio"] == pytest.approx(3 / 7)
+    assert result.metadata["provider_calls_saved"] == 3
+    assert pipeline.get_cost_stats()["dedup_saved"] == 3
+
+
+def test_cross_skill_reuse_through_shared_cache_dir(tmp_path):
+    """Test a second skill reuses vectors the first one stored."""
+    first = _counting_pipeline(cache_dir=tmp_path)
+    first.generate_batch(["shared license", "skill a"], show_progress=False)
+
+    second = _counting_pipeline(cache_dir=tmp_path)
+    result = second.generate_batch(["shared license", "skill b"], show_progress=False)
+
+    assert second.provider.calls == [["skill b"]]
+    assert result.cached_count == 1
+
+
+def test_cache_reads_legacy_json_files(tmp_path):
+    """Test per-vector JSON files from older versions are still used."""
+    import json
+
+    cache = EmbeddingCache(cache_dir=tmp_path)
+    key = cache._compute_hash("old text", "test-model")
+    (tmp_path / f"{key}.json").write_text(json.dumps({"embedding": [0.5, 0.25]}))
+
+    assert cache.get("old text", "test-model") == [0.5, 0.25]
+    assert key in EmbeddingCache(cache_dir=tmp_path)._store
+
+
+def test_vector_store_sharded_files(tmp_path):
+    """Test many vectors land in a fixed number of shard files."""
+    store = VectorStore(tmp_path, shards=4)
+    cache = EmbeddingCache()
+    items = [(cache._compute_hash(f"t{i}", "m"), [float(i)] * 3) for i in range(500)]
+    store.put_many(items)
+    store.put_many(items[:10])  # Already stored; not appended again
+
+    files = sorted(p.name for p in tmp_path.iterdir() if p.suffix in (".bin", ".idx"))
+    assert len(files) == 8
+    assert sum((tmp_path / f).stat().st_size for f in files if f.endswith(".bin")) == 500 * 12
+
+    reopened = VectorStore(tmp_path, shards=4)
+    assert len(reopened) == 500
+    assert reopened.get(items[123][0]) == [123.0] * 3
+
+
+def test_vector_store_ignores_torn_index_record(tmp_path):
+    """Test a partially written index record is dropped on open."""
+    store = VectorStore(tmp_path, shards=1)
+    store.put_many([("ab" * 32, [1.0, 2.0])])
+    with open(tmp_path / "vectors-00.idx", "ab") as f:
+        f.write(b"partial")
+
+    reopened = VectorStore(tmp_path, shards=1)
+    assert len(reopened) == 1
+    assert reopened.get("ab" * 32) == [1.0, 2.0]
+    assert (tmp_path / "vectors-00.idx").stat().st_size == VectorStore.RECORD.size
+
+
+def _shared_vector(worker, batch, i):
+    # Large enough that each batch is flushed in several writes
+    return [float(worker), float(batch), float(i)] * 100
+
+
+def _put_process_vectors(root, worker):
+    store = VectorStore(root, shards=1)
+    for batch in range(20):
+        store.put_many(
+            [
+                (
+                    hashlib.sha256(f"{worker}-{batch}-{i}".encode()).hexdigest(),
+                    _shared_vector(worker, batch, i),
+                )
+                for i in range(50)
+            ]
+        )
+
+
+def test_vector_store_shared_across_processes(tmp_path):
+    """Test concurrent appends from several processes keep every offset right."""
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_put_process_vectors, [tmp_path] * 4, range(4)))
+
+    store = VectorStore(tmp_path, shards=1)
+    assert len(store) == 4 * 20 * 50
+    for worker in range(4):
+        for batch in range(20):
+            for i in range(50):
+                key = hashlib.sha256(f"{worker}-{batch}-{i}".encode()).hexdigest()
+                assert store.get(key) == _shared_vector(worker, batch, i)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
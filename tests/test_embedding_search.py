@@ -0,0 +1,180 @@
+"""
+Tests for the vectorized top-k search kernel and per-skill matrix cache.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from skill_seekers.embedding.search import (
+    SkillMatrix,
+    SkillSearchCache,
+    load_vector_index,
+    top_k_batch,
+)
+
+
+def _matrix(n, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((n, dim)).astype(np.float32)
+
+
+def _skill(name, n, dim=16, seed=0):
+    return SkillMatrix.from_embeddings(
+        name, [f"{name}-{i}" for i in range(n)], _matrix(n, dim, seed), model="m"
+    )
+
+
+def test_top_k_batch_matches_brute_force():
+    skill = _skill("s", 500)
+    queries = skill.matrix[[3, 250, 499]]
+
+    indices, scores = top_k_batch(skill.matrix, queries, 7)
+
+    for row, query in enumerate(queries):
+        expected = np.argsort(-(skill.matrix @ query), kind="stable")[:7]
+        assert indices[row].tolist() == expected.tolist()
+        assert scores[row] == pytest.approx(skill.matrix[expected] @ query, abs=1e-6)
+    assert indices[:, 0].tolist() == [3, 250, 499]
+
+
+def test_top_k_batch_k_larger_than_matrix():
+    skill = _skill("s", 4)
+    indices, scores = top_k_batch(skill.matrix, skill.matrix[:1], 10)
+    assert indices.shape == (1, 4)
+    assert indices[0, 0] == 0
+    assert list(scores[0]) == sorted(scores[0], reverse=True)
+
+
+def test_matrix_is_contiguous_and_normalized():
+    skill = SkillMatrix.from_embeddings("s", ["a", "b"], [[3.0, 4.0], [0.0, 0.0]])
+    assert skill.matrix.flags["C_CONTIGUOUS"] and skill.matrix.dtype == np.float32
+    assert skill.matrix[0].tolist() == pytest.approx([0.6, 0.8])
+    assert skill.matrix[1].tolist() == [0.0, 0.0]
+
+    with pytest.raises(ValueError, match="Expected 3 embeddings"):
+        SkillMatrix.from_embeddings("s", ["a", "b", "c"], [[1.0, 0.0]])
+
+
+def test_search_returns_hits_per_query():
+    cache = SkillSearchCache()
+    skill = _skill("react", 100)
+    skill.metadata[42] = {"file": "hooks.md"}
+    cache.put(skill)
+
+    results = cache.search("react", skill.matrix[[42, 7]] * 3.0, k=3)
+
+    assert len(results) == 2
+    assert results[0][0]["id"] == "react-42"
+    assert results[0][0]["score"] == pytest.approx(1.0, abs=1e-5)
+    assert results[0][0]["metadata"] == {"file": "hooks.md"}
+    assert results[1][0]["id"] == "react-7"
+
+    with pytest.raises(KeyError):
+        cache.search("vue", skill.matrix[:1])
+    with pytest.raises(ValueError, match="dimension"):
+        cache.search("react", [[1.0, 0.0]])
+
+
+def test_lru_eviction_by_memory_budget():
+    one = _skill("a", 1000).nbytes  # 64 KB each
+    cache = SkillSearchCache(memory_budget_mb=2.5 * one / (1024 * 1024))
+
+    cache.put(_skill("a", 1000))
+    cache.put(_skill("b", 1000))
+    cache.get("a")  # a becomes most recently used
+    cache.put(_skill("c", 1000))
+
+    stats = cache.stats()
+    assert set(stats["skills"]) == {"a", "c"}
+    assert stats["evictions"] == 1
+    assert stats["memory_bytes"] == 2 * one
+
+    # A matrix larger than the whole budget is still kept, alone
+    cache.put(_skill("big", 5000))
+    assert set(cache.stats()["skills"]) == {"big"}
+
+
+def test_loader_on_miss_and_reload_after_eviction():
+    loads = []
+
+    def loader(skill):
+        loads.append(skill)
+        return _skill(skill, 10) if skill != "missing" else None
+
+    cache = SkillSearchCache(memory_budget_mb=0, loader=loader)
+    assert cache.search("x", _skill("x", 10).matrix[:1], k=1)[0][0]["id"] == "x-0"
+    cache.search("y", _skill("y", 10).matrix[:1], k=1)  # evicts x
+    cache.search("x", _skill("x", 10).matrix[:1], k=1)
+    assert cache.get("missing") is None
+
+    assert loads == ["x", "y", "x", "missing"]
+    assert cache.stats()["loads"] == 3
+
+
+def test_load_from_vector_index(tmp_path):
+    from skill_seekers.cli.vector_index import VectorIndex
+
+    vectors = _matrix(20)
+    index = VectorIndex(tmp_path / "react")
+    index.add([f"id{i}" for i in range(20)], vectors, [{"i": i} for i in range(20)])
+    index.delete(["id3"])
+
+    skill = load_vector_index("react", tmp_path / "react")
+    assert len(skill.ids) == 19 and "id3" not in skill.ids
+
+    cache = SkillSearchCache()
+    cache.put(skill)
+    hit = cache.search("react", vectors[5:6], k=1)[0][0]
+    assert hit["id"] == "id5" and hit["metadata"] == {"i": 5}
+
+
+def test_latency_percentiles_reported():
+    cache = SkillSearchCache()
+    assert cache.stats()["latency_ms"] == {"p50": None, "p99": None}
+
+    skill = _skill("s", 100)
+    cache.put(skill)
+    cache.search("s", skill.matrix[:8], k=5)
+    stats = cache.stats()
+
+    assert stats["queries"] == 8
+    assert stats["latency_ms"]["p50"] is not None
+    assert stats["latency_ms"]["p99"] >= stats["latency_ms"]["p50"]
+
+
+@pytest.mark.benchmark
+class TestSearchBenchmark:
+    """Top-10 latency per query, single and batched, on one CPU."""
+
+    @pytest.mark.parametrize(
+        "n, dim",
+        [
+            (50_000, 384),
+            pytest.param(500_000, 384, marks=pytest.mark.slow),
+            pytest.param(500_000, 128, marks=pytest.mark.slow),
+        ],
+    )
+    def test_top10_latency(self, n, dim):
+        cache = SkillSearchCache(memory_budget_mb=4096)
+        cache.put(_skill("bench", n, dim))
+        queries = _matrix(64, dim, seed=1)
+        cache.search("bench", queries[:1], k=10)  # warm up
+
+        single = []
+        for query in queries[:32]:
+            start = time.perf_counter()
+            cache.search("bench", query[None, :], k=10)
+            single.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        cache.search("bench", queries, k=10)
+        batched = (time.perf_counter() - start) * 1000 / len(queries)
+
+        p50, p99 = np.percentile(single, [50, 99])
+        print(
+            f"\n{n:,} x {dim}-dim top-10: single p50 {p50:.2f} ms, p99 {p99:.2f} ms; "
+            f"batched {batched:.2f} ms/query"
+        )
+        assert batched < p50
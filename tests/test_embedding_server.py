@@ -19,7 +19,10 @@ pytestmark = pytest.mark.skipif(not STARLETTE_AVAILABLE, reason="Starlette not i
 
 @pytest.fixture
 def mock_generator():
-    with patch("skill_seekers.embedding.server.generator") as mock_gen:
+    with (
+        patch("skill_seekers.embedding.server.generator") as mock_gen,
+        patch("skill_seekers.embedding.server.batcher.generator", mock_gen),
+    ):
         mock_gen.list_models.return_value = [
             {
                 "name": "text-embedding-3-small",
@@ -45,6 +48,7 @@ def mock_cache():
     with patch("skill_seekers.embedding.server.cache") as mock_cache:
         mock_cache.has.return_value = False
         mock_cache.get.return_value = None
+        mock_cache.get_many.return_value = {}
         mock_cache.size.return_value = 42
         mock_cache.stats.return_value = {
             "total": 42,
@@ -136,6 +140,21 @@ class TestEmbedBatch:
         assert data["dimensions"] == 2
         assert len(data["embeddings"]) == 2
 
+    def test_embed_batch_cached(self, client, mock_cache, mock_generator):
+        mock_generator.compute_hash.side_effect = lambda text, *_: f"hash_{text}"
+        mock_cache.get_many.return_value = {"hash_text1": [0.5, 0.6]}
+        mock_generator.generate.return_value = [0.3, 0.4]
+
+        response = client.post("/embed/batch", json={"texts": ["text1", "text2"]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["embeddings"] == [[0.5, 0.6], [0.3, 0.4]]
+        assert data["cached_count"] == 1
+        mock_cache.get_many.assert_called_once_with(["hash_text1", "hash_text2"])
+        mock_cache.set_many.assert_called_once_with(
+            [("hash_text2", [0.3, 0.4], "text-embedding-3-small")]
+        )
+
     def test_embed_batch_empty(self, client, mock_generator):
         mock_generator.generate_batch.return_value = ([[0.1]], 1)
 
@@ -143,6 +162,19 @@ class TestEmbedBatch:
         assert response.status_code == 200
 
 
+class TestMetrics:
+    def test_metrics_after_batch(self, client):
+        response = client.post("/embed/batch", json={"texts": ["text1", "text2"]})
+        assert response.status_code == 200
+
+        data = client.get("/metrics").json()
+        assert data["queue_depth"] == 0
+        assert data["batches"] >= 1
+        assert sum(data["batch_size_histogram"].values()) == data["batches"]
+        assert "queue_depth_histogram" in data
+        assert data["config"]["max_batch_size"] >= 1
+
+
 class TestEmbedSkill:
     def test_embed_skill(self, client, tmp_path):
         skill_dir = tmp_path / "test-skill"
@@ -169,6 +201,77 @@ class TestEmbedSkill:
         assert response.status_code == 404
 
 
+class TestSearch:
+    @pytest.fixture(autouse=True)
+    def _fresh_searcher(self):
+        from skill_seekers.embedding.search import SkillSearchCache
+
+        with patch("skill_seekers.embedding.server.searcher", SkillSearchCache()) as searcher:
+            yield searcher
+
+    def _embed_skill(self, client, tmp_path, mock_generator):
+        skill_dir = tmp_path / "search-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "First paragraph about hooks and effects in components.\n\n"
+            "Second paragraph about routing between pages and layouts."
+        )
+        mock_generator.generate_batch.return_value = ([[1.0, 0.0], [0.0, 1.0]], 2)
+        response = client.post("/embed/skill", json={"skill_path": str(skill_dir)})
+        assert response.status_code == 200
+
+    def test_search_with_query_embeddings(self, client, tmp_path, mock_generator):
+        self._embed_skill(client, tmp_path, mock_generator)
+
+        response = client.post(
+            "/search",
+            json={"skill": "search-skill", "query_embeddings": [[0.1, 0.9], [2.0, 0.0]], "k": 1},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 2
+        assert data["results"][0][0]["id"] == "search-skill:1"
+        assert data["results"][0][0]["metadata"]["content"].startswith("Second paragraph")
+        assert data["results"][1][0]["id"] == "search-skill:0"
+        assert data["results"][1][0]["score"] == pytest.approx(1.0)
+
+    def test_search_with_query_text(self, client, tmp_path, mock_generator):
+        self._embed_skill(client, tmp_path, mock_generator)
+        mock_generator.generate.return_value = [0.0, 1.0]
+
+        response = client.post("/search", json={"skill": "search-skill", "queries": ["routing"]})
+        assert response.status_code == 200
+        assert response.json()["results"][0][0]["id"] == "search-skill:1"
+
+        response = client.post(
+            "/search",
+            json={"skill": "search-skill", "queries": ["x"], "model": "text-embedding-3-large"},
+        )
+        assert response.status_code == 400
+
+    def test_search_errors(self, client, tmp_path, mock_generator):
+        response = client.post("/search", json={"skill": "nope", "query_embeddings": [[1.0]]})
+        assert response.status_code == 404
+
+        response = client.post("/search", json={"skill": "nope"})
+        assert response.status_code == 400
+
+        self._embed_skill(client, tmp_path, mock_generator)
+        response = client.post(
+            "/search", json={"skill": "search-skill", "query_embeddings": [[1.0, 0.0, 0.0]]}
+        )
+        assert response.status_code == 400
+
+    def test_search_stats(self, client, tmp_path, mock_generator):
+        self._embed_skill(client, tmp_path, mock_generator)
+        client.post("/search", json={"skill": "search-skill", "query_embeddings": [[1.0, 0.0]]})
+
+        data = client.get("/search/stats").json()
+        assert data["skills"]["search-skill"]["chunks"] == 2
+        assert data["queries"] == 1
+        assert data["latency_ms"]["p50"] is not None
+
+
 class TestCacheEndpoints:
     def test_cache_stats(self, client):
         response = client.get("/cache/stats")
@@ -0,0 +1,372 @@
+"""
+Tests for the parallel, single-parse per-file analysis engine used by
+analyze_codebase().
+"""
+
+import ast
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from skill_seekers.cli import file_analysis
+from skill_seekers.cli.code_analyzer import CodeAnalyzer
+from skill_seekers.cli.file_analysis import (
+    FileStageRunner,
+    FileStages,
+    analyze_files,
+    analyze_source_file,
+    resolve_jobs,
+)
+
+ALL_STAGES = FileStages(dependencies=True, patterns=True, test_examples=True)
+
+MODULE = '''
+import os
+from typing import Any
+
+from .pkg0.mod_0000 import Widget0
+
+
+class Widget{n}:
+    """Widget number {n}."""
+
+    def __init__(self, size: int = {n}):
+        self.size = size
+
+    def grow(self, by: int) -> int:
+        return self.size + by
+
+
+def make_widget_{n}(size: int) -> "Widget{n}":
+    return Widget{n}(size)
+'''
+
+TEST_MODULE = """
+from pkg0.mod_0000 import Widget0
+
+
+def test_widget_grows():
+    widget = Widget0(size=3)
+    assert widget.grow(2) == 5
+"""
+
+SINGLETON = """
+class ConfigSingleton:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+"""
+
+
+def _write_tree(root, count):
+    for i in range(count):
+        package = root / f"pkg{i % 7}"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / f"mod_{i:04d}.py").write_text(MODULE.format(n=i))
+    (root / "pkg0" / "empty.py").write_text("# nothing to see\n")
+    return sorted(root.rglob("*.py"))
+
+
+def _sources(files):
+    return [(f, "Python") for f in files]
+
+
+def _entries(results):
+    return [r.entry for r in results if r.entry is not None]
+
+
+def test_resolve_jobs():
+    assert resolve_jobs(1) == 1
+    assert resolve_jobs(3) == 3
+    assert resolve_jobs(0) == (os.cpu_count() or 1)
+    assert resolve_jobs(None) == (os.cpu_count() or 1)
+    assert resolve_jobs(-2) == 1
+
+
+def test_skips_files_without_content(tmp_path):
+    files = _write_tree(tmp_path, 2)
+
+    entries = _entries(analyze_files(_sources(files), tmp_path))
+
+    assert [e["file"] for e in entries] == [
+        os.path.join("pkg0", "mod_0000.py"),
+        os.path.join("pkg1", "mod_0001.py"),
+    ]
+    assert entries[0]["classes"][0]["name"] == "Widget0"
+
+
+def test_parallel_matches_serial_order(tmp_path):
+    files = _write_tree(tmp_path, 40)
+    (tmp_path / "test_widgets.py").write_text(TEST_MODULE)
+    files.append(tmp_path / "test_widgets.py")
+
+    serial = analyze_files(_sources(files), tmp_path, ALL_STAGES, jobs=1)
+    parallel = analyze_files(_sources(files), tmp_path, ALL_STAGES, jobs=3)
+
+    assert len(_entries(serial)) == 41
+    assert serial[-1].test_examples
+    assert parallel == serial
+
+
+def test_every_stage_shares_one_read_and_parse(tmp_path, monkeypatch):
+    files = _write_tree(tmp_path, 3)
+    (tmp_path / "test_widgets.py").write_text(TEST_MODULE)
+    files.append(tmp_path / "test_widgets.py")
+    parse = ast.parse
+    parses = []
+
+    def counting_parse(*args, **kwargs):
+        parses.append(1)
+        return parse(*args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+
+    results = analyze_files(_sources(files), tmp_path, ALL_STAGES)
+
+    assert len(parses) == len(files)
+    assert [r.parses for r in results] == [1] * len(files)
+    widget = results[1]
+    assert widget.entry["classes"][0]["name"] == "Widget0"
+    assert [d.imported_module for d in widget.dependencies] == [
+        "os",
+        "typing",
+        ".pkg0.mod_0000",
+    ]
+    assert results[-1].test_examples[0].file_path == str(tmp_path / "test_widgets.py")
+
+
+def test_surface_depth_skips_reading_without_other_stages(tmp_path, monkeypatch):
+    files = _write_tree(tmp_path, 2)
+
+    def read(*_args):
+        raise AssertionError("file was read")
+
+    monkeypatch.setattr(file_analysis.FileModel, "read", read)
+
+    results = analyze_files(_sources(files), tmp_path, FileStages(depth="surface"), jobs=2)
+
+    assert [r.errors for r in results] == [[], [], []]
+    assert _entries(results) == []
+
+
+def test_surface_depth_still_detects_patterns(tmp_path):
+    (tmp_path / "config.py").write_text(SINGLETON)
+
+    (result,) = analyze_files(
+        [(tmp_path / "config.py", "Python")],
+        tmp_path,
+        FileStages(depth="surface", patterns=True),
+    )
+
+    assert result.entry is None
+    assert "Singleton" in {p["pattern_type"] for p in result.patterns["patterns"]}
+
+
+def test_slow_file_times_out_without_stalling_run(tmp_path, monkeypatch, caplog):
+    files = _write_tree(tmp_path, 3)
+    slow = files[1]
+    analyze = CodeAnalyzer.analyze_file
+
+    def analyze_file(self, file_path, *args):
+        if file_path == str(slow):
+            time.sleep(5)
+        return analyze(self, file_path, *args)
+
+    monkeypatch.setattr(CodeAnalyzer, "analyze_file", analyze_file)
+    caplog.set_level(logging.WARNING, logger=file_analysis.__name__)
+
+    start = time.perf_counter()
+    entries = _entries(analyze_files(_sources(files), tmp_path, file_timeout=0.2))
+
+    assert time.perf_counter() - start < 2
+    assert str(slow.relative_to(tmp_path)) not in {e["file"] for e in entries}
+    assert len(entries) == 2
+    assert "Timed out analyzing" in caplog.text
+
+
+def test_timeout_is_not_swallowed_by_analyzer_fallbacks(tmp_path, monkeypatch):
+    path = tmp_path / "spin.py"
+    path.write_text("x = 1\n")
+
+    def analyze_file(*_args):
+        # Analyzers wrap parsing in broad except-Exception fallbacks
+        try:
+            while True:
+                pass
+        except Exception:
+            return {"functions": [{"name": "fallback"}]}
+
+    monkeypatch.setattr(CodeAnalyzer, "analyze_file", analyze_file)
+
+    result = analyze_source_file(
+        FileStageRunner(FileStages()), path, "Python", tmp_path, file_timeout=0.1
+    )
+    assert result.entry is None
+    assert "Timed out" in result.errors[0]
+
+
+def test_analysis_errors_are_reported(tmp_path, monkeypatch):
+    files = _write_tree(tmp_path, 2)
+
+    def analyze_file(*_args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(CodeAnalyzer, "analyze_file", analyze_file)
+
+    result = analyze_source_file(FileStageRunner(FileStages()), files[0], "Python", tmp_path)
+    assert result.entry is None and "boom" in result.errors[0]
+    assert _entries(analyze_files(_sources(files), tmp_path)) == []
+
+
+def test_stage_failure_does_not_drop_other_stages(tmp_path, monkeypatch):
+    from skill_seekers.cli.dependency_analyzer import DependencyAnalyzer
+
+    files = _write_tree(tmp_path, 1)
+
+    def extract_dependencies(*_args):
+        raise RuntimeError("bad import")
+
+    monkeypatch.setattr(DependencyAnalyzer, "extract_dependencies", extract_dependencies)
+
+    result = analyze_source_file(
+        FileStageRunner(FileStages(dependencies=True)), files[1], "Python", tmp_path
+    )
+    assert result.entry["classes"][0]["name"] == "Widget0"
+    assert result.dependencies is None
+    assert "bad import" in result.errors[0]
+
+
+def test_analyze_codebase_output_independent_of_jobs(tmp_path):
+    from skill_seekers.cli.codebase_scraper import analyze_codebase
+
+    _write_tree(tmp_path / "src", 12)
+    (tmp_path / "src" / "test_widgets.py").write_text(TEST_MODULE)
+    outputs = []
+    for jobs in (1, 2):
+        out = tmp_path / f"out{jobs}"
+        analyze_codebase(
+            tmp_path / "src",
+            out,
+            depth="deep",
+            build_api_reference=False,
+            build_how_to_guides=False,
+            extract_config_patterns=False,
+            extract_docs=False,
+            jobs=jobs,
+        )
+        # _generate_references() moves the stage outputs under references/
+        refs = out / "references"
+        outputs.append(
+            [
+                (out / "code_analysis.json").read_text(),
+                (refs / "dependencies" / "dependency_graph.json").read_text(),
+                (refs / "test_examples" / "test_examples.json").read_text(),
+            ]
+        )
+
+    assert outputs[0] == outputs[1]
+    assert len(json.loads(outputs[0][0])["files"]) == 13
+    assert json.loads(outputs[0][2])["total_examples"] >= 1
+
+
+def test_jobs_flag_reaches_analyzer_config():
+    import argparse
+
+    from skill_seekers.cli.arguments.create import add_create_arguments
+    from skill_seekers.cli.execution_context import ExecutionContext
+
+    parser = argparse.ArgumentParser()
+    add_create_arguments(parser, mode="all")
+    args = parser.parse_args(["./repo", "--jobs", "4"])
+
+    ExecutionContext.reset()
+    try:
+        ctx = ExecutionContext.initialize(args=args)
+        assert ctx.analysis.jobs == 4
+    finally:
+        ExecutionContext.reset()
+
+
+@pytest.mark.benchmark
+class TestFileAnalysisBenchmark:
+    """Files/sec from 1 to N worker processes, and the shared model's I/O and parse counts."""
+
+    def test_files_per_second_scaling(self, tmp_path):
+        files = _write_tree(tmp_path, 600)
+        cpus = os.cpu_count() or 1
+        baseline = None
+
+        for jobs in sorted({1, 2, cpus}):
+            start = time.perf_counter()
+            results = analyze_files(_sources(files), tmp_path, ALL_STAGES, jobs=jobs)
+            rate = len(files) / (time.perf_counter() - start)
+
+            if baseline is None:
+                baseline = results
+            assert results == baseline
+            print(f"\n{len(files)} files, jobs={jobs} ({cpus} CPUs): {rate:,.0f} files/sec")
+
+    def test_reads_and_parses_vs_separate_stages(self, tmp_path, monkeypatch):
+        from skill_seekers.cli.dependency_analyzer import DependencyAnalyzer
+        from skill_seekers.cli.pattern_recognizer import PatternRecognizer
+        from skill_seekers.cli.test_example_extractor import TestExampleExtractor
+
+        _write_tree(tmp_path, 200)
+        for i in range(20):
+            (tmp_path / f"test_widgets_{i}.py").write_text(TEST_MODULE)
+        files = sorted(tmp_path.rglob("*.py"))
+
+        counts = {"reads": 0, "parses": 0}
+        parse, read_text = ast.parse, Path.read_text
+
+        def counting_parse(*args, **kwargs):
+            counts["parses"] += 1
+            return parse(*args, **kwargs)
+
+        def counting_read(self, *args, **kwargs):
+            counts["reads"] += 1
+            return read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(ast, "parse", counting_parse)
+        monkeypatch.setattr(Path, "read_text", counting_read)
+
+        def separate_stages():
+            # Each stage reading and parsing every file on its own
+            code, deps = CodeAnalyzer("deep"), DependencyAnalyzer()
+            patterns = PatternRecognizer(depth="deep", enhance_with_ai=False)
+            for path in files:
+                code.analyze_file(str(path), path.read_text(), "Python")
+            for path in files:
+                deps.analyze_file(path.name, path.read_text(), "Python")
+            for path in files:
+                patterns.analyze_file(str(path), path.read_text(), "Python")
+            TestExampleExtractor(enhance_with_ai=False).extract_from_directory(tmp_path)
+
+        def shared_model():
+            analyze_files(_sources(files), tmp_path, ALL_STAGES)
+
+        profile = {}
+        for name, run in [
+            ("separate stages", separate_stages),
+            ("shared file model", shared_model),
+        ]:
+            counts.update(reads=0, parses=0)
+            start = time.perf_counter()
+            run()
+            profile[name] = dict(counts, seconds=time.perf_counter() - start)
+            print(
+                f"\n{name}: {counts['reads']} reads, {counts['parses']} AST parses "
+                f"for {len(files)} files in {profile[name]['seconds']:.2f}s"
+            )
+
+        assert profile["shared file model"]["reads"] == len(files)
+        assert profile["shared file model"]["parses"] == len(files)
+        assert profile["separate stages"]["parses"] > 3 * len(files)
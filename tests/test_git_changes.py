@@ -0,0 +1,288 @@
+"""
+Tests for git-based change detection and its use by the incremental
+analysis cache and the three-stream fetcher's clone updates.
+"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from skill_seekers.cli import git_changes
+from skill_seekers.cli.analysis_cache import AnalysisCache
+from skill_seekers.cli.file_analysis import FileStageRunner, FileStages, analyze_files
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+MODULE = '''
+class Widget{n}:
+    """Widget number {n}."""
+
+    def grow(self, by: int) -> int:
+        return by + {n}
+'''
+
+
+@pytest.fixture(autouse=True)
+def _git_identity(monkeypatch):
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def _commit(repo, message="change"):
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+def _make_repo(path, count=4):
+    (path / "src").mkdir(parents=True)
+    _git(path, "init", "-q")
+    for i in range(count):
+        (path / "src" / f"mod_{i}.py").write_text(MODULE.format(n=i))
+    _commit(path, "initial")
+    return path
+
+
+def _sources(root):
+    return [(f, "Python") for f in sorted((root / "src").rglob("*.py"))]
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Paths read for hashing or analysis."""
+    from pathlib import Path
+
+    seen = []
+    read_bytes, read_text = Path.read_bytes, Path.read_text
+
+    def counting_read_bytes(self):
+        seen.append(self.name)
+        return read_bytes(self)
+
+    def counting_read_text(self, *args, **kwargs):
+        seen.append(self.name)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    return seen
+
+
+@pytest.fixture
+def runs(monkeypatch):
+    ran = []
+    run = FileStageRunner.run
+
+    def counting_run(self, model):
+        ran.append(model.path.name)
+        return run(self, model)
+
+    monkeypatch.setattr(FileStageRunner, "run", counting_run)
+    return ran
+
+
+def test_changed_paths_covers_commits_worktree_and_untracked(tmp_path):
+    repo = _make_repo(tmp_path / "repo")
+    first = git_changes.head_commit(repo)
+    assert len(first) == 40
+
+    (repo / "src" / "mod_0.py").write_text("x = 1\n")
+    _git(repo, "mv", "src/mod_1.py", "src/renamed.py")
+    _commit(repo)
+    (repo / "src" / "mod_2.py").write_text("y = 2\n")  # unstaged
+    (repo / "src" / "new.py").write_text("z = 3\n")  # untracked
+    (repo / ".gitignore").write_text("ignored.py\n")
+    (repo / "src" / "ignored.py").write_text("")
+
+    assert git_changes.changed_paths(repo / "src", first) == {
+        "mod_0.py",
+        "mod_1.py",
+        "renamed.py",
+        "mod_2.py",
+        "new.py",
+    }
+    assert git_changes.changed_paths(repo / "src", "0" * 40) is None
+    assert git_changes.tracked_paths(repo / "src") == {
+        "mod_0.py",
+        "mod_2.py",
+        "mod_3.py",
+        "renamed.py",
+    }
+
+
+def test_outside_a_work_tree_returns_none(tmp_path):
+    assert git_changes.head_commit(tmp_path) is None
+    assert git_changes.tracked_paths(tmp_path) is None
+
+
+def test_unchanged_files_are_not_read_on_rerun(tmp_path, reads, runs):
+    repo = _make_repo(tmp_path / "repo")
+    cache = AnalysisCache()
+
+    first = analyze_files(_sources(repo), repo, cache=cache)
+    assert len(runs) == 4
+
+    (repo / "src" / "mod_2.py").write_text(MODULE.format(n=22))
+    _commit(repo)
+    reads.clear()
+    runs.clear()
+    second = analyze_files(_sources(repo), repo, cache=cache)
+
+    assert runs == ["mod_2.py"]
+    assert sorted(set(reads)) == ["mod_2.py"]
+    assert second[2].entry["classes"][0]["name"] == "Widget22"
+    assert [r for i, r in enumerate(second) if i != 2] == [r for i, r in enumerate(first) if i != 2]
+
+
+def test_dirty_files_are_not_trusted_from_the_snapshot(tmp_path, runs):
+    repo = _make_repo(tmp_path / "repo")
+    cache = AnalysisCache()
+
+    # Analyzed while dirty, then reverted: git sees no change since HEAD,
+    # but the cached key was for the dirty content
+    (repo / "src" / "mod_1.py").write_text(MODULE.format(n=11))
+    analyze_files(_sources(repo), repo, cache=cache)
+    _git(repo, "checkout", "--", "src/mod_1.py")
+
+    runs.clear()
+    results = analyze_files(_sources(repo), repo, cache=cache)
+    assert results[1].entry["classes"][0]["name"] == "Widget1"
+    assert runs == ["mod_1.py"]
+
+
+def test_missing_history_falls_back_to_hashing(tmp_path, caplog, reads, runs):
+    repo = _make_repo(tmp_path / "repo")
+    cache = AnalysisCache()
+    analyze_files(_sources(repo), repo, cache=cache)
+
+    # History rewritten: the recorded commit no longer exists
+    shutil.rmtree(repo / ".git")
+    _git(repo, "init", "-q")
+    _commit(repo, "fresh history")
+    (repo / "src" / "mod_3.py").write_text(MODULE.format(n=33))
+
+    reads.clear()
+    runs.clear()
+    with caplog.at_level("INFO"):
+        results = analyze_files(_sources(repo), repo, cache=cache)
+
+    assert "not in the local history" in caplog.text
+    assert len(set(reads)) == 4  # every file hashed
+    assert runs == ["mod_3.py"]
+    assert results[3].entry["classes"][0]["name"] == "Widget33"
+
+
+def test_use_git_false_hashes_every_file(tmp_path, reads):
+    repo = _make_repo(tmp_path / "repo")
+    cache = AnalysisCache()
+    analyze_files(_sources(repo), repo, FileStages(), cache=cache)
+
+    reads.clear()
+    analyze_files(_sources(repo), repo, FileStages(), cache=cache, use_git=False)
+    assert len(reads) == 4
+
+
+def test_github_local_mode_uses_the_cache(tmp_path, runs):
+    from skill_seekers.cli.github_scraper import GitHubScraper
+
+    repo = _make_repo(tmp_path / "repo")
+    config = {
+        "repo": "test/repo",
+        "name": "test",
+        "local_repo_path": str(repo),
+        "analysis_cache": str(tmp_path / "analysis.db"),
+    }
+
+    scraper = GitHubScraper(config)
+    scraper._extract_file_tree_local()
+    scraper._extract_signatures_and_tests()
+    first = scraper.extracted_data["code_analysis"]
+
+    assert first["files_analyzed"] == 4
+    assert {f["file"] for f in first["files"]} == {f"src/mod_{i}.py" for i in range(4)}
+
+    runs.clear()
+    scraper = GitHubScraper(config)
+    scraper._extract_file_tree_local()
+    scraper._extract_signatures_and_tests()
+    assert runs == []
+    assert scraper.extracted_data["code_analysis"] == first
+
+
+def test_clone_repo_updates_an_existing_clone(tmp_path, monkeypatch):
+    from skill_seekers.cli.github_fetcher import GitHubThreeStreamFetcher
+
+    upstream = _make_repo(tmp_path / "upstream")
+    fetcher = GitHubThreeStreamFetcher("https://github.com/owner/repo", interactive=False)
+    # Point git at the local upstream instead of github.com
+    monkeypatch.setattr(fetcher, "repo_url", f"file://{upstream}")
+
+    clone = fetcher.clone_repo(tmp_path / "clones")
+    first = git_changes.head_commit(clone)
+    (clone / "scratch.txt").write_text("left over")
+
+    (upstream / "src" / "mod_0.py").write_text(MODULE.format(n=100))
+    _commit(upstream)
+    calls = []
+    run = subprocess.run
+
+    def recording_run(cmd, *args, **kwargs):
+        calls.append(cmd[:4])
+        return run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", recording_run)
+    assert fetcher.clone_repo(tmp_path / "clones") == clone
+
+    assert not any("clone" in cmd for cmd in calls)
+    assert git_changes.head_commit(clone) == git_changes.head_commit(upstream)
+    assert "Widget100" in (clone / "src" / "mod_0.py").read_text()
+    assert not (clone / "scratch.txt").exists()
+    # The previous commit is still available for change detection
+    assert git_changes.changed_paths(clone, first) == {"src/mod_0.py"}
+
+
+def test_clone_repo_leaves_foreign_checkouts_alone(tmp_path, monkeypatch):
+    from skill_seekers.cli.github_fetcher import GitHubThreeStreamFetcher
+
+    upstream = _make_repo(tmp_path / "upstream")
+    fetcher = GitHubThreeStreamFetcher("https://github.com/owner/repo", interactive=False)
+    monkeypatch.setattr(fetcher, "repo_url", f"file://{upstream}")
+
+    # The user's own checkout of the same remote, with local work in it
+    checkout = tmp_path / "code" / "repo"
+    subprocess.run(
+        ["git", "clone", "-q", fetcher.repo_url, str(checkout)], check=True, capture_output=True
+    )
+    before = git_changes.head_commit(checkout)
+    (checkout / "src" / "mod_0.py").write_text("# uncommitted\n")
+    (checkout / "notes.txt").write_text("untracked")
+    (upstream / "src" / "mod_1.py").write_text(MODULE.format(n=100))
+    _commit(upstream)
+
+    with pytest.raises(RuntimeError, match="Failed to clone"):
+        fetcher.clone_repo(tmp_path / "code")
+
+    assert git_changes.head_commit(checkout) == before
+    assert (checkout / "src" / "mod_0.py").read_text() == "# uncommitted\n"
+    assert (checkout / "notes.txt").read_text() == "untracked"
+
+
+def test_clone_repo_keeps_its_clone_when_the_update_fails(tmp_path, monkeypatch):
+    from skill_seekers.cli.github_fetcher import GitHubThreeStreamFetcher
+
+    upstream = _make_repo(tmp_path / "upstream")
+    fetcher = GitHubThreeStreamFetcher("https://github.com/owner/repo", interactive=False)
+    monkeypatch.setattr(fetcher, "repo_url", f"file://{upstream}")
+    clone = fetcher.clone_repo(tmp_path / "clones")
+
+    # The remote becomes unreachable, e.g. while offline
+    shutil.rmtree(upstream)
+    with pytest.raises(RuntimeError, match="Failed to update"):
+        fetcher.clone_repo(tmp_path / "clones")
+    assert (clone / "src" / "mod_0.py").exists()
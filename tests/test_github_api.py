@@ -0,0 +1,322 @@
+"""
+Tests for the bulk GitHub fetcher (github_api.GitHubAPIClient) against a
+local fake of the REST API, raw host and tarball endpoint, and its use by
+GitHubScraper's remote mode.
+"""
+
+import hashlib
+import io
+import json
+import tarfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from skill_seekers.cli import github_api
+from skill_seekers.cli.github_api import BlobCache, GitHubAPIClient, git_blob_sha, open_blob_cache
+from skill_seekers.cli.rate_limit_handler import RateLimitError, RateLimitHandler
+
+COMMIT = "c0ffee" + "0" * 34
+
+FILES = {
+    "README.md": b"# Demo\n",
+    "src/app.py": b"class App:\n    def run(self):\n        return 1\n",
+    "src/util.py": b"def helper(x):\n    return x\n",
+    "src/copy.py": b"def helper(x):\n    return x\n",  # same blob as util.py
+    "src/pkg/deep.py": b"def deep():\n    pass\n",
+    "docs/guide.md": b"Guide\n",
+}
+
+
+def _tree_sha(directory: str) -> str:
+    return hashlib.sha1(f"tree:{directory}".encode()).hexdigest()
+
+
+def _tree(directory: str, recursive: bool) -> list[dict]:
+    """Entries under ``directory`` with paths relative to it."""
+    prefix = f"{directory}/" if directory else ""
+    entries = {}
+    for path, content in FILES.items():
+        if not path.startswith(prefix):
+            continue
+        parts = path[len(prefix) :].split("/")
+        for depth in range(1, len(parts)):
+            if not recursive and depth > 1:
+                break
+            sub = "/".join(parts[:depth])
+            entries[sub] = {"path": sub, "type": "tree", "sha": _tree_sha(prefix + sub)}
+        if recursive or len(parts) == 1:
+            rel = "/".join(parts)
+            entries[rel] = {
+                "path": rel,
+                "type": "blob",
+                "sha": git_blob_sha(content),
+                "size": len(content),
+            }
+    return sorted(entries.values(), key=lambda e: e["path"])
+
+
+def _tarball() -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for path, content in FILES.items():
+            info = tarfile.TarInfo(f"owner-repo-{COMMIT[:7]}/{path}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+class _FakeGitHub(BaseHTTPRequestHandler):
+    """REST API under /repos, raw files under /raw, tarballs under /codeload."""
+
+    requests: list[str] = []
+    rate_limited = 0  # next N API requests answer 403 rate limit
+    truncate_root = False
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        path, _, query = self.path.partition("?")
+        with cls.lock:
+            cls.requests.append(self.path)
+            limited = path.startswith("/repos/") and cls.rate_limited > 0
+            if limited:
+                cls.rate_limited -= 1
+        if limited:
+            self._send(
+                403,
+                json.dumps({"message": "API rate limit exceeded"}).encode(),
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()))},
+            )
+            return
+
+        api = "/repos/owner/repo"
+        if path == f"{api}/commits/main":
+            self._send(200, COMMIT.encode())
+        elif path.startswith(f"{api}/git/trees/"):
+            sha = path.rsplit("/", 1)[1]
+            directory = "" if sha == COMMIT else self._directory(sha)
+            recursive = "recursive=1" in query
+            tree = _tree(directory, recursive)
+            truncated = recursive and directory == "" and cls.truncate_root
+            if truncated:
+                tree = tree[:2]
+            body = {"sha": sha, "tree": tree, "truncated": truncated}
+            self._send(200, json.dumps(body).encode())
+        elif path == f"{api}/tarball/{COMMIT}":
+            self.send_response(302)
+            self.send_header("Location", f"/codeload/owner/repo/tar.gz/{COMMIT}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif path == f"/codeload/owner/repo/tar.gz/{COMMIT}":
+            self._send(200, _tarball())
+        elif path.startswith(f"/raw/owner/repo/{COMMIT}/"):
+            file_path = path[len(f"/raw/owner/repo/{COMMIT}/") :]
+            if file_path in FILES:
+                self._send(200, FILES[file_path])
+            else:
+                self._send(404, b"Not Found")
+        else:
+            self._send(404, b"{}")
+
+    @staticmethod
+    def _directory(sha: str) -> str:
+        for path in FILES:
+            parts = path.split("/")
+            for depth in range(1, len(parts)):
+                directory = "/".join(parts[:depth])
+                if _tree_sha(directory) == sha:
+                    return directory
+        raise KeyError(sha)
+
+    def _send(self, status: int, body: bytes, headers: dict | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: ARG002
+        pass  # Suppress request logging during tests
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGitHub)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def fake(server, monkeypatch):
+    _FakeGitHub.requests = []
+    _FakeGitHub.rate_limited = 0
+    _FakeGitHub.truncate_root = False
+    monkeypatch.setattr(github_api, "GITHUB_API_URL", server)
+    monkeypatch.setattr(github_api, "GITHUB_RAW_URL", f"{server}/raw")
+    return _FakeGitHub
+
+
+def _handler(strategy: str = "wait") -> RateLimitHandler:
+    handler = RateLimitHandler(token=None, interactive=False)
+    handler.strategy = strategy
+    return handler
+
+
+def _client(**kwargs) -> GitHubAPIClient:
+    return GitHubAPIClient("owner/repo", rate_limiter=_handler(), **kwargs)
+
+
+def _blobs(tree):
+    return [entry for entry in tree.entries if entry.type == "blob"]
+
+
+def test_tree_is_listed_in_one_call(fake):
+    client = _client()
+    tree = client.fetch_tree("main")
+
+    assert tree.commit == COMMIT
+    assert {e.path for e in _blobs(tree)} == set(FILES)
+    assert {e.path for e in tree.entries if e.type == "tree"} == {"src", "src/pkg", "docs"}
+    assert client.stats["api_calls"] == 2  # resolve the ref, list the tree
+    assert len(fake.requests) == 2
+
+
+def test_truncated_tree_is_listed_by_subtree(fake):
+    fake.truncate_root = True
+    tree = _client().fetch_tree("main")
+
+    assert {e.path for e in _blobs(tree)} == set(FILES)
+    assert len(tree.entries) == len({e.path for e in tree.entries})
+
+
+def test_blobs_are_downloaded_raw_once_and_cached(fake):
+    client = _client()
+    tree = client.fetch_tree("main")
+    cache = BlobCache()
+
+    contents = client.fetch_blobs(_blobs(tree), tree.commit, cache)
+    assert contents == FILES
+    # util.py and copy.py share a blob
+    assert client.stats["raw_downloads"] == len(FILES) - 1
+    assert client.stats["api_calls"] == 2
+
+    fake.requests.clear()
+    again = _client().fetch_blobs(_blobs(tree), tree.commit, cache)
+    assert again == FILES
+    assert fake.requests == []
+
+
+@pytest.mark.usefixtures("fake")
+def test_many_files_come_from_one_tarball():
+    client = _client(tarball_threshold=2)
+    tree = client.fetch_tree("main")
+
+    contents = client.fetch_blobs(_blobs(tree), tree.commit)
+    assert contents == FILES
+    assert client.stats["tarballs"] == 1
+    assert client.stats["raw_downloads"] == 0
+    assert client.stats["api_calls"] == 3
+
+
+@pytest.mark.usefixtures("fake")
+def test_missing_files_are_left_out():
+    client = _client()
+    tree = client.fetch_tree("main")
+    ghost = github_api.TreeEntry("src/ghost.py", "blob", "f" * 40, 1)
+
+    contents = client.fetch_blobs([*_blobs(tree), ghost], tree.commit)
+    assert "src/ghost.py" not in contents
+    assert len(contents) == len(FILES)
+
+
+def test_rate_limit_is_waited_out_once(fake, monkeypatch):
+    handler = _handler("wait")
+    calls = []
+    handle = handler.handle_rate_limit
+    monkeypatch.setattr(
+        handler, "handle_rate_limit", lambda info: calls.append(info) or handle(info)
+    )
+    fake.rate_limited = 1
+
+    tree = GitHubAPIClient("owner/repo", rate_limiter=handler).fetch_tree("main")
+    assert {e.path for e in _blobs(tree)} == set(FILES)
+    assert len(calls) == 1
+    assert calls[0]["remaining"] == 0
+
+
+def test_rate_limit_fail_strategy_raises(fake):
+    fake.rate_limited = 1
+    client = GitHubAPIClient("owner/repo", rate_limiter=_handler("fail"))
+    with pytest.raises(RateLimitError):
+        client.fetch_tree("main")
+
+
+def test_blob_cache_stores_only_verified_content(tmp_path):
+    with BlobCache(tmp_path / "blobs.db") as cache:
+        good = b"print('hi')\n"
+        stored = cache.set_many({git_blob_sha(good): good, "0" * 40: b"tampered"})
+        assert stored == 1
+        assert cache.get_many([git_blob_sha(good), "0" * 40]) == {git_blob_sha(good): good}
+
+
+def test_unavailable_blob_cache_is_skipped(tmp_path, caplog):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+
+    assert open_blob_cache(None) is None
+    assert open_blob_cache(blocker / "blobs.db") is None
+    assert "Blob cache" in caplog.text
+
+    cache = open_blob_cache(tmp_path / "blobs.db")
+    assert isinstance(cache, BlobCache)
+    cache.close()
+
+
+@pytest.mark.usefixtures("fake")
+@pytest.mark.parametrize("cache_writable", [True, False])
+def test_scraper_remote_mode_uses_tree_and_blobs(tmp_path, monkeypatch, cache_writable):
+    from skill_seekers.cli import github_scraper
+
+    cache_dir = tmp_path / "cache"
+    if not cache_writable:
+        # A file where the cache directory should be: the cache cannot be opened
+        cache_dir.write_text("")
+    monkeypatch.setattr(github_scraper, "RateLimitHandler", lambda **_kwargs: _handler("wait"))
+    scraper = github_scraper.GitHubScraper(
+        {
+            "repo": "owner/repo",
+            "name": "repo",
+            "github_token": None,
+            "blob_cache": str(cache_dir / "blobs.db"),
+        }
+    )
+    scraper.repo = Mock(default_branch="main")
+
+    scraper._extract_file_tree_github()
+    tree = scraper.extracted_data["file_tree"]
+    assert {item["path"] for item in tree if item["type"] == "file"} == set(FILES)
+    assert {"path": "src", "type": "dir", "size": None} in tree
+
+    scraper._extract_signatures_and_tests()
+    analysis = scraper.extracted_data["code_analysis"]
+    assert {f["file"] for f in analysis["files"]} == {
+        "src/app.py",
+        "src/util.py",
+        "src/copy.py",
+        "src/pkg/deep.py",
+    }
+    # Four Python files, three distinct blobs; nothing fetched per file via the API
+    assert scraper.api_client.stats == {
+        "api_calls": 2,
+        "raw_downloads": 3,
+        "tarballs": 0,
+        "cached_blobs": 0,
+    }
@@ -7,6 +7,7 @@ Tests the three-stream architecture that splits GitHub repositories into:
 - Insights stream (issues, metadata)
 """
 
+import json
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -656,3 +657,128 @@ class TestIssueFiltering:
         assert fetcher.issue_since is None
         assert fetcher.issue_labels == []
         assert fetcher.issue_state == "all"
+
+
+class _FakeIssuesAPI:
+    """Stands in for requests.get: paginated issues with ETags and Link headers."""
+
+    def __init__(self, issues, per_page_cap=100):
+        self.issues = issues
+        self.per_page_cap = per_page_cap
+        self.calls = []
+
+    def __call__(self, url, headers=None, params=None, **_kwargs):
+        params = params or {}
+        self.calls.append(dict(params))
+        per_page = min(params.get("per_page", 30), self.per_page_cap)
+        page = params.get("page", 1)
+        state = params.get("state", "open")
+        since = params.get("since")
+        selected = [
+            i
+            for i in self.issues
+            if (state == "all" or i["state"] == state)
+            and (since is None or i["updated_at"] >= since)
+        ]
+        selected.sort(key=lambda i: (-i["comments"], -i["number"]))
+        last = max(1, -(-len(selected) // per_page))
+        body = selected[(page - 1) * per_page : page * per_page]
+        etag = f'"{hash(repr(body))}"'
+
+        response = Mock()
+        response.headers = {"ETag": etag}
+        if page < last:
+            response.headers["Link"] = (
+                f'<{url}?page={page + 1}>; rel="next", <{url}?page={last}>; rel="last"'
+            )
+        if (headers or {}).get("If-None-Match") == etag:
+            response.status_code = 304
+            return response
+        response.status_code = 200
+        response.json.return_value = body
+        response.content = json.dumps(body).encode()
+        return response
+
+
+def _issue(number, comments, state="open", updated_at="2026-01-01T00:00:00+00:00"):
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "state": state,
+        "comments": comments,
+        "labels": [],
+        "updated_at": updated_at,
+    }
+
+
+class TestCachedPagination:
+    """Concurrent page fetching, ETag revalidation and incremental issue sync."""
+
+    def test_remaining_pages_are_fetched_once_page_count_is_known(self):
+        api = _FakeIssuesAPI([_issue(n, n) for n in range(1, 251)], per_page_cap=50)
+        fetcher = GitHubThreeStreamFetcher("https://github.com/owner/repo", interactive=False)
+
+        with patch("requests.get", side_effect=api):
+            issues = fetcher._fetch_issues_page("open", 180)
+
+        assert [i["number"] for i in issues] == list(range(250, 70, -1))
+        # Page 1 reveals the last page; pages 2-4 cover the remaining 130 issues
+        assert sorted(c["page"] for c in api.calls) == [1, 2, 3, 4]
+
+    def test_unchanged_pages_are_revalidated_not_refetched(self, tmp_path):
+        api = _FakeIssuesAPI([_issue(n, n) for n in range(1, 6)])
+        cache = tmp_path / "github_api.db"
+        url = "https://api.github.com/repos/owner/repo"
+
+        fetcher = GitHubThreeStreamFetcher(
+            "https://github.com/owner/repo", interactive=False, api_cache=cache
+        )
+        with patch("requests.get", side_effect=api):
+            first, _ = fetcher._get_json(f"{url}/issues", {"state": "open"})
+            second, _ = fetcher._get_json(f"{url}/issues", {"state": "open"})
+
+        assert first == second
+        assert fetcher.page_cache.hits == 1
+        assert fetcher.page_cache.misses == 1
+
+    def test_issues_are_synced_incrementally(self, tmp_path):
+        api = _FakeIssuesAPI([_issue(n, n) for n in range(1, 11)])
+        cache = tmp_path / "github_api.db"
+
+        def fetch():
+            fetcher = GitHubThreeStreamFetcher(
+                "https://github.com/owner/repo", interactive=False, api_cache=cache
+            )
+            with patch("requests.get", side_effect=api):
+                return [i["number"] for i in fetcher._fetch_issues_page("open", 20)]
+
+        assert fetch() == list(range(10, 0, -1))
+
+        # Issue 3 got busy, issue 9 was closed, issue 11 was opened
+        later = "2999-01-01T00:00:00+00:00"
+        api.issues[2] = _issue(3, 50, updated_at=later)
+        api.issues[8] = _issue(9, 9, state="closed", updated_at=later)
+        api.issues.append(_issue(11, 0, updated_at=later))
+        api.calls.clear()
+
+        assert fetch() == [3, 10, 8, 7, 6, 5, 4, 2, 1, 11]
+        assert len(api.calls) == 1
+        assert api.calls[0]["state"] == "all"
+        assert "since" in api.calls[0]
+
+    def test_truncated_sync_refetches_when_issues_leave_the_list(self, tmp_path):
+        api = _FakeIssuesAPI([_issue(n, n) for n in range(1, 11)])
+        cache = tmp_path / "github_api.db"
+
+        def fetch():
+            fetcher = GitHubThreeStreamFetcher(
+                "https://github.com/owner/repo", interactive=False, api_cache=cache
+            )
+            with patch("requests.get", side_effect=api):
+                return [i["number"] for i in fetcher._fetch_issues_page("open", 3)]
+
+        assert fetch() == [10, 9, 8]
+
+        api.issues[9] = _issue(10, 10, state="closed", updated_at="2999-01-01T00:00:00+00:00")
+        # Issue 7 was never stored; only a full fetch can find it
+        assert fetch() == [9, 8, 7]
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-host adaptive rate limiter (host_rate_limiter.HostRateLimiter)
+and its use by DocToSkillConverter's sync and async fetch paths.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from skill_seekers.cli.doc_scraper import DocToSkillConverter
+from skill_seekers.cli.host_rate_limiter import (
+    MAX_RATE_FACTOR,
+    MIN_RATE_FACTOR,
+    TARGET_LATENCY,
+    HostRateLimiter,
+    parse_retry_after,
+)
+
+URL = "https://docs.example.com/page"
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_delta_seconds(self):
+        self.assertEqual(parse_retry_after("2"), 2.0)
+        self.assertEqual(parse_retry_after(" 0.5 "), 0.5)
+
+    def test_http_date(self):
+        now = time.time()
+        self.assertAlmostEqual(parse_retry_after(formatdate(now + 30), now=now), 30, delta=1)
+
+    def test_past_date_and_garbage(self):
+        now = time.time()
+        self.assertEqual(parse_retry_after(formatdate(now - 30), now=now), 0.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_capped(self):
+        self.assertEqual(parse_retry_after("86400"), 300.0)
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    def test_burst_then_paced(self):
+        limiter = HostRateLimiter(base_rate=2.0, burst=2)
+        self.assertEqual(limiter.reserve(URL), 0)
+        self.assertEqual(limiter.reserve(URL), 0)
+        self.assertAlmostEqual(limiter.reserve(URL), 0.5, delta=0.05)
+        self.assertAlmostEqual(limiter.reserve(URL), 1.0, delta=0.05)
+
+    def test_hosts_are_independent(self):
+        limiter = HostRateLimiter(base_rate=1.0, burst=1)
+        limiter.reserve(URL)
+        self.assertGreater(limiter.reserve(URL), 0)
+        self.assertEqual(limiter.reserve("https://other.example.com/"), 0)
+
+    def test_unlimited_never_waits(self):
+        limiter = HostRateLimiter(base_rate=None)
+        self.assertTrue(all(limiter.reserve(URL) == 0 for _ in range(100)))
+        self.assertIsNone(limiter.current_rate(URL))
+
+    def test_fast_responses_increase_rate_up_to_cap(self):
+        limiter = HostRateLimiter(base_rate=2.0)
+        limiter.record(URL, 200, TARGET_LATENCY / 10)
+        self.assertGreater(limiter.current_rate(URL), 2.0)
+        for _ in range(200):
+            limiter.record(URL, 200, TARGET_LATENCY / 10)
+        self.assertEqual(limiter.current_rate(URL), 2.0 * MAX_RATE_FACTOR)
+
+    def test_slow_responses_decrease_rate(self):
+        limiter = HostRateLimiter(base_rate=2.0)
+        limiter.record(URL, 200, TARGET_LATENCY * 3)
+        self.assertLess(limiter.current_rate(URL), 2.0)
+
+    def test_throttle_halves_rate_with_floor(self):
+        limiter = HostRateLimiter(base_rate=2.0)
+        limiter.record(URL, 429, 0.01)
+        self.assertEqual(limiter.current_rate(URL), 1.0)
+        limiter.record(URL, 503, 0.01)
+        self.assertEqual(limiter.current_rate(URL), 0.5)
+        for _ in range(20):
+            limiter.record(URL, 429, 0.01)
+        self.assertEqual(limiter.current_rate(URL), 2.0 * MIN_RATE_FACTOR)
+
+    def test_not_adaptive_keeps_rate(self):
+        limiter = HostRateLimiter(base_rate=2.0, adaptive=False)
+        limiter.record(URL, 200, 0.01)
+        limiter.record(URL, 429, 0.01)
+        self.assertEqual(limiter.current_rate(URL), 2.0)
+
+    def test_retry_after_blocks_host_even_when_unlimited(self):
+        limiter = HostRateLimiter(base_rate=None)
+        limiter.record(URL, 429, 0.01, retry_after="2")
+        self.assertAlmostEqual(limiter.reserve(URL), 2.0, delta=0.1)
+        self.assertEqual(limiter.reserve("https://other.example.com/"), 0)
+
+    def test_summary_reports_achieved_rps(self):
+        limiter = HostRateLimiter(base_rate=None)
+        with patch("skill_seekers.cli.host_rate_limiter.time.monotonic", side_effect=[0, 1, 2, 4]):
+            limiter.reserve(URL)
+            limiter.reserve(URL)
+            limiter.record(URL, 200, 0.2)
+            limiter.record(URL, 429, 0.4)
+
+        stats = limiter.summary()["docs.example.com"]
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["throttled"], 1)
+        self.assertEqual(stats["achieved_rps"], 0.5)
+        self.assertIsNone(stats["final_rate"])
+
+    def test_shared_across_threads(self):
+        limiter = HostRateLimiter(base_rate=1.0, burst=1)
+        waits: list[float] = []
+        lock = threading.Lock()
+
+        def take():
+            wait = limiter.reserve(URL)
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=take) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Every thread got a distinct slot: 0s, ~1s, ~2s, ... ~7s
+        self.assertEqual([round(w) for w in sorted(waits)], list(range(8)))
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    """Answer the first request to each page with 429 + Retry-After."""
+
+    throttled: set[str] = set()
+    requests = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        path = self.path.split("?")[0]
+        with cls.lock:
+            cls.requests += 1
+            first = path not in cls.throttled
+            cls.throttled.add(path)
+        if first:
+            self.send_response(429)
+            self.send_header("Retry-After", "0.2")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        links = '<a href="/docs/a">A</a>' if path == "/docs/" else ""
+        body = (
+            f"<html><head><title>{path}</title></head><body><nav>{links}</nav>"
+            f"<article><h1>{path}</h1><p>{path} documents a feature in detail.</p>"
+            f"</article></body></html>"
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: ARG002
+        pass  # Suppress request logging during tests
+
+
+@pytest.mark.serial
+class TestScraperRateLimiting(unittest.TestCase):
+    """Both fetch paths retry 429s after Retry-After and report per-host RPS."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ThrottlingHandler)
+        cls.server.daemon_threads = True
+        cls.host = f"127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        _ThrottlingHandler.throttled = set()
+        _ThrottlingHandler.requests = 0
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+
+    def _scrape(self, **overrides) -> DocToSkillConverter:
+        config = {
+            "name": "ratelimit_test",
+            "base_url": f"http://{self.host}/docs/",
+            "selectors": {"main_content": "article"},
+            "rate_limit": 0.01,
+            "max_retries": 2,
+            "skip_llms_txt": True,
+            "max_pages": -1,
+        }
+        config.update(overrides)
+        converter = DocToSkillConverter(config)
+        converter._try_sitemap = lambda: []
+        if converter.async_mode:
+            asyncio.run(converter.scrape_all_async())
+        else:
+            converter.scrape_all()
+        return converter
+
+    def _assert_throttled_and_recovered(self, converter: DocToSkillConverter) -> None:
+        self.assertEqual(sorted(p["url"].rsplit("/", 1)[-1] for p in converter.pages), ["", "a"])
+        self.assertEqual(_ThrottlingHandler.requests, 4)
+
+        stats = converter.rate_limiter.summary()[self.host]
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["throttled"], 2)
+        self.assertGreater(stats["achieved_rps"], 0)
+
+        converter.save_summary()
+        with open(f"{converter.data_dir}/summary.json", encoding="utf-8") as f:
+            summary = json.load(f)
+        self.assertEqual(summary["rate_limits"][self.host]["throttled"], 2)
+
+    def test_sync_path(self):
+        converter = self._scrape()
+        self._assert_throttled_and_recovered(converter)
+
+    def test_async_path(self):
+        converter = self._scrape(async_mode=True, workers=2, parse_workers=0)
+        self._assert_throttled_and_recovered(converter)
+
+    def test_rate_limit_zero_disables_pacing(self):
+        converter = DocToSkillConverter(
+            {"name": "nolimit", "base_url": f"http://{self.host}/docs/", "rate_limit": 0},
+            dry_run=True,
+        )
+        self.assertIsNone(converter.rate_limiter.base_rate)
+
+    def test_base_rate_matches_old_fixed_sleep_throughput(self):
+        converter = DocToSkillConverter(
+            {
+                "name": "rate",
+                "base_url": f"http://{self.host}/docs/",
+                "rate_limit": 0.5,
+                "workers": 4,
+            },
+            dry_run=True,
+        )
+        self.assertEqual(converter.rate_limiter.base_rate, 8.0)
+        self.assertEqual(converter.rate_limiter.burst, 4)
+
+
+class TestBrowserRenderPacing(unittest.TestCase):
+    """browser: true renders take the same per-host tokens as HTTP fetches."""
+
+    HTML = "<html><body><article><h1>T</h1><p>Rendered page body text.</p></article></body></html>"
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        self.converter = DocToSkillConverter(
+            {
+                "name": "browser_pacing",
+                "base_url": "https://docs.example.com/",
+                "selectors": {"main_content": "article"},
+                "rate_limit": 0.5,
+                "browser": True,
+            }
+        )
+        self.converter._render_with_browser = lambda url: self.HTML  # noqa: ARG005
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+
+    def test_sync_render_waits_for_token_and_records(self):
+        with patch("skill_seekers.cli.doc_scraper.time.sleep") as sleep:
+            self.converter.scrape_page("https://docs.example.com/a")
+            self.converter.scrape_page("https://docs.example.com/b")
+
+        self.assertEqual(len(self.converter.pages), 2)
+        self.assertEqual(sleep.call_count, 1)
+        self.assertGreater(sleep.call_args.args[0], 0)
+        stats = self.converter.rate_limiter.summary()["docs.example.com"]
+        self.assertEqual(stats["requests"], 2)
+        self.assertIsNotNone(stats["avg_latency"])
+
+    def test_async_render_waits_for_token_and_records(self):
+        async def scrape() -> list[float]:
+            delays: list[float] = []
+            real_sleep = asyncio.sleep
+
+            async def fake_sleep(delay):
+                delays.append(delay)
+                await real_sleep(0)
+
+            semaphore = asyncio.Semaphore(2)
+            with patch("skill_seekers.cli.doc_scraper.asyncio.sleep", fake_sleep):
+                await asyncio.gather(
+                    self.converter.scrape_page_async("https://docs.example.com/a", semaphore, None),
+                    self.converter.scrape_page_async("https://docs.example.com/b", semaphore, None),
+                )
+            return delays
+
+        delays = asyncio.run(scrape())
+
+        self.assertEqual(len(self.converter.pages), 2)
+        self.assertEqual(len(delays), 1)
+        self.assertGreater(delays[0], 0)
+        self.assertEqual(self.converter.rate_limiter.summary()["docs.example.com"]["requests"], 2)
+
+    def test_failed_render_is_recorded(self):
+        def boom(url):  # noqa: ARG001
+            raise TimeoutError("render timed out")
+
+        self.converter._render_with_browser = boom
+        self.converter.scrape_page("https://docs.example.com/a")
+
+        self.assertEqual(self.converter.pages, [])
+        stats = self.converter.rate_limiter.summary()["docs.example.com"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertIsNotNone(stats["avg_latency"])
+
+
+if __name__ == "__main__":
+    unittest.main()
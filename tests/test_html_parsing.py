@@ -7,9 +7,14 @@ from bs4 import BeautifulSoup
 
 from skill_seekers.cli import html_parsing
 from skill_seekers.cli.html_parsing import (
+    LXML_PARSER_CHAIN,
     PARSER_CHAIN,
+    ParseTimings,
     available_parsers,
+    lexbor_available,
     parse_html,
+    parse_html_lexbor,
+    parser_chain,
 )
 
 WELL_FORMED = "<html><body><div id='main'><p>Documentation content</p></div></body></html>"
@@ -121,3 +126,105 @@ class TestScraperIntegration:
         src = inspect.getsource(html_scraper)
         assert 'BeautifulSoup(raw_html, "html.parser")' not in src
         assert "parse_html(" in src
+
+
+class TestParserEngines:
+    def test_default_engine_is_html_parser(self, monkeypatch):
+        monkeypatch.delenv(html_parsing.PARSER_ENGINE_ENV, raising=False)
+        assert parser_chain() == PARSER_CHAIN
+
+    def test_lxml_engine_tries_lxml_first(self):
+        assert parser_chain("lxml")[0] == "lxml"
+        # Same fallbacks as the default chain
+        assert set(parser_chain("lxml")) == set(PARSER_CHAIN)
+
+    def test_env_selects_engine(self, monkeypatch):
+        monkeypatch.setenv(html_parsing.PARSER_ENGINE_ENV, "lxml")
+        assert parser_chain() == LXML_PARSER_CHAIN
+
+    def test_unknown_engine_falls_back(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            assert parser_chain("no-such-engine") == PARSER_CHAIN
+        assert any("Unknown HTML parser engine" in r.message for r in caplog.records)
+
+    @pytest.mark.skipif("lxml" not in available_parsers(), reason="lxml not installed")
+    def test_lxml_chain_keeps_fallback_on_empty_tree(self):
+        soup = parse_html(WELL_FORMED, parsers=LXML_PARSER_CHAIN)
+        assert soup.find("p").get_text() == "Documentation content"
+
+
+class TestParseTimings:
+    def test_parse_html_records_timing(self):
+        html_parsing.PARSE_TIMINGS.reset()
+        parse_html(WELL_FORMED)
+        stats = html_parsing.PARSE_TIMINGS.snapshot()
+        assert stats["html.parser"]["count"] == 1
+        assert sum(stats["html.parser"]["buckets"].values()) == 1
+
+    def test_histogram_buckets_and_merge(self):
+        timings = ParseTimings()
+        timings.record("lxml", 0.0005)
+        timings.record("lxml", 0.030)
+        timings.record("lxml", 5.0)
+
+        other = ParseTimings()
+        other.merge(timings.drain())
+        stats = other.snapshot()["lxml"]
+
+        assert timings.snapshot() == {}
+        assert stats["count"] == 3
+        assert stats["buckets"]["<=1ms"] == 1
+        assert stats["buckets"]["<=50ms"] == 1
+        assert stats["buckets"][">1000ms"] == 1
+        assert "lxml: 3 parses" in other.format_report()
+
+
+_DOC_PAGE = """<!DOCTYPE html><html><head><title>Widget API  Reference</title></head>
+<body>
+<nav><a href="/docs/intro">Intro</a> <a href="/docs/api?utm_source=x#top">API</a>
+<a href="https://elsewhere.example/">Off-site</a></nav>
+<div role="main"><h1 id="widget">Widget &amp; friends</h1>
+<p>The widget module creates widgets that render documentation pages.</p>
+<h2>Install</h2>
+<div class="note"><p>Example: create a widget and render it to a page.</p></div>
+<pre class="language-python"><code>from widget import Widget
+w = Widget(name="demo")
+w.render()</code></pre>
+<h3 id>Shell</h3>
+<pre><code class="language-bash">pip install widget --upgrade</code></pre>
+<p>Short.</p>
+<p>Usage: call <code>render()</code> after configuring every widget option.</p>
+<pre><code>def configure(widget):
+    widget.size = 3
+    return widget</code></pre>
+</div></body></html>"""
+
+
+@pytest.mark.skipif(not lexbor_available(), reason="selectolax not installed")
+class TestLexborExtractionParity:
+    """The selectolax fast path must match BeautifulSoup extract_content."""
+
+    def _converter(self, tmp_path, monkeypatch, engine):
+        from skill_seekers.cli.doc_scraper import DocToSkillConverter
+
+        monkeypatch.chdir(tmp_path)
+        config = {
+            "name": "parity",
+            "base_url": "https://example.com/docs/",
+            "html_parser": engine,
+        }
+        return DocToSkillConverter(config, dry_run=True)
+
+    def test_page_dict_matches_beautifulsoup(self, tmp_path, monkeypatch):
+        url = "https://example.com/docs/widget"
+        expected = self._converter(tmp_path, monkeypatch, "html.parser")._extract_html(
+            _DOC_PAGE, url
+        )
+        fast = self._converter(tmp_path, monkeypatch, "selectolax")._extract_html(_DOC_PAGE, url)
+
+        assert expected["code_samples"] and expected["patterns"]
+        assert fast == expected
+
+    def test_swallowed_markup_falls_back(self):
+        assert parse_html_lexbor(UNTERMINATED_COMMENT) is None
+        assert parse_html_lexbor(WELL_FORMED) is not None
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Tests for the conditional-GET page cache (http_cache.HttpPageCache) and its
+use by DocToSkillConverter re-scrapes.
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from skill_seekers.cli.doc_scraper import DocToSkillConverter
+from skill_seekers.cli.http_cache import HttpPageCache
+
+_PAGES = {
+    "/docs/": '<a href="/docs/a">A</a> <a href="/docs/b">B</a>',
+    "/docs/a": '<a href="/docs/">Home</a>',
+    "/docs/b": '<a href="/docs/">Home</a>',
+}
+
+
+def _html(path: str, version: int) -> bytes:
+    return (
+        f"<html><head><title>Page {path}</title></head><body><nav>{_PAGES[path]}</nav>"
+        f"<article><h1>Page {path}</h1>"
+        f"<p>Version {version} of {path} documents a feature in enough detail.</p>"
+        f"</article></body></html>"
+    ).encode()
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Serve _PAGES with ETags; answer 304 when If-None-Match matches."""
+
+    version = 1
+    status_counts: dict[int, int] = {}
+
+    def do_GET(self):
+        cls = type(self)
+        path = self.path.split("?")[0]
+        if path not in _PAGES:
+            self._count(404)
+            self.send_error(404)
+            return
+        etag = f'"{path}-v{cls.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._count(304)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = _html(path, cls.version)
+        self._count(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _count(self, status: int) -> None:
+        counts = type(self).status_counts
+        counts[status] = counts.get(status, 0) + 1
+
+    def log_message(self, format, *args):  # noqa: ARG002
+        pass  # Suppress request logging during tests
+
+
+class TestHttpPageCache(unittest.TestCase):
+    """Unit tests for the cache itself."""
+
+    def setUp(self):
+        self.cache = HttpPageCache()
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_roundtrip(self):
+        page = {"url": "https://x/docs/", "title": "T", "links": []}
+        stored = self.cache.store(
+            "https://x/docs/", {"ETag": '"abc"', "Last-Modified": "Mon"}, b"<html/>", page
+        )
+        self.assertTrue(stored)
+
+        entry = self.cache.get("https://x/docs/")
+        self.assertEqual(entry.body, b"<html/>")
+        self.assertEqual(entry.page, page)
+        self.assertEqual(
+            HttpPageCache.conditional_headers(entry),
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Mon"},
+        )
+
+    def test_response_without_validator_not_stored(self):
+        self.assertFalse(self.cache.store("https://x/", {}, b"body"))
+        self.assertIsNone(self.cache.get("https://x/"))
+        self.assertEqual(HttpPageCache.conditional_headers(None), {})
+
+    def test_corrupt_entry_is_a_miss(self):
+        self.cache.conn.execute(
+            "INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+            ("https://x/", '"e"', None, b"not zlib", None, "now"),
+        )
+        self.assertIsNone(self.cache.get("https://x/"))
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "sub", "http_cache.db")
+            with HttpPageCache(db_path) as cache:
+                cache.store("https://x/", {"ETag": '"1"'}, b"body")
+            with HttpPageCache(db_path) as cache:
+                self.assertEqual(cache.get("https://x/").etag, '"1"')
+
+
+@pytest.mark.serial
+class TestConditionalRescrape(unittest.TestCase):
+    """Re-scrapes revalidate with If-None-Match and reuse cached pages on 304."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+        cls.server.daemon_threads = True
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/docs/"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        _ETagHandler.version = 1
+        _ETagHandler.status_counts = {}
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+
+    def _scrape(self, **overrides) -> DocToSkillConverter:
+        config = {
+            "name": "cache_test",
+            "base_url": self.base_url,
+            "selectors": {"main_content": "article"},
+            "rate_limit": 0,
+            "max_retries": 1,
+            "skip_llms_txt": True,
+            "max_pages": -1,
+            "http_cache": True,
+        }
+        config.update(overrides)
+        converter = DocToSkillConverter(config)
+        # Skip sitemap/llms.txt discovery: the fixture serves only HTML pages
+        converter._try_sitemap = lambda: []
+        if converter.async_mode:
+            asyncio.run(converter.scrape_all_async())
+        else:
+            converter.scrape_all()
+        return converter
+
+    def _assert_second_run_revalidates(self, **overrides):
+        first = self._scrape(**overrides)
+        self.assertEqual(_ETagHandler.status_counts, {200: 3})
+
+        _ETagHandler.status_counts = {}
+        second = self._scrape(**overrides)
+
+        self.assertEqual(_ETagHandler.status_counts, {304: 3})
+        self.assertEqual(second.http_cache.hits, 3)
+        by_url = {p["url"]: p for p in first.pages}
+        self.assertEqual({p["url"]: p for p in second.pages}, by_url)
+
+    def test_sync_rescrape_uses_304(self):
+        self._assert_second_run_revalidates()
+
+    def test_async_rescrape_uses_304(self):
+        self._assert_second_run_revalidates(async_mode=True, workers=2, parse_workers=0)
+
+    def test_changed_page_is_downloaded_again(self):
+        self._scrape()
+        _ETagHandler.version = 2
+        _ETagHandler.status_counts = {}
+
+        converter = self._scrape()
+
+        self.assertEqual(_ETagHandler.status_counts, {200: 3})
+        self.assertTrue(all("Version 2" in p["content"] for p in converter.pages))
+
+    def test_cache_closed_after_crawl(self):
+        for overrides in ({}, {"async_mode": True, "workers": 2, "parse_workers": 0}):
+            converter = self._scrape(**overrides)
+            with self.assertRaises(sqlite3.ProgrammingError):
+                converter.http_cache.size()
+
+    def test_converter_reusable_after_crawl(self):
+        converter = self._scrape()
+        pages = len(converter.pages)
+
+        # Between crawls the closed cache is skipped instead of failing every page
+        _ETagHandler.status_counts = {}
+        converter.scrape_page(self.base_url)
+        self.assertEqual(_ETagHandler.status_counts, {200: 1})
+        self.assertEqual(len(converter.pages), pages + 1)
+
+        # The next crawl reopens it
+        _ETagHandler.status_counts = {}
+        converter._open_http_cache()
+        converter.scrape_page(self.base_url)
+        self.assertEqual(_ETagHandler.status_counts, {304: 1})
+        self.assertEqual(converter.http_cache.hits, 1)
+        converter._close_http_cache()
+
+    def test_cache_disabled_sends_no_validators(self):
+        converter = DocToSkillConverter({"name": "nocache", "base_url": self.base_url})
+        self.assertIsNone(converter.http_cache)
+        self.assertIsNone(converter._cached_response(self.base_url))
+
+
+if __name__ == "__main__":
+    unittest.main()
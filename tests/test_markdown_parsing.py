@@ -393,9 +393,7 @@ class TestSavePageContentFiltering(unittest.TestCase):
 
         self.converter.save_page(page)
 
-        pages_dir = os.path.join(self.converter.data_dir, "pages")
-        if os.path.exists(pages_dir):
-            self.assertEqual(len(os.listdir(pages_dir)), 0)
+        self.assertEqual(len(self.converter.page_store), 0)
 
     def test_skip_short_content_under_50_chars(self):
         """Test that pages with content < 50 chars are skipped."""
@@ -409,9 +407,7 @@ class TestSavePageContentFiltering(unittest.TestCase):
 
         self.converter.save_page(page)
 
-        pages_dir = os.path.join(self.converter.data_dir, "pages")
-        if os.path.exists(pages_dir):
-            self.assertEqual(len(os.listdir(pages_dir)), 0)
+        self.assertEqual(len(self.converter.page_store), 0)
 
     def test_save_content_over_50_chars(self):
         """Test that pages with content >= 50 chars are saved."""
@@ -425,9 +421,8 @@ class TestSavePageContentFiltering(unittest.TestCase):
 
         self.converter.save_page(page)
 
-        pages_dir = os.path.join(self.converter.data_dir, "pages")
-        self.assertTrue(os.path.exists(pages_dir))
-        self.assertEqual(len(os.listdir(pages_dir)), 1)
+        self.assertEqual(len(self.converter.page_store), 1)
+        self.assertEqual(self.converter.page_store.get(page["url"]), page)
 
 
 class TestLlmsTxtParseMarkdown(unittest.TestCase):
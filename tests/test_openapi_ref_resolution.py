@@ -0,0 +1,168 @@
+"""
+Tests for $ref resolution and schema flattening in the OpenAPI converter:
+reference cycles, memoized flattening, and a large synthetic spec.
+"""
+
+import time
+
+import pytest
+
+from skill_seekers.cli.openapi_scraper import OpenAPIToSkillConverter
+
+
+def _ref(name: str) -> dict:
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def _spec(schemas: dict, paths: dict | None = None) -> dict:
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Test API", "version": "1.0"},
+        "paths": paths or {},
+        "components": {"schemas": schemas},
+    }
+
+
+def _object(**properties) -> dict:
+    return {"type": "object", "properties": properties}
+
+
+@pytest.fixture
+def converter(tmp_path):
+    return OpenAPIToSkillConverter({"name": "test-api", "output_dir": str(tmp_path)})
+
+
+def test_self_reference_is_stubbed(converter):
+    spec = _spec({"Node": _object(value={"type": "string"}, children=_ref("Node"))})
+
+    node = converter._flatten_schema(_ref("Node"), spec)
+    assert node["_ref_name"] == "Node"
+    assert node["properties"]["children"] == {
+        "type": "object",
+        "_ref_name": "Node",
+        "_circular_ref": True,
+    }
+
+
+def test_memoized_schema_depends_on_its_cycle(converter):
+    # A and B reference each other; C references A without being in the cycle
+    spec = _spec(
+        {
+            "A": _object(b=_ref("B")),
+            "B": _object(a=_ref("A")),
+            "C": _object(a=_ref("A")),
+        }
+    )
+
+    via_b = converter._flatten_schema(_ref("B"), spec)["properties"]["a"]
+    via_c = converter._flatten_schema(_ref("C"), spec)["properties"]["a"]
+
+    # Same ref at the same depth, but only inside B is the B expansion a cycle
+    assert via_b["properties"]["b"]["_circular_ref"] is True
+    assert via_c["properties"]["b"]["properties"]["a"]["_circular_ref"] is True
+
+
+def test_shared_schema_is_flattened_once_per_depth(converter):
+    spec = _spec(
+        {
+            "Address": _object(city={"type": "string"}),
+            "User": _object(home=_ref("Address"), work=_ref("Address")),
+            "Order": _object(shipping=_ref("Address"), billing=_ref("Address")),
+        }
+    )
+    user = converter._flatten_schema(_ref("User"), spec)
+    order = converter._flatten_schema(_ref("Order"), spec)
+
+    assert user["properties"]["home"] == order["properties"]["billing"]
+    assert user["properties"]["home"]["properties"]["city"] == {"type": "string"}
+    # The second Address reference at the same depth comes from the memo
+    index = converter._get_ref_index(spec)
+    assert len([k for k in index.flattened if k[0].endswith("/Address")]) == 1
+    # Returned copies are independent at the top level
+    user["properties"]["home"]["extra"] = True
+    assert "extra" not in order["properties"]["shipping"]
+
+
+def test_unresolvable_ref_is_stubbed(converter):
+    spec = _spec({"A": _object(missing=_ref("Missing"))})
+
+    flat = converter._flatten_schema(_ref("A"), spec)
+    assert flat["properties"]["missing"] == {
+        "type": "object",
+        "$ref": "#/components/schemas/Missing",
+        "_ref_name": "Missing",
+    }
+
+
+def test_ref_index_is_rebuilt_for_a_new_spec(converter):
+    first = _spec({"A": _object(x={"type": "string"})})
+    second = _spec({"A": _object(x={"type": "integer"})})
+
+    assert converter._flatten_schema(_ref("A"), first)["properties"]["x"]["type"] == "string"
+    assert converter._flatten_schema(_ref("A"), second)["properties"]["x"]["type"] == "integer"
+
+
+def _large_spec(layers: int = 6, width: int = 40, endpoints: int = 2000) -> dict:
+    """GitHub/Stripe-shaped spec: layered shared models, each referencing
+    three models of the next layer, plus a few reference cycles."""
+    schemas = {}
+    for layer in range(layers):
+        for i in range(width):
+            properties = {"id": {"type": "string"}, "name": {"type": "string"}}
+            if layer + 1 < layers:
+                properties["parent"] = _ref(f"L{layer + 1}M{i}")
+                properties["items"] = {
+                    "type": "array",
+                    "items": _ref(f"L{layer + 1}M{(i + 1) % width}"),
+                }
+                properties["meta"] = {"allOf": [_ref(f"L{layer + 1}M{(i + 2) % width}")]}
+            elif i % 10 == 0:
+                properties["owner"] = _ref(f"L{layer - 1}M{i}")  # a two-schema cycle
+            schemas[f"L{layer}M{i}"] = _object(**properties)
+
+    paths = {}
+    for n in range(endpoints // 2):
+        model = _ref(f"L0M{n % width}")
+        paths[f"/resources/{n}"] = {
+            "get": {
+                "operationId": f"get{n}",
+                "responses": {
+                    "200": {"description": "OK", "content": {"application/json": {"schema": model}}}
+                },
+            },
+            "post": {
+                "operationId": f"create{n}",
+                "requestBody": {"content": {"application/json": {"schema": model}}},
+                "responses": {"201": {"description": "Created"}},
+            },
+        }
+    return _spec(schemas, paths)
+
+
+def test_large_spec_extraction(converter):
+    spec = _large_spec()
+
+    result = converter._parse_openapi_3(spec)
+
+    assert len(result["endpoints"]) == 2000
+    assert len(result["schemas"]) == 240
+    post = next(e for e in result["endpoints"] if e["method"] == "POST")
+    body = post["request_body"]["content"]["application/json"]["schema"]
+    assert body["properties"]["parent"]["_ref_name"].startswith("L1M")
+
+    index = converter._get_ref_index(spec)
+    # Every pointer is walked once, however often it is referenced
+    assert len(index._targets) == 240
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+def test_large_spec_extraction_time(converter):
+    spec = _large_spec()
+
+    start = time.perf_counter()
+    converter._parse_openapi_3(spec)
+    elapsed = time.perf_counter() - start
+    print(f"\n  2000 endpoints, 240 shared schemas: extracted in {elapsed:.2f}s")
+
+    assert elapsed < 30
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-file page store (page_store.PageStore) and the streaming
+build_skill path in DocToSkillConverter.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from skill_seekers.cli.doc_scraper import DocToSkillConverter
+from skill_seekers.cli.page_store import PageStore, PageView
+
+
+def _page(n: int, section: str = "guide", **extra) -> dict:
+    page = {
+        "url": f"https://example.com/docs/{section}/page{n}",
+        "title": f"{section.title()} {n}",
+        "content": f"Page {n} of the {section} section explains a feature in detail.",
+        "headings": [{"level": "h2", "text": f"Heading {n}"}],
+        "code_samples": [{"code": f"call_{section}({n})", "language": "python"}],
+        "patterns": [{"description": f"Call {section} {n}", "code": f"call_{section}({n})"}],
+        "links": [],
+    }
+    page.update(extra)
+    return page
+
+
+class TestPageStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = PageStore(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_empty_store(self):
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(list(self.store), [])
+        self.assertFalse(self.store.path.exists())
+
+    def test_append_and_stream(self):
+        pages = [_page(i) for i in range(5)]
+        for page in pages:
+            self.store.append(page)
+
+        self.assertEqual(list(self.store), pages)
+        self.assertEqual(len(PageStore(self.temp_dir)), 5)
+        self.assertEqual(self.store.get(pages[3]["url"]), pages[3])
+        self.assertIn(pages[0]["url"], self.store)
+
+    def test_resave_supersedes_and_compacts(self):
+        self.store.append(_page(1))
+        self.store.append(_page(2))
+        updated = _page(1, content="Rewritten content for page one, long enough to be kept.")
+        self.store.append(updated)
+
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(list(self.store)[0], updated)
+        self.assertGreater(self.store.stale_bytes, 0)
+
+        self.store.compact()
+        self.assertEqual(self.store.stale_bytes, 0)
+        self.assertEqual(len(self.store.path.read_text(encoding="utf-8").splitlines()), 2)
+        reopened = PageStore(self.temp_dir)
+        self.assertEqual(list(reopened), [updated, _page(2)])
+        self.assertEqual(reopened.stale_bytes, 0)
+
+    def test_missing_index_is_rebuilt(self):
+        for i in range(3):
+            self.store.append(_page(i))
+        self.store.index_path.unlink()
+
+        reopened = PageStore(self.temp_dir)
+        self.assertEqual(list(reopened), [_page(i) for i in range(3)])
+        self.assertTrue(reopened.index_path.exists())
+
+    def test_torn_write_is_dropped(self):
+        self.store.append(_page(0))
+        self.store.append(_page(1))
+        with open(self.store.path, "ab") as f:
+            f.write(b'{"url": "https://example.com/partial", "tit')
+
+        reopened = PageStore(self.temp_dir)
+        self.assertEqual(list(reopened), [_page(0), _page(1)])
+        reopened.append(_page(2))
+        self.assertEqual(list(PageStore(self.temp_dir)), [_page(i) for i in range(3)])
+
+    def test_legacy_pages_dir_is_read_and_shadowed(self):
+        legacy_dir = Path(self.temp_dir) / "pages"
+        legacy_dir.mkdir()
+        for i in range(3):
+            with open(legacy_dir / f"Guide_{i}.json", "w", encoding="utf-8") as f:
+                json.dump(_page(i), f, indent=2)
+        (legacy_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+        newer = _page(1, title="Guide 1 (re-scraped)")
+        self.store.append(newer)
+
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.get(newer["url"]), newer)
+        self.assertEqual(
+            sorted(p["title"] for p in self.store),
+            sorted(["Guide 0", "Guide 1 (re-scraped)", "Guide 2"]),
+        )
+
+    def test_view_is_lazy_sequence(self):
+        for i in range(6):
+            self.store.append(_page(i))
+        refs = [ref for ref, page in self.store.items() if int(page["url"][-1]) % 2 == 0]
+
+        view = self.store.view(refs)
+        self.assertIsInstance(view, PageView)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(view[1], _page(2))
+        self.assertEqual(list(view[:2]), [_page(0), _page(2)])
+        self.assertEqual([p["url"] for p in view], [_page(i)["url"] for i in (0, 2, 4)])
+
+
+class TestStreamingBuild(unittest.TestCase):
+    """build_skill over the page store produces the same skill as the list path."""
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        self.pages = [
+            _page(i, section) for section in ("guide", "api", "tutorial") for i in range(4)
+        ]
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _converter(self, name: str) -> DocToSkillConverter:
+        return DocToSkillConverter({"name": name, "base_url": "https://example.com/docs/"})
+
+    def _references(self, converter: DocToSkillConverter) -> dict[str, str]:
+        ref_dir = Path(converter.skill_dir) / "references"
+        return {p.name: p.read_text(encoding="utf-8") for p in sorted(ref_dir.glob("*.md"))}
+
+    def test_store_build_matches_in_memory_build(self):
+        streamed = self._converter("streamed")
+        for page in self.pages:
+            streamed.save_page(page)
+        self.assertTrue(streamed.build_skill())
+
+        in_memory = self._converter("in_memory")
+        categories = in_memory.smart_categorize(self.pages)
+        for cat, cat_pages in categories.items():
+            self.assertIsInstance(cat_pages, list)
+            in_memory.create_reference_file(cat, cat_pages)
+
+        store_categories = streamed.smart_categorize(streamed.page_store)
+        self.assertEqual(
+            {cat: [p["url"] for p in v] for cat, v in store_categories.items()},
+            {cat: [p["url"] for p in v] for cat, v in categories.items()},
+        )
+        self.assertEqual(
+            streamed.generate_quick_reference(streamed.page_store),
+            in_memory.generate_quick_reference(self.pages),
+        )
+        streamed_refs = self._references(streamed)
+        streamed_refs.pop("index.md")
+        self.assertEqual(
+            {k: v.replace("Streamed", "In_Memory") for k, v in streamed_refs.items()},
+            self._references(in_memory),
+        )
+
+    def test_build_from_legacy_pages_dir(self):
+        converter = self._converter("legacy")
+        legacy_dir = Path(converter.data_dir) / "pages"
+        legacy_dir.mkdir(parents=True)
+        for i, page in enumerate(self.pages):
+            with open(legacy_dir / f"page_{i}.json", "w", encoding="utf-8") as f:
+                json.dump(page, f, indent=2)
+
+        self.assertTrue(converter.build_skill())
+        self.assertEqual(len(converter.load_scraped_data()), len(self.pages))
+        self.assertTrue((Path(converter.skill_dir) / "SKILL.md").exists())
+        self.assertFalse(Path(converter.page_store.path).exists())
+
+    def test_empty_store_fails_build(self):
+        self.assertFalse(self._converter("empty").build_skill())
+
+
+if __name__ == "__main__":
+    unittest.main()
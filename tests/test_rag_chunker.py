@@ -205,6 +205,51 @@ class TestRAGChunker:
         assert "overview" in categories  # From SKILL.md
         assert "getting_started" in categories or "api" in categories  # From references
 
+    def test_chunk_skill_parallel_matches_sequential(self, tmp_path):
+        """chunk_skill(workers=N) returns the same chunks in the same order."""
+        skill_dir = tmp_path / "test_skill"
+        references_dir = skill_dir / "references"
+        references_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Main Skill\n\n" + "Overview text. " * 300)
+        for i in range(5):
+            (references_dir / f"ref_{i}.md").write_text(
+                f"# Reference {i}\n\n" + f"Paragraph for reference {i}.\n\n" * 200
+            )
+
+        chunker = RAGChunker(chunk_size=64, chunk_overlap=8, min_chunk_size=10)
+        sequential = chunker.chunk_skill(skill_dir)
+        parallel = chunker.chunk_skill(skill_dir, workers=3)
+
+        assert parallel == sequential
+        assert len({chunk["metadata"]["source_file"] for chunk in parallel}) == 6
+
+    def test_chunk_documents_falls_back_when_pool_breaks(self, monkeypatch):
+        """A dead worker pool degrades to in-process chunking."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        from skill_seekers.cli import rag_chunker
+
+        class _BrokenPool:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+        monkeypatch.setattr(rag_chunker, "ProcessPoolExecutor", _BrokenPool)
+        chunker = RAGChunker(chunk_size=50)
+        documents = [("Some text. " * 100, {"source": f"doc{i}"}, None) for i in range(3)]
+
+        assert chunker.chunk_documents(documents, workers=2) == [
+            chunker.chunk_document(*document) for document in documents
+        ]
+
     def test_save_chunks(self, tmp_path):
         """Test saving chunks to JSON file."""
         chunker = RAGChunker()
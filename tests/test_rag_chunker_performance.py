@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Parity and performance tests for the linear-time RAGChunker.
+
+The boundary search, splitting and code-block reinsertion were rewritten to
+bisect over boundary offsets instead of re-slicing the document; output must
+stay byte-identical to the original implementation, kept below as
+``_ReferenceChunker``.
+
+Usage:
+    pytest tests/test_rag_chunker_performance.py -v
+    pytest tests/test_rag_chunker_performance.py -v -m benchmark -s
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from skill_seekers.cli.rag_chunker import RAGChunker
+
+
+class _ReferenceChunker(RAGChunker):
+    """The pre-rewrite algorithm, verbatim, as the parity oracle."""
+
+    def _reinsert_code_blocks(self, chunks: list[str], code_blocks: list[dict]) -> list[str]:
+        result = []
+        for chunk in chunks:
+            for block in code_blocks:
+                placeholder = f"<<CODE_BLOCK_{block['index']}>>"
+                if placeholder in chunk:
+                    chunk = chunk.replace(placeholder, block["content"])
+            result.append(chunk)
+        return result
+
+    def _find_semantic_boundaries(self, text: str) -> list[int]:
+        boundaries = [0]
+        if self.preserve_paragraphs:
+            for match in re.finditer(r"\n\n+", text):
+                boundaries.append(match.end())
+        for match in re.finditer(r"\n#{1,6}\s+.+\n", text):
+            boundaries.append(match.start())
+        for match in re.finditer(r"\n", text):
+            boundaries.append(match.start())
+        target_size_chars = self.chunk_size * self.chars_per_token
+        if len(text) > target_size_chars:
+            expected_chunks = len(text) // target_size_chars
+            if len(boundaries) < expected_chunks:
+                for i in range(target_size_chars, len(text), target_size_chars):
+                    if i not in boundaries:
+                        boundaries.append(i)
+        boundaries.append(len(text))
+        return sorted(set(boundaries))
+
+    def _split_with_overlap(self, text: str, boundaries: list[int]) -> list[str]:
+        chunks = []
+        target_size_chars = self.chunk_size * self.chars_per_token
+        overlap_chars = self.chunk_overlap * self.chars_per_token
+        min_size_chars = self.min_chunk_size * self.chars_per_token
+        if len(text) <= target_size_chars:
+            if text.strip():
+                return [text]
+            return []
+        i = 0
+        while i < len(boundaries) - 1:
+            start_pos = boundaries[i]
+            j = i + 1
+            while j < len(boundaries):
+                potential_end = boundaries[j]
+                potential_chunk = text[start_pos:potential_end]
+                if len(potential_chunk) > target_size_chars:
+                    if j > i + 1:
+                        j -= 1
+                    break
+                j += 1
+            if j == i + 1:
+                j = min(i + 2, len(boundaries))
+            end_pos = boundaries[min(j, len(boundaries) - 1)]
+            chunk_text = text[start_pos:end_pos]
+            if chunk_text.strip() and (
+                len(text) <= target_size_chars or len(chunk_text) >= min_size_chars
+            ):
+                chunks.append(chunk_text)
+            if j < len(boundaries) - 1:
+                overlap_start = max(start_pos, end_pos - overlap_chars)
+                overlap_boundary_idx = min(j - 1, i + 1)
+                for k in range(i + 1, j):
+                    if boundaries[k] >= overlap_start:
+                        overlap_boundary_idx = k
+                        break
+                i = overlap_boundary_idx if overlap_boundary_idx > i else i + 1
+            else:
+                break
+        return chunks
+
+
+_WORDS = [
+    "api",
+    "hook",
+    "state",
+    "render",
+    "props",
+    "effect",
+    "query",
+    "cache",
+    "index",
+    "token",
+    "vector",
+    "schema",
+]
+
+
+def _document(size: int, seed: int = 0, line_len: int = 80, code_every: int = 12) -> str:
+    """Markdown-ish document of about ``size`` characters."""
+    rng = random.Random(seed)
+    parts: list[str] = []
+    total = 0
+    n = 0
+    while total < size:
+        n += 1
+        if n % code_every == 0:
+            part = f"```python\ndef f{n}(x):\n    return x * {n}\n```\n\n"
+        elif n % 7 == 0:
+            part = f"\n## Section {n}\n\n"
+        else:
+            words = " ".join(rng.choice(_WORDS) for _ in range(max(1, line_len // 6)))
+            part = words + ("\n\n" if rng.random() < 0.3 else "\n")
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)
+
+
+def _chunks(chunker: RAGChunker, text: str) -> list[str]:
+    return [c["page_content"] for c in chunker.chunk_document(text, {"source": "t"})]
+
+
+_DOCUMENTS = {
+    "markdown": _document(40_000),
+    "long_lines": _document(40_000, seed=1, line_len=900),
+    "single_line": "word " * 12_000,
+    "sparse_newlines": ("x" * 3_000 + "\n") * 10,
+    "whitespace_runs": ("text line\n" + " \t  \n" * 40 + "\x1c\x1f\n") * 60,
+    "code_heavy": _document(30_000, seed=2, code_every=2),
+    "headers_only": "".join(f"\n# H{i}\n" for i in range(3_000)),
+    "placeholder_text": "Literal <<CODE_BLOCK_1>> and <<CODE_BLOCK_01>> text.\n" * 200
+    + "```\ncode <<CODE_BLOCK_0>> inside\n```\n"
+    + "```\nsecond\n```\n" * 3,
+    "unicode": ("Ünïcødé 文档 ✓ " * 20 + "\n") * 150,
+    "tiny": "short text",
+    "blank": " \n\n\t \n",
+}
+
+_PARAMS = [
+    {},
+    {"chunk_size": 50, "chunk_overlap": 10, "min_chunk_size": 5},
+    {"chunk_size": 200, "chunk_overlap": 0, "min_chunk_size": 0},
+    {"chunk_size": 128, "chunk_overlap": 127, "preserve_paragraphs": False},
+    {"chunk_size": 64, "chunk_overlap": 20, "preserve_code_blocks": False},
+]
+
+
+class TestChunkerParity:
+    """The rewritten chunker emits exactly what the original did."""
+
+    @pytest.mark.parametrize("params", _PARAMS, ids=lambda p: ",".join(map(str, p.values())))
+    @pytest.mark.parametrize("name", sorted(_DOCUMENTS))
+    def test_chunks_match_reference(self, name, params):
+        text = _DOCUMENTS[name]
+        assert _chunks(RAGChunker(**params), text) == _chunks(_ReferenceChunker(**params), text)
+
+    @pytest.mark.parametrize("name", sorted(_DOCUMENTS))
+    def test_boundaries_match_reference(self, name):
+        text = _DOCUMENTS[name]
+        for params in _PARAMS:
+            assert RAGChunker(**params)._find_semantic_boundaries(text) == _ReferenceChunker(
+                **params
+            )._find_semantic_boundaries(text)
+
+    def test_random_documents_match_reference(self):
+        rng = random.Random(42)
+        alphabet = ["a", "b", " ", "\n", "\n\n", "# ", "\t", "```\n", "<<CODE_BLOCK_0>>"]
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 3_000)))
+            params = {
+                "chunk_size": rng.randint(2, 120),
+                "chunk_overlap": rng.randint(0, 60),
+                "min_chunk_size": rng.randint(0, 30),
+                "preserve_paragraphs": rng.random() < 0.5,
+            }
+            assert _chunks(RAGChunker(**params), text) == _chunks(
+                _ReferenceChunker(**params), text
+            ), params
+
+    def test_nested_placeholder_in_code_block(self):
+        chunker = RAGChunker()
+        blocks = [
+            {"index": 0, "content": "```\nsee <<CODE_BLOCK_1>>\n```"},
+            {"index": 1, "content": "```\ninner\n```"},
+        ]
+        chunks = ["<<CODE_BLOCK_0>> and <<CODE_BLOCK_1>>"]
+        assert chunker._reinsert_code_blocks(
+            chunks, blocks
+        ) == _ReferenceChunker()._reinsert_code_blocks(chunks, blocks)
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+class TestChunkerBenchmark:
+    """Chunking time grows linearly from 10 KB to 50 MB documents."""
+
+    SIZES = (10_000, 1_000_000, 10_000_000, 50_000_000)
+
+    @staticmethod
+    def _time(chunker: RAGChunker, text: str) -> float:
+        start = time.perf_counter()
+        chunker.chunk_document(text, {"source": "bench"})
+        return time.perf_counter() - start
+
+    def test_scales_linearly(self):
+        chunker = RAGChunker()
+        per_mb = {}
+        for size in self.SIZES:
+            text = _document(size)
+            elapsed = self._time(chunker, text)
+            per_mb[size] = elapsed / (len(text) / 1_000_000)
+            print(
+                f"\n{size / 1_000_000:>7.2f} MB: {elapsed * 1000:9.1f} ms ({per_mb[size]:.3f} s/MB)"
+            )
+
+        # Throughput at 50 MB stays within a small factor of 1 MB
+        assert per_mb[50_000_000] < 3 * per_mb[1_000_000]
+
+    def test_faster_than_reference(self):
+        for name, text in (
+            ("markdown", _document(1_000_000)),
+            ("long_lines", _document(1_000_000, seed=1, line_len=900)),
+        ):
+            new = self._time(RAGChunker(), text)
+            old = self._time(_ReferenceChunker(), text)
+            print(f"\n{name} 1 MB: {new * 1000:.1f} ms vs reference {old * 1000:.1f} ms")
+            assert new < old
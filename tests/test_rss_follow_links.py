@@ -0,0 +1,142 @@
+"""
+Tests for RssToSkillConverter's link following: concurrent fetches with
+per-host politeness, the global time budget, and conditional-GET reuse of
+articles fetched on an earlier run.
+"""
+
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from skill_seekers.cli import rss_scraper
+from skill_seekers.cli.rss_scraper import RssToSkillConverter
+
+# Loopback addresses that are distinct hosts to the rate limiter
+HOSTS = ("127.0.0.1", "localhost", "127.1")
+
+
+class _FakeBlogs(BaseHTTPRequestHandler):
+    """Article pages with an ETag; answers 304 when it matches."""
+
+    latency = 0.0
+    requests: dict[str, list[float]] = defaultdict(list)
+    revalidated: list[str] = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        host = self.headers["Host"].rsplit(":", 1)[0]
+        with cls.lock:
+            cls.requests[host].append(time.monotonic())
+        time.sleep(cls.latency)
+
+        body = (
+            f"<html><body><article><h1>Post {self.path}</h1>"
+            f"<p>Body of {self.path} on {host}.</p></article></body></html>"
+        ).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            with cls.lock:
+                cls.revalidated.append(self.path)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: ARG002
+        pass  # Suppress request logging during tests
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FakeBlogs)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+
+
+@pytest.fixture
+def blogs(server, monkeypatch):
+    _FakeBlogs.latency = 0.25
+    _FakeBlogs.requests = defaultdict(list)
+    _FakeBlogs.revalidated = []
+    monkeypatch.setattr(rss_scraper, "_REQUEST_DELAY", 0.2)
+    monkeypatch.setattr(rss_scraper, "_FOLLOW_TIME_BUDGET", 1.5)
+    return server
+
+
+def _articles(port: int, hosts=HOSTS, per_host: int = 5) -> list[dict]:
+    return [
+        {"title": f"Post {n}", "link": f"http://{host}:{port}/posts/{n}"}
+        for n in range(per_host)
+        for host in hosts
+    ]
+
+
+def _converter(tmp_path) -> RssToSkillConverter:
+    return RssToSkillConverter({"name": "blog", "output_dir": str(tmp_path / "blog")})
+
+
+def test_articles_are_fetched_concurrently_with_per_host_delay(tmp_path, blogs):
+    articles = _articles(blogs)
+    stats = _converter(tmp_path)._follow_links(articles)
+
+    assert stats["scraped"] == len(articles) == 15
+    assert stats["skipped_by_budget"] == 0
+    # One request at a time plus the delay would have run out of budget
+    assert stats["serial_within_budget"] < stats["scraped"]
+    assert all("Body of /posts/" in a["full_text"] for a in articles)
+
+    for host in HOSTS:
+        starts = sorted(_FakeBlogs.requests[host])
+        assert len(starts) == 5
+        gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+        assert min(gaps) >= 0.15  # _REQUEST_DELAY per host, minus timer slack
+
+
+def test_unchanged_articles_are_revalidated_from_cache(tmp_path, blogs):
+    first = _articles(blogs)
+    _converter(tmp_path)._follow_links(first)
+    assert _FakeBlogs.revalidated == []
+
+    second = _articles(blogs)
+    stats = _converter(tmp_path)._follow_links(second)
+
+    assert stats["not_modified"] == 15
+    assert len(_FakeBlogs.revalidated) == 15
+    assert [a["full_text"] for a in second] == [a["full_text"] for a in first]
+
+
+def test_http_cache_can_be_disabled(tmp_path, blogs):
+    config = {"name": "blog", "output_dir": str(tmp_path / "blog"), "http_cache": False}
+    RssToSkillConverter(config)._follow_links(_articles(blogs, per_host=1))
+    stats = RssToSkillConverter(config)._follow_links(_articles(blogs, per_host=1))
+
+    assert stats["not_modified"] == 0
+    assert _FakeBlogs.revalidated == []
+
+
+def test_no_request_starts_after_the_budget(tmp_path, blogs, monkeypatch):
+    monkeypatch.setattr(rss_scraper, "_REQUEST_DELAY", 0.3)
+    monkeypatch.setattr(rss_scraper, "_FOLLOW_TIME_BUDGET", 0.75)
+    articles = _articles(blogs, hosts=("127.0.0.1",), per_host=6)
+
+    stats = _converter(tmp_path)._follow_links(articles)
+
+    # Slots at 0, 0.3 and 0.6s fit the budget; 0.9s onwards do not
+    assert stats["scraped"] == 3
+    assert stats["skipped_by_budget"] == 3
+    assert len(_FakeBlogs.requests["127.0.0.1"]) == 3
+    assert sum("full_text" in a for a in articles) == 3
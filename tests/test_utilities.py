@@ -326,6 +326,28 @@ class TestRetryWithBackoffAsync(unittest.TestCase):
         with self.assertRaises(ConnectionError):
             asyncio.run(retry_with_backoff_async(operation, max_attempts=2, base_delay=0.01))
 
+    def test_async_should_retry_rejects_error(self):
+        """Test errors rejected by should_retry are raised on the first attempt"""
+        import asyncio
+
+        call_count = 0
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Not transient")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(
+                retry_with_backoff_async(
+                    operation,
+                    max_attempts=3,
+                    base_delay=0.01,
+                    should_retry=lambda e: isinstance(e, ConnectionError),
+                )
+            )
+        self.assertEqual(call_count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
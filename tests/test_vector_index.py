@@ -0,0 +1,302 @@
+"""
+Tests for the local IVF vector index.
+"""
+
+import json
+import time
+
+import numpy as np
+import pytest
+
+from skill_seekers.cli.vector_index import (
+    VectorIndex,
+    build_from_package,
+    load_package_records,
+    top_k,
+)
+
+DIM = 32
+
+
+def _clustered(n, dim=DIM, clusters=64, seed=0):
+    """Unit vectors drawn around ``clusters`` random centers."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim))
+    points = centers[rng.integers(0, clusters, n)] + 0.3 * rng.standard_normal((n, dim))
+    return (points / np.linalg.norm(points, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _records(n):
+    ids = [f"{i:032x}" for i in range(n)]
+    metadatas = [
+        {"category": ["api", "guide", "overview"][i % 3], "file": f"ref_{i % 10}.md"}
+        for i in range(n)
+    ]
+    return ids, metadatas
+
+
+def test_top_k_orders_best_first():
+    scores = np.array([0.1, 0.9, 0.5, 0.7])
+    assert top_k(scores, 2).tolist() == [1, 3]
+    assert top_k(scores, 10).tolist() == [1, 3, 2, 0]
+
+
+def test_small_index_is_exact(tmp_path):
+    vectors = _clustered(200)
+    ids, metadatas = _records(200)
+    index = VectorIndex(tmp_path / "idx")
+    index.add(ids, vectors, metadatas)
+
+    assert index.nlist == 1
+    hits = index.search(vectors[17], k=3)
+    assert hits[0]["id"] == ids[17]
+    assert hits[0]["score"] == pytest.approx(1.0, abs=1e-5)
+    assert hits[0]["metadata"] == metadatas[17]
+    assert [h["score"] for h in hits] == sorted((h["score"] for h in hits), reverse=True)
+
+
+def test_metadata_filters(tmp_path):
+    vectors = _clustered(3000)
+    ids, metadatas = _records(3000)
+    index = VectorIndex(tmp_path / "idx", nprobe=2)
+    index.add(ids, vectors, metadatas)
+
+    hits = index.search(vectors[0], k=20, filters={"category": "guide"})
+    assert len(hits) == 20
+    assert all(h["metadata"]["category"] == "guide" for h in hits)
+
+    hits = index.search(
+        vectors[0], k=50, filters={"category": "api", "file": ["ref_0.md", "ref_3.md"]}
+    )
+    assert all(h["metadata"]["file"] in ("ref_0.md", "ref_3.md") for h in hits)
+    assert all(h["metadata"]["category"] == "api" for h in hits)
+    # Selective filters fall back to scanning every match, so k is still met
+    assert len(hits) == 50
+
+    assert index.search(vectors[0], k=5, filters={"category": "missing"}) == []
+
+
+def test_persistence_and_incremental_updates(tmp_path):
+    vectors = _clustered(1500)
+    ids, metadatas = _records(1500)
+    index = VectorIndex(tmp_path / "idx")
+    index.add(ids[:1000], vectors[:1000], metadatas[:1000])
+    index.add(ids[1000:], vectors[1000:], metadatas[1000:])
+
+    assert index.delete([ids[5], ids[6], "not-there"]) == 2
+    # Re-adding an ID replaces its vector and metadata
+    index.add([ids[7]], [vectors[900]], [{"category": "moved"}])
+
+    reopened = VectorIndex(tmp_path / "idx")
+    assert len(reopened) == 1498
+    assert ids[5] not in reopened and ids[7] in reopened
+    assert all(h["id"] != ids[5] for h in reopened.search(vectors[5], k=10, exact=True))
+    assert reopened.search(vectors[900], k=5, filters={"category": "moved"})[0]["id"] == ids[7]
+    assert reopened.stats()["deleted"] == 3
+
+    reopened.compact()
+    assert reopened.stats()["deleted"] == 0
+    again = VectorIndex(tmp_path / "idx")
+    assert len(again) == 1498
+    assert again.search(vectors[1200], k=1)[0]["id"] == ids[1200]
+
+
+def test_uncommitted_tail_is_discarded(tmp_path):
+    vectors = _clustered(10)
+    ids, metadatas = _records(10)
+    index = VectorIndex(tmp_path / "idx")
+    index.add(ids, vectors, metadatas)
+
+    # Simulate a crash after rows were appended but before the manifest commit
+    with open(tmp_path / "idx" / "vectors.f32", "ab") as f:
+        f.write(b"\x00" * (DIM * 4 * 3 + 5))
+    with open(tmp_path / "idx" / "records.jsonl", "a") as f:
+        f.write('{"id": "torn", "metadata": {}}\n{"id": "to')
+
+    reopened = VectorIndex(tmp_path / "idx")
+    assert len(reopened) == 10 and "torn" not in reopened
+    reopened.add(["new"], [vectors[0]], [{}])
+    assert len(VectorIndex(tmp_path / "idx")) == 11
+
+
+def _compactable(tmp_path):
+    vectors = _clustered(50)
+    ids, metadatas = _records(50)
+    index = VectorIndex(tmp_path / "idx")
+    index.add(ids, vectors, metadatas)
+    index.delete(ids[:20])
+    return index, ids, vectors
+
+
+def _assert_intact(root, ids, vectors):
+    reopened = VectorIndex(root)
+    assert len(reopened) == 30
+    for i in (20, 35, 49):
+        hit = reopened.search(vectors[i], k=1, exact=True)[0]
+        assert hit["id"] == ids[i]
+        assert hit["score"] == pytest.approx(1.0, abs=1e-5)
+    return reopened
+
+
+def test_crash_before_compaction_commit_keeps_old_generation(tmp_path, monkeypatch):
+    index, ids, vectors = _compactable(tmp_path)
+
+    def crash():
+        raise OSError("disk full")
+
+    monkeypatch.setattr(index, "_save_state", crash)
+    with pytest.raises(OSError):
+        index.compact()
+
+    reopened = _assert_intact(tmp_path / "idx", ids, vectors)
+    assert reopened.stats()["deleted"] == 20
+    assert sorted(p.name for p in (tmp_path / "idx").iterdir()) == [
+        "centroids.npy",
+        "lists.npy",
+        "manifest.json",
+        "records.jsonl",
+        "vectors.f32",
+    ]
+
+
+def test_compaction_switches_generation(tmp_path):
+    index, ids, vectors = _compactable(tmp_path)
+    # A torn array write only ever leaves a temp file behind
+    (tmp_path / "idx" / "lists.npy.tmp").write_bytes(b"\x93NUMPY")
+
+    index.compact()
+
+    root = tmp_path / "idx"
+    assert json.loads((root / "manifest.json").read_text())["generation"] == 1
+    reopened = _assert_intact(root, ids, vectors)
+    assert sorted(p.name for p in root.iterdir()) == [
+        "centroids.1.npy",
+        "lists.1.npy",
+        "manifest.json",
+        "records.1.jsonl",
+        "vectors.1.f32",
+    ]
+    assert reopened.stats()["deleted"] == 0
+    reopened.add(["new"], [vectors[0]], [{}])
+    assert len(VectorIndex(root)) == 31
+
+
+def test_rejects_mismatched_dimensions(tmp_path):
+    index = VectorIndex(tmp_path / "idx")
+    index.add(["a"], [[1.0, 0.0]])
+    with pytest.raises(ValueError, match="2-dim"):
+        index.add(["b"], [[1.0, 0.0, 0.0]])
+    with pytest.raises(ValueError, match="query"):
+        index.search([1.0, 0.0, 0.0])
+
+
+def test_build_from_package(tmp_path):
+    package = tmp_path / "skill-chroma.json"
+    documents = ["alpha hooks", "beta routing", "gamma state"]
+    package.write_text(
+        json.dumps(
+            {
+                "documents": documents,
+                "metadatas": [{"category": "api", "file": f"{d.split()[0]}.md"} for d in documents],
+                "ids": ["id-a", "id-b", "id-c"],
+            }
+        )
+    )
+    calls = []
+
+    def embed(texts):
+        calls.append(list(texts))
+        return [[float(len(t)), float(t[0] == "a"), 1.0] for t in texts]
+
+    index = build_from_package(package, tmp_path / "idx", embed)
+    assert len(index) == 3
+    assert index.search(embed(["alpha hooks"])[0], k=1)[0]["id"] == "id-a"
+
+    # Re-building only embeds new chunks and drops removed ones
+    package.write_text(
+        json.dumps(
+            {"documents": ["alpha hooks", "delta"], "metadatas": [{}, {}], "ids": ["id-a", "id-d"]}
+        )
+    )
+    calls.clear()
+    index = build_from_package(package, tmp_path / "idx", embed)
+    assert calls == [["delta"]]
+    assert sorted(index._slots) == ["id-a", "id-d"]
+
+
+def test_cli_embeds_with_local_model_by_default(tmp_path, monkeypatch, capsys):
+    from skill_seekers.cli import vector_index
+    from skill_seekers.embedding.generator import EmbeddingGenerator
+
+    package = tmp_path / "skill-chroma.json"
+    package.write_text(
+        json.dumps(
+            {
+                "documents": ["alpha hooks", "beta routing"],
+                "metadatas": [{"category": "api"}, {"category": "guide"}],
+                "ids": ["id-a", "id-b"],
+            }
+        )
+    )
+    models = []
+
+    def generate_batch(self, texts, model="text-embedding-3-small", **kwargs):  # noqa: ARG001
+        models.append(model)
+        return [[float(t[0] == "a"), float(t[0] == "b"), 1.0] for t in texts], 3
+
+    monkeypatch.setattr(EmbeddingGenerator, "generate_batch", generate_batch)
+    for argv in (
+        ["build", str(package), str(tmp_path / "idx")],
+        ["search", str(tmp_path / "idx"), "alpha", "-k", "1"],
+    ):
+        monkeypatch.setattr("sys.argv", ["skill-seekers-index", *argv])
+        vector_index.main()
+
+    assert models == ["all-MiniLM-L6-v2", "all-MiniLM-L6-v2"]
+    assert "id-a" in capsys.readouterr().out.splitlines()[-1]
+
+
+def test_langchain_package_gets_deterministic_ids(tmp_path):
+    package = tmp_path / "skill-langchain.json"
+    package.write_text(
+        json.dumps([{"page_content": "hello", "metadata": {"source": "s", "file": "a.md"}}])
+    )
+    from skill_seekers.cli.adaptors import get_adaptor
+
+    ids, documents, _ = load_package_records(package)
+    expected = get_adaptor("chroma")._generate_deterministic_id(
+        "hello", {"source": "s", "file": "a.md"}
+    )
+    assert ids == [expected] and documents == ["hello"]
+
+
+@pytest.mark.benchmark
+class TestVectorIndexBenchmark:
+    """IVF recall@10 and latency against brute force."""
+
+    @pytest.mark.parametrize("n", [20_000, pytest.param(200_000, marks=pytest.mark.slow)])
+    def test_recall_and_latency(self, n, tmp_path):
+        vectors = _clustered(n, dim=64, clusters=256)
+        index = VectorIndex(tmp_path / "idx", nprobe=24)
+        index.add([str(i) for i in range(n)], vectors)
+        index.train()
+
+        queries = _clustered(100, dim=64, clusters=256, seed=1)
+        recall, ivf_time, exact_time = 0.0, 0.0, 0.0
+        for q in queries:
+            start = time.perf_counter()
+            approx = {h["id"] for h in index.search(q, k=10)}
+            ivf_time += time.perf_counter() - start
+            start = time.perf_counter()
+            exact = {h["id"] for h in index.search(q, k=10, exact=True)}
+            exact_time += time.perf_counter() - start
+            recall += len(approx & exact) / 10
+
+        recall /= len(queries)
+        print(
+            f"\n{n:,} x 64-dim, nlist={index.nlist}, nprobe=24: recall@10 {recall:.3f}, "
+            f"IVF {ivf_time / len(queries) * 1000:.2f} ms vs brute force "
+            f"{exact_time / len(queries) * 1000:.2f} ms per query"
+        )
+        assert recall >= 0.9
+        assert ivf_time < exact_time